@@ -14,6 +14,8 @@ from pathlib import Path
 from datetime import datetime, timedelta
 import logging
 
+from src.position_matcher import get_position_matcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -241,9 +243,12 @@ class IncentiveCalculator:
         if not self.condition_matrix:
             return []
 
-        # TYPE별 조건 매핑
-        type_conditions = self.condition_matrix.get('type_conditions', {})
-        condition_ids = type_conditions.get(type_name, [])
+        # TYPE별 조건 매핑이 있으면 사용, 없으면 position_matrix 패턴 매칭 (step1과 동일한 공용 매처)
+        type_conditions = self.condition_matrix.get('type_conditions')
+        if type_conditions is not None:
+            condition_ids = type_conditions.get(type_name, [])
+        else:
+            condition_ids = get_position_matcher(self.condition_matrix).get_applicable_conditions(type_name, position)
 
         # 조건 정의 가져오기
         conditions_def = self.condition_matrix.get('conditions', {})
@@ -5,36 +5,49 @@ Extract and analyze employeeData from dashboard HTML
 import re
 import base64
 import json
+import os
+import sys
 import pandas as pd
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from src.dashboard_payload import decode_columns
+
 # Read the dashboard HTML
 html_path = 'output_files/Incentive_Dashboard_2025_09_Version_6.html'
 with open(html_path, 'r', encoding='utf-8') as f:
     html_content = f.read()
 
-# Extract Base64 encoded employee data from <script> tag
-pattern = r'<script type="application/json" id="employeeDataBase64">\s*([^<]+)\s*</script>'
+# Extract columnar employee payload from <script> tag (src/dashboard_payload.py)
+pattern = r'<script type="application/json" id="employeePayload">\s*(.*?)\s*</script>'
 match = re.search(pattern, html_content, re.DOTALL)
 
-if not match:
-    print("❌ Could not find employeeDataBase64 script tag in HTML")
-    exit(1)
+if match:
+    employee_data = decode_columns(json.loads(match.group(1)))
+    print(f"✅ Found columnar payload: {len(match.group(1))} characters")
+else:
+    # Older dashboards: Base64 encoded employee list
+    pattern = r'<script type="application/json" id="employeeDataBase64">\s*([^<]+)\s*</script>'
+    match = re.search(pattern, html_content, re.DOTALL)
+
+    if not match:
+        print("❌ Could not find employeePayload or employeeDataBase64 script tag in HTML")
+        exit(1)
 
-base64_data = match.group(1).strip()
-print(f"✅ Found Base64 data: {len(base64_data)} characters")
+    base64_data = match.group(1).strip()
+    print(f"✅ Found Base64 data: {len(base64_data)} characters")
 
-# Decode Base64 to JSON
-try:
-    json_str = base64.b64decode(base64_data).decode('utf-8')
-    employee_data = json.loads(json_str)
-except Exception as e:
-    print(f"❌ Error decoding data: {e}")
-    # Try direct JSON parse (in case it's not Base64)
+    # Decode Base64 to JSON
     try:
-        employee_data = json.loads(base64_data)
-        print("✅ Data was plain JSON, not Base64")
-    except:
-        exit(1)
+        json_str = base64.b64decode(base64_data).decode('utf-8')
+        employee_data = json.loads(json_str)
+    except Exception as e:
+        print(f"❌ Error decoding data: {e}")
+        # Try direct JSON parse (in case it's not Base64)
+        try:
+            employee_data = json.loads(base64_data)
+            print("✅ Data was plain JSON, not Base64")
+        except:
+            exit(1)
 
 print(f"\n📊 Dashboard Employee Data Analysis:")
 print(f"   Total employees in dashboard: {len(employee_data)}")
@@ -9,14 +9,15 @@
 import os
 import sys
 import glob
-import subprocess
-from pathlib import Path
+import argparse
 
 # 상위 디렉토리를 경로에 추가
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
+from src.qip_pipeline import run_calculation, generate_dashboard
+
 def find_config_files():
     """config_files 디렉토리에서 config 파일 찾기"""
     config_pattern = "config_files/config_*_*.json"
@@ -60,13 +61,15 @@ def find_config_files():
 
     return configs_info
 
-def calculate_incentive(month_str, year):
+def calculate_incentive(month_str, year, with_dashboard=False, quiet=False):
     """
-    특정 월의 인센티브 계산
+    특정 월의 인센티브 계산 (in-process: step1 모듈을 한 번만 import)
 
     Args:
         month_str: 월 이름 (예: 'november')
         year: 연도
+        with_dashboard: True면 계산 결과(month_data)로 대시보드까지 바로 생성
+        quiet: True면 계산/대시보드 상세 출력 생략 (경고/오류와 요약만)
 
     Returns:
         bool: 성공 여부
@@ -82,63 +85,47 @@ def calculate_incentive(month_str, year):
             print(f"  ⚠️ Config 파일이 없습니다: {config_file}")
             return False
 
-        # step1_인센티브_계산_개선버전.py 실행 (--config 인자 사용)
-        cmd = [
-            sys.executable,
-            "src/step1_인센티브_계산_개선버전.py",
-            "--config", config_file
-        ]
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=parent_dir,
-            timeout=300  # 5분 타임아웃
-        )
-
-        if result.returncode == 0:
-            print(f"  ✅ 인센티브 계산 성공")
-
-            # Print stdout for debugging
-            if result.stdout:
-                print(f"  📝 계산 로그:")
-                for line in result.stdout.split('\n')[-20:]:  # Print last 20 lines
-                    if line.strip():
-                        print(f"    {line}")
-
-            # 생성된 파일 확인
-            month_names = {
-                'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                'september': 9, 'october': 10, 'november': 11, 'december': 12
-            }
-            month_num = month_names[month_str.lower()]
-
-            csv_pattern = f"output_files/output_QIP_incentive_{month_str}_{year}_Complete_V8.02_Complete.csv"
-            csv_files = glob.glob(csv_pattern)
-
-            if csv_files:
-                print(f"  📄 생성된 CSV: {csv_files[0]}")
-                return True
-            else:
-                print(f"  ⚠️ CSV 파일을 찾을 수 없습니다")
-                return False
-        else:
+        # step1과 같은 작업 디렉토리 기준으로 실행
+        os.chdir(parent_dir)
+        result = run_calculation(config_file, quiet=quiet)
+
+        if not result.success:
             print(f"  ❌ 인센티브 계산 실패")
-            if result.stderr:
-                print(f"  오류: {result.stderr[:500]}")  # 처음 500자만
+            if result.error:
+                print(f"  오류: {result.error[:500]}")  # 처음 500자만
             return False
 
-    except subprocess.TimeoutExpired:
-        print(f"  ❌ 타임아웃: 계산 시간 초과 (5분)")
-        return False
+        print(f"  ✅ 인센티브 계산 성공")
+
+        # 생성된 파일 확인
+        if result.csv_file and os.path.exists(result.csv_file):
+            print(f"  📄 생성된 CSV: {result.csv_file}")
+        else:
+            print(f"  ⚠️ CSV 파일을 찾을 수 없습니다")
+            return False
+
+        if with_dashboard:
+            dashboard_file = generate_dashboard(result)
+            if dashboard_file:
+                print(f"  📄 생성된 대시보드: {dashboard_file}")
+            else:
+                print(f"  ⚠️ 대시보드 생성 실패 (generate_dashboard_for_pages.py에서 재시도)")
+
+        return True
+
     except Exception as e:
         print(f"  ❌ 오류 발생: {e}")
         return False
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='config 기반 전체 월 인센티브 자동 계산')
+    parser.add_argument('--dashboards', action='store_true',
+                        help='계산 결과로 대시보드 HTML도 같은 프로세스에서 생성 (CSV 재로드 없음)')
+    parser.add_argument('--quiet', action='store_true',
+                        help='계산/대시보드 상세 출력 없이 경고/오류와 월별 요약(단계별 시간)만 출력')
+    args = parser.parse_args()
+
     print("=" * 70)
     print("💰 인센티브 자동 계산 시작")
     print("=" * 70)
@@ -159,7 +146,8 @@ def main():
     failed_calculations = []
 
     for config_info in configs:
-        result = calculate_incentive(config_info['month_str'], config_info['year'])
+        result = calculate_incentive(config_info['month_str'], config_info['year'],
+                                     with_dashboard=args.dashboards, quiet=args.quiet)
 
         if result:
             successful_calculations.append(config_info)
@@ -4,12 +4,47 @@
 """
 월 선택 페이지 생성 스크립트
 모든 월의 대시보드를 선택할 수 있는 메인 페이지 생성
+
+docs/data/YYYY_MM.json.gz (app shell 배포, generate_dashboard_for_pages.py --layout shell)가 있는 월은
+단독 HTML 대신 dashboard.html?month=YYYY_MM&v=<data hash> 로 연결합니다.
 """
 
 import os
+import sys
 import glob
 from datetime import datetime
 
+# 상위 디렉토리를 경로에 추가
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from src.dashboard_shell import DATA_DIR, SHELL_PAGE, file_version
+
+MONTH_NAMES = ['', 'January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+
+def find_shell_dashboards():
+    """app shell 배포의 월별 data (docs/data/YYYY_MM.json.gz)"""
+    dashboards = []
+    if not os.path.exists(os.path.join('docs', SHELL_PAGE)):
+        return dashboards
+    for file in glob.glob(os.path.join('docs', DATA_DIR, '*_*.json.gz')):
+        try:
+            key = os.path.basename(file)[:-len('.json.gz')]
+            year, month = (int(part) for part in key.split('_'))
+            dashboards.append({
+                'filename': f"{SHELL_PAGE}?month={key}&v={file_version(file)}",
+                'year': year,
+                'month': month,
+                'month_name': MONTH_NAMES[month] if 1 <= month <= 12 else str(month),
+                'version': 'shell',
+                'sort_key': year * 100 + month
+            })
+        except Exception as e:
+            print(f"⚠️ 파일 파싱 실패 {file}: {e}")
+    return dashboards
+
 def create_month_selector_page():
     """월 선택 페이지 HTML 생성"""
 
@@ -31,16 +66,7 @@ def create_month_selector_page():
             if len(parts) >= 5 and parts[4] == 'Version':
                 version_str = parts[5] if len(parts) > 5 else '0.0'
 
-            month_names = ['', 'January', 'February', 'March', 'April', 'May', 'June',
-                          'July', 'August', 'September', 'October', 'November', 'December']
-            month_name = month_names[month] if 1 <= month <= 12 else str(month)
-
-            # 2025년 11월 이후만 표시 (10월 확정 지급 완료)
-            if year == 2025 and month < 11:
-                continue
-            # 8월(August) 제외 (다른 해도 적용)
-            if month == 8:
-                continue
+            month_name = MONTH_NAMES[month] if 1 <= month <= 12 else str(month)
 
             dashboards.append({
                 'filename': filename,
@@ -54,12 +80,19 @@ def create_month_selector_page():
             print(f"⚠️ 파일 파싱 실패 {file}: {e}")
             continue
 
-    # 중복 제거: 동일한 year/month에서 가장 높은 버전만 선택
+    dashboards.extend(find_shell_dashboards())
+
+    # 2025년 11월 이후만 표시 (10월 확정 지급 완료), 8월(August) 제외 (다른 해도 적용)
+    dashboards = [d for d in dashboards if not (d['year'] == 2025 and d['month'] < 11) and d['month'] != 8]
+
+    # 중복 제거: 동일한 year/month에서 가장 높은 버전만 선택 (app shell 배포가 있으면 우선)
     unique_dashboards = {}
     for dashboard in dashboards:
         key = (dashboard['year'], dashboard['month'])
-        if key not in unique_dashboards:
+        if key not in unique_dashboards or dashboard['version'] == 'shell':
             unique_dashboards[key] = dashboard
+        elif unique_dashboards[key]['version'] == 'shell':
+            continue
         else:
             # 버전 비교 (9.0 > 8.02 > 8.01)
             current_version = tuple(map(float, dashboard['version'].split('.')))
@@ -4,12 +4,16 @@
 """
 GitHub Pages용 대시보드 자동 생성 스크립트
 Google Drive에서 다운로드한 CSV 파일들로 HTML 대시보드 생성
+
+--layout shell: 월별 단독 HTML 대신 docs/에 app shell 하나 + 월별 data 배포
+    docs/dashboard.html, docs/app/dashboard-shell.<version>.js, docs/data/YYYY_MM.json.gz (+ .json)
 """
 
 import os
 import sys
 import glob
-import subprocess
+import shutil
+import argparse
 from datetime import datetime
 
 # 상위 디렉토리를 경로에 추가
@@ -17,6 +21,9 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
+from src.qip_pipeline import load_dashboard_module
+from src.dashboard_shell import DATA_DIR, month_key, read_html_build_version, read_month_shell_version, write_shell
+
 def find_csv_files():
     """output_files 디렉토리에서 CSV 파일 찾기"""
     csv_pattern = "output_files/output_QIP_incentive_*_Complete_V*.csv"
@@ -71,50 +78,89 @@ def find_csv_files():
 
     return files_info
 
-def generate_dashboard(month, year):
-    """특정 월의 대시보드 생성"""
+def find_existing_dashboard(month, year, layout='html'):
+    """이미 생성된 월별 대시보드 HTML (shell이면 월별 data, 없으면 None)"""
+    if layout == 'shell':
+        data_file = os.path.join('output_files', DATA_DIR, f"{month_key(year, month)}.json.gz")
+        return data_file if os.path.exists(data_file) else None
+    html_pattern = f"output_files/Incentive_Dashboard_{year}_{month:02d}_Version_*.html"
+    html_files = glob.glob(html_pattern)
+    return html_files[0] if html_files else None
+
+def current_build_version():
+    """현재 template + config(번역, position matrix 등)의 dashboard build version"""
+    os.chdir(parent_dir)
+    return load_dashboard_module().static_slot_values()['dashboard_build']
+
+def is_dashboard_up_to_date(file_info, layout='html', build_version=None):
+    """
+    대시보드가 결과 CSV보다 최신이고 현재 template/config(build_version)로 만든 것이면 True
+    (auto_calculate_incentives.py --dashboards로 이미 생성된 경우)
+    """
+    html_file = find_existing_dashboard(file_info['month'], file_info['year'], layout)
+    if not html_file:
+        return False
+    # 월별 data('shell') / 단독 HTML(meta)에 기록된 build version이 현재와 같아야 함
+    built_with = read_month_shell_version(html_file) if layout == 'shell' else read_html_build_version(html_file)
+    if build_version is not None and built_with != build_version:
+        return False
+    return os.path.getmtime(html_file) >= os.path.getmtime(file_info['file'])
+
+def generate_dashboard(month, year, layout='html'):
+    """특정 월의 대시보드 생성 (in-process: 모듈 import/번역 로드는 한 번만)"""
     try:
         print(f"\n🎨 대시보드 생성 중: {year}년 {month}월")
 
-        # integrated_dashboard_final.py 실행
-        cmd = [
-            sys.executable,
-            "integrated_dashboard_final.py",
-            "--month", str(month),
-            "--year", str(year)
-        ]
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=parent_dir
-        )
-
-        if result.returncode == 0:
+        # integrated_dashboard_final.py와 같은 작업 디렉토리 기준으로 실행
+        os.chdir(parent_dir)
+        dashboard = load_dashboard_module()
+        output_file = dashboard.build_dashboard(month, year, layout=layout)
+
+        if output_file:
             print(f"  ✅ 대시보드 생성 성공")
 
             # 생성된 파일 확인
-            html_pattern = f"output_files/Incentive_Dashboard_{year}_{month:02d}_Version_*.html"
-            html_files = glob.glob(html_pattern)
-
-            if html_files:
-                print(f"  📄 생성된 파일: {html_files[0]}")
-                return html_files[0]
+            html_file = find_existing_dashboard(month, year, layout)
+            if html_file:
+                print(f"  📄 생성된 파일: {html_file}")
+                return html_file
             else:
                 print(f"  ⚠️ HTML 파일을 찾을 수 없습니다")
                 return None
         else:
             print(f"  ❌ 대시보드 생성 실패")
-            print(f"  오류: {result.stderr}")
             return None
 
     except Exception as e:
         print(f"  ❌ 오류 발생: {e}")
         return None
 
+def publish_shell_layout(dashboards, docs_dir):
+    """app shell + 월별 data를 docs/에 배포 (template/config가 같으면 shell 파일은 그대로)"""
+    os.chdir(parent_dir)
+    # 번역 등 월과 무관한 slot 값은 배포할 때마다 현재 config로 다시 만듦
+    shell_hash = write_shell(docs_dir, load_dashboard_module().static_slot_values())
+    print(f"\n📦 App shell 배포: {docs_dir}/dashboard.html (shell {shell_hash})")
+
+    target_dir = os.path.join(docs_dir, DATA_DIR)
+    os.makedirs(target_dir, exist_ok=True)
+    # 같은 월의 CSV가 여러 버전이면 같은 data 파일이 여러 번 나옴
+    for data_file in dict.fromkeys(dashboard['file'] for dashboard in dashboards):
+        base = data_file[:-len('.json.gz')]
+        for suffix in ('.json.gz', '.json'):
+            shutil.copy2(base + suffix, target_dir)
+        print(f"  📄 {target_dir}/{os.path.basename(data_file)}")
+
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='GitHub Pages용 월별 대시보드 생성')
+    parser.add_argument('--missing-only', action='store_true',
+                        help='CSV보다 오래되었거나 없는 대시보드만 생성')
+    parser.add_argument('--layout', choices=['html', 'shell'], default='html',
+                        help='html: 월별 단독 HTML (기본) / shell: docs/에 app shell + 월별 data/YYYY_MM.json.gz 배포')
+    parser.add_argument('--docs-dir', default='docs', help='--layout shell 배포 디렉토리')
+    args = parser.parse_args()
+
     print("=" * 60)
     print("🚀 GitHub Pages용 대시보드 생성 시작")
     print("=" * 60)
@@ -130,9 +176,14 @@ def main():
     print(f"\n📊 {len(csv_files)}개월 데이터 발견")
 
     # 각 월별로 대시보드 생성
+    build_version = current_build_version() if args.missing_only else None
     generated_dashboards = []
     for file_info in csv_files:
-        dashboard_file = generate_dashboard(file_info['month'], file_info['year'])
+        if args.missing_only and is_dashboard_up_to_date(file_info, args.layout, build_version):
+            dashboard_file = find_existing_dashboard(file_info['month'], file_info['year'], args.layout)
+            print(f"\n⏭️ 최신 대시보드 유지: {dashboard_file}")
+        else:
+            dashboard_file = generate_dashboard(file_info['month'], file_info['year'], args.layout)
         if dashboard_file:
             generated_dashboards.append({
                 'file': dashboard_file,
@@ -152,6 +203,9 @@ def main():
         print("❌ 생성된 대시보드가 없습니다")
         sys.exit(1)
 
+    if args.layout == 'shell':
+        publish_shell_layout(generated_dashboards, args.docs_dir)
+
     print("=" * 60)
 
 if __name__ == "__main__":
@@ -0,0 +1,111 @@
+"""
+AQL history 공통 로더 모듈
+input_files/AQL history/의 월별 AQL REPORT 파일을 한 번만 파싱
+
+작성일: 2025-11-20
+버전: 1.0
+
+AQL REPORT 파일은 헤더의 "PARTIAL\nNO" 필드가 두 줄로 나뉘어 있습니다.
+기존에는 소비자마다 파일을 다시 읽고(임시 파일로 헤더 재작성 포함)
+EMPLOYEE NO를 각자 다른 방식으로 정리했습니다.
+
+이 모듈은:
+- 헤더를 메모리에서 병합 (줄바꿈 제거 → 'PARTIALNO')
+- EMPLOYEE NO를 9자리 문자열로 정규화한 EMPLOYEE_ID 컬럼 추가
+- 파싱 결과를 프로세스 내에서 캐시 (경로 + 크기 + mtime 기준)
+"""
+
+import io
+import os
+import pandas as pd
+from typing import Dict, Optional, Tuple
+
+AQL_HISTORY_DIR = 'input_files/AQL history'
+
+# 정규화된 직원 ID 컬럼 (9자리 zero-padded, 없으면 NaN)
+EMPLOYEE_ID_COLUMN = 'EMPLOYEE_ID'
+
+# {절대경로: ((size, mtime), DataFrame)}
+_AQL_CACHE: Dict[str, Tuple[Tuple[int, float], pd.DataFrame]] = {}
+
+
+def get_aql_report_path(month_name: str, year: int, aql_dir: str = AQL_HISTORY_DIR) -> str:
+    """월별 AQL REPORT 파일 경로 (예: 1.HSRG AQL REPORT-NOVEMBER.2025.csv)"""
+    return os.path.join(aql_dir, f'1.HSRG AQL REPORT-{month_name.upper()}.{year}.csv')
+
+
+def normalize_employee_no(value) -> Optional[str]:
+    """EMPLOYEE NO → 9자리 문자열 (float 표기 '.0' 제거, 3자리 미만은 무효)"""
+    if pd.isna(value):
+        return None
+    emp_str = str(value).strip()
+    if emp_str == '' or emp_str == 'nan' or len(emp_str) < 3:
+        return None
+    if '.' in emp_str:
+        try:
+            emp_str = str(int(float(emp_str)))
+        except ValueError:
+            emp_str = emp_str.split('.')[0]
+    return emp_str.zfill(9)
+
+
+def _parse_aql_report(file_path: str) -> pd.DataFrame:
+    """AQL REPORT 파일 파싱 (두 줄 헤더 병합, EMPLOYEE_ID 추가)"""
+    # 텍스트 모드로 읽어 줄바꿈 통일 (BOM 제거)
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        text = f.read()
+
+    df = pd.read_csv(io.StringIO(text))
+
+    # 헤더 필드 안의 줄바꿈 제거: "PARTIAL\nNO" → "PARTIALNO"
+    df.columns = [
+        col.replace('\r', '').replace('\n', '') if isinstance(col, str) else col
+        for col in df.columns
+    ]
+
+    if 'EMPLOYEE NO' in df.columns:
+        unique_ids = df['EMPLOYEE NO'].dropna().unique()
+        id_map = {raw: normalize_employee_no(raw) for raw in unique_ids}
+        df[EMPLOYEE_ID_COLUMN] = df['EMPLOYEE NO'].map(id_map)
+
+    return df
+
+
+def read_aql_report(file_path) -> Optional[pd.DataFrame]:
+    """
+    AQL REPORT 파일 로드 (프로세스 내 캐시)
+
+    Args:
+        file_path: AQL REPORT CSV 경로
+
+    Returns:
+        DataFrame 복사본 (호출자가 자유롭게 수정 가능), 파일이 없거나 파싱 실패 시 None
+    """
+    file_path = str(file_path)
+    if not os.path.exists(file_path):
+        return None
+
+    cache_key = os.path.abspath(file_path)
+    stat = os.stat(file_path)
+    signature = (stat.st_size, stat.st_mtime)
+
+    cached = _AQL_CACHE.get(cache_key)
+    if cached is None or cached[0] != signature:
+        try:
+            df = _parse_aql_report(file_path)
+        except Exception:
+            return None
+        _AQL_CACHE[cache_key] = (signature, df)
+        cached = _AQL_CACHE[cache_key]
+
+    return cached[1].copy()
+
+
+def load_aql_month(month_name: str, year: int, aql_dir: str = AQL_HISTORY_DIR) -> Optional[pd.DataFrame]:
+    """월 이름/연도로 AQL REPORT 로드"""
+    return read_aql_report(get_aql_report_path(month_name, year, aql_dir))
+
+
+def clear_aql_cache():
+    """캐시 초기화 (입력 파일 교체 후 강제 재파싱용)"""
+    _AQL_CACHE.clear()
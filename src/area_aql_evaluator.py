@@ -0,0 +1,143 @@
+"""
+담당 구역 AQL reject율 일괄 계산 모듈
+auditor_trainer_area_mapping.json의 구역 조건을 boolean mask로 컴파일
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존에는 Auditor/Trainer마다 mapping JSON과 AQL 파일을 다시 읽고,
+조건마다 copy()/pd.concat으로 필터링된 DataFrame을 만들었습니다.
+이 모듈은 AQL 데이터 한 벌 위에서 조건별 mask를 계산하고
+모든 담당자의 (검사 건수, 실패 건수)를 한 번에 집계합니다.
+
+집계 규칙 (기존 concat 방식과 동일):
+- ALL: 전체 데이터 (앞선 조건 결과는 버림)
+- AND: 모든 filter 일치 행 (없는 컬럼의 filter는 무시)
+- OR: filter마다 일치 행을 각각 추가 (중복 행은 중복 집계)
+"""
+
+import hashlib
+import json
+import pandas as pd
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+class AreaRejectStats(NamedTuple):
+    """담당 구역 집계 결과"""
+    name: str
+    total_inspections: int
+    total_failures: int
+
+    @property
+    def reject_rate(self) -> float:
+        """reject율 (%) - 검사 건수가 없으면 0"""
+        if self.total_inspections > 0:
+            return (self.total_failures / self.total_inspections) * 100
+        return 0.0
+
+
+def mapping_hash(area_mapping: Dict) -> str:
+    """mapping 내용 해시 (memoize 키)"""
+    payload = json.dumps(area_mapping, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def iter_area_configs(area_mapping: Dict):
+    """(employee_id, config) 순회 - Model Master가 일반 Auditor/Trainer보다 우선"""
+    if not area_mapping:
+        return
+    seen = set()
+    for emp_id, config in area_mapping.get('model_master', {}).get('employees', {}).items():
+        seen.add(emp_id)
+        yield emp_id, config
+    for emp_id, config in area_mapping.get('auditor_trainer_areas', {}).items():
+        if emp_id not in seen:
+            yield emp_id, config
+
+
+class AreaConditionEvaluator:
+    """AQL 데이터 한 벌에 대한 구역 조건 평가기 (mask 캐시)"""
+
+    def __init__(self, aql_data: pd.DataFrame):
+        self.aql_data = aql_data
+        self.total_rows = len(aql_data)
+
+        # Result 컬럼 (대소문자 구분 없이 첫 번째)
+        result_col = next(
+            (col for col in aql_data.columns if col.upper() == 'RESULT'), None
+        )
+        if result_col is not None and self.total_rows > 0:
+            self.fail_mask = (aql_data[result_col].str.upper() == 'FAIL').to_numpy()
+        else:
+            self.fail_mask = None
+
+        self._filter_masks: Dict[tuple, Any] = {}
+
+    def _filter_mask(self, column: str, value: Any):
+        """(column, value) 일치 mask - 컬럼이 없으면 None"""
+        if column not in self.aql_data.columns:
+            return None
+        key = (column, value)
+        if key not in self._filter_masks:
+            self._filter_masks[key] = (self.aql_data[column] == value).to_numpy()
+        return self._filter_masks[key]
+
+    def _count(self, mask) -> tuple:
+        """(행 수, 실패 수) - mask None이면 전체"""
+        if mask is None:
+            total = self.total_rows
+            failures = int(self.fail_mask.sum()) if self.fail_mask is not None else 0
+        else:
+            total = int(mask.sum())
+            failures = int((mask & self.fail_mask).sum()) if self.fail_mask is not None else 0
+        return total, failures
+
+    def evaluate(self, conditions: List[Dict]) -> tuple:
+        """조건 목록의 (검사 건수, 실패 건수)"""
+        total = 0
+        failures = 0
+        for condition in conditions:
+            if condition['type'] == 'ALL':
+                return self._count(None)
+            elif condition['type'] == 'AND':
+                mask = None
+                for filter_item in condition['filters']:
+                    col_mask = self._filter_mask(filter_item['column'], filter_item['value'])
+                    if col_mask is not None:
+                        mask = col_mask if mask is None else (mask & col_mask)
+                cond_total, cond_failures = self._count(mask)
+                total += cond_total
+                failures += cond_failures
+            elif condition['type'] == 'OR':
+                for filter_item in condition['filters']:
+                    col_mask = self._filter_mask(filter_item['column'], filter_item['value'])
+                    if col_mask is not None:
+                        cond_total, cond_failures = self._count(col_mask)
+                        total += cond_total
+                        failures += cond_failures
+        return total, failures
+
+
+def evaluate_area_reject_stats(aql_data: Optional[pd.DataFrame],
+                               area_mapping: Dict) -> Dict[str, AreaRejectStats]:
+    """
+    mapping에 등록된 모든 담당자의 구역 reject 집계
+
+    Args:
+        aql_data: 정규화된 AQL 데이터 (load_aql_data_for_area_calculation 결과)
+        area_mapping: auditor_trainer_area_mapping.json 내용
+
+    Returns:
+        {employee_id(str): AreaRejectStats}
+    """
+    stats = {}
+    has_data = aql_data is not None and not aql_data.empty
+    evaluator = AreaConditionEvaluator(aql_data) if has_data else None
+
+    for emp_id, config in iter_area_configs(area_mapping):
+        if evaluator is None:
+            total, failures = 0, 0
+        else:
+            total, failures = evaluator.evaluate(config.get('conditions', []))
+        stats[emp_id] = AreaRejectStats(config.get('name', 'Unknown'), total, failures)
+    return stats
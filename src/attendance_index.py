@@ -0,0 +1,133 @@
+"""
+출근 데이터 인덱스 모듈
+attendance 파일을 한 번만 읽고 직원별 집계값을 미리 계산
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존에는 직원마다 attendance 파일 전체를 다시 읽고 필터링했습니다.
+이 모듈은 한 번의 pass로 아래 값을 직원별로 집계합니다:
+- 승인휴가 일수 (AR1이 아닌 Reason Description)
+- AR1 무단결근 횟수 (compAdd == 'Vắng mặt')
+- 실제 근무일 수 (compAdd == 'Đi làm' 또는 출장 'Đi công tác', 날짜 중복 제거)
+
+집계 규칙과 ID 매칭 방식은 step1의 기존 per-employee 로직과 동일합니다.
+"""
+
+import os
+import pandas as pd
+from typing import Dict, Optional, Any
+
+# process_attendance_conditions와 동일한 날짜 컬럼 우선순위
+DATE_COLUMN_CANDIDATES = ['Work Date', 'Date', 'date', 'DATE', 'Ngày', 'ngày', 'WorkDate']
+
+
+class AttendanceIndex:
+    """직원별 출근 집계 인덱스 (한 번 빌드, 이후 dict 조회)"""
+
+    def __init__(self, att_df: pd.DataFrame, emp_col: str = 'ID No'):
+        """
+        초기화
+
+        Args:
+            att_df: 원본 일별 attendance 데이터프레임
+            emp_col: 직원 ID 컬럼명
+        """
+        self.emp_col = emp_col
+        self.date_col = None
+        self.approved_leave: Dict[str, int] = {}
+        self.ar1_absences: Dict[str, int] = {}
+        self.worked_days: Dict[str, int] = {}
+        self.record_counts: Dict[str, int] = {}
+        self._build(att_df)
+
+    @classmethod
+    def from_csv(cls, file_path: str, emp_col: str = 'ID No') -> Optional['AttendanceIndex']:
+        """attendance CSV에서 인덱스 생성 (파일이 없거나 읽기 실패 시 None)"""
+        if not file_path or not os.path.exists(file_path):
+            return None
+        try:
+            return cls(pd.read_csv(file_path), emp_col)
+        except Exception:
+            return None
+
+    def _build(self, att_df: pd.DataFrame):
+        """모든 집계를 한 번에 계산"""
+        if self.emp_col not in att_df.columns:
+            return
+
+        raw_ids = att_df[self.emp_col].astype(str)
+        # 승인휴가: 앞의 0 제거 키 / 근무일·AR1: 9자리 zfill 키 (기존 매칭 방식 유지)
+        lstrip_key = raw_ids.str.lstrip('0')
+        zfill_key = raw_ids.str.zfill(9)
+
+        self.record_counts = zfill_key.value_counts().to_dict()
+
+        has_reason = 'Reason Description' in att_df.columns
+        if has_reason:
+            reason = att_df['Reason Description']
+            try:
+                approved_mask = reason.notna() & ~reason.str.startswith('AR1', na=False)
+                self.approved_leave = {
+                    k: int(v) for k, v in approved_mask.groupby(lstrip_key).sum().items()
+                }
+            except AttributeError:
+                # 문자열이 아닌 컬럼 → 기존 로직과 동일하게 전원 0
+                self.approved_leave = {}
+            reason_str = reason.where(reason.notna(), '').astype(str).str.strip()
+        else:
+            reason_str = pd.Series('', index=att_df.index)
+
+        if 'compAdd' not in att_df.columns:
+            return
+
+        comp = att_df['compAdd']
+        comp_notna = comp.notna()
+        comp_str = comp.astype(str).str.strip()
+
+        is_work = comp_str == 'Đi làm'
+        is_trip = reason_str == 'Đi công tác'
+        is_ar1_reason = (
+            reason_str.str.contains('AR1', regex=False) |
+            reason_str.str.contains('Vắng không phép', regex=False) |
+            reason_str.str.lower().str.contains('không phép', regex=False)
+        )
+
+        self.date_col = next((c for c in DATE_COLUMN_CANDIDATES if c in att_df.columns), None)
+        if self.date_col:
+            date_ok = att_df[self.date_col].notna()
+            worked_mask = comp_notna & date_ok & (is_work | is_trip)
+            # if/elif 순서: 출장(날짜 있음)이 결근 판정보다 먼저
+            absent_mask = comp_notna & (comp_str == 'Vắng mặt') & ~(is_trip & date_ok)
+            worked_dates = att_df.loc[worked_mask, self.date_col].astype(str)
+            self.worked_days = {
+                k: int(v) for k, v in worked_dates.groupby(zfill_key[worked_mask]).nunique().items()
+            }
+        else:
+            # 날짜 컬럼이 없으면 레코드 수로 카운트 (중복 제거 불가)
+            worked_mask = comp_notna & (is_work | is_trip)
+            absent_mask = comp_notna & (comp_str == 'Vắng mặt') & ~is_trip
+            self.worked_days = {
+                k: int(v) for k, v in worked_mask[worked_mask].groupby(zfill_key[worked_mask]).size().items()
+            }
+
+        ar1_mask = absent_mask & is_ar1_reason
+        self.ar1_absences = {
+            k: int(v) for k, v in ar1_mask[ar1_mask].groupby(zfill_key[ar1_mask]).size().items()
+        }
+
+    def has_records(self, emp_id: str) -> bool:
+        """직원의 attendance 레코드 존재 여부 (9자리 ID 기준)"""
+        return emp_id in self.record_counts
+
+    def get_approved_leave_days(self, emp_no: Any) -> int:
+        """승인휴가 일수 (앞의 0을 무시하고 매칭)"""
+        return self.approved_leave.get(str(emp_no).lstrip('0'), 0)
+
+    def get_ar1_absences(self, emp_id: str) -> int:
+        """AR1 무단결근 횟수 (9자리 ID 기준)"""
+        return self.ar1_absences.get(emp_id, 0)
+
+    def get_worked_days(self, emp_id: str) -> int:
+        """실제 근무일 수 (9자리 ID 기준)"""
+        return self.worked_days.get(emp_id, 0)
@@ -52,6 +52,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from google_drive_manager import GoogleDriveManager
+from qip_pipeline import run_calculation, generate_dashboard
 
 # Setup logging
 # Ensure logs directory exists
@@ -83,6 +84,8 @@ class AutomatedQIPRunner:
         """
         self.drive_manager = GoogleDriveManager(drive_config, force_download=force_download)
         self.initialized = False
+        # 마지막 in-process 계산 결과 (dashboard 생성 시 month_data 직접 사용)
+        self.last_result = None
         
     def initialize(self, auth_type: str = 'service_account', 
                   credentials_path: Optional[str] = None) -> bool:
@@ -355,27 +358,14 @@ class AutomatedQIPRunner:
             bool: True if successful
         """
         try:
-            # Check if main script exists
-            calc_script = Path('step1_인센티브_계산_개선버전.py')
-            if not calc_script.exists():
-                # Try src folder
-                calc_script = Path('src/step1_인센티브_계산_개선버전.py')
-                if not calc_script.exists():
-                    logger.error("Main calculation script not found")
-                    return False
+            # step1 모듈을 현재 프로세스에서 실행 (interpreter 재시작/CSV 재로드 없음)
+            self.last_result = run_calculation(config_file)
             
-            # Run calculation
-            result = subprocess.run(
-                [sys.executable, str(calc_script), '--config', config_file],
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode == 0:
+            if self.last_result.success:
                 logger.info("✅ Incentive calculation completed")
                 return True
             else:
-                logger.error(f"Calculation failed: {result.stderr}")
+                logger.error(f"Calculation failed: {self.last_result.error}")
                 return False
                 
         except Exception as e:
@@ -394,6 +384,13 @@ class AutomatedQIPRunner:
             bool: True if successful
         """
         try:
+            # Integrated dashboard - 방금 계산한 month_data/attendance를 그대로 사용
+            result = self.last_result
+            if result is not None and result.success and result.month_name == (month or '').lower():
+                logger.info(f"Generating integrated dashboard for {month} {year} (in-process)...")
+                if not generate_dashboard(result):
+                    logger.warning("Integrated dashboard generation warning: no output file")
+            
             # Dashboard version 4 (최신 버전) - 월별 파일명 지원
             dashboard_v4 = Path(__file__).parent / 'step2_dashboard_version4.py'
             if dashboard_v4.exists():
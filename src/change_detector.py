@@ -0,0 +1,234 @@
+"""
+입력 변경 감지 모듈 (--incremental)
+직원별 입력 행 hash를 이전 실행과 비교해 변경된 직원 + 상위 관리자만 골라냄
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존에는 basic manpower 한 행 수정이나 늦게 들어온 AQL 기록 한 건에도
+전체 재계산 후 CSV/Excel/메타데이터/대시보드를 모두 다시 만들었습니다.
+이 모듈은:
+- basic manpower / attendance / 5PRS / AQL 입력을 정규화(문자열, 컬럼명 순서)해 직원별 행 hash 계산
+- 그 외 입력(config, 이전 달 결과, 매핑 JSON, AQL history, 계산 코드)은 파일 크기 + mtime digest 하나로 비교
+- 이전 실행 snapshot(history ledger)과 비교해 변경 직원 + manager 그래프 상위 관리자 집합 반환
+
+변경 집합은 결과 파일 patch 범위를 정하는 데 사용합니다.
+계산 자체는 TYPE-2 평균/구역 reject율 등 직원 간 의존이 있어 메모리에서 전체 실행합니다.
+"""
+
+import glob
+import hashlib
+import os
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+# 입력 frame → 직원 ID 컬럼
+INPUT_KEY_COLUMNS = {
+    'basic': 'Employee No',
+    'attendance': 'ID No',
+    '5prs': 'Inspector ID',
+    'aql': 'EMPLOYEE NO',
+}
+
+# 직원 ID가 없는 행 (변경되면 전체 영향)
+UNKEYED = ''
+
+# global digest 대상 (작업 디렉토리 기준)
+GLOBAL_INPUT_PATTERNS = (
+    'config_files/*.json',
+    'input_files/**/*',
+    'output_files/*_Complete_V*.csv',
+    'src/*.py',
+    'scripts/utils/*.py',
+)
+
+
+class IncrementalPlan(NamedTuple):
+    """--incremental 실행 계획"""
+    mode: str                      # 'up_to_date' / 'patch' / 'full'
+    reason: str
+    affected: Optional[Set[str]]   # patch: 변경 직원 + 상위 관리자 (9자리 Employee No)
+
+
+def normalize_employee_key(value) -> str:
+    """직원 ID → 9자리 문자열 (617100049 / 617100049.0 / '617100049' 동일), 없으면 UNKEYED"""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return UNKEYED
+    text = str(value).strip()
+    if not text or text.lower() == 'nan':
+        return UNKEYED
+    try:
+        return str(int(float(text))).zfill(9)
+    except (TypeError, ValueError, OverflowError):
+        return text
+
+
+def frame_row_hashes(df: pd.DataFrame, key_col: str) -> Dict[str, str]:
+    """
+    직원별 입력 행 hash (정규화: 모든 값 문자열, 컬럼명 순 정렬)
+
+    같은 직원의 여러 행은 파일 순서대로 묶어 hash 하나로 만듭니다.
+    key 컬럼이 없으면 전체를 UNKEYED 하나로 취급합니다.
+    """
+    if df is None:
+        return {}
+    normalized = df.reindex(columns=sorted(df.columns, key=str)).astype(str)
+    row_hashes = pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+
+    if key_col in df.columns:
+        keys = [normalize_employee_key(value) for value in df[key_col].tolist()]
+    else:
+        keys = [UNKEYED] * len(df)
+
+    grouped: Dict[str, List[int]] = {}
+    for pos, key in enumerate(keys):
+        grouped.setdefault(key, []).append(pos)
+
+    header = '\x1f'.join(str(col) for col in normalized.columns).encode('utf-8')
+    return {
+        key: hashlib.sha1(header + row_hashes[positions].tobytes()).hexdigest()
+        for key, positions in grouped.items()
+    }
+
+
+def input_row_hashes(data: Dict[str, pd.DataFrame], month_name: str) -> Dict[str, Dict[str, str]]:
+    """CompleteDataLoader.load_all_files 결과 → {frame: {employee_no: hash}}"""
+    return {
+        frame: frame_row_hashes(data.get(f"{month_name}_{frame}"), key_col)
+        for frame, key_col in INPUT_KEY_COLUMNS.items()
+    }
+
+
+def global_input_digest(exclude: Iterable[str]) -> str:
+    """직원별 hash 대상이 아닌 입력 파일들의 (경로, 크기, mtime) digest"""
+    excluded = {os.path.abspath(path) for path in exclude if path}
+    files = set()
+    for pattern in GLOBAL_INPUT_PATTERNS:
+        files.update(os.path.normpath(path) for path in glob.glob(pattern, recursive=True))
+
+    digest = hashlib.sha1()
+    for path in sorted(files):
+        if os.path.abspath(path) in excluded or not os.path.isfile(path):
+            continue
+        stat = os.stat(path)
+        digest.update(f"{path}\x1f{stat.st_size}\x1f{stat.st_mtime_ns}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def changed_employees(old: Dict[str, Dict[str, str]],
+                      new: Dict[str, Dict[str, str]]) -> Optional[Set[str]]:
+    """
+    frame별 hash 비교 → 변경/추가/삭제된 직원 집합
+
+    Returns:
+        직원 집합, ID 없는 행이 바뀌었으면 None (전체 영향)
+    """
+    changed: Set[str] = set()
+    for frame in set(old) | set(new):
+        old_hashes = old.get(frame, {})
+        new_hashes = new.get(frame, {})
+        for key in set(old_hashes) | set(new_hashes):
+            if old_hashes.get(key) != new_hashes.get(key):
+                if key == UNKEYED:
+                    return None
+                changed.add(key)
+    return changed
+
+
+def with_manager_ancestors(basic_df: pd.DataFrame, employees: Set[str],
+                           boss_col: str = 'direct boss name') -> Set[str]:
+    """
+    변경 직원 + manager 그래프상 모든 상위 관리자
+
+    상사는 create_manager_subordinate_mapping과 같이 boss 이름 → 같은 Full Name의 첫 행으로 찾습니다.
+    """
+    if basic_df is None or boss_col not in basic_df.columns or 'Full Name' not in basic_df.columns:
+        return set(employees)
+
+    first_id_by_name: Dict[str, str] = {}
+    boss_name_by_id: Dict[str, str] = {}
+    for emp_no, name, boss_name in zip(basic_df['Employee No'].tolist(), basic_df['Full Name'].tolist(),
+                                       basic_df[boss_col].tolist()):
+        key = normalize_employee_key(emp_no)
+        if isinstance(name, str):
+            first_id_by_name.setdefault(name, key)
+        if isinstance(boss_name, str) and boss_name.strip():
+            boss_name_by_id.setdefault(key, boss_name)
+
+    affected = set(employees)
+    for emp_no in employees:
+        cursor = emp_no
+        while True:
+            boss_id = first_id_by_name.get(boss_name_by_id.get(cursor))
+            if boss_id is None or boss_id in affected:
+                break
+            affected.add(boss_id)
+            cursor = boss_id
+    return affected
+
+
+class ChangeDetector:
+    """이전 실행 snapshot과 현재 입력 비교 → IncrementalPlan"""
+
+    def __init__(self, config, data: Dict[str, pd.DataFrame], resolved_paths: Dict[str, str], ledger):
+        """
+        초기화
+
+        Args:
+            config: MonthConfig
+            data: CompleteDataLoader.load_all_files 결과
+            resolved_paths: CompleteDataLoader.resolved_paths (attendance 변환 경로 포함)
+            ledger: HistoryLedger
+        """
+        self.config = config
+        self.data = data
+        self.ledger = ledger
+        self.month_name = config.month.full_name
+        self.output_file = os.path.join('output_files', f"{config.output_prefix}_Complete_V9.0_Complete.csv")
+
+        # 직원별 hash로 비교하는 파일(실제로 읽은 경로)은 global digest에서 제외
+        # attendance 원본은 변환 파일과 별도로 approved leave 계산에서 읽으므로 digest에 남김
+        self.hashed_files = {
+            resolved_paths.get(f"{self.month_name}_{frame}") for frame in INPUT_KEY_COLUMNS
+        } - {None}
+
+        self.row_hashes = input_row_hashes(data, self.month_name)
+
+    def global_digest(self) -> str:
+        """global digest (이번 달 결과 파일 제외)"""
+        own_outputs = glob.glob(os.path.join('output_files', f"{self.config.output_prefix}_*"))
+        return global_input_digest(self.hashed_files | set(own_outputs))
+
+    def plan(self) -> IncrementalPlan:
+        """이전 snapshot 대비 실행 계획"""
+        if not os.path.exists(self.output_file):
+            return IncrementalPlan('full', 'no previous output', None)
+
+        snapshot = self.ledger.load_input_snapshot(self.config.year, self.config.month.number)
+        if snapshot is None:
+            return IncrementalPlan('full', 'no input snapshot (or output changed since)', None)
+
+        old_digest, old_hashes = snapshot
+        if old_digest != self.global_digest():
+            return IncrementalPlan('full', 'config/history/code inputs changed', None)
+
+        changed = changed_employees(old_hashes, self.row_hashes)
+        if changed is None:
+            return IncrementalPlan('full', 'rows without employee ID changed', None)
+        if not changed:
+            return IncrementalPlan('up_to_date', 'no input changes', set())
+
+        affected = with_manager_ancestors(self.data.get(f"{self.month_name}_basic"), changed)
+        return IncrementalPlan('patch', f"{len(changed)} employees changed", affected)
+
+    def record(self):
+        """저장이 끝난 뒤 현재 입력을 snapshot으로 기록 (저장 중 생성된 파일까지 digest에 반영)"""
+        try:
+            self.ledger.record_input_snapshot(
+                self.config.year, self.config.month.number,
+                self.global_digest(), self.row_hashes, self.output_file
+            )
+        except Exception as e:
+            print(f"⚠️ Input snapshot write failed: {e}")
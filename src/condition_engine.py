@@ -0,0 +1,115 @@
+"""
+10대 조건 일괄 평가 엔진
+position_condition_matrix.json 기반 적용 조건 mask + 조건별 벡터 판정
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존 add_condition_evaluation_to_excel은 직원마다 self.month_data.loc[idx, ...]로
+조건 결과를 한 칸씩 기록했습니다. 이 모듈은:
+- (ROLE TYPE STD, QIP POSITION 1ST NAME) 조합별로 적용 조건을 한 번만 조회해 mask 생성
+- 각 조건을 전체 컬럼에 대한 numpy 식으로 판정
+- 결과 컬럼을 한 번에 기록 (기존 행 단위 기록과 같은 dtype/값 유지)
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, List, Optional, Sequence
+
+NOT_APPLICABLE = 'NOT_APPLICABLE'
+
+# cond_1 ~ cond_10 결과 컬럼 (순서 = 조건 번호)
+CONDITION_COLUMNS = [
+    'cond_1_attendance_rate', 'cond_2_unapproved_absence', 'cond_3_actual_working_days',
+    'cond_4_minimum_days', 'cond_5_aql_personal_failure', 'cond_6_aql_continuous',
+    'cond_7_aql_team_area', 'cond_8_area_reject', 'cond_9_5prs_pass_rate', 'cond_10_5prs_inspection_qty'
+]
+
+
+def build_applicability_masks(emp_types: Sequence, positions: Sequence,
+                              get_applicable: Callable) -> Dict[int, np.ndarray]:
+    """
+    조건 번호별 적용 mask
+
+    Args:
+        emp_types: 행별 ROLE TYPE STD
+        positions: 행별 QIP POSITION 1ST NAME
+        get_applicable: (emp_type, position) → applicable_conditions 리스트
+
+    Returns:
+        {조건 번호(1~10): bool 배열}
+    """
+    n = len(emp_types)
+    masks = {cond_no: np.zeros(n, dtype=bool) for cond_no in range(1, 11)}
+    combo_rows: Dict[tuple, List[int]] = {}
+    for pos, combo in enumerate(zip(emp_types, positions)):
+        combo_rows.setdefault(combo, []).append(pos)
+
+    for (emp_type, position), rows in combo_rows.items():
+        for cond_no in get_applicable(emp_type, position):
+            if cond_no in masks:
+                masks[cond_no][rows] = True
+    return masks
+
+
+def judge(applicable: np.ndarray, passed: np.ndarray,
+          not_evaluable: Optional[np.ndarray] = None) -> np.ndarray:
+    """적용 mask + 통과 mask → 'PASS'/'FAIL'/'NOT_APPLICABLE' 배열"""
+    result = np.where(passed, 'PASS', 'FAIL').astype(object)
+    if not_evaluable is not None:
+        result[not_evaluable] = NOT_APPLICABLE
+    result[~applicable] = NOT_APPLICABLE
+    return result
+
+
+def column_values(df: pd.DataFrame, col: str, default) -> np.ndarray:
+    """컬럼 값 배열 (컬럼이 없으면 default로 채운 배열)"""
+    if col in df.columns:
+        return df[col].to_numpy()
+    return np.full(len(df), default, dtype=object if isinstance(default, str) else None)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, (bool, np.bool_))
+
+
+def assign_like_loc(df: pd.DataFrame, col: str, values: Sequence):
+    """
+    행 순서대로 df.loc[idx, col] = value 를 반복한 것과 같은 결과로 컬럼 기록
+
+    - 새 컬럼/float 컬럼: 첫 문자열 전까지는 float, 이후 object로 바뀌며 값 그대로 보존
+    - object 컬럼: 값 그대로
+    """
+    values = list(values)
+    existing_object = col in df.columns and df[col].dtype == object
+    if existing_object:
+        df[col] = pd.Series(values, index=df.index, dtype=object)
+        return
+
+    first_other = next((i for i, v in enumerate(values) if not _is_number(v)), None)
+    if first_other is None:
+        df[col] = pd.Series(values, index=df.index, dtype='float64')
+        return
+
+    mixed = [float(v) for v in values[:first_other]] + values[first_other:]
+    df[col] = pd.Series(mixed, index=df.index, dtype=object)
+
+
+def summarize_conditions(results: Sequence[np.ndarray]):
+    """
+    조건 결과 배열들 → (적용 조건 수, 통과 수, 통과율 %)
+
+    NOT_APPLICABLE/N/A/None/NaN 결과는 적용 조건에서 제외
+    """
+    n = len(results[0]) if results else 0
+    applicable_count = np.zeros(n, dtype=int)
+    passed_count = np.zeros(n, dtype=int)
+    for result in results:
+        series = pd.Series(result)
+        counted = series.notna() & ~series.isin(['N/A', NOT_APPLICABLE])
+        applicable_count += counted.to_numpy()
+        passed_count += (counted & (series == 'PASS')).to_numpy()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pass_rate = np.where(applicable_count > 0, passed_count / np.maximum(applicable_count, 1) * 100, 0)
+    return applicable_count, passed_count, pass_rate
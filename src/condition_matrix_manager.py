@@ -4,12 +4,16 @@ Centralizes condition application logic using JSON configuration
 """
 
 import json
-import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 import logging
 
+try:
+    from position_matcher import PositionMatcher
+except ImportError:
+    from src.position_matcher import PositionMatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -68,21 +72,8 @@ class ConditionMatrixManager:
         }
     
     def _build_pattern_cache(self):
-        """Build regex patterns for position matching"""
-        self.pattern_cache = {}
-        
-        for type_key, type_positions in self.matrix.get('position_matrix', {}).items():
-            self.pattern_cache[type_key] = {}
-            
-            for pos_key, pos_config in type_positions.items():
-                if pos_key == 'default':
-                    continue
-                    
-                patterns = pos_config.get('patterns', [])
-                if patterns:
-                    # Create a regex pattern that matches any of the patterns
-                    pattern_str = '|'.join([re.escape(p) for p in patterns])
-                    self.pattern_cache[type_key][pos_key] = re.compile(pattern_str, re.IGNORECASE)
+        """Build the shared position matcher (compiled patterns + per-position LRU cache)"""
+        self.position_matcher = PositionMatcher(self.matrix)
     
     def get_applicable_conditions(self, employee_type: str, position: str) -> Tuple[List[int], List[int]]:
         """
@@ -103,13 +94,12 @@ class ConditionMatrixManager:
         # Get type configuration
         type_config = self.matrix.get('position_matrix', {}).get(employee_type, {})
         
-        # Try to match specific position
+        # Try to match specific position (cached per (type, position))
         matched_config = None
-        for pos_key, pattern in self.pattern_cache.get(employee_type, {}).items():
-            if pattern.search(position):
-                matched_config = type_config.get(pos_key)
-                logger.info(f"Matched position '{position}' to pattern '{pos_key}'")
-                break
+        pos_key = self.position_matcher.resolve_key(employee_type, position)
+        if pos_key is not None:
+            matched_config = type_config.get(pos_key)
+            logger.info(f"Matched position '{position}' to pattern '{pos_key}'")
         
         # Fall back to default if no match
         if not matched_config:
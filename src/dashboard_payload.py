@@ -0,0 +1,172 @@
+"""
+Dashboard 직원 payload 모듈
+직원 record 목록 → column 단위 + 문자열 사전 인코딩 payload (HTML에 JSON 그대로 삽입)
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존 dashboard HTML은 직원 목록을 base64 JSON으로 한 번, excel_dashboard_data 안의
+employee_data로 같은 행을 한 번 더 넣었고 base64가 다시 33%를 더해서 월별 파일이 약 2.8MB였습니다.
+이 모듈은:
+- encode_columns(records): record마다 반복되던 key를 column 이름 한 번으로, 반복 값이 많은
+  scalar column(TYPE, 직급, 조건 yes/no 등)은 dict + codes로 저장
+- script_json(obj): <script type="application/json"> 안에 그대로 넣을 수 있는 JSON ('<' escape, base64 없음)
+- decode_columns(payload): Python 쪽 복원 (분석 스크립트용, JS의 decodeColumnarPayload와 같은 규칙)
+- gzip_base64(obj): --payload gzip 모드의 압축 island (JS가 Worker + DecompressionStream으로 복원)
+- records_from_frame(df): DataFrame → record 목록 (column 단위 NaN → None, numpy → Python 타입)
+- encode_columns(records, clean=True): key 공백 정리 + NaN → null + 문자열 제어문자 정리를 column 단위로 적용
+
+payload 형식 (columnar-v1):
+    {"format": "columnar-v1", "rows": n,
+     "columns": [{"name": key, "values": [...]}                      # 일반 column
+                 {"name": key, "dict": [...], "codes": [...]}         # 사전 인코딩 column
+                 ... "absent": [행 번호, ...]                          # 해당 key가 없는 record (선택)]}
+"""
+
+import base64
+import gzip
+import json
+import math
+from typing import Dict, List
+
+import pandas as pd
+
+PAYLOAD_FORMAT = 'columnar-v1'
+
+# dashboard data 삽입 방식: inline (JSON/Base64 island, 기본) / gzip (압축 island 하나 + .data.json fallback)
+PAYLOAD_MODES = ('inline', 'gzip')
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _dictionary_encode(values: List) -> Dict:
+    """scalar 값 목록 → (dict, codes), 이득이 없으면 None"""
+    index: Dict = {}
+    uniques = []
+    codes = []
+    for value in values:
+        if not isinstance(value, _SCALAR_TYPES):
+            return None
+        # 1 / 1.0 / True는 JSON에서 다른 값이므로 type까지 key로 사용
+        key = (type(value), value)
+        code = index.get(key)
+        if code is None:
+            code = index[key] = len(uniques)
+            uniques.append(value)
+        codes.append(code)
+    if len(uniques) * 2 > len(values):
+        return None
+    return {'dict': uniques, 'codes': codes}
+
+
+def records_from_frame(df: pd.DataFrame) -> List[Dict]:
+    """
+    DataFrame → record(dict) 목록
+
+    행마다 셀 타입을 검사하던 방식과 같은 결과: NaN → None, numpy int/float/bool → Python 타입
+    """
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+
+def _clean_value(value):
+    """NaN → None, 문자열 제어문자(\r 제거, \n/\t → 공백) 정리, dict/list는 재귀"""
+    if isinstance(value, float):
+        return None if math.isnan(value) else value
+    if isinstance(value, dict):
+        return {key: _clean_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clean_value(item) for item in value]
+    if isinstance(value, str):
+        return value.replace('\r', '').replace('\n', ' ').replace('\t', ' ')
+    return value
+
+
+def _clean_column(values: List) -> List:
+    """column 값 정리 (column 타입을 한 번 보고 필요한 처리만)"""
+    kinds = {type(value) for value in values}
+    if kinds <= {str, type(None)}:
+        return [value.replace('\r', '').replace('\n', ' ').replace('\t', ' ')
+                if value and ('\r' in value or '\n' in value or '\t' in value) else value
+                for value in values]
+    if kinds <= {int, bool, type(None)}:
+        return values
+    if kinds <= {float, int, bool, type(None)}:
+        return [None if value != value else value for value in values]
+    return [_clean_value(value) for value in values]
+
+
+def _clean_key(key):
+    """'QIP POSITION 1ST  NAME' → 'QIP POSITION 1ST NAME'"""
+    return ' '.join(key.split()) if isinstance(key, str) else key
+
+
+def encode_columns(records: List[Dict], clean: bool = False) -> Dict:
+    """
+    record(dict) 목록 → columnar-v1 payload (column 순서 = key 최초 등장 순서)
+
+    clean=True이면 key 공백 정리, NaN → null, 문자열 제어문자 정리를 column 단위로 적용
+    """
+    names: Dict[str, None] = {}
+    for record in records:
+        for key in record:
+            if key not in names:
+                names[key] = None
+
+    if clean:
+        cleaned = {name: _clean_key(name) for name in names}
+        if len(set(cleaned.values())) < len(cleaned):
+            # 정리 후 같은 key가 되는 경우만 record 단위로 합침 (나중 값 우선)
+            records = [{cleaned[key]: value for key, value in record.items()} for record in records]
+            return encode_columns(records, clean=True)
+
+    columns = []
+    for name in names:
+        absent = [row for row, record in enumerate(records) if name not in record]
+        if absent:
+            present = set(range(len(records))).difference(absent)
+            values = [records[row][name] for row in sorted(present)]
+        else:
+            values = [record[name] for record in records]
+
+        if clean:
+            values = _clean_column(values)
+        column = {'name': cleaned[name] if clean else name}
+        encoded = _dictionary_encode(values)
+        if encoded is not None:
+            column.update(encoded)
+        else:
+            column['values'] = values
+        if absent:
+            column['absent'] = absent
+        columns.append(column)
+
+    return {'format': PAYLOAD_FORMAT, 'rows': len(records), 'columns': columns}
+
+
+def decode_columns(payload: Dict) -> List[Dict]:
+    """columnar-v1 payload → record(dict) 목록"""
+    if payload.get('format') != PAYLOAD_FORMAT:
+        raise ValueError(f"unsupported dashboard payload format: {payload.get('format')}")
+    records: List[Dict] = [{} for _ in range(payload['rows'])]
+    for column in payload['columns']:
+        if 'codes' in column:
+            values = [column['dict'][code] for code in column['codes']]
+        else:
+            values = column['values']
+        absent = set(column.get('absent', ()))
+        rows = (row for row in range(len(records)) if row not in absent)
+        for row, value in zip(rows, values):
+            records[row][column['name']] = value
+    return records
+
+
+def script_json(obj) -> str:
+    """<script type="application/json"> 안에 넣을 compact JSON ('</script>' 등 방지)"""
+    # JSON 구조 문자에는 '<'가 없으므로 문자열 안의 '<'만 escape 됨
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).replace('<', '\\u003c')
+
+
+def gzip_base64(obj) -> str:
+    """obj → compact JSON → gzip (mtime=0, 같은 입력이면 같은 출력) → Base64"""
+    raw = json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return base64.b64encode(gzip.compress(raw, compresslevel=9, mtime=0)).decode('ascii')
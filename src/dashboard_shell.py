@@ -0,0 +1,153 @@
+"""
+Dashboard app shell 배포 모듈 (docs/ GitHub Pages)
+정적 HTML/CSS/JS는 version별 shell 파일 하나로, 월별 값은 data/YYYY_MM.json.gz로 분리
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존 docs/Incentive_Dashboard_YYYY_MM_Version_9.0.html은 월마다 Bootstrap/Chart.js/D3 markup과
+번역, modal script를 통째로 다시 담고 있어서 selector.html에서 월을 바꿀 때마다 전부 다시 받았습니다.
+이 모듈은 compile된 dashboard template(src/dashboard_template.py)을 그대로 나눕니다:
+- shell: app/dashboard-shell.<hash>.js = 정적 조각 + slot 이름 + 월과 무관한 slot 값
+  (번역, position matrix, progression 표, auditor mapping: config 파일에서 만들어지는 값, STATIC_SLOTS)
+  배포할 때마다 현재 config로 다시 만들고, 파일명 hash = 내용 hash → template이나 config가 바뀌지 않으면 cache 유지
+  직전 shell 파일은 한 세대 보관 (cache된 dashboard.html이 이전 shell을 요청해도 404 없음)
+- 월별 data: data/YYYY_MM.json.gz (+ 압축 없는 .json fallback) = 나머지 slot 값 (직원 payload 포함)
+  월을 바꿀 때는 이 파일만 받음
+- dashboard.html?month=YYYY_MM: shell + data를 이어 붙여 문서를 그리는 작은 loader (templates/dashboard/shell.html)
+
+build version (build_version) = template + STATIC_SLOTS 값의 hash
+월별 data('shell')와 단독 HTML(<meta name="dashboard-build">)에 기록 → --missing-only 재생성 판단
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+from typing import Dict, Optional
+
+from src.dashboard_template import load_template
+
+SHELL_DIR = 'app'
+DATA_DIR = 'data'
+SHELL_PAGE = 'dashboard.html'
+DATA_FORMAT = 'dashboard-month-v2'
+
+# 월과 무관한 slot (config 파일에서 만들어짐) → 월별 data 대신 shell 파일에 한 번만
+CONFIG_SLOTS = ('translations_js', 'position_matrix_json', 'progression_rows', 'auditor_mapping_b64')
+STATIC_SLOTS = CONFIG_SLOTS + ('dashboard_build',)
+
+_BUILD_META = re.compile(rb'<meta name="dashboard-build" content="([0-9a-f]+)">')
+
+
+def month_key(year: int, month: int) -> str:
+    """월별 data 이름 (2025_11)"""
+    return f"{year}_{month:02d}"
+
+
+def _shell_parts():
+    return [[static, slot] for static, slot in load_template('dashboard.html').parts]
+
+
+def shell_version() -> str:
+    """현재 dashboard template의 version (정적 조각 + slot 이름의 hash)"""
+    raw = json.dumps(_shell_parts(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(raw).hexdigest()[:12]
+
+
+def build_version(static_values: Dict[str, str]) -> str:
+    """template(shell_version) + CONFIG_SLOTS 값의 hash (template이나 config가 바뀌면 달라짐)"""
+    config_values = {slot: static_values.get(slot, '') for slot in CONFIG_SLOTS}
+    raw = json.dumps([shell_version(), config_values], ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(raw).hexdigest()[:12]
+
+
+def read_html_build_version(path: str) -> Optional[str]:
+    """단독 dashboard HTML의 build version (<head>의 meta, 없거나 읽을 수 없으면 None)"""
+    try:
+        with open(path, 'rb') as f:
+            match = _BUILD_META.search(f.read(8192))
+    except OSError:
+        return None
+    return match.group(1).decode('ascii') if match else None
+
+
+def file_version(path: str) -> str:
+    """월별 data 파일 내용 hash (selector link의 ?v=, cache 무효화용)"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+def write_month_data(slot_values: Dict[str, str], data_dir: str, year: int, month: int) -> str:
+    """
+    월별 slot 값 저장 → data_dir/YYYY_MM.json.gz (+ .json)
+
+    STATIC_SLOTS 값은 월별 data에 넣지 않음 (write_shell이 배포 때 shell에 포함),
+    'shell'에는 이 data를 만든 build version 기록
+
+    Returns:
+        .json.gz 경로
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    data = {
+        'format': DATA_FORMAT,
+        'shell': slot_values['dashboard_build'],
+        'month': month_key(year, month),
+        'slots': {slot: value for slot, value in slot_values.items() if slot not in STATIC_SLOTS},
+    }
+    raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    base = os.path.join(data_dir, month_key(year, month))
+    with open(f"{base}.json", 'wb') as f:
+        f.write(raw)
+    with open(f"{base}.json.gz", 'wb') as f:
+        f.write(gzip.compress(raw, compresslevel=9, mtime=0))
+    return f"{base}.json.gz"
+
+
+def read_month_shell_version(path: str) -> Optional[str]:
+    """월별 data가 만들어진 build version (읽을 수 없거나 이전 data 형식이면 None)"""
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data.get('shell') if data.get('format') == DATA_FORMAT else None
+
+
+
+def write_shell(docs_dir: str, static_values: Dict[str, str]) -> str:
+    """
+    docs_dir에 app/dashboard-shell.<hash>.js와 dashboard.html 저장 (직전 shell 파일 하나만 남기고 이전 것은 삭제)
+
+    Args:
+        static_values: STATIC_SLOTS 값 (현재 config 기준, integrated_dashboard_final.static_slot_values)
+
+    Returns:
+        shell 파일 hash
+    """
+    shell = {'version': static_values['dashboard_build'], 'parts': _shell_parts(),
+             'static': {slot: static_values[slot] for slot in STATIC_SLOTS if slot in static_values}}
+    content = ('window.DASHBOARD_SHELL = '
+               + json.dumps(shell, ensure_ascii=False, separators=(',', ':')) + ';\n').encode('utf-8')
+    file_hash = hashlib.sha256(content).hexdigest()[:12]
+
+    shell_dir = os.path.join(docs_dir, SHELL_DIR)
+    os.makedirs(shell_dir, exist_ok=True)
+    shell_name = f"dashboard-shell.{file_hash}.js"
+
+    # 직전 shell(가장 최근 것) 하나는 보관: cache된 dashboard.html이 아직 그 파일을 참조할 수 있음
+    old_files = [file for file in glob.glob(os.path.join(shell_dir, 'dashboard-shell.*.js'))
+                 if os.path.basename(file) != shell_name]
+    old_files.sort(key=os.path.getmtime, reverse=True)
+    for old_file in old_files[1:]:
+        os.remove(old_file)
+
+    with open(os.path.join(shell_dir, shell_name), 'wb') as f:
+        f.write(content)
+
+    page = load_template('shell.html').render({'shell_file': f"{SHELL_DIR}/{shell_name}", 'data_dir': DATA_DIR})
+    with open(os.path.join(docs_dir, SHELL_PAGE), 'w', encoding='utf-8') as f:
+        f.write(page)
+    return file_hash
@@ -0,0 +1,114 @@
+"""
+Dashboard HTML template 모듈
+templates/dashboard/의 정적 HTML/CSS/JS를 한 번 compile해서 slot 값만 채워 출력
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존 generate_dashboard_html은 약 15,000줄의 f-string을 += 로 이어 붙이고,
+modal script에 .replace()를 8번 연쇄 적용해서 호출할 때마다 수 MB 문자열을 여러 번 복사했습니다.
+이 모듈은:
+- template 문법: {%name%} (slot), {%include file%} (같은 폴더의 파일을 compile 시 삽입)
+  JS 코드의 {{passed}} / ${...} 와 겹치지 않도록 {% %} 사용
+- compile 결과 = (정적 조각, slot 이름) 목록 → 프로세스 안에서 파일 경로 + mtime 기준 cache
+- render_to(out, values): 정적 조각과 slot 값을 순서대로 out.write (파일로 바로 streaming 가능)
+
+slot 값은 format(value) 로 문자열이 되므로 format spec(:02d, :,)이 필요한 값은 호출 쪽에서 미리 만듭니다.
+"""
+
+import io
+import os
+import re
+from typing import Dict, List, Mapping, Optional, Tuple
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates', 'dashboard')
+
+_TAG = re.compile(r'\{%(include )?([\w.]+)%\}')
+
+# (경로, mtime 목록) → CompiledTemplate
+_cache: Dict[str, Tuple[Tuple[float, ...], 'CompiledTemplate']] = {}
+
+
+class CompiledTemplate:
+    """정적 조각 + slot 목록"""
+
+    def __init__(self, parts: List[Tuple[str, Optional[str]]], files: List[str]):
+        self.parts = parts
+        self.files = files
+        self.slots = frozenset(slot for _, slot in parts if slot)
+
+    def slot_values(self, values: Mapping[str, object]) -> Dict[str, str]:
+        """slot별 출력 문자열 (값이 없는 slot이 있으면 KeyError)"""
+        missing = self.slots.difference(values)
+        if missing:
+            raise KeyError(f"template slots without value: {', '.join(sorted(missing))}")
+        return {slot: format(values[slot]) for slot in self.slots}
+
+    def render_to(self, out, values: Mapping[str, object]):
+        """slot을 채워 out(write 메서드가 있는 객체)에 순서대로 기록"""
+        rendered = self.slot_values(values)
+        write = out.write
+        for static, slot in self.parts:
+            write(static)
+            if slot:
+                write(rendered[slot])
+
+    def render(self, values: Mapping[str, object]) -> str:
+        """slot을 채운 전체 문자열"""
+        out = io.StringIO()
+        self.render_to(out, values)
+        return out.getvalue()
+
+
+def _read(path: str) -> str:
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def _compile(path: str, files: List[str], parts: List[Tuple[str, Optional[str]]], pending: List[str]):
+    """path를 parts에 펼침 (include는 재귀, 순환 include는 오류)"""
+    if path in pending:
+        raise ValueError(f"circular template include: {' -> '.join(pending + [path])}")
+    files.append(path)
+    text = _read(path)
+    position = 0
+    for match in _TAG.finditer(text):
+        static = text[position:match.start()]
+        if match.group(1):
+            parts.append((static, None))
+            include = os.path.join(os.path.dirname(path), match.group(2))
+            _compile(include, files, parts, pending + [path])
+        else:
+            parts.append((static, match.group(2)))
+        position = match.end()
+    parts.append((text[position:], None))
+
+
+def compile_template(path: str) -> CompiledTemplate:
+    """template 파일 compile (인접한 정적 조각은 합침)"""
+    files: List[str] = []
+    raw: List[Tuple[str, Optional[str]]] = []
+    _compile(path, files, raw, [])
+
+    parts: List[Tuple[str, Optional[str]]] = []
+    static = ''
+    for text, slot in raw:
+        static += text
+        if slot:
+            parts.append((static, slot))
+            static = ''
+    parts.append((static, None))
+    return CompiledTemplate(parts, files)
+
+
+def load_template(name: str, template_dir: str = TEMPLATE_DIR) -> CompiledTemplate:
+    """compile된 template (include된 파일까지 mtime이 같으면 cache 재사용)"""
+    path = os.path.join(template_dir, name)
+    cached = _cache.get(path)
+    if cached is not None:
+        mtimes, template = cached
+        if mtimes == tuple(os.path.getmtime(file) for file in template.files):
+            return template
+    template = compile_template(path)
+    _cache[path] = (tuple(os.path.getmtime(file) for file in template.files), template)
+    return template
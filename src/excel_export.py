@@ -0,0 +1,146 @@
+"""
+결과 Excel background export 모듈
+CSV 저장 직후 XLSX를 background thread에서 streaming(write-only) 방식으로 생성
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존 save_results는 CSV 저장 후 같은 frame을 DataFrame.to_excel로 다시 저장했고,
+셀마다 openpyxl Cell 객체를 만드는 이 단계가 전체 실행에서 가장 느렸습니다.
+이 모듈은:
+- openpyxl write-only workbook으로 행을 바로 기록 (셀 객체를 메모리에 모으지 않음, 메모리 일정)
+- export를 단일 background worker에서 실행하고 ExcelExportHandle 반환 (dashboard 단계는 기다리지 않음)
+- 임시 파일에 저장 후 교체 → 다른 단계가 작성 중인 XLSX를 읽지 않음
+
+worker thread는 non-daemon이므로 프로세스 종료 시 남은 export가 끝날 때까지 기다립니다.
+"""
+
+import math
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import List, Optional
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+
+# export는 순서대로 하나씩 (batch mode에서 여러 달 동시 기록 방지)
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+# 아직 진행 중이거나 실패한 export (성공한 export는 끝나는 즉시 제거)
+_pending: List['ExcelExportHandle'] = []
+
+# DataFrame.to_excel 헤더 스타일과 동일
+_THIN = Side(style='thin')
+HEADER_FONT = Font(bold=True)
+HEADER_BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='top')
+
+
+class ExcelExportHandle:
+    """background Excel export 완료 handle"""
+
+    def __init__(self, excel_file: str, future: Future):
+        self.excel_file = excel_file
+        self._future = future
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        export 완료 대기
+
+        Returns:
+            저장된 XLSX 경로 (실패 시 None), timeout 초과 시 TimeoutError
+        """
+        try:
+            return self._future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise
+        except Exception as e:
+            print(f"⚠️ Excel file created failure: {self.excel_file} ({e})")
+            return None
+
+
+def _cell_value(value):
+    """DataFrame 값 → openpyxl 값 (to_excel과 같은 NaN/inf/NaT 처리)"""
+    if value is None or value is pd.NaT:
+        return None
+    if isinstance(value, float):
+        if math.isnan(value):
+            return None
+        if math.isinf(value):
+            return 'inf' if value > 0 else '-inf'
+    return value
+
+
+def write_excel_streaming(df: pd.DataFrame, excel_file: str, sheet_name: str = 'Sheet1') -> str:
+    """DataFrame → XLSX (write-only, index 없음, to_excel과 같은 헤더 스타일)"""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+
+    header = []
+    for col in df.columns:
+        cell = WriteOnlyCell(sheet, value=str(col))
+        cell.font = HEADER_FONT
+        cell.border = HEADER_BORDER
+        cell.alignment = HEADER_ALIGNMENT
+        header.append(cell)
+    sheet.append(header)
+
+    columns = [df[col].tolist() for col in df.columns]
+    for row in zip(*columns):
+        sheet.append([_cell_value(value) for value in row])
+
+    temp_file = f"{excel_file}.tmp"
+    try:
+        workbook.save(temp_file)
+        os.replace(temp_file, excel_file)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+    return excel_file
+
+
+def _export(df: pd.DataFrame, excel_file: str) -> str:
+    write_excel_streaming(df, excel_file)
+    print(f"✅ Excel file 저장 완료: {excel_file}")
+    return excel_file
+
+
+def _forget_finished(handle: ExcelExportHandle):
+    """성공한 export handle을 _pending에서 제거 (실패는 wait_for_exports가 보고하도록 유지)"""
+    if handle._future.exception() is not None:
+        return
+    with _executor_lock:
+        if handle in _pending:
+            _pending.remove(handle)
+
+
+def export_excel_async(df: pd.DataFrame, excel_file: str) -> ExcelExportHandle:
+    """
+    XLSX export를 background worker에 등록
+
+    frame은 복사해서 넘기므로 호출 후 원본을 수정해도 됩니다.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='excel-export')
+        handle = ExcelExportHandle(excel_file, _executor.submit(_export, df.copy(), excel_file))
+        _pending.append(handle)
+    # lock 밖에서 등록 (이미 끝난 future면 callback이 바로 실행됨)
+    handle._future.add_done_callback(lambda _: _forget_finished(handle))
+    print(f"📄 Excel export started in background: {excel_file}")
+    return handle
+
+
+def wait_for_exports(timeout: Optional[float] = None) -> bool:
+    """등록된 모든 export 완료 대기 → 전부 성공이면 True"""
+    with _executor_lock:
+        handles = list(_pending)
+        _pending.clear()
+    return all([handle.wait(timeout) is not None for handle in handles])
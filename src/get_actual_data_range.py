@@ -8,6 +8,11 @@ import pandas as pd
 import os
 from datetime import datetime
 
+try:
+    from src.input_file_cache import read_input_csv
+except ImportError:
+    from input_file_cache import read_input_csv
+
 def get_attendance_date_range(month, year):
     """출근 데이터의 실제 날짜 범위 반환"""
     try:
@@ -15,7 +20,7 @@ def get_attendance_date_range(month, year):
         if not os.path.exists(file_path):
             return None, None
 
-        df = pd.read_csv(file_path)
+        df = read_input_csv(file_path, normalized=True)
 
         # Work Date 컬럼 파싱
         if 'Work Date' in df.columns:
@@ -62,7 +67,7 @@ def get_5prs_date_range(month, year):
         if not os.path.exists(file_path):
             return None, None
 
-        df = pd.read_csv(file_path)
+        df = read_input_csv(file_path, normalized=True)
 
         # Date 관련 컬럼 찾기
         date_cols = [col for col in df.columns if 'date' in col.lower() or 'Date' in col]
@@ -0,0 +1,474 @@
+"""
+직원 월별 이력 ledger 모듈
+월별 결과(연속 개월, 인센티브)와 AQL REPORT 요약(직원별 FAIL 건수)을 SQLite에 누적 저장
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존에는 매 실행마다:
+- 이전 달 output_QIP_incentive_*_Complete_V*.csv 전체를 V9.1 → V9.0 → V8.02 순서로 다시 읽고
+- AQL history 폴더의 모든 REPORT를 다시 파싱해 3개월 연속 FAIL을 계산했습니다.
+
+이 모듈은:
+- step1 실행 종료 시 해당 월 결과 중 다음 달 계산에 필요한 컬럼만 기록
+- 이전 달 조회는 원본 CSV 경로 + 크기 + mtime이 같으면 ledger에서 바로 반환
+- 기록이 없거나 원본이 바뀐 월만 해당 CSV 한 개를 읽어 backfill (전체 재스캔 없음)
+- AQL REPORT는 파일별 요약(행 수, MONTH, 직원별 FAIL 건수, BUILDING)만 저장
+- --incremental 실행의 입력 snapshot (직원별 입력 행 hash + 그 외 입력 digest) 저장
+
+저장 위치는 .cache/history_ledger.sqlite 입니다.
+파일이 지워져도 다음 실행에서 필요한 월만 output CSV로부터 다시 채워집니다.
+"""
+
+import io
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    from aql_history_reader import EMPLOYEE_ID_COLUMN
+except ImportError:
+    from src.aql_history_reader import EMPLOYEE_ID_COLUMN
+
+DEFAULT_LEDGER_PATH = '.cache/history_ledger.sqlite'
+LEDGER_FORMAT_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ledger_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS month_sources (
+    source_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_file TEXT UNIQUE NOT NULL,
+    size INTEGER,
+    mtime REAL,
+    year INTEGER,
+    month INTEGER,
+    requested_columns TEXT,
+    columns TEXT,
+    row_count INTEGER,
+    recorded_at TEXT
+);
+CREATE TABLE IF NOT EXISTS employee_months (
+    source_id INTEGER NOT NULL,
+    row_no INTEGER NOT NULL,
+    employee_no TEXT,
+    incentive REAL,
+    continuous_months REAL,
+    fields TEXT,
+    PRIMARY KEY (source_id, row_no)
+);
+CREATE INDEX IF NOT EXISTS idx_employee_months_employee ON employee_months (employee_no);
+CREATE TABLE IF NOT EXISTS aql_reports (
+    source_file TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime REAL,
+    month_name TEXT,
+    loaded INTEGER,
+    row_count INTEGER,
+    valid_rows INTEGER,
+    month_value REAL,
+    has_building INTEGER,
+    recorded_at TEXT
+);
+CREATE TABLE IF NOT EXISTS aql_employees (
+    source_file TEXT NOT NULL,
+    employee_no TEXT NOT NULL,
+    failures INTEGER,
+    building TEXT,
+    PRIMARY KEY (source_file, employee_no)
+);
+CREATE TABLE IF NOT EXISTS input_snapshots (
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    global_digest TEXT,
+    output_file TEXT,
+    output_size INTEGER,
+    output_mtime REAL,
+    recorded_at TEXT,
+    PRIMARY KEY (year, month)
+);
+CREATE TABLE IF NOT EXISTS input_row_hashes (
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    frame TEXT NOT NULL,
+    employee_no TEXT NOT NULL,
+    row_hash TEXT,
+    PRIMARY KEY (year, month, frame, employee_no)
+);
+"""
+
+
+class AqlMonthSummary(NamedTuple):
+    """AQL REPORT 한 달 요약 (3개월 연속 FAIL 판정용)"""
+    month_name: str
+    loaded: bool                         # 파일 로드 성공 여부
+    row_count: int                       # 월 필터링 후 행 수 (0 = 사용 불가)
+    valid_rows: int                      # 빈 행 제외 건수
+    month_value: Optional[float]         # 첫 행의 MONTH 값 (없으면 None)
+    failures: Dict[str, int]             # {EMPLOYEE_ID: FAIL 건수}
+    buildings: Optional[Dict[str, Any]]  # {EMPLOYEE_ID: 첫 행 BUILDING} (BUILDING 컬럼 없으면 None)
+
+
+def _json_value(value):
+    """numpy 스칼라 → JSON 저장 가능한 Python 값 (NaN은 그대로 유지)"""
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if np.isnan(result) else result
+
+
+def _normalize_employee_no(value) -> Optional[str]:
+    """output CSV Employee No → 9자리 문자열 (조회용 인덱스)"""
+    try:
+        return str(int(value)).zfill(9) if pd.notna(value) else None
+    except (TypeError, ValueError):
+        return None
+
+
+def summarize_aql_month(df: Optional[pd.DataFrame], month_name: str) -> AqlMonthSummary:
+    """
+    월 필터링이 끝난 AQL REPORT → 요약
+
+    Args:
+        df: load_aql_history 결과 (None 가능)
+        month_name: 파일명 기준 월 이름 (예: 'NOVEMBER')
+    """
+    if df is None or df.empty:
+        return AqlMonthSummary(month_name, df is not None, 0, 0, None, {}, None)
+
+    month_value = None
+    if 'MONTH' in df.columns:
+        month_value = _to_float(df['MONTH'].iloc[0])
+
+    failures: Dict[str, int] = {}
+    buildings = None
+    if EMPLOYEE_ID_COLUMN in df.columns:
+        valid_df = df[df[EMPLOYEE_ID_COLUMN].notna()]
+        if 'RESULT' in valid_df.columns:
+            fail_df = valid_df[valid_df['RESULT'].str.upper() == 'FAIL']
+            failures = {emp_id: int(count) for emp_id, count in fail_df.groupby(EMPLOYEE_ID_COLUMN).size().items()}
+        if 'BUILDING' in valid_df.columns:
+            first_rows = valid_df.drop_duplicates(EMPLOYEE_ID_COLUMN)
+            buildings = dict(zip(first_rows[EMPLOYEE_ID_COLUMN], first_rows['BUILDING']))
+
+    return AqlMonthSummary(
+        month_name, True, len(df), len(df.dropna(how='all')), month_value, failures, buildings
+    )
+
+
+def _file_signature(file_path: str):
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime
+
+
+class HistoryLedger:
+    """월별 직원 이력 + AQL REPORT 요약 저장소 (SQLite)"""
+
+    def __init__(self, db_path: str = DEFAULT_LEDGER_PATH):
+        self.db_path = db_path
+        self.hits = 0
+        self.backfills = 0
+        self._conn = None
+
+    # ------------------------------------------------------------------
+    # 연결 / 스키마
+    # ------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            # batch mode에서 여러 worker가 동시에 기록할 수 있으므로 lock 대기 시간 확보
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.executescript(_SCHEMA)
+            row = conn.execute("SELECT value FROM ledger_meta WHERE key = 'version'").fetchone()
+            if row is None or row[0] != str(LEDGER_FORMAT_VERSION):
+                # 형식이 바뀌면 비우고 다시 채움 (원본 CSV/REPORT에서 backfill 가능)
+                with conn:
+                    for table in ('month_sources', 'employee_months', 'aql_reports', 'aql_employees',
+                                  'input_snapshots', 'input_row_hashes'):
+                        conn.execute(f"DELETE FROM {table}")
+                    conn.execute(
+                        "INSERT OR REPLACE INTO ledger_meta (key, value) VALUES ('version', ?)",
+                        (str(LEDGER_FORMAT_VERSION),)
+                    )
+            self._conn = conn
+        return self._conn
+
+    def __getstate__(self):
+        # SQLite 연결은 프로세스 간 전달 불가 → 받는 쪽에서 다시 연결
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        return state
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ------------------------------------------------------------------
+    # 월별 결과
+    # ------------------------------------------------------------------
+    def record_frame(self, source_file: str, year: int, month: int,
+                     df: pd.DataFrame, columns: List[str]) -> int:
+        """
+        월 결과 기록 (source_file 기준으로 해당 월 partition 교체)
+
+        Args:
+            source_file: 결과 CSV 경로 (df와 같은 내용이 저장된 파일)
+            year, month: 결과 연월
+            df: 결과 DataFrame (메모리 또는 CSV에서 읽은 것)
+            columns: 저장할 컬럼 ('Employee No' 외, 없는 컬럼은 무시)
+
+        Returns:
+            기록한 행 수
+        """
+        present = [col for col in columns if col in df.columns and col != 'Employee No']
+        subset = df[['Employee No'] + present] if 'Employee No' in df.columns else df[present]
+
+        # CSV 저장 후 다시 읽은 것과 같은 값/타입으로 맞춤
+        buffer = io.StringIO()
+        subset.to_csv(buffer, index=False)
+        buffer.seek(0)
+        frame = pd.read_csv(buffer)
+
+        return self._store_frame(source_file, year, month, frame, columns, present)
+
+    def _store_frame(self, source_file: str, year: int, month: int,
+                     frame: pd.DataFrame, requested: List[str], present: List[str]) -> int:
+        size, mtime = _file_signature(source_file)
+        key = os.path.abspath(source_file)
+        has_id = 'Employee No' in frame.columns
+        stored_columns = (['Employee No'] if has_id else []) + present
+
+        rows = []
+        for row_no, record in enumerate(frame[stored_columns].to_dict('records')):
+            fields = {col: _json_value(val) for col, val in record.items()}
+            rows.append((
+                row_no,
+                _normalize_employee_no(fields.get('Employee No')) if has_id else None,
+                _to_float(fields.get('Final Incentive amount')),
+                _to_float(fields.get('Continuous_Months')),
+                json.dumps(fields, ensure_ascii=False)
+            ))
+
+        conn = self._connect()
+        with conn:
+            old = conn.execute("SELECT source_id FROM month_sources WHERE source_file = ?", (key,)).fetchone()
+            if old is not None:
+                conn.execute("DELETE FROM employee_months WHERE source_id = ?", (old[0],))
+                conn.execute("DELETE FROM month_sources WHERE source_id = ?", (old[0],))
+            cursor = conn.execute(
+                "INSERT INTO month_sources (source_file, size, mtime, year, month, requested_columns,"
+                " columns, row_count, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, size, mtime, year, month, json.dumps(list(requested), ensure_ascii=False),
+                 json.dumps(stored_columns, ensure_ascii=False), len(rows),
+                 datetime.now().isoformat(timespec='seconds'))
+            )
+            source_id = cursor.lastrowid
+            conn.executemany(
+                "INSERT INTO employee_months (source_id, row_no, employee_no, incentive,"
+                " continuous_months, fields) VALUES (?, ?, ?, ?, ?, ?)",
+                [(source_id,) + row for row in rows]
+            )
+        return len(rows)
+
+    def _find_source(self, source_file: str, columns: List[str]):
+        """원본 파일이 바뀌지 않았고 요청 컬럼이 모두 기록된 경우 (source_id, columns) 반환"""
+        key = os.path.abspath(source_file)
+        row = self._connect().execute(
+            "SELECT source_id, size, mtime, requested_columns, columns FROM month_sources WHERE source_file = ?",
+            (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        source_id, size, mtime, requested_json, columns_json = row
+        if (size, mtime) != _file_signature(source_file):
+            return None
+        if not set(columns) <= set(json.loads(requested_json)):
+            return None
+        return source_id, json.loads(columns_json)
+
+    def load_month(self, source_file: str, year: int, month: int,
+                   columns: List[str]) -> Optional[pd.DataFrame]:
+        """
+        이전 달 결과 조회 (없거나 원본이 바뀌었으면 그 CSV 한 개만 읽어 backfill)
+
+        Returns:
+            'Employee No' + 기록된 컬럼 DataFrame (원본 CSV 행 순서), 실패 시 None
+        """
+        if not source_file or not os.path.exists(source_file):
+            return None
+        try:
+            found = self._find_source(source_file, columns)
+            if found is None:
+                wanted = set(columns) | {'Employee No'}
+                frame = pd.read_csv(source_file, encoding='utf-8-sig', usecols=lambda col: col in wanted)
+                present = [col for col in columns if col in frame.columns and col != 'Employee No']
+                self._store_frame(source_file, year, month, frame, columns, present)
+                self.backfills += 1
+                found = self._find_source(source_file, columns)
+                if found is None:
+                    return None
+            else:
+                self.hits += 1
+
+            source_id, stored_columns = found
+            records = [
+                json.loads(fields) for (fields,) in self._connect().execute(
+                    "SELECT fields FROM employee_months WHERE source_id = ? ORDER BY row_no", (source_id,)
+                )
+            ]
+            return pd.DataFrame.from_records(records, columns=stored_columns)
+        except (sqlite3.Error, OSError, ValueError) as e:
+            print(f"⚠️ History ledger read failed ({os.path.basename(source_file)}): {e}")
+            return None
+
+    # ------------------------------------------------------------------
+    # AQL REPORT 요약
+    # ------------------------------------------------------------------
+    def get_aql_summary(self, source_file: str, month_name: str,
+                        loader: Callable[[], Optional[pd.DataFrame]]) -> AqlMonthSummary:
+        """
+        AQL REPORT 요약 조회 (파일이 바뀌지 않았으면 파싱 없이 반환)
+
+        Args:
+            source_file: AQL REPORT 경로
+            month_name: 파일명 기준 월 이름
+            loader: 캐시 miss 시 월 필터링된 DataFrame을 반환하는 함수
+        """
+        if not os.path.exists(source_file):
+            return summarize_aql_month(loader(), month_name)
+
+        key = os.path.abspath(source_file)
+        signature = _file_signature(source_file)
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT size, mtime, month_name, loaded, row_count, valid_rows, month_value, has_building"
+                " FROM aql_reports WHERE source_file = ?", (key,)
+            ).fetchone()
+            if row is not None and (row[0], row[1]) == signature and row[2] == month_name:
+                self.hits += 1
+                failures = {}
+                buildings = {} if row[7] else None
+                for emp_id, fail_count, building in conn.execute(
+                    "SELECT employee_no, failures, building FROM aql_employees WHERE source_file = ?", (key,)
+                ):
+                    if fail_count:
+                        failures[emp_id] = fail_count
+                    if buildings is not None and building is not None:
+                        buildings[emp_id] = json.loads(building)
+                return AqlMonthSummary(month_name, bool(row[3]), row[4], row[5], row[6], failures, buildings)
+        except sqlite3.Error as e:
+            print(f"⚠️ History ledger read failed ({os.path.basename(source_file)}): {e}")
+            return summarize_aql_month(loader(), month_name)
+
+        summary = summarize_aql_month(loader(), month_name)
+        self.backfills += 1
+        try:
+            self._store_aql_summary(key, signature, summary)
+        except sqlite3.Error as e:
+            print(f"⚠️ History ledger write failed ({os.path.basename(source_file)}): {e}")
+        return summary
+
+    def _store_aql_summary(self, key: str, signature, summary: AqlMonthSummary):
+        employees = set(summary.failures)
+        if summary.buildings is not None:
+            employees |= set(summary.buildings)
+
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM aql_employees WHERE source_file = ?", (key,))
+            conn.execute(
+                "INSERT OR REPLACE INTO aql_reports (source_file, size, mtime, month_name, loaded, row_count,"
+                " valid_rows, month_value, has_building, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, signature[0], signature[1], summary.month_name, int(summary.loaded), summary.row_count,
+                 summary.valid_rows, summary.month_value, int(summary.buildings is not None),
+                 datetime.now().isoformat(timespec='seconds'))
+            )
+            conn.executemany(
+                "INSERT INTO aql_employees (source_file, employee_no, failures, building) VALUES (?, ?, ?, ?)",
+                [
+                    (key, emp_id, summary.failures.get(emp_id, 0),
+                     json.dumps(_json_value(summary.buildings[emp_id]), ensure_ascii=False)
+                     if summary.buildings is not None and emp_id in summary.buildings else None)
+                    for emp_id in employees
+                ]
+            )
+
+    # ------------------------------------------------------------------
+    # 입력 snapshot (--incremental)
+    # ------------------------------------------------------------------
+    def record_input_snapshot(self, year: int, month: int, global_digest: str,
+                              row_hashes: Dict[str, Dict[str, str]], output_file: str):
+        """
+        월 입력 snapshot 기록 (해당 월 기존 snapshot 교체)
+
+        Args:
+            global_digest: 직원별로 나눌 수 없는 입력(config, 이전 달 결과, 코드 등) digest
+            row_hashes: {frame: {employee_no: row hash}}
+            output_file: 이 입력으로 저장한 결과 CSV
+        """
+        size, mtime = _file_signature(output_file)
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM input_row_hashes WHERE year = ? AND month = ?", (year, month))
+            conn.execute(
+                "INSERT OR REPLACE INTO input_snapshots (year, month, global_digest, output_file,"
+                " output_size, output_mtime, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (year, month, global_digest, os.path.abspath(output_file), size, mtime,
+                 datetime.now().isoformat(timespec='seconds'))
+            )
+            conn.executemany(
+                "INSERT INTO input_row_hashes (year, month, frame, employee_no, row_hash) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (year, month, frame, employee_no, row_hash)
+                    for frame, hashes in row_hashes.items()
+                    for employee_no, row_hash in hashes.items()
+                ]
+            )
+
+    def load_input_snapshot(self, year: int, month: int):
+        """
+        월 입력 snapshot 조회
+
+        Returns:
+            (global_digest, {frame: {employee_no: row hash}}), 없거나 결과 CSV가 그 뒤에 바뀌었으면 None
+        """
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT global_digest, output_file, output_size, output_mtime FROM input_snapshots"
+                " WHERE year = ? AND month = ?", (year, month)
+            ).fetchone()
+            if row is None:
+                return None
+            global_digest, output_file, size, mtime = row
+            if not os.path.exists(output_file) or (size, mtime) != _file_signature(output_file):
+                return None
+
+            row_hashes: Dict[str, Dict[str, str]] = {}
+            for frame, employee_no, row_hash in conn.execute(
+                "SELECT frame, employee_no, row_hash FROM input_row_hashes WHERE year = ? AND month = ?",
+                (year, month)
+            ):
+                row_hashes.setdefault(frame, {})[employee_no] = row_hash
+            return global_digest, row_hashes
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ History ledger read failed (input snapshot): {e}")
+            return None
@@ -0,0 +1,195 @@
+"""
+입력 CSV 디스크 캐시 모듈
+월별 입력 파일(basic manpower, attendance, 5PRS, AQL 등)의 파싱 결과를 재사용
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존에는 매 실행마다 4개 인코딩 × 4개 구분자를 시도하며 read_csv를 반복했습니다.
+이 모듈은 파싱된 DataFrame과 감지된 인코딩/구분자를 .cache/input_frames/에 저장하고,
+원본 파일이 바뀌지 않았으면 캐시에서 바로 로드합니다.
+
+캐시 유효성:
+- 경로 + 크기 + mtime 일치 → 즉시 캐시 사용
+- mtime만 바뀐 경우(재다운로드 등) → 내용 해시(sha1) 비교 후 재사용
+
+저장 형식은 pandas pickle입니다 (pyarrow 불필요, dtype/혼합 object 컬럼까지 그대로 보존).
+"""
+
+import hashlib
+import json
+import os
+import pandas as pd
+from typing import Dict, Optional, Tuple
+
+DEFAULT_CACHE_DIR = '.cache/input_frames'
+CACHE_FORMAT_VERSION = 1
+
+# CompleteDataLoader.load_single_file과 동일한 시도 순서
+ENCODINGS = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr']
+SEPARATORS = [',', ';', '\t', '|']
+
+# 정규화(typed) 뷰에서 9자리 문자열로 변환할 직원 ID 컬럼
+EMPLOYEE_ID_COLUMNS = ['Employee No', 'EMPLOYEE NO', 'ID No']
+
+
+def sniff_and_read_csv(file_path: str) -> Tuple[Optional[pd.DataFrame], Optional[str], Optional[str]]:
+    """
+    인코딩/구분자 자동 감지하여 CSV 로드
+
+    Returns:
+        (DataFrame, encoding, sep) - 실패 시 (None, None, None)
+    """
+    for enc in ENCODINGS:
+        for s in SEPARATORS:
+            try:
+                df = pd.read_csv(file_path, sep=s, encoding=enc)
+                if len(df) > 0 and len(df.columns) > 1:
+                    return df, enc, s
+            except Exception:
+                continue
+    return None, None, None
+
+
+def _file_sha1(file_path: str) -> str:
+    """파일 내용 해시"""
+    sha1 = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def normalize_input_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    typed 뷰 생성: 직원 ID는 9자리 문자열, 'date'가 들어간 컬럼은 datetime
+
+    원본 dtype을 그대로 기대하는 step1 계산에는 사용하지 않습니다.
+    """
+    df = df.copy()
+    for col in EMPLOYEE_ID_COLUMNS:
+        if col in df.columns:
+            def to_fixed_width(x):
+                if pd.isna(x) or str(x).strip() == '':
+                    return ''
+                emp_str = str(x).strip()
+                if emp_str.endswith('.0'):
+                    emp_str = emp_str[:-2]
+                return emp_str.zfill(9)
+            df[col] = df[col].map(to_fixed_width)
+
+    for col in df.columns:
+        if isinstance(col, str) and 'date' in col.lower() and df[col].dtype == object:
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+    return df
+
+
+class InputFileCache:
+    """입력 CSV 파싱 결과 캐시"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, enabled: bool = True):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_paths(self, file_path: str, normalized: bool) -> Tuple[str, str]:
+        """캐시 엔트리 경로 (원본 절대경로 기준)"""
+        key = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()[:16]
+        suffix = '_typed' if normalized else ''
+        base = os.path.join(self.cache_dir, f"{key}{suffix}")
+        return base + '.pkl', base + '.json'
+
+    def _read_meta(self, meta_path: str) -> Dict:
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _write_entry(self, frame_path: str, meta_path: str, df: pd.DataFrame, meta: Dict):
+        """캐시 저장 (실패해도 계산에는 영향 없음)"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            df.to_pickle(frame_path)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"⚠️ Input cache write failed ({os.path.basename(meta['source'])}): {e}")
+
+    def load_csv(self, file_path: str, normalized: bool = False) -> Optional[pd.DataFrame]:
+        """
+        CSV 로드 (캐시 우선)
+
+        Args:
+            file_path: 원본 CSV 경로
+            normalized: True면 normalize_input_frame 적용된 typed 뷰 반환
+
+        Returns:
+            DataFrame 또는 None (파일 없음/파싱 실패)
+        """
+        if not file_path or not os.path.exists(file_path):
+            return None
+
+        if not self.enabled:
+            df, _, _ = sniff_and_read_csv(file_path)
+            if df is not None and normalized:
+                df = normalize_input_frame(df)
+            return df
+
+        stat = os.stat(file_path)
+        frame_path, meta_path = self._entry_paths(file_path, normalized)
+        meta = self._read_meta(meta_path)
+
+        if meta.get('version') == CACHE_FORMAT_VERSION and os.path.exists(frame_path):
+            same_stat = meta.get('size') == stat.st_size and meta.get('mtime') == stat.st_mtime
+            same_content = same_stat or (meta.get('size') == stat.st_size and meta.get('sha1') == _file_sha1(file_path))
+            if same_content:
+                try:
+                    df = pd.read_pickle(frame_path)
+                    if not same_stat:
+                        # 내용은 같고 mtime만 변경 → 메타만 갱신
+                        meta['mtime'] = stat.st_mtime
+                        self._write_entry(frame_path, meta_path, df, meta)
+                    self.hits += 1
+                    return df
+                except Exception:
+                    pass
+
+        self.misses += 1
+        df, encoding, sep = sniff_and_read_csv(file_path)
+        if df is None:
+            return None
+        if normalized:
+            df = normalize_input_frame(df)
+
+        self._write_entry(frame_path, meta_path, df, {
+            'version': CACHE_FORMAT_VERSION,
+            'source': os.path.abspath(file_path),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'sha1': _file_sha1(file_path),
+            'encoding': encoding,
+            'sep': sep,
+            'normalized': normalized,
+            'rows': len(df),
+            'dtypes': {str(col): str(dtype) for col, dtype in df.dtypes.items()}
+        })
+        return df
+
+
+# 프로세스 공용 인스턴스
+_default_cache = None
+
+
+def get_input_cache() -> InputFileCache:
+    """기본 캐시 인스턴스 반환"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = InputFileCache()
+    return _default_cache
+
+
+def read_input_csv(file_path: str, normalized: bool = False) -> Optional[pd.DataFrame]:
+    """기본 캐시를 통한 입력 CSV 로드"""
+    return get_input_cache().load_csv(file_path, normalized=normalized)
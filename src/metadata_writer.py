@@ -0,0 +1,346 @@
+"""
+계산 메타데이터 writer / reader
+결과 DataFrame 컬럼에서 직원별 조건 충족 정보를 만들어 JSON + JSONL로 스트리밍 저장
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존 save_calculation_metadata는 iterrows로 행마다 Series를 만들고
+전체 metadata dict를 메모리에 모은 뒤 json.dump 했습니다.
+대시보드는 그 JSON 전체를 다시 읽고 area_reject_rate 몇 건만 사용했습니다.
+이 모듈은:
+- 필요한 컬럼만 Python list로 한 번 꺼내 직원별 항목을 순서대로 생성 (Series/전체 dict 없음)
+- 항목을 만드는 즉시 JSON(기존과 같은 바이트)과 JSONL(한 줄에 [직원번호, 항목])에 기록
+- JSONL은 직원번호 → 파일 offset 인덱스만 만들고 요청한 직원 줄만 파싱 (LazyMetadata)
+- JSON을 닫은 뒤 seal_jsonl로 JSONL 마지막 줄에 형식 버전 + JSON 파일 크기 기록
+  → load_metadata는 이 줄이 현재 JSON과 맞을 때만 JSONL 사용 (파일 mtime에 의존하지 않음)
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, TextIO, Tuple
+
+import pandas as pd
+
+# JSONL 마지막 줄 {"format": ..., "json_bytes": ...} 의 형식 버전
+JSONL_FORMAT = 'metadata-jsonl-v1'
+
+# 위치 컬럼 우선순위 (기존 row.index 확인 순서)
+POSITION_COLUMNS = ('QIP POSITION 1ST  NAME', 'Position', 'POSITION')
+
+
+def jsonl_path_for(json_path: str) -> str:
+    """metadata JSON 경로 → JSONL 경로"""
+    return os.path.splitext(json_path)[0] + '.jsonl'
+
+
+class _Columns:
+    """month_data 컬럼 → Python list (없는 컬럼은 None 값 list)"""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.n = len(df)
+
+    def get(self, col: str, missing: Any = None) -> List:
+        if col in self.df.columns:
+            return self.df[col].tolist()
+        return [missing] * self.n
+
+    def has(self, col: str) -> bool:
+        return col in self.df.columns
+
+
+def _notna(value) -> bool:
+    return value is not None and bool(pd.notna(value))
+
+
+def _attendance_conditions(absence, unapproved, working_days) -> Dict:
+    absence_ok = _notna(absence)
+    unapproved_ok = _notna(unapproved)
+    working_ok = _notna(working_days)
+    return {
+        '출근율_Attendance_Rate_Percent': {
+            'passed': absence <= 12 if absence_ok else True,
+            'value': 100 - absence if absence_ok else 100,
+            'threshold': 88,
+            'applicable': True
+        },
+        'unapproved_absence': {
+            'passed': unapproved <= 2 if unapproved_ok else True,
+            'value': int(unapproved) if unapproved_ok else 0,
+            'threshold': 2,
+            'applicable': True
+        },
+        'working_days': {
+            'passed': working_days > 0 if working_ok else False,
+            'value': int(working_days) if working_ok else 0,
+            'threshold': 1,
+            'applicable': True
+        },
+        'minimum_days': {
+            'passed': working_days >= 12 if working_ok else False,
+            'value': int(working_days) if working_ok else 0,
+            'threshold': 12,
+            'applicable': True
+        }
+    }
+
+
+def _monthly_failure(aql_failures, applicable: bool) -> Dict:
+    aql_ok = _notna(aql_failures)
+    return {
+        'passed': aql_failures == 0 if aql_ok else True,
+        'value': int(aql_failures) if aql_ok else 0,
+        'threshold': 0,
+        'applicable': applicable
+    }
+
+
+def _continuous_condition(continuous_fail, continuous_fail_value) -> Dict:
+    return {
+        'passed': continuous_fail_value != 'YES' if _notna(continuous_fail) else True,
+        'value': continuous_fail_value,
+        'threshold': 'NO',
+        'applicable': True
+    }
+
+
+def _area_condition(area_reject_rate: float) -> Dict:
+    return {
+        'passed': area_reject_rate < 3.0,
+        'value': round(area_reject_rate, 2),
+        'threshold': 3.0,
+        'applicable': True
+    }
+
+
+def iter_metadata_entries(month_data: pd.DataFrame, incentive_col: str, aql_col: str,
+                          model_master_reject_rate: float = 0.0,
+                          auditor_area_reject_rates: Optional[Dict[str, float]] = None,
+                          reuse: Optional[Tuple[Dict, Set[int]]] = None) -> Iterator[Tuple[str, Dict]]:
+    """
+    직원별 (직원번호, metadata 항목) 생성 (행 순서, 같은 직원번호는 첫 행 위치에 마지막 행 내용)
+
+    Args:
+        month_data: 계산 결과
+        incentive_col: 당월 인센티브 컬럼
+        aql_col: 당월 AQL Failures 컬럼
+        model_master_reject_rate: 전체 factory reject율 (MODEL MASTER)
+        auditor_area_reject_rates: {직원번호: 담당 구역 reject율} (AUDIT & TRAINING)
+        reuse: (기존 metadata, 다시 만들 행 위치 집합) - 나머지 행은 기존 항목 사용
+    """
+    cols = _Columns(month_data)
+    auditor_rates = auditor_area_reject_rates or {}
+
+    emp_ids = [str(value) for value in cols.get('Employee No')]
+    names = month_data['Full Name'].tolist()
+    role_types = month_data['ROLE TYPE STD'].tolist()
+    amounts_raw = month_data[incentive_col].tolist()
+    position_col = next((col for col in POSITION_COLUMNS if cols.has(col)), None)
+    positions = cols.get(position_col) if position_col else [''] * cols.n
+
+    absence = cols.get('결근율_Absence_Rate_Percent')
+    unapproved = cols.get('Unapproved Absences')
+    working_days = cols.get('Actual Working Days')
+    aql_failures = cols.get(aql_col)
+    continuous_fail = cols.get('Continuous_FAIL')
+    continuous_fail_values = cols.get('Continuous_FAIL', 'NO')
+    validation_qty = cols.get('Total Valiation Qty')
+    pass_percent = cols.get('Pass %')
+
+    # 같은 직원번호: 첫 행 위치에 마지막 행 내용 (기존 dict 덮어쓰기 결과)
+    last_pos = {emp_id: pos for pos, emp_id in enumerate(emp_ids)}
+
+    emitted = set()
+    for first_pos, emp_id in enumerate(emp_ids):
+        if emp_id in emitted:
+            continue
+        emitted.add(emp_id)
+        pos = last_pos[emp_id]
+
+        if reuse is not None and pos not in reuse[1] and emp_id in reuse[0]:
+            yield emp_id, reuse[0][emp_id]
+            continue
+
+        amount = amounts_raw[pos] if pd.notna(amounts_raw[pos]) else 0
+        position_value = positions[pos]
+        position_upper = str(position_value).upper()
+        role_type = role_types[pos]
+
+        entry = {
+            'name': names[pos],
+            'position': position_value,
+            'type': role_type,
+            'amount': float(amount),
+            'calculation_basis': '',
+            'conditions': {
+                'attendance': _attendance_conditions(absence[pos], unapproved[pos], working_days[pos])
+            }
+        }
+
+        # AQL condition (TYPE-1only)
+        if role_type == 'TYPE-1':
+            if 'MODEL MASTER' in position_upper:
+                area_reject_rate = model_master_reject_rate
+                entry['conditions']['aql'] = {
+                    'monthly_failure': _monthly_failure(aql_failures[pos], False),
+                    '3월_continuous': _continuous_condition(continuous_fail[pos], continuous_fail_values[pos]),
+                    'subordinate_aql': {'passed': True, 'value': 'N/A', 'threshold': 'N/A', 'applicable': False},
+                    'area_reject_rate': _area_condition(area_reject_rate)
+                }
+                if amount == 0 and area_reject_rate >= 3.0:
+                    entry['calculation_basis'] = f'전체 factory AQL reject율 {area_reject_rate:.1f}% (basis: 3% 미only)'
+                elif amount == 0:
+                    entry['calculation_basis'] = '기타 condition 미충족'
+                else:
+                    entry['calculation_basis'] = 'Model Master incentive'
+            elif 'AUDIT' in position_upper or 'TRAINING' in position_upper:
+                area_reject_rate = auditor_rates.get(emp_id, 0.0)
+                entry['conditions']['aql'] = {
+                    'monthly_failure': _monthly_failure(aql_failures[pos], True),
+                    '3월_continuous': _continuous_condition(continuous_fail[pos], continuous_fail_values[pos]),
+                    'subordinate_aql': {'passed': True, 'value': 'N/A', 'threshold': 'N/A', 'applicable': True},
+                    'area_reject_rate': _area_condition(area_reject_rate)
+                }
+                if amount == 0 and area_reject_rate >= 3.0:
+                    entry['calculation_basis'] = f'in charge area AQL reject율 {area_reject_rate:.1f}% (basis: 3% 미only)'
+                elif amount == 0:
+                    entry['calculation_basis'] = '기타 condition 미충족'
+                else:
+                    entry['calculation_basis'] = 'Auditor/Trainer incentive'
+            elif 'AQL INSPECTOR' in str(position_value):
+                aql_value = aql_failures[pos]
+                entry['conditions']['aql'] = {
+                    'monthly_failure': {
+                        'passed': amount > 0,  # incentive 받았으면 passed로 간주
+                        'value': 0 if amount > 0 else int(aql_value) if _notna(aql_value) else 0,
+                        'threshold': 0,
+                        'applicable': True
+                    },
+                    '3월_continuous': {'applicable': False},
+                    'subordinate_aql': {'applicable': False},
+                    'area_reject_rate': {'applicable': False}
+                }
+                entry['calculation_basis'] = 'AQL Inspector 3-part incentive'
+            else:
+                entry['conditions']['aql'] = {
+                    'monthly_failure': _monthly_failure(aql_failures[pos], True),
+                    '3월_continuous': _continuous_condition(continuous_fail[pos], continuous_fail_values[pos])
+                }
+
+        # 5PRS conditions (TYPE-1, TYPE-2 일부)
+        if role_type in ['TYPE-1', 'TYPE-2'] and 'AQL INSPECTOR' not in str(position_value):
+            qty = validation_qty[pos]
+            rate = pass_percent[pos]
+            entry['conditions']['5prs'] = {
+                'volume': {
+                    'passed': qty >= 100 if _notna(qty) else False,
+                    'value': int(qty) if _notna(qty) else 0,
+                    'threshold': 100,
+                    'applicable': True
+                },
+                'pass_rate': {
+                    'passed': rate >= 95 if _notna(rate) else False,
+                    'value': float(rate) if _notna(rate) else 0,
+                    'threshold': 95,
+                    'applicable': True
+                }
+            }
+        else:
+            entry['conditions']['5prs'] = {'applicable': False}
+
+        yield emp_id, entry
+
+
+def write_metadata(entries: Iterator[Tuple[str, Dict]], json_out: TextIO,
+                   jsonl_out: Optional[TextIO] = None) -> int:
+    """
+    항목을 하나씩 기록
+
+    json_out: json.dump(metadata, ensure_ascii=False, indent=2)와 같은 바이트
+    jsonl_out: 한 줄에 [직원번호, 항목]
+
+    Returns:
+        기록한 직원 수
+    """
+    count = 0
+    json_out.write('{')
+    for emp_id, entry in entries:
+        body = json.dumps(entry, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+        json_out.write(('\n  ' if count == 0 else ',\n  ') + json.dumps(emp_id, ensure_ascii=False) + ': ' + body)
+        if jsonl_out is not None:
+            jsonl_out.write(json.dumps([emp_id, entry], ensure_ascii=False) + '\n')
+        count += 1
+    json_out.write('\n}' if count else '}')
+    return count
+
+
+def seal_jsonl(json_path: str):
+    """
+    JSON을 모두 쓰고 닫은 뒤 JSONL 마지막 줄에 형식 버전 + JSON 파일 크기 기록
+
+    JSONL이 이 JSON과 같은 실행에서 끝까지 기록되었다는 표시 (load_metadata 판단 기준)
+    """
+    footer = {'format': JSONL_FORMAT, 'json_bytes': os.path.getsize(json_path)}
+    with open(jsonl_path_for(json_path), 'a', encoding='utf-8') as f:
+        f.write(json.dumps(footer) + '\n')
+
+
+class LazyMetadata(Mapping):
+    """metadata JSONL 읽기 전용 dict (직원번호 인덱스만 만들고 항목은 요청 시 파싱)"""
+
+    def __init__(self, jsonl_path: str):
+        self.path = jsonl_path
+        self.footer: Optional[Dict] = None
+        self._offsets: Dict[str, int] = {}
+        self._cache: Dict[str, Dict] = {}
+        decoder = json.JSONDecoder()
+        with open(jsonl_path, 'rb') as f:
+            offset = 0
+            for line in f:
+                if line.startswith(b'{'):
+                    self.footer = json.loads(line.decode('utf-8'))
+                elif line.strip():
+                    emp_id, _ = decoder.raw_decode(line.decode('utf-8'), 1)
+                    self._offsets[emp_id] = offset
+                offset += len(line)
+
+    def matches(self, json_path: str) -> bool:
+        """seal_jsonl 기록이 현재 형식 버전이고 json_path(없으면 통과)와 크기가 같은지"""
+        if not self.footer or self.footer.get('format') != JSONL_FORMAT:
+            return False
+        return not os.path.exists(json_path) or self.footer.get('json_bytes') == os.path.getsize(json_path)
+
+    def __getitem__(self, emp_id: str) -> Dict:
+        if emp_id not in self._cache:
+            offset = self._offsets[emp_id]
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                self._cache[emp_id] = json.loads(f.readline().decode('utf-8'))[1]
+        return self._cache[emp_id]
+
+    def __contains__(self, emp_id) -> bool:
+        return emp_id in self._offsets
+
+    def __iter__(self):
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+
+def load_metadata(json_path: str) -> Mapping:
+    """
+    metadata 로드: JSONL 마지막 줄(seal_jsonl)이 현재 JSON과 맞으면 LazyMetadata, 아니면 JSON 전체
+
+    파일이 없으면 빈 dict
+    """
+    jsonl_path = jsonl_path_for(json_path)
+    if os.path.exists(jsonl_path):
+        lazy = LazyMetadata(jsonl_path)
+        if lazy.matches(json_path):
+            return lazy
+    if os.path.exists(json_path):
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
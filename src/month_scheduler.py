@@ -0,0 +1,113 @@
+"""
+이전 달 결과 재계산 스케줄러
+결과 CSV가 없는 조상 월을 모두 찾아 오래된 월부터 한 번씩만 계산
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존 ensure_previous_month_exists는 직전 달 CSV가 없으면 그 달만
+이전 달 체크 없이 TYPE별 계산만 다시 실행했습니다 (그 달의 이전 달 이력 없이).
+이 모듈은:
+- 직전 달부터 거슬러 올라가며 결과가 없는 월을 모두 수집 (결과가 있는 월에서 중단)
+- 오래된 월부터 순서대로 실제 실행과 같은 흐름으로 계산 → 각 월은 자기 이전 달 이력을 사용
+- 계산한 월은 프로세스 내 registry에 기록해 이후 요청에서 재사용 (월당 계산 1회)
+
+계산 방법(설정 로드, 계산, 저장)은 호출자가 callback으로 제공합니다.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 조상 탐색 최대 개월 수 (1년)
+MAX_CHAIN_MONTHS = 12
+
+# {(base_path, year, month): 결과 파일 경로} - 프로세스 내 계산 완료 registry
+_COMPUTED: Dict[Tuple[str, int, int], str] = {}
+
+
+def previous_month(year: int, month: int) -> Tuple[int, int]:
+    """(year, month) 직전 달 (1월 → 전년 12월)"""
+    if month == 1:
+        return year - 1, 12
+    return year, month - 1
+
+
+class MonthScheduler:
+    """조상 월 재계산 계획 + 실행 (월당 1회)"""
+
+    def __init__(self, base_path: str,
+                 find_result: Callable[[int, int], Optional[str]],
+                 can_compute: Callable[[int, int], bool],
+                 compute: Callable[[int, int, bool], Optional[str]]):
+        """
+        초기화
+
+        Args:
+            base_path: 작업 디렉토리 (registry 키)
+            find_result: (year, month) → 기존 결과 파일 경로 (없으면 None)
+            can_compute: (year, month) → 계산에 필요한 config/입력 파일이 모두 있는지
+            compute: (year, month, is_root) → 저장된 결과 파일 경로
+                     is_root=True면 그 월의 이전 달 결과가 없음 (이전 달 확인 생략 필요)
+        """
+        self.base_path = str(base_path)
+        self.find_result = find_result
+        self.can_compute = can_compute
+        self.compute = compute
+
+    def lookup(self, year: int, month: int) -> Optional[str]:
+        """이번 프로세스에서 계산한 결과 또는 디스크의 기존 결과"""
+        computed = _COMPUTED.get((self.base_path, year, month))
+        if computed is not None:
+            return computed
+        return self.find_result(year, month)
+
+    def plan(self, year: int, month: int) -> Tuple[List[Tuple[int, int]], bool]:
+        """
+        (year, month) 계산 전에 필요한 조상 월 목록
+
+        Returns:
+            ([(year, month), ...] 오래된 순, 가장 오래된 월의 이전 달 결과가 없는지 여부)
+        """
+        missing = []
+        cursor = previous_month(year, month)
+        root_has_history = False
+        for _ in range(MAX_CHAIN_MONTHS):
+            if self.lookup(*cursor) is not None:
+                root_has_history = True
+                break
+            if not self.can_compute(*cursor):
+                break
+            missing.append(cursor)
+            cursor = previous_month(*cursor)
+
+        missing.reverse()
+        return missing, not root_has_history
+
+    def ensure_ancestors(self, year: int, month: int) -> List[Tuple[int, int]]:
+        """
+        (year, month)의 결과 없는 조상 월을 오래된 순으로 계산
+
+        Returns:
+            이번에 계산한 (year, month) 목록
+        """
+        chain, root_without_history = self.plan(year, month)
+        if chain:
+            labels = ', '.join(f"{y}-{m:02d}" for y, m in chain)
+            print(f"📅 Previous month chain to calculate: {labels}")
+
+        for position, (chain_year, chain_month) in enumerate(chain):
+            is_root = position == 0 and root_without_history
+            result_file = self.compute(chain_year, chain_month, is_root)
+            if result_file is None:
+                raise Exception(f"{chain_year}-{chain_month:02d} calculation failed")
+            _COMPUTED[(self.base_path, chain_year, chain_month)] = str(result_file)
+        return chain
+
+
+def register_result(base_path: str, year: int, month: int, result_file: str):
+    """외부에서 계산한 월 결과를 registry에 기록 (일괄 실행 시 중복 계산 방지)"""
+    _COMPUTED[(str(base_path), year, month)] = str(result_file)
+
+
+def clear_registry():
+    """registry 초기화"""
+    _COMPUTED.clear()
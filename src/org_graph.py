@@ -0,0 +1,143 @@
+"""
+조직도(manager-부하) 그래프 모듈
+create_manager_subordinate_mapping 결과를 한 번 인덱싱하여 팀 탐색을 dict 조회로 처리
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존에는 팀 탐색 노드마다 month_data 전체를 Employee No로 필터링했습니다.
+OrgGraph는 빌드 시:
+- Employee No → 행 위치 인덱스 (raw 값 / 문자열 값 두 가지)
+- 관리자별 하위 조직 방문 순서 (기존 재귀 탐색과 동일: 깊이 5 제한, visited 체크)
+- 직급별 하위 직원 목록 (lazy memoize)
+를 준비합니다. 인센티브 금액 등 값은 항상 현재 month_data에서 읽습니다.
+"""
+
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 기존 find_line_leaders_recursive의 깊이 제한
+MAX_TEAM_DEPTH = 5
+
+
+def is_type1_line_leader(role_type: Any, position: str) -> bool:
+    """TYPE-1 LINE LEADER 여부 (팀 평균 계산 대상)"""
+    return role_type == 'TYPE-1' and 'LINE' in position and 'LEADER' in position
+
+
+class OrgGraph:
+    """manager-부하 그래프 (행 위치 인덱스 + 하위 조직 캐시)"""
+
+    def __init__(self, month_data: pd.DataFrame, subordinate_mapping: Dict[Any, List[Any]]):
+        """
+        초기화
+
+        Args:
+            month_data: 현재 월 직원 데이터
+            subordinate_mapping: {boss_id: [sub_id, ...]} (create_manager_subordinate_mapping 결과)
+        """
+        self.month_data = month_data
+        self.subordinate_mapping = subordinate_mapping
+
+        emp_values = month_data['Employee No'].tolist() if 'Employee No' in month_data.columns else []
+
+        # 첫 번째 행 우선 (기존 iloc[0] 동작)
+        self.pos_by_raw_id: Dict[Any, int] = {}
+        self.pos_by_str_id: Dict[str, int] = {}
+        for pos, value in enumerate(emp_values):
+            try:
+                self.pos_by_raw_id.setdefault(value, pos)
+            except TypeError:
+                pass
+            self.pos_by_str_id.setdefault(str(value), pos)
+
+        # 빌드 시점의 직급/타입 스냅샷 (계산 단계에서 변경되지 않음)
+        self._positions = (
+            month_data['QIP POSITION 1ST  NAME'].astype(str).str.upper().tolist()
+            if 'QIP POSITION 1ST  NAME' in month_data.columns else [''] * len(month_data)
+        )
+        self._role_types = (
+            month_data['ROLE TYPE STD'].tolist()
+            if 'ROLE TYPE STD' in month_data.columns else [''] * len(month_data)
+        )
+
+        self._team_cache: Dict[Any, Tuple[int, ...]] = {}
+        self._position_cache: Dict[Tuple[Any, str], Tuple[int, ...]] = {}
+
+    def is_for(self, month_data: pd.DataFrame, subordinate_mapping: Dict) -> bool:
+        """같은 데이터/매핑으로 빌드된 그래프인지 확인"""
+        return self.month_data is month_data and self.subordinate_mapping is subordinate_mapping
+
+    def get_direct_subordinates(self, boss_id: Any) -> List[Any]:
+        """직속 부하 ID 목록"""
+        return self.subordinate_mapping.get(boss_id, [])
+
+    def row_position(self, emp_id: Any, match: str = 'str') -> Optional[int]:
+        """
+        직원 행 위치 조회
+
+        Args:
+            emp_id: 직원 ID
+            match: 'str' → Employee No == str(emp_id), 'raw' → Employee No == emp_id
+        """
+        if match == 'raw':
+            try:
+                return self.pos_by_raw_id.get(emp_id)
+            except TypeError:
+                return None
+        return self.pos_by_str_id.get(str(emp_id))
+
+    def get_team_positions(self, manager_id: Any) -> Tuple[int, ...]:
+        """
+        하위 조직 행 위치 (직접 부하 + 부하의 부하, 기존 재귀 탐색 순서)
+
+        month_data에서 찾지 못한 부하는 건너뛰고 그 하위도 탐색하지 않습니다.
+        """
+        cached = self._team_cache.get(manager_id)
+        if cached is not None:
+            return cached
+
+        team = []
+        visited = set()
+
+        # 명시적 스택으로 재귀(전위 순회)와 동일한 순서 재현
+        stack = [(manager_id, 0, 0)]
+        while stack:
+            boss_id, depth, next_idx = stack.pop()
+            if next_idx == 0:
+                if depth > MAX_TEAM_DEPTH or boss_id in visited:
+                    continue
+                visited.add(boss_id)
+
+            subs = self.subordinate_mapping.get(boss_id, [])
+            if next_idx >= len(subs):
+                continue
+
+            stack.append((boss_id, depth, next_idx + 1))
+            sub_id = subs[next_idx]
+            pos = self.pos_by_str_id.get(str(sub_id))
+            if pos is not None:
+                team.append(pos)
+                stack.append((sub_id, depth + 1, 0))
+
+        self._team_cache[manager_id] = tuple(team)
+        return self._team_cache[manager_id]
+
+    def get_team_positions_matching(self, manager_id: Any, key: str,
+                                    predicate: Callable[[Any, str], bool]) -> Tuple[int, ...]:
+        """하위 조직 중 predicate(role_type, position)를 만족하는 행 위치 (key별 memoize)"""
+        cache_key = (manager_id, key)
+        cached = self._position_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        matched = tuple(
+            pos for pos in self.get_team_positions(manager_id)
+            if predicate(self._role_types[pos], self._positions[pos])
+        )
+        self._position_cache[cache_key] = matched
+        return matched
+
+    def get_team_line_leader_positions(self, manager_id: Any) -> Tuple[int, ...]:
+        """하위 조직의 TYPE-1 LINE LEADER 행 위치"""
+        return self.get_team_positions_matching(manager_id, 'TYPE-1 LINE LEADER', is_type1_line_leader)
@@ -0,0 +1,142 @@
+"""
+직급(position) 매칭 공통 모듈
+position_condition_matrix.json의 patterns를 한 번 컴파일하고 직급 문자열별 결과를 캐시
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존에는 step1, integrated_dashboard_final, ConditionMatrixManager, dashboard_v2가
+각자 직원마다 patterns를 substring/regex로 다시 스캔했습니다.
+이 모듈은 (type, 직급) 조합별로 매칭 결과를 LRU 캐시에 저장하므로
+한 달 데이터의 고유 직급 수만큼만 스캔하고, 나머지는 dict 조회입니다.
+
+매칭 규칙 (모든 호출처 공통):
+- 직급 문자열을 대문자로 변환 후 pattern(대문자)이 포함되면 매칭
+- type 내 position 순서(JSON 순서)대로 첫 번째 매칭 사용, 없으면 'default'
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# 캐시 크기 (월별 고유 직급 수보다 충분히 크게)
+POSITION_CACHE_SIZE = 4096
+
+# 보관할 matrix별 매처 수 (matrix를 다시 로드하면 오래된 매처부터 제거)
+MATCHER_CACHE_SIZE = 4
+
+# 직급 → Type 판정 키워드 (ROLE TYPE STD가 없을 때 대시보드에서 사용)
+TYPE3_POSITION_KEYWORDS = ('NEW QIP MEMBER',)
+TYPE1_POSITION_KEYWORDS = (
+    'AQL INSPECTOR', 'ASSEMBLY INSPECTOR', 'AUDIT & TRAINING',
+    'MODEL MASTER', 'MANAGER', 'A.MANAGER', 'ASSISTANT MANAGER',
+    'LINE LEADER', '(V) SUPERVISOR', 'V.SUPERVISOR'
+)
+TYPE2_POSITION_KEYWORDS = (
+    'STITCHING INSPECTOR', 'BOTTOM INSPECTOR', 'MTL INSPECTOR',
+    'OSC INSPECTOR', 'GROUP LEADER'
+)
+
+
+@lru_cache(maxsize=POSITION_CACHE_SIZE)
+def _type_from_position_upper(position_upper: str) -> str:
+    if any(keyword in position_upper for keyword in TYPE3_POSITION_KEYWORDS):
+        return 'TYPE-3'
+    if any(keyword in position_upper for keyword in TYPE1_POSITION_KEYWORDS):
+        return 'TYPE-1'
+    if any(keyword in position_upper for keyword in TYPE2_POSITION_KEYWORDS):
+        return 'TYPE-2'
+    # Default to TYPE-2 for unknown positions
+    return 'TYPE-2'
+
+
+def determine_type_from_position(position: Any) -> str:
+    """직급 이름에서 Type 판정 (TYPE-3 → TYPE-1 → TYPE-2 순서, 기본 TYPE-2)"""
+    return _type_from_position_upper(str(position).upper())
+
+
+class PositionMatcher:
+    """position_matrix 패턴 매처 (type별 컴파일 + 직급별 LRU 캐시)"""
+
+    def __init__(self, matrix: Optional[Dict]):
+        """
+        초기화
+
+        Args:
+            matrix: position_condition_matrix.json 내용
+        """
+        self.matrix = matrix or {}
+        position_matrix = self.matrix.get('position_matrix', {})
+
+        # {type: [(pos_key, (PATTERN, ...)), ...]} - JSON 순서 유지
+        self._rules: Dict[Any, List[Tuple[str, Tuple[str, ...]]]] = {}
+        for type_key, type_positions in position_matrix.items():
+            self._rules[type_key] = [
+                (pos_key, tuple(str(p).upper() for p in pos_config.get('patterns', [])))
+                for pos_key, pos_config in type_positions.items()
+                if pos_key != 'default'
+            ]
+
+        self._resolve_key = lru_cache(maxsize=POSITION_CACHE_SIZE)(self._match)
+
+    def _match(self, emp_type: Any, position_upper: str) -> Optional[str]:
+        """매칭된 position key (없으면 None)"""
+        for pos_key, patterns in self._rules.get(emp_type, []):
+            for pattern in patterns:
+                if pattern in position_upper:
+                    return pos_key
+        return None
+
+    def resolve_key(self, emp_type: Any, position: Any) -> Optional[str]:
+        """(type, 직급) → 매칭된 position key (없으면 None = default 사용)"""
+        try:
+            return self._resolve_key(emp_type, str(position).upper())
+        except TypeError:
+            # unhashable type 값 → 캐시 없이 매칭
+            return self._match(emp_type, str(position).upper())
+
+    def get_type_config(self, emp_type: Any) -> Dict:
+        """type 설정 전체 (없으면 {})"""
+        try:
+            return self.matrix.get('position_matrix', {}).get(emp_type, {})
+        except TypeError:
+            return {}
+
+    def get_position_config(self, emp_type: Any, position: Any) -> Dict:
+        """매칭된 position 설정, 없으면 type의 'default' 설정 ({} 가능)"""
+        type_config = self.get_type_config(emp_type)
+        pos_key = self.resolve_key(emp_type, position)
+        if pos_key is not None:
+            return type_config.get(pos_key, {})
+        return type_config.get('default', {})
+
+    def get_matched_config(self, emp_type: Any, position: Any) -> Optional[Dict]:
+        """패턴으로 매칭된 position 설정만 반환 (default 미사용, 없으면 None)"""
+        pos_key = self.resolve_key(emp_type, position)
+        if pos_key is None:
+            return None
+        return self.get_type_config(emp_type).get(pos_key)
+
+    def get_applicable_conditions(self, emp_type: Any, position: Any,
+                                  default: Optional[List[int]] = None) -> List[int]:
+        """적용 조건 번호 목록 (설정에 applicable_conditions가 없으면 default)"""
+        fallback = default if default is not None else []
+        return self.get_position_config(emp_type, position).get('applicable_conditions', fallback)
+
+
+# {id(matrix): (matrix, PositionMatcher)} - 같은 matrix 객체는 같은 매처 재사용
+# matrix를 항목에 보관하므로 보관 중인 id는 재사용되지 않음, 최근 MATCHER_CACHE_SIZE개만 유지
+_MATCHERS: 'OrderedDict[int, Tuple[Dict, PositionMatcher]]' = OrderedDict()
+
+
+def get_position_matcher(matrix: Optional[Dict]) -> PositionMatcher:
+    """matrix 객체별 공용 PositionMatcher"""
+    key = id(matrix)
+    entry = _MATCHERS.get(key)
+    if entry is None or entry[0] is not matrix:
+        entry = (matrix, PositionMatcher(matrix))
+        _MATCHERS[key] = entry
+        while len(_MATCHERS) > MATCHER_CACHE_SIZE:
+            _MATCHERS.popitem(last=False)
+    _MATCHERS.move_to_end(key)
+    return entry[1]
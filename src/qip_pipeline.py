@@ -0,0 +1,238 @@
+"""
+QIP in-process 파이프라인 모듈
+step1 계산 → dashboard 생성을 하나의 Python 프로세스 안에서 실행
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존 자동화 스크립트는 월마다 step1과 dashboard를 subprocess로 새 인터프리터에서 실행했고,
+dashboard는 step1이 저장한 CSV를 output_files/에서 다시 읽었습니다.
+이 모듈은:
+- step1 모듈을 한 번만 import (pandas/설정/position matrix 재로드 없음)
+- CompleteQIPCalculator의 month_data를 dashboard에 직접 전달 (CSV 재파싱 없음)
+- step1이 읽은 attendance frame을 dashboard에 전달
+- AQL history는 aql_history_reader의 프로세스 내 캐시를 공유
+- 결과 XLSX는 background에서 저장되고 dashboard 생성과 겹쳐 실행 (result.excel_export handle)
+
+사용 예:
+    from src.qip_pipeline import run_pipeline
+    result = run_pipeline('config_files/config_november_2025.json')
+
+모든 함수는 프로젝트 루트를 작업 디렉토리로 가정합니다 (step1/dashboard와 동일).
+"""
+
+import importlib.util
+import io
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SRC_DIR)
+STEP1_PATH = os.path.join(SRC_DIR, 'step1_인센티브_계산_개선버전.py')
+STEP1_MODULE_NAME = 'qip_step1_calculator'
+
+# step1/dashboard의 'from xxx import' / 'from src.xxx import' 둘 다 동작하도록
+for _path in (SRC_DIR, PROJECT_ROOT):
+    if _path not in sys.path:
+        sys.path.append(_path)
+
+from month_scheduler import register_result
+from run_logger import run_log, INFO, WARNING
+
+_step1_module = None
+_dashboard_module = None
+
+
+@dataclass
+class PipelineResult:
+    """한 달 계산 결과 (dashboard 생성에 필요한 in-memory 데이터 포함)"""
+    config_file: str
+    config: Any = None
+    success: bool = False
+    month_data: Optional[pd.DataFrame] = None
+    csv_file: Optional[str] = None
+    attendance_df: Optional[pd.DataFrame] = None
+    loaded_files: Dict[str, str] = field(default_factory=dict)
+    dashboard_file: Optional[str] = None
+    excel_export: Any = None    # ExcelExportHandle (dashboard 생성은 Excel 완료를 기다리지 않음)
+    error: Optional[str] = None
+
+    @property
+    def month_name(self) -> str:
+        return self.config.month.full_name if self.config else ''
+
+    @property
+    def month_number(self) -> int:
+        return self.config.month.number if self.config else 0
+
+    @property
+    def year(self) -> int:
+        return self.config.year if self.config else 0
+
+
+def load_step1_module():
+    """step1 모듈 import (프로세스당 한 번)"""
+    global _step1_module
+    if _step1_module is None:
+        spec = importlib.util.spec_from_file_location(STEP1_MODULE_NAME, STEP1_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[STEP1_MODULE_NAME] = module
+        spec.loader.exec_module(module)
+        _step1_module = module
+    return _step1_module
+
+
+def load_dashboard_module():
+    """integrated_dashboard_final 모듈 import (번역 파일 로드 포함, 프로세스당 한 번)"""
+    global _dashboard_module
+    if _dashboard_module is None:
+        import integrated_dashboard_final
+        integrated_dashboard_final.load_translations()
+        _dashboard_module = integrated_dashboard_final
+    return _dashboard_module
+
+
+def to_csv_schema(month_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    step1 결과를 CSV로 저장 후 다시 읽은 것과 같은 dtype으로 변환 (메모리 내)
+
+    dashboard는 CSV 파싱 결과의 dtype(빈 값 NaN, 숫자형 ID 등)을 기준으로 작성되어 있으므로
+    파일을 거치지 않고 같은 형태를 만들어 전달합니다.
+    """
+    buffer = io.StringIO()
+    month_data.to_csv(buffer, index=False)
+    buffer.seek(0)
+    return pd.read_csv(buffer)
+
+
+def run_calculation(config_file: str, save: bool = True, quiet: bool = False) -> PipelineResult:
+    """
+    step1 인센티브 계산 (main()의 --config 실행과 동일한 순서)
+
+    Args:
+        config_file: config JSON 경로
+        save: True면 save_results()로 CSV/Excel/메타데이터 저장
+        quiet: True면 경고/오류와 마지막 요약(집계 카운터, 단계별 시간)만 출력
+
+    Returns:
+        PipelineResult (success=False면 error에 사유)
+    """
+    result = PipelineResult(config_file=config_file)
+    step1 = load_step1_module()
+    run_log.reset()
+    run_log.set_level(WARNING if quiet else min(run_log.level, INFO))
+    with run_log.quiet_output():
+        _run_calculation_stages(step1, config_file, save, result)
+    run_log.summary()
+    return result
+
+
+def _run_calculation_stages(step1, config_file: str, save: bool, result: PipelineResult):
+    """run_calculation 본문 (단계별 시간은 run_log에 기록)"""
+    try:
+        config = step1.ConfigManager.load_config(config_file)
+        if config is None:
+            result.error = f"config file not found: {config_file}"
+            print(f"\n❌ configuration file not found: {config_file}")
+            return
+        print(f"\n✅ configuration file loaded successfully: {config_file}")
+        result.config = config
+
+        with run_log.stage('load'):
+            loader = step1.CompleteDataLoader(config)
+            data = loader.load_all_files()
+        if not data:
+            result.error = 'no input data loaded'
+            print("❌ withloaddone data 없습니다.")
+            return
+        result.loaded_files = dict(loader.resolved_paths)
+
+        # dashboard 전달용 attendance 원본 (계산 전에 복사)
+        attendance_key = f"{config.month.full_name}_attendance"
+        if attendance_key in data:
+            result.attendance_df = data[attendance_key].copy()
+
+        with run_log.stage('prepare'):
+            calculator = step1.CompleteQIPCalculator(data, config)
+        with run_log.stage('calculate'):
+            calculator.calculate_all_incentives()
+        with run_log.stage('summary'):
+            calculator.generate_summary()
+
+        if save:
+            with run_log.stage('save'):
+                result.success = bool(calculator.save_results())
+            result.csv_file = os.path.join(
+                'output_files', f"{config.output_prefix}_Complete_V9.0_Complete.csv"
+            )
+            if result.success:
+                # 같은 프로세스의 다음 월 계산에서 이전 달 재계산 생략
+                register_result(os.getcwd(), config.year, config.month.number, os.path.abspath(result.csv_file))
+        else:
+            result.success = True
+        result.month_data = calculator.month_data
+        result.excel_export = calculator.excel_export
+
+        if result.success:
+            print(f"\n🎉 {config.get_month_str('korean')} incentive calculation 완료!")
+        else:
+            result.error = 'save_results failed'
+    except Exception as e:
+        import traceback
+        result.error = str(e)
+        print(f"\n❌ 실행 in progress 오류 발생: {e}")
+        traceback.print_exc()
+
+
+def _attendance_for_dashboard(result: PipelineResult) -> Optional[pd.DataFrame]:
+    """dashboard가 읽을 attendance file과 step1이 읽은 file이 같을 때만 frame 전달"""
+    if result.attendance_df is None:
+        return None
+    dashboard_path = result.config.file_paths.get('attendance')
+    loaded_path = result.loaded_files.get(f"{result.month_name}_attendance")
+    if not dashboard_path or not loaded_path:
+        return None
+    if os.path.normpath(dashboard_path) != os.path.normpath(loaded_path):
+        return None
+    return result.attendance_df
+
+
+def generate_dashboard(result: PipelineResult) -> Optional[str]:
+    """
+    계산 결과로 integrated dashboard 생성 (CSV 재로드 없이 month_data 직접 사용)
+
+    Returns:
+        생성된 HTML 경로 (실패 시 None)
+    """
+    if not result.success or result.month_data is None:
+        print("⚠️ 계산 결과가 없어 dashboard를 생성하지 않습니다.")
+        return None
+
+    dashboard = load_dashboard_module()
+    try:
+        # run_calculation(quiet=True) 이후면 dashboard 출력도 경고/오류만
+        with run_log.quiet_output():
+            result.dashboard_file = dashboard.build_dashboard(
+                result.month_number,
+                result.year,
+                results_df=to_csv_schema(result.month_data),
+                attendance_df=_attendance_for_dashboard(result)
+            )
+    except Exception as e:
+        import traceback
+        print(f"❌ dashboard creation failed: {e}")
+        traceback.print_exc()
+        result.dashboard_file = None
+    return result.dashboard_file
+
+
+def run_pipeline(config_file: str, dashboard: bool = True) -> PipelineResult:
+    """step1 계산 + (선택) dashboard 생성"""
+    result = run_calculation(config_file)
+    if dashboard and result.success:
+        generate_dashboard(result)
+    return result
@@ -0,0 +1,135 @@
+"""
+step1 실행 로그 모듈
+직원별 상세 출력은 카운터로 집계하고, 단계별 소요 시간과 함께 마지막에 요약 출력
+
+작성일: 2025-11-20
+버전: 1.0
+
+기존 step1은 직원마다 print를 호출했습니다 (연속 개월 Priority 로그, 부하직원 매핑 [DEBUG],
+3개월 연속 AQL 실패, 퇴사자 처리 등). 큰 사이트에서는 문자열 포맷/터미널 출력이 실행 시간의
+상당 부분을 차지했고 CI 로그가 수 MB가 되었습니다.
+이 모듈은:
+- 레벨: DEBUG(직원별 상세까지 출력) / INFO(기본, 직원별 상세는 집계만) / WARNING(--quiet)
+- detail(key, message): 직원별 상세 → key별 카운터 (DEBUG일 때만 출력, message는 callable도 가능)
+- stage(name): 단계별 소요 시간 기록
+- quiet_output(): WARNING 레벨이면 ⚠️/❌ 로 시작하는 줄만 통과시키는 stdout 필터
+- summary(): 집계 카운터 + 단계별 시간 표
+
+사용 예:
+    from src.run_logger import run_log
+    run_log.detail('continuity.priority1', f"✅ {emp_id}: [Priority 1] ...")
+"""
+
+import io
+import logging
+import sys
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Tuple, Union
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+
+# --quiet에서 통과시키는 줄 머리 (경고/오류)
+QUIET_PASS_PREFIXES = ('⚠', '❌')
+
+
+class _QuietStream(io.TextIOBase):
+    """경고/오류 줄만 원래 stdout으로 전달"""
+
+    def __init__(self, target):
+        self.target = target
+        self._buffer = ''
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split('\n')
+        for line in lines:
+            if line.lstrip().startswith(QUIET_PASS_PREFIXES):
+                self.target.write(line + '\n')
+        return len(text)
+
+    def flush(self):
+        self.target.flush()
+
+
+class RunLogger:
+    """레벨 + 카운터 + 단계 시간 (프로세스당 하나, run_log)"""
+
+    def __init__(self, level: int = INFO):
+        self.level = level
+        self.counters: Dict[str, int] = OrderedDict()
+        self.stages: List[Tuple[str, float]] = []
+
+    def set_level(self, level: int):
+        self.level = level
+
+    @property
+    def verbose(self) -> bool:
+        return self.level <= DEBUG
+
+    def detail(self, key: str, message: Union[str, Callable[[], str]] = None):
+        """
+        직원별 상세 기록 (key 카운트, DEBUG 레벨에서만 출력)
+
+        message에 lambda를 넘기면 출력할 때만 문자열을 만듭니다.
+        """
+        self.counters[key] = self.counters.get(key, 0) + 1
+        if message is not None and self.level <= DEBUG:
+            print(message() if callable(message) else message)
+
+    def count(self, key: str, n: int = 1):
+        """카운터만 증가"""
+        self.counters[key] = self.counters.get(key, 0) + n
+
+    @contextmanager
+    def stage(self, name: str):
+        """단계 소요 시간 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, time.perf_counter() - start))
+
+    @contextmanager
+    def quiet_output(self):
+        """WARNING 레벨이면 경고/오류 줄만 출력"""
+        if self.level < WARNING:
+            yield
+            return
+        original = sys.stdout
+        sys.stdout = _QuietStream(original)
+        try:
+            yield
+        finally:
+            sys.stdout.flush()
+            sys.stdout = original
+
+    def summary(self):
+        """집계 카운터 + 단계별 시간 출력 (--quiet에서도 출력)"""
+        if self.counters:
+            print("\n📋 Detail counters (per-employee messages, --verbose로 전체 출력):")
+            width = max(len(key) for key in self.counters)
+            for key, value in self.counters.items():
+                print(f"  {key:<{width}}  {value:>6,}")
+        if self.stages:
+            total = sum(seconds for _, seconds in self.stages)
+            print("\n⏱️ Stage timing:")
+            width = max(len(name) for name, _ in self.stages)
+            for name, seconds in self.stages:
+                share = seconds / total * 100 if total > 0 else 0
+                print(f"  {name:<{width}}  {seconds:>8.2f}s  {share:5.1f}%")
+            print(f"  {'total':<{width}}  {total:>8.2f}s")
+
+    def reset(self):
+        """카운터/단계 초기화 (batch mode 월마다)"""
+        self.counters.clear()
+        self.stages.clear()
+
+
+run_log = RunLogger()
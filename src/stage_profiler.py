@@ -0,0 +1,164 @@
+"""
+단계별 profiling 모듈
+calculate_all_incentives 각 단계의 wall/CPU 시간, peak RSS 증가량, 행 수(in/out)를 기록
+
+작성일: 2025-11-20
+버전: 1.0
+
+calculate_all_incentives는 validate_and_report_issues, ensure_previous_month_exists,
+add_condition_evaluation_to_excel, 부하직원 매핑, TYPE별 계산, apply_talent_pool_bonus 등
+10여 단계로 구성되어 있지만 어느 단계가 실행 시간을 차지하는지 알 수 없었습니다.
+이 모듈은:
+- stage(name, rows): 단계별 wall time / CPU time / peak RSS 증가량 / 행 수(전후) 기록
+- 선택한 단계 하나만 cProfile(기본) 또는 pyinstrument(설치된 경우)로 상세 profiling
+- write(path): 결과 CSV 옆에 machine-readable JSON으로 저장 (상세 profile은 같은 이름 .prof/.html)
+
+peak RSS는 resource.getrusage(ru_maxrss) 기준입니다 (프로세스 최대값의 증가분, Windows에서는 None).
+"""
+
+import io
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# 상세 profiling backend
+PROFILERS = ('cprofile', 'pyinstrument')
+
+
+def peak_rss_kb() -> Optional[int]:
+    """현재까지 프로세스 peak RSS (KB, macOS는 bytes 단위라 변환)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+class StageProfiler:
+    """단계별 측정값 수집 + (선택) 한 단계 상세 profiling"""
+
+    def __init__(self, profile_stage: Optional[str] = None, profiler: str = 'cprofile'):
+        """
+        초기화
+
+        Args:
+            profile_stage: 상세 profiling할 단계 이름 (None이면 측정만)
+            profiler: 'cprofile' 또는 'pyinstrument'
+        """
+        if profiler not in PROFILERS:
+            raise ValueError(f"profiler must be one of {PROFILERS}: {profiler}")
+        self.profile_stage = profile_stage
+        self.profiler = profiler
+        self.stages: List[Dict] = []
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self._detail = None   # (backend, profile 객체)
+
+    def __getstate__(self):
+        # batch mode에서 process 간 전달 (상세 profile 객체는 pickle 불가)
+        state = self.__dict__.copy()
+        state['_detail'] = None
+        return state
+
+    @contextmanager
+    def stage(self, name: str, rows: Optional[Callable[[], Optional[int]]] = None):
+        """
+        단계 측정
+
+        Args:
+            name: 단계 이름
+            rows: 현재 행 수를 돌려주는 callable (단계 전/후 호출)
+        """
+        rows_in = rows() if rows else None
+        rss_before = peak_rss_kb()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        detail = self._start_detail() if name == self.profile_stage else None
+        try:
+            yield
+        finally:
+            if detail is not None:
+                self._stop_detail(detail)
+            rss_after = peak_rss_kb()
+            self.stages.append({
+                'name': name,
+                'wall_s': round(time.perf_counter() - wall_start, 4),
+                'cpu_s': round(time.process_time() - cpu_start, 4),
+                'peak_rss_delta_kb': rss_after - rss_before if rss_before is not None else None,
+                'rows_in': rows_in,
+                'rows_out': rows() if rows else None,
+            })
+
+    def _start_detail(self):
+        if self.profiler == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                print("⚠️ pyinstrument not installed, using cProfile")
+            else:
+                profiler = Profiler()
+                profiler.start()
+                return 'pyinstrument', profiler
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return 'cprofile', profiler
+
+    def _stop_detail(self, detail):
+        backend, profiler = detail
+        if backend == 'pyinstrument':
+            profiler.stop()
+        else:
+            profiler.disable()
+        self._detail = detail
+
+    def write(self, path: str, **meta) -> str:
+        """
+        JSON 저장 (+ 상세 profile: .prof(cProfile) / .html(pyinstrument), 상위 함수 20개 출력)
+
+        Args:
+            path: JSON 경로
+            meta: JSON에 함께 기록할 값 (month, year 등)
+        """
+        total_wall = sum(stage['wall_s'] for stage in self.stages)
+        report = {
+            **meta,
+            'started_at': self.started_at,
+            'total_wall_s': round(total_wall, 4),
+            'total_cpu_s': round(sum(stage['cpu_s'] for stage in self.stages), 4),
+            'stages': [
+                {**stage, 'wall_share': round(stage['wall_s'] / total_wall, 4) if total_wall > 0 else 0}
+                for stage in self.stages
+            ],
+        }
+
+        if self._detail is not None:
+            backend, profiler = self._detail
+            base = os.path.splitext(path)[0]
+            if backend == 'pyinstrument':
+                detail_file = f"{base}_{self.profile_stage}.html"
+                with open(detail_file, 'w', encoding='utf-8') as f:
+                    f.write(profiler.output_html())
+                print(profiler.output_text(unicode=True, color=False))
+            else:
+                import pstats
+                detail_file = f"{base}_{self.profile_stage}.prof"
+                profiler.dump_stats(detail_file)
+                text = io.StringIO()
+                pstats.Stats(profiler, stream=text).sort_stats('cumulative').print_stats(20)
+                print(text.getvalue())
+            report['detail_profile'] = {'stage': self.profile_stage, 'backend': backend, 'file': detail_file}
+        elif self.profile_stage:
+            print(f"⚠️ Profile stage not found: {self.profile_stage} "
+                  f"(stages: {', '.join(stage['name'] for stage in self.stages)})")
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return path
@@ -44,6 +44,7 @@ from datetime import datetime
 from pathlib import Path
 import warnings
 import traceback
+from collections import Counter
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -65,6 +66,96 @@ except ImportError:
     print("⚠️ Common condition check module not found. Using legacy logic.")
     get_condition_checker = None
 
+# Import shared AQL history reader (AQL REPORT 1회 파싱 + 캐시)
+try:
+    from aql_history_reader import load_aql_month, read_aql_report, get_aql_report_path
+except ImportError:
+    from src.aql_history_reader import load_aql_month, read_aql_report, get_aql_report_path
+
+# Import history ledger (월별 연속 개월/인센티브 + AQL REPORT 요약 누적 저장)
+try:
+    from history_ledger import HistoryLedger, summarize_aql_month
+except ImportError:
+    from src.history_ledger import HistoryLedger, summarize_aql_month
+
+# Import org graph (manager-부하 탐색 인덱스)
+try:
+    from org_graph import OrgGraph
+except ImportError:
+    from src.org_graph import OrgGraph
+
+# Import area AQL evaluator (담당 구역 reject율 일괄 계산)
+try:
+    from area_aql_evaluator import evaluate_area_reject_stats, mapping_hash
+except ImportError:
+    from src.area_aql_evaluator import evaluate_area_reject_stats, mapping_hash
+
+# Import condition engine (cond_1~10 일괄 평가)
+try:
+    from condition_engine import (
+        CONDITION_COLUMNS, NOT_APPLICABLE, build_applicability_masks, judge,
+        column_values, assign_like_loc, summarize_conditions
+    )
+except ImportError:
+    from src.condition_engine import (
+        CONDITION_COLUMNS, NOT_APPLICABLE, build_applicability_masks, judge,
+        column_values, assign_like_loc, summarize_conditions
+    )
+
+# Import shared position matcher (직급 패턴 매칭 + LRU 캐시)
+try:
+    from position_matcher import get_position_matcher
+except ImportError:
+    from src.position_matcher import get_position_matcher
+
+# Import previous month scheduler (결과 없는 조상 월을 오래된 순으로 1회씩 계산)
+try:
+    from month_scheduler import MonthScheduler, previous_month
+except ImportError:
+    from src.month_scheduler import MonthScheduler, previous_month
+
+# Import change detector (--incremental: 직원별 입력 행 hash 비교)
+try:
+    from change_detector import ChangeDetector, normalize_employee_key
+except ImportError:
+    from src.change_detector import ChangeDetector, normalize_employee_key
+
+# Import metadata writer (컬럼 단위 metadata 생성 + JSON/JSONL 스트리밍 저장)
+try:
+    from metadata_writer import iter_metadata_entries, write_metadata, jsonl_path_for, seal_jsonl
+except ImportError:
+    from src.metadata_writer import iter_metadata_entries, write_metadata, jsonl_path_for, seal_jsonl
+
+# Import background Excel export (XLSX는 CSV 저장 후 background에서 streaming 저장)
+try:
+    from excel_export import export_excel_async, wait_for_exports
+except ImportError:
+    from src.excel_export import export_excel_async, wait_for_exports
+
+# Import run logger (직원별 상세 출력 집계 + 단계별 시간 요약, --quiet/--verbose)
+try:
+    from run_logger import run_log, DEBUG, WARNING
+except ImportError:
+    from src.run_logger import run_log, DEBUG, WARNING
+
+# Import stage profiler (calculate_all_incentives 단계별 시간/RSS/행 수 → *_stage_profile.json)
+try:
+    from stage_profiler import StageProfiler
+except ImportError:
+    from src.stage_profiler import StageProfiler
+
+# Import input CSV cache (인코딩/구분자 감지 결과 + 파싱된 frame 재사용)
+try:
+    from input_file_cache import InputFileCache
+except ImportError:
+    InputFileCache = None
+
+# Import attendance index module (attendance 파일 1회 로드)
+try:
+    from attendance_index import AttendanceIndex
+except ImportError:
+    AttendanceIndex = None
+
 # Position condition matrix withload
 def load_position_condition_matrix():
     """Load position condition matrix JSON file"""
@@ -98,20 +189,8 @@ def get_position_config_from_matrix(emp_type, position):
     if not POSITION_CONDITION_MATRIX:
         return None
 
-    position_upper = position.upper()
-    type_config = POSITION_CONDITION_MATRIX.get('position_matrix', {}).get(emp_type, {})
-
-    # Find configuration by position
-    for pos_key, pos_config in type_config.items():
-        if pos_key == 'default':
-            continue
-        patterns = pos_config.get('patterns', [])
-        for pattern in patterns:
-            if pattern in position_upper:
-                return pos_config
-
-    # Return default value
-    return type_config.get('default', {})
+    # 공용 PositionMatcher: (type, position) 조합별 결과 캐시 (dashboard와 동일한 매칭 규칙)
+    return get_position_matcher(POSITION_CONDITION_MATRIX).get_position_config(emp_type, position)
 
 
 class Month(Enum):
@@ -479,12 +558,24 @@ class SpecialCaseHandler:
 class DataProcessor:
     """data processing 클래스 (improved 버전)"""
 
+    # attendance condition 엔진 선택 (False = 기존 per-employee 루프, parity 체크용)
+    use_vectorized_attendance = True
+
+    # 월별 이력 ledger 사용 여부 (--no-history-ledger로 비활성화 → 매번 CSV/REPORT 직접 로드)
+    use_history_ledger = True
+
     def __init__(self, config: MonthConfig):
         self.config = config
         self.column_cache = {}
         self.progression_table = self._load_progression_table()
         print(f"✅ Progression table loaded: {len(self.progression_table)} entries")
 
+        # 이전 달 연속 개월 수 맵 (get_continuity_map에서 lazy 빌드)
+        self._continuity_map = (None, None)
+        self._continuity_map_loaded = False
+
+        self.history_ledger = HistoryLedger() if self.use_history_ledger else None
+
     def _load_progression_table(self) -> dict:
         """
         progression_table을 position_condition_matrix.json에서 동적으로 로딩
@@ -526,12 +617,13 @@ class DataProcessor:
                 14: 1000000, 15: 1000000
             }
 
-    def _reverse_calculate_months_from_incentive(self, incentive_amount: float) -> int:
+    def _reverse_calculate_months_from_incentive(self, incentive_amount: float, verbose: bool = True) -> Optional[int]:
         """
         인센티브 금액에서 개월 수를 역산
 
         Args:
             incentive_amount: 인센티브 금액
+            verbose: False면 경고 출력 없이 못 찾은 경우 None 반환
 
         Returns:
             int: 해당 금액에 대응하는 개월 수 (찾지 못하면 1)
@@ -549,6 +641,8 @@ class DataProcessor:
                 return months + 1  # 다음 달 개월 수
 
         # 찾지 못한 경우
+        if not verbose:
+            return None
         print(f"  ⚠️ Incentive amount {incentive_int:,} VND not found in progression_table → defaulting to 1 month")
         print(f"  ⚠️ This may indicate a special bonus or manual adjustment. Manual verification recommended.")
         return 1
@@ -690,6 +784,11 @@ class DataProcessor:
         if 'ACTUAL WORK DAY' in att_df.columns and 'TOTAL WORK DAY' in att_df.columns:
             # 미 converted file
             print("✅ converted attendance file detected")
+            if self.use_vectorized_attendance:
+                result_df = self._build_converted_attendance_results(att_df, emp_col)
+                print(f"✅ Attendance condition processing completed: {len(result_df)} employees")
+                return result_df
+
             attendance_results = []
             
             for idx, row in att_df.iterrows():
@@ -784,7 +883,12 @@ class DataProcessor:
         if not date_columns:
             print("❌ Date column not found.")
             return pd.DataFrame()
-        
+
+        if self.use_vectorized_attendance and AttendanceIndex is not None:
+            result_df = self._build_daily_attendance_results(att_df, emp_col)
+            print(f"✅ Attendance condition processing completed: {len(result_df)} employees")
+            return result_df
+
         attendance_results = []
         
         # employee별 processing
@@ -808,7 +912,7 @@ class DataProcessor:
             
             # 방어적 코ing: attendance data 없 employee processing
             if emp_data.empty:
-                print(f"⚠️ Attendance data not found: {emp_id}")
+                run_log.detail('attendance.not_found', lambda: f"⚠️ Attendance data not found: {emp_id}")
                 # attendance data 없 employee은 0 dayswith processing하고 next employeewith
                 continue
             
@@ -857,7 +961,7 @@ class DataProcessor:
                     actual_working_days = len(worked_dates)
                 else:
                     # Date column 없으면 existing 방식 사용 (하지only Warning 출력)
-                    print(f"⚠️ Date column 없어 Accurate attendance days calculation may be difficult: {emp_id}")
+                    run_log.detail('attendance.no_date_column', lambda: f"⚠️ Date column 없어 Accurate attendance days calculation may be difficult: {emp_id}")
                     for idx, row in emp_data.iterrows():
                         comp_add = row['compAdd']
                         reason_desc = row.get('Reason Description', '') if 'Reason Description' in row else ''
@@ -933,6 +1037,93 @@ class DataProcessor:
         print(f"✅ Attendance condition processing completed: {len(result_df)} employees")
         return result_df
     
+    def _build_converted_attendance_results(self, att_df: pd.DataFrame, emp_col: str) -> pd.DataFrame:
+        """converted attendance file (employee당 1행) 컬럼 단위 processing"""
+        emp_ids = att_df[emp_col].map(self.standardize_employee_id)
+        valid = (emp_ids != '') & (emp_ids != '0')
+        if not valid.any():
+            return pd.DataFrame()
+
+        # 유효하지 않은 ID 행은 숫자 변환 전에 제외 (버려질 행의 잘못된 값으로 실패하지 않도록)
+        att_df = att_df[valid]
+        emp_ids = emp_ids[valid]
+
+        def numeric_column(col_name, default):
+            if col_name in att_df.columns:
+                return att_df[col_name].astype(float)
+            return pd.Series(float(default), index=att_df.index)
+
+        actual_days = numeric_column('ACTUAL WORK DAY', 0)
+        total_days = numeric_column('TOTAL WORK DAY', 27)
+        ar1_absences = numeric_column('AR1 Absences', 0)
+        unapproved_absences = numeric_column('Unapproved Absences', 0)
+        absence_rate = numeric_column('Absence Rate (%)', 0)
+
+        # previous 형식andof 호환성 위해
+        if 'Absence (without permission) time' in att_df.columns:
+            unapproved_absences = numeric_column('Absence (without permission) time', 0)
+        if 'Absence (without permission) Ratio (%)' in att_df.columns:
+            absence_rate = numeric_column('Absence (without permission) Ratio (%)', 0)
+
+        # 실제 근무 days 전체 근무 days보다 많은 경우 조정 (absence rate 0)
+        over_worked = actual_days > total_days
+        actual_days = actual_days.where(~over_worked, total_days)
+        absence_rate = absence_rate.where(~over_worked, 0.0)
+        absence_rate = absence_rate.where(~(absence_rate < 0), 0.0)
+
+        return pd.DataFrame({
+            'Employee No': emp_ids.values,
+            'Total Working Days': total_days.values,
+            'Actual Working Days': actual_days.values,
+            'AR1 Absences': ar1_absences.values,
+            'Unapproved Absences': unapproved_absences.values,
+            '결근율_Absence_Rate_Percent': absence_rate.values
+        })
+
+    def _build_daily_attendance_results(self, att_df: pd.DataFrame, emp_col: str) -> pd.DataFrame:
+        """original  days별 attendance data를 AttendanceIndex로 한 번에 집계"""
+        attendance_index = AttendanceIndex(att_df, emp_col)
+        if 'compAdd' in att_df.columns and attendance_index.date_col is None:
+            print(f"⚠️ Date column 없어 Accurate attendance days calculation may be difficult (record count 사용)")
+
+        total_working_days = self.config.working_days
+        emp_ids, actual_list, ar1_list, rate_list = [], [], [], []
+
+        # employee별 결과 (unique ID 순서 유지, dict 조회only)
+        for raw_id in att_df[emp_col].dropna().unique():
+            emp_id = self.standardize_employee_id(raw_id)
+            if not emp_id:
+                continue
+
+            if not attendance_index.has_records(emp_id):
+                run_log.detail('attendance.not_found', lambda: f"⚠️ Attendance data not found: {emp_id}")
+                continue
+
+            actual_working_days = min(attendance_index.get_worked_days(emp_id), total_working_days)
+            if total_working_days > 0:
+                absence_rate = ((total_working_days - actual_working_days) / total_working_days) * 100
+            else:
+                absence_rate = 0
+            if absence_rate < 0:
+                absence_rate = 0
+
+            emp_ids.append(emp_id)
+            actual_list.append(actual_working_days)
+            ar1_list.append(attendance_index.get_ar1_absences(emp_id))
+            rate_list.append(round(absence_rate, 2))
+
+        if not emp_ids:
+            return pd.DataFrame()
+
+        return pd.DataFrame({
+            'Employee No': emp_ids,
+            'Total Working Days': [total_working_days] * len(emp_ids),
+            'Actual Working Days': actual_list,
+            'AR1 Absences': ar1_list,  # AR1 absences are the unapproved absences
+            'Unapproved Absences': ar1_list,
+            '결근율_Absence_Rate_Percent': rate_list
+        })
+
     def process_5pairs_conditions(self, prs_df: pd.DataFrame) -> pd.DataFrame:
         """5PRS conditions processing - TQC ID (inspection 대상자) basis"""
         print("\n📊 5PRS Processing conditions...")
@@ -1068,59 +1259,130 @@ class DataProcessor:
         2. Next_Month_Expected 컬럼 직접 읽기 (fallback)
         3. 인센티브 금액 역산 (progression_table 동적 사용)
 
+        이전 달 데이터는 run당 한 번만 로딩하고, 직원별 결과는
+        get_continuity_map()의 사전 계산 결과를 조회합니다.
+
         Args:
             emp_id: 직원 ID
-            month_data: 현재 달 데이터 (옵션)
+            month_data: 현재 달 데이터 (옵션, 호환성 유지용)
 
         Returns:
             int: 다음 달 연속 개월 수 (1-15)
         """
-        continuous_months = 0
-
-        # month_data 전달되지 않으면 self.month_data 사용 (호환성 유지)
-        if month_data is None and hasattr(self, 'month_data'):
-            month_data = self.month_data
-
         # Employee ID 9자리 패딩
         emp_id_padded = str(emp_id).zfill(9)
 
-        # ============================================
-        # 이전 달 데이터 로딩
-        # ============================================
-        prev_df, prev_month_name = self._load_previous_month_data()
+        continuity_map, prev_month_name = self.get_continuity_map()
 
-        if prev_df is None or prev_df.empty:
-            print(f"[New Employee] {emp_id_padded}: No previous month data → Starting at 1 month")
+        if continuity_map is None:
+            run_log.detail('continuity.new_no_previous_month', lambda: f"[New Employee] {emp_id_padded}: No previous month data → Starting at 1 month")
             return 1
 
-        # 이전 달에서 해당 직원 찾기
-        emp_prev = prev_df[prev_df['Employee No'] == emp_id_padded]
-
-        if emp_prev.empty:
-            print(f"[New Employee] {emp_id_padded}: Not found in {prev_month_name} data → Starting at 1 month")
+        entry = continuity_map.get(emp_id_padded)
+        if entry is None:
+            run_log.detail('continuity.new_not_in_previous_month', lambda: f"[New Employee] {emp_id_padded}: Not found in {prev_month_name} data → Starting at 1 month")
             return 1
 
-        prev_row = emp_prev.iloc[0]
+        continuous_months, priority, messages = entry
+        key = f'continuity.priority{priority}' if priority else 'continuity.default_1_month'
+        run_log.detail(key, lambda: '\n'.join(messages))
+        return continuous_months
+
+    def continuous_months_for(self, emp_ids) -> np.ndarray:
+        """
+        여러 직원의 연속 개월 수 (calculate_continuous_months_from_history 일괄 버전)
+
+        신규 직원 수와 우선순위별(continuity.priorityN) 직원 수를 run_log 카운터에 한 번에 집계합니다
+        (--verbose에서 신규 직원 요약 + 직원별 우선순위 로그 출력).
+        """
+        emp_ids_padded = [str(emp_id).zfill(9) for emp_id in emp_ids]
+        if not emp_ids_padded:
+            return np.zeros(0, dtype=int)
+
+        continuity_map, prev_month_name = self.get_continuity_map()
+        if continuity_map is None:
+            run_log.count('continuity.new_no_previous_month', len(emp_ids_padded))
+            if run_log.verbose:
+                print(f"[New Employee] {len(emp_ids_padded)} employees: No previous month data → Starting at 1 month")
+            return np.ones(len(emp_ids_padded), dtype=int)
+
+        entries = [continuity_map.get(emp_id) for emp_id in emp_ids_padded]
+        new_count = sum(entry is None for entry in entries)
+        if new_count:
+            run_log.count('continuity.new_not_in_previous_month', new_count)
+            if run_log.verbose:
+                print(f"[New Employee] {new_count} employees not found in {prev_month_name} data → Starting at 1 month")
+
+        priority_counts = Counter(entry[1] for entry in entries if entry is not None)
+        for priority, count in priority_counts.items():
+            run_log.count(f'continuity.priority{priority}' if priority else 'continuity.default_1_month', count)
+        if run_log.verbose:
+            for entry in entries:
+                if entry is not None:
+                    print('\n'.join(entry[2]))
+        return np.array([1 if entry is None else entry[0] for entry in entries], dtype=int)
+
+    def get_continuity_map(self) -> tuple:
+        """
+        이전 달 연속 개월 수 맵 반환 (최초 호출 시 1회 빌드)
+
+        Returns:
+            tuple: ({emp_id_padded: (개월수, 우선순위, 로그 메시지)}, month_name)
+                   이전 달 데이터가 없으면 (None, None)
+        """
+        if self._continuity_map_loaded:
+            return self._continuity_map
+
+        self._continuity_map_loaded = True
+        prev_df, prev_month_name = self._load_previous_month_data()
 
+        if prev_df is None or prev_df.empty:
+            self._continuity_map = (None, None)
+            return self._continuity_map
+
+        continuity_map = {}
+        for prev_row in prev_df.to_dict('records'):
+            emp_id_padded = prev_row.get('Employee No')
+            # 중복 ID는 첫 번째 행 우선 (기존 iloc[0] 동작)
+            if emp_id_padded in continuity_map:
+                continue
+            continuity_map[emp_id_padded] = self._resolve_continuity_entry(
+                emp_id_padded, prev_row, prev_df.columns, prev_month_name
+            )
+
+        self._continuity_map = (continuity_map, prev_month_name)
+        print(f"✅ Continuity map built from {prev_month_name} data: {len(continuity_map)} employees")
+        return self._continuity_map
+
+    def reset_continuity_map(self):
+        """이전 달 데이터 캐시 초기화 (새 calculation run 시작 시)"""
+        self._continuity_map = (None, None)
+        self._continuity_map_loaded = False
+
+    def _resolve_continuity_entry(self, emp_id_padded: str, prev_row: Dict,
+                                  prev_columns, prev_month_name: str) -> tuple:
+        """이전 달 한 행에서 (개월수, 우선순위, 로그 메시지) 계산"""
         # ============================================
         # 우선순위 1: Continuous_Months + 1 (가장 신뢰성 높음)
         # ============================================
-        if 'Continuous_Months' in prev_df.columns:
+        if 'Continuous_Months' in prev_columns:
             cont_months = prev_row.get('Continuous_Months', 0)
             if pd.notna(cont_months) and cont_months != '' and float(cont_months) >= 0:
                 continuous_months = int(cont_months) + 1
-                print(f"✅ {emp_id_padded}: [Priority 1] Continuous_Months + 1 → {int(cont_months)} + 1 = {continuous_months} months")
-                return continuous_months
+                return (continuous_months, 1, (
+                    f"✅ {emp_id_padded}: [Priority 1] Continuous_Months + 1 → {int(cont_months)} + 1 = {continuous_months} months",
+                ))
 
         # ============================================
         # 우선순위 2: Next_Month_Expected 컬럼 (fallback)
         # ============================================
-        if 'Next_Month_Expected' in prev_df.columns:
+        if 'Next_Month_Expected' in prev_columns:
             next_expected = prev_row.get('Next_Month_Expected', 0)
             if pd.notna(next_expected) and next_expected != '' and float(next_expected) > 0:
                 continuous_months = int(next_expected)
-                print(f"✅ {emp_id_padded}: [Priority 2] Next_Month_Expected column → {continuous_months} months")
-                return continuous_months
+                return (continuous_months, 2, (
+                    f"✅ {emp_id_padded}: [Priority 2] Next_Month_Expected column → {continuous_months} months",
+                ))
 
         # ============================================
         # 우선순위 3: 인센티브 금액 역산
@@ -1134,25 +1396,70 @@ class DataProcessor:
             'Source_Final_Incentive'
         ]
 
+        messages = []
         prev_incentive = None
         for col_name in incentive_columns:
-            if col_name in prev_df.columns:
+            if col_name in prev_columns:
                 val = prev_row.get(col_name, 0)
                 if pd.notna(val) and val != '' and float(val) > 0:
                     prev_incentive = float(val)
-                    print(f"  📊 {emp_id_padded}: Found incentive in column '{col_name}': {prev_incentive:,.0f} VND")
+                    messages.append(f"  📊 {emp_id_padded}: Found incentive in column '{col_name}': {prev_incentive:,.0f} VND")
                     break
 
         if prev_incentive is not None and prev_incentive > 0:
-            continuous_months = self._reverse_calculate_months_from_incentive(prev_incentive)
-            print(f"✅ {emp_id_padded}: [Priority 3] Reverse calculation from {prev_incentive:,.0f} VND → {continuous_months} months")
-            return continuous_months
+            continuous_months = self._reverse_calculate_months_from_incentive(prev_incentive, verbose=False)
+            if continuous_months is None:
+                incentive_int = int(prev_incentive)
+                messages.append(f"  ⚠️ Incentive amount {incentive_int:,} VND not found in progression_table → defaulting to 1 month")
+                messages.append(f"  ⚠️ This may indicate a special bonus or manual adjustment. Manual verification recommended.")
+                continuous_months = 1
+            messages.append(f"✅ {emp_id_padded}: [Priority 3] Reverse calculation from {prev_incentive:,.0f} VND → {continuous_months} months")
+            return (continuous_months, 3, tuple(messages))
 
         # ============================================
         # Fallback: 데이터 없음 → 1개월로 시작
         # ============================================
-        print(f"⚠️ {emp_id_padded}: No valid data in {prev_month_name} → Defaulting to 1 month")
-        return 1
+        messages.append(f"⚠️ {emp_id_padded}: No valid data in {prev_month_name} → Defaulting to 1 month")
+        return (1, 0, tuple(messages))
+
+    @staticmethod
+    def history_columns(month_obj) -> List[str]:
+        """다음 달 계산에서 읽는 결과 컬럼 (연속 개월 + 인센티브 컬럼 후보)"""
+        name = month_obj.full_name.lower()
+        return [
+            'Continuous_Months', 'Next_Month_Expected',
+            f'{name}_Incentive', f'{name.capitalize()}_Incentive', f'{name.upper()}_Incentive',
+            f'{name}_incentive', f'{month_obj.korean_name} incentive',
+            'Final Incentive amount', 'incentive 지급액', 'Source_Final_Incentive'
+        ]
+
+    def read_previous_output(self, file_path: str, year: int, month_obj) -> pd.DataFrame:
+        """
+        이전 달 결과 CSV 로드 (history ledger 우선, 없으면 CSV 직접 읽기)
+
+        ledger 결과에는 'Employee No'와 history_columns() 중 존재하는 컬럼만 포함됩니다.
+        """
+        if self.history_ledger is not None:
+            df = self.history_ledger.load_month(
+                file_path, year, month_obj.number, self.history_columns(month_obj)
+            )
+            if df is not None:
+                return df
+        return pd.read_csv(file_path, encoding='utf-8-sig')
+
+    def record_history(self, csv_file: str, month_data: pd.DataFrame):
+        """이번 달 결과를 history ledger에 기록 (다음 달 계산에서 CSV 재로드 없이 조회)"""
+        if self.history_ledger is None:
+            return
+        try:
+            count = self.history_ledger.record_frame(
+                csv_file, self.config.year, self.config.month.number,
+                month_data, self.history_columns(self.config.month)
+            )
+            print(f"✅ History ledger updated: {self.config.get_month_str('capital')} {self.config.year} ({count} rows)")
+            print(f"  → history ledger: {self.history_ledger.hits} hit, {self.history_ledger.backfills} backfilled")
+        except Exception as e:
+            print(f"⚠️ History ledger update failed: {e}")
 
     def _load_previous_month_data(self) -> tuple:
         """
@@ -1193,7 +1500,7 @@ class DataProcessor:
             if os.path.exists(august_file):
                 try:
                     print(f"📂 September calculation: Loading August CSV from {august_file}")
-                    august_df = pd.read_csv(august_file, encoding='utf-8-sig')
+                    august_df = self.read_previous_output(august_file, prev_year, prev_month_obj)
 
                     # Employee No 표준화
                     if 'Employee No' in august_df.columns:
@@ -1228,7 +1535,7 @@ class DataProcessor:
             if os.path.exists(excel_path):
                 try:
                     print(f"📂 Loading previous month data from {os.path.basename(excel_path)}")
-                    prev_df = pd.read_csv(excel_path, encoding='utf-8-sig')
+                    prev_df = self.read_previous_output(excel_path, prev_year, prev_month_obj)
 
                     # Employee No 표준화
                     if 'Employee No' in prev_df.columns:
@@ -1250,7 +1557,6 @@ class DataProcessor:
         """AQL history file 활용한 3-month consecutive failure 체크"""
         print("\n📊 AQL History Checking 3-month consecutive failures based on files...")
         
-        import tempfile
         import os
         import glob
         import re
@@ -1261,41 +1567,14 @@ class DataProcessor:
             개선사항 (2025-10-07):
             - Mixed-month 데이터 자동 필터링
             - October 2025 이슈 재발 방지
-            """
-            file_path = f'input_files/AQL history/1.HSRG AQL REPORT-{month_name}.2025.csv'
-
-            if not os.path.exists(file_path):
-                return None
 
+            개선사항 (2025-11-20):
+            - 공통 aql_history_reader 사용 (헤더 병합 in-memory, 프로세스 내 캐시)
+            """
             try:
-                # file 텍스트with first 읽어서 헤더 processing
-                with open(file_path, 'r', encoding='utf-8-sig') as f:
-                    lines = f.readlines()
-
-                # 임시 fileto 정리done data 쓰기
-                with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8') as tmp:
-                    # 실제 파일의 헤더 사용 (1-2번째 줄 결합)
-                    # 1번째 줄과 2번째 줄을 결합하여 완전한 헤더 생성
-                    header_line1 = lines[0].rstrip('\n').rstrip('\r')
-                    header_line2 = lines[1].rstrip('\n').rstrip('\r')
-
-                    # 2번째 줄이 quote로 시작하는 경우 처리
-                    if header_line2.startswith('"') or header_line2.startswith('NO"'):
-                        # 이전 줄의 마지막 필드와 결합
-                        full_header = header_line1 + header_line2
-                    else:
-                        full_header = header_line1 + ',' + header_line2
-
-                    tmp.write(full_header + '\n')
-
-                    # data 라인들 쓰기 (3번째 줄from)
-                    for line in lines[2:]:
-                        tmp.write(line)
-                    tmp_path = tmp.name
-
-                # 임시 파일에서 data 읽기
-                df = pd.read_csv(tmp_path)
-                os.unlink(tmp_path)  # 임시 file 삭제
+                df = load_aql_month(month_name, 2025)
+                if df is None:
+                    return None
 
                 # ==========================================
                 # 자동 필터링 로직 추가 (2025-10-07)
@@ -1330,6 +1609,15 @@ class DataProcessor:
             except Exception as e:
                 return None
         
+        def load_aql_summary(month_name):
+            """월별 AQL 요약 (history ledger에 있으면 파싱 없이 사용)"""
+            loader = lambda: load_aql_history(month_name)
+            if self.history_ledger is not None:
+                return self.history_ledger.get_aql_summary(
+                    get_aql_report_path(month_name, 2025), month_name.upper(), loader
+                )
+            return summarize_aql_month(loader(), month_name.upper())
+
         def get_latest_three_months():
             """최신 3-month 자same 선택 (fileemployeesand MONTH column validation)
 
@@ -1337,6 +1625,9 @@ class DataProcessor:
             - 첫 행뿐만 아니라 전체 행의 MONTH 값 검증
             - Mixed-month 데이터 자동 필터링
             - October 2025 이슈 재발 방지
+
+            개선사항 (2025-11-20):
+            - 파일별 요약(MONTH, FAIL 건수)을 history ledger에서 재사용
             """
             print("\n  🔍 Scanning AQL history files...")
 
@@ -1357,20 +1648,11 @@ class DataProcessor:
                 if match:
                     filename_month = match.group(1)
 
-                    # file withload
-                    df = load_aql_history(filename_month)
-                    if df is not None and not df.empty:
-                        # ==========================================
-                        # 개선된 검증 로직 (2025-10-07)
-                        # ==========================================
-
-                        # 1. 첫 행 MONTH 확인 (기존 로직 호환)
-                        first_month = df['MONTH'].iloc[0]
-
-                        # 2. 전체 행의 MONTH 확인 (NEW - October 2025 문제 방지)
-                        unique_months = df['MONTH'].dropna().unique()
-
-                        # 3. 파일명과 일치하는 월 번호 찾기
+                    # 월 요약 (load_aql_history에서 Mixed-month 자동 필터링 완료)
+                    summary = load_aql_summary(filename_month)
+                    aql_summaries[filename_month] = summary
+                    if summary.row_count > 0:
+                        # 파일명과 일치하는 월 번호 찾기
                         expected_month_num = None
                         for num, name in month_map.items():
                             if name.upper() == filename_month.upper():
@@ -1381,30 +1663,14 @@ class DataProcessor:
                             print(f"    ⚠️ {filename_month}: Unknown month name")
                             continue
 
-                        # 4. Mixed-month 데이터 검출 및 자동 필터링
-                        if len(unique_months) > 1:
-                            print(f"    ⚠️ {filename_month}: Multiple months detected - {sorted([int(m) for m in unique_months])}")
-
-                            # 올바른 월만 필터링
-                            original_count = len(df)
-                            df = df[df['MONTH'] == expected_month_num].copy()
-                            filtered_count = original_count - len(df)
+                        # 첫 행 검증 (기존 로직)
+                        month_value = summary.month_value
 
-                            print(f"       → Auto-filtered: removed {filtered_count} records from other months")
-                            print(f"       → Keeping {len(df)} records for month {expected_month_num}")
-
-                            if len(df) == 0:
-                                print(f"    ❌ {filename_month}: No valid records after filtering")
-                                continue
-
-                        # 5. 첫 행 검증 (기존 로직)
-                        month_value = df['MONTH'].iloc[0]
-
-                        if pd.notna(month_value):
+                        if month_value is not None:
                             month_num = int(month_value)
                             month_name = month_map.get(month_num, '')
 
-                            # 6. 최종 검증: 파일명 == MONTH 컬럼
+                            # 최종 검증: 파일명 == MONTH 컬럼
                             if filename_month.upper() == month_name.upper():
                                 valid_months[month_num] = filename_month
                                 print(f"    ✅ {filename_month}: validation passed (MONTH={month_num})")
@@ -1423,6 +1689,7 @@ class DataProcessor:
             return latest_three
         
         # 1. 최신 3-month 자same 선택
+        aql_summaries = {}
         latest_months = get_latest_three_months()
         
         if not latest_months or len(latest_months) < 3:
@@ -1430,59 +1697,38 @@ class DataProcessor:
             print("  ⚠️ Auto-selection failed, using default values (MAY, JUNE, JULY)")
             latest_months = ['MAY', 'JUNE', 'JULY']
         
-        # 2. 3-month AQL history file withload
-        month_dfs = {}
+        # 2. 3-month AQL history 요약 withload
+        month_summaries = {}
         for month_name in latest_months:
-            df = load_aql_history(month_name)
-            if df is not None:
-                month_dfs[month_name] = df
+            summary = aql_summaries.get(month_name) or load_aql_summary(month_name)
+            if summary.loaded:
+                month_summaries[month_name] = summary
                 # 빈 행 제거한 실제 data cases수 표시
-                valid_rows = df.dropna(how='all')
-                print(f"  ✅ {month_name} AQL history withload: {len(valid_rows)}cases")
+                print(f"  ✅ {month_name} AQL history withload: {summary.valid_rows}cases")
             else:
                 print(f"  ⚠️ {month_name} AQL history file load failed")
         
         # 3-month 모두 withload되었지 checking
-        if len(month_dfs) < 3:
+        if len(month_summaries) < 3:
             print("  ❌ Cannot load all required AQL history files. Processing with legacy method.")
             return self.process_aql_conditions(aql_df)
         
-        # month별 DataFrame 할당 (latest_months 순서대with)
-        month1_df = month_dfs[latest_months[0]]
-        month2_df = month_dfs[latest_months[1]]
-        month3_df = month_dfs[latest_months[2]]
+        # month별 요약 할당 (latest_months 순서대with)
+        month1_summary = month_summaries[latest_months[0]]
+        month2_summary = month_summaries[latest_months[1]]
+        month3_summary = month_summaries[latest_months[2]]
         
         # 2. 각 monthof failures 추출
-        def get_failures(df, month_name):
-            """각 monthof failure employeeand cases수 추출"""
-            failures = {}
-            
-            # EMPLOYEE NO 유효한 dataonly 필터링
-            valid_df = df[df['EMPLOYEE NO'].notna()].copy()
-            valid_df['EMPLOYEE NO'] = valid_df['EMPLOYEE NO'].astype(str).str.strip()
-            
-            # employee별 failure cases수 calculation
-            for emp_id_raw in valid_df['EMPLOYEE NO'].unique():
-                if emp_id_raw == 'nan' or len(emp_id_raw) < 3:
-                    continue
-                
-                # 9자리with 패ing
-                emp_id = emp_id_raw.split('.')[0].zfill(9)  # float 형식 processing
-                
-                # original IDwith 검색
-                emp_data = valid_df[valid_df['EMPLOYEE NO'].astype(str).str.strip() == emp_id_raw]
-                fail_count = len(emp_data[emp_data['RESULT'].str.upper() == 'FAIL'])
-                
-                if fail_count > 0:
-                    failures[emp_id] = fail_count
-            
+        def get_failures(summary, month_name):
+            """각 monthof failure employeeand cases수 (EMPLOYEE_ID 9자리 기준)"""
+            failures = summary.failures
             print(f"  → {month_name}: {len(failures)}명 failure")
             return failures
         
         # 각 monthof failures 추출
-        month1_failures = get_failures(month1_df, latest_months[0])
-        month2_failures = get_failures(month2_df, latest_months[1])
-        month3_failures = get_failures(month3_df, latest_months[2])
+        month1_failures = get_failures(month1_summary, latest_months[0])
+        month2_failures = get_failures(month2_summary, latest_months[1])
+        month3_failures = get_failures(month3_summary, latest_months[2])
         
         # 3. 3-month consecutive failures 찾기
         continuous_fail_employees = set()
@@ -1497,7 +1743,7 @@ class DataProcessor:
 
             if month1_fail and month2_fail and month3_fail:
                 continuous_fail_employees.add(emp_id)
-                print(f"    ✅ {emp_id}: 3-month consecutive failure ({latest_months[0]}:{month1_failures.get(emp_id)}cases, {latest_months[1]}:{month2_failures.get(emp_id)}cases, {latest_months[2]}:{month3_failures.get(emp_id)}cases)")
+                run_log.detail('aql.continuous_fail_employee', lambda: f"    ✅ {emp_id}: 3-month consecutive failure ({latest_months[0]}:{month1_failures.get(emp_id)}cases, {latest_months[1]}:{month2_failures.get(emp_id)}cases, {latest_months[2]}:{month3_failures.get(emp_id)}cases)")
 
         print(f"\n  📊 3-month consecutive failures: {len(continuous_fail_employees)}명")
 
@@ -1506,28 +1752,13 @@ class DataProcessor:
         current_month_fail_col = f"{self.config.get_month_str('capital')} AQL Failures"
         
         # 최신 month(3번째 month) datafrom BUILDING 정보 추출
+        # previous monthfromalso BUILDING 정보 수집 (최신 monthto 없 경우 대비)
         employee_buildings = {}
-        if 'BUILDING' in month3_df.columns:
-            for _, row in month3_df.iterrows():
-                emp_no = str(row['EMPLOYEE NO']).strip()
-                if emp_no and emp_no != 'nan':
-                    if '.' in emp_no:
-                        emp_no = str(int(float(emp_no)))
-                    emp_no = emp_no.zfill(9)
+        for summary in [month3_summary, month2_summary, month1_summary]:
+            if summary.buildings is not None:
+                for emp_no, building in summary.buildings.items():
                     if emp_no not in employee_buildings:
-                        employee_buildings[emp_no] = row['BUILDING']
-        
-        # previous monthfromalso BUILDING 정보 수집 (최신 monthto 없 경우 대비)
-        for month_df in [month2_df, month1_df]:
-            if 'BUILDING' in month_df.columns:
-                for _, row in month_df.iterrows():
-                    emp_no = str(row['EMPLOYEE NO']).strip()
-                    if emp_no and emp_no != 'nan':
-                        if '.' in emp_no:
-                            emp_no = str(int(float(emp_no)))
-                        emp_no = emp_no.zfill(9)
-                        if emp_no not in employee_buildings:
-                            employee_buildings[emp_no] = row['BUILDING']
+                        employee_buildings[emp_no] = building
         
         # 모든 employeeof 결and include (failure 없더라also)
         # first default data프레임from 모든 employee ID 져오기
@@ -1690,6 +1921,10 @@ class DataProcessor:
 class CompleteQIPCalculator:
     """완전한 QIP incentive calculation기 (improved 버전)"""
 
+    # 상세 profiling할 단계 이름과 backend (--profile-stage / --profiler, None이면 단계별 측정만)
+    profile_stage = None
+    profiler_backend = 'cprofile'
+
     def __init__(self, data: Dict[str, pd.DataFrame], config: MonthConfig):
         self.config = config
         self.month_data = None
@@ -1703,11 +1938,36 @@ class CompleteQIPCalculator:
         from pathlib import Path
         self.base_path = Path.cwd()
 
+        # True면 previous month 결과 확인/재계산 생략 (이전 달 결과가 없는 가장 오래된 월 재계산 시)
+        self.skip_previous_month_check = False
+
+        # preparation 단계에서 previous month 결과 file을 사용했는지 (batch mode 재준비 판단용)
+        self.prepared_with_previous_output = False
+
+        # save_results의 background Excel export handle (ExcelExportHandle)
+        self.excel_export = None
+
         # data saved
         self.raw_data = data
 
+        # attendance index (승인휴가 calculation 시 lazy 빌드)
+        self._attendance_index = None
+        self._attendance_index_loaded = False
+
+        # 조직 그래프 (create_manager_subordinate_mapping에서 빌드)
+        self.org_graph = None
+
+        # 담당 구역 AQL 캐시 (mapping JSON / AQL 프레임 / (month, mapping hash)별 집계)
+        self._area_mapping_cache = None
+        self._area_aql_frame_cache = {}
+        self._area_reject_stats_cache = {}
+
+        # 단계별 profiling (save_results에서 결과 CSV 옆에 *_stage_profile.json 저장)
+        self.profiler = StageProfiler(self.profile_stage, self.profiler_backend)
+
         # preparation 작업
-        self.prepare_integrated_data()
+        with self.profiler.stage('prepare_integrated_data', self._stage_rows):
+            self.prepare_integrated_data()
 
     def load_july_incentive_data(self):
         """July incentive data withload (August calculation 시 특별 processing)"""
@@ -1919,6 +2179,7 @@ class CompleteQIPCalculator:
                 aql_conditions = self.data_processor.process_aql_conditions_with_history()
             else:
                 print("  → Using legacy method (based on previous incentive file)")
+                self.prepared_with_previous_output = historical_data is not None
                 aql_conditions = self.data_processor.process_aql_conditions(
                     self.raw_data[aql_key],
                     historical_data
@@ -2047,7 +2308,7 @@ class CompleteQIPCalculator:
                 ])
                 rate = (fails_all / total_all * 100) if total_all > 0 else 0
                 self.month_data.loc[idx, 'Area_Reject_Rate'] = rate
-                print(f"  → MODEL MASTER {emp_id}: 전체 area reject율 = {rate:.2f}%")
+                run_log.detail('area_reject.model_master', lambda: f"  → MODEL MASTER {emp_id}: 전체 area reject율 = {rate:.2f}%")
 
             # Auditor & Training Team인 경우
             elif 'AUDIT' in position or 'TRAINING' in position:
@@ -2119,7 +2380,7 @@ class CompleteQIPCalculator:
                             # 레거시 컬럼 삭제:                             # minimum 근무 days conditiononly 체크 (Absence Rate 나in progressto calculation)
                             # 레거시 컬럼 삭제: self.month_data.loc[idx, 'attendancy condition 4 - minimum working days'] = 'yes' if actual_days < 12 else 'no'
 
-                            print(f"  → 퇴사자 {row.get('Employee No', '')}: {stop_date.strftime('%Y-%m-%d')} 퇴사, 근무능 days {working_days_possible} days (Absence Rate 승인휴 반영하여 나in progressto calculation)")
+                            run_log.detail('resigned.working_days_adjusted', lambda: f"  → 퇴사자 {row.get('Employee No', '')}: {stop_date.strftime('%Y-%m-%d')} 퇴사, 근무능 days {working_days_possible} days (Absence Rate 승인휴 반영하여 나in progressto calculation)")
                         
                         # calculation month previous 퇴사자
                         elif stop_date < calc_month_start:
@@ -2169,7 +2430,7 @@ class CompleteQIPCalculator:
                             # 레거시 컬럼 삭제:                             self.month_data.loc[idx, 'Total Working Days'] = 0
                             # 레거시 컬럼 삭제: self.month_data.loc[idx, 'attendancy condition 1 - acctual working days is zero'] = 'yes'
                             self.month_data.loc[idx, '결근율_Absence_Rate_Percent'] = 100.0
-                            print(f"  → Stop Working employee {row.get('Employee No', '')}: {stop_date.strftime('%Y-%m-%d')} 퇴사 → Actual Working Days = 0")
+                            run_log.detail('resigned.before_month_zero_days', lambda: f"  → Stop Working employee {row.get('Employee No', '')}: {stop_date.strftime('%Y-%m-%d')} 퇴사 → Actual Working Days = 0")
                     except Exception as e:
                         print(f"  ⚠️ Stop Working Date processing 오류 (employee {row.get('Employee No', '')}): {e}")
         
@@ -2215,7 +2476,7 @@ class CompleteQIPCalculator:
                     emp_no = row.get('Employee No', 'Unknown')
                     emp_name = row.get('Full Name', 'Unknown')
                     position = row.get('QIP POSITION 1ST  NAME', 'Unknown')
-                    print(f"  → TYPE-1 → TYPE-2 수정: {emp_no} ({emp_name}) - {position}")
+                    run_log.detail('type.stitching_type1_to_type2', lambda: f"  → TYPE-1 → TYPE-2 수정: {emp_no} ({emp_name}) - {position}")
                     correction_count += 1
                 
                 # TYPE TYPE-2with 수정
@@ -2258,161 +2519,160 @@ class CompleteQIPCalculator:
         return True
     
     def ensure_previous_month_exists(self):
-        """previous month incentive file checking 및 자same created"""
-        if self.config.month.number == 1:
-            prev_month = 12
-            prev_year = self.config.year - 1
-        else:
-            prev_month = self.config.month.number - 1
-            prev_year = self.config.year
-        
-        prev_month_obj = Month.from_number(prev_month)
+        """previous month incentive file checking 및 자same created
 
-        # Fallback pattern: V9.0 먼저 확인, 없으면 V8.02, V8.01로 폴백
-        prev_file_patterns = [
-            self.base_path / 'output_files' / f'output_QIP_incentive_{prev_month_obj.full_name}_{prev_year}_Complete_V9.0_Complete.csv',
-            self.base_path / 'output_files' / f'output_QIP_incentive_{prev_month_obj.full_name}_{prev_year}_Complete_V8.02_Complete.csv',
-            self.base_path / 'output_files' / f'output_QIP_incentive_{prev_month_obj.full_name}_{prev_year}_Complete_V8.01_Complete.csv'
-        ]
+        직전 달 결과가 없으면 결과 없는 조상 월을 모두 찾아 오래된 월부터
+        실제 실행과 같은 흐름(calculate_all_incentives + save_results)으로 한 번씩 계산합니다.
+        """
+        if self.skip_previous_month_check:
+            print("⚠️ previous month result not available → previous month check skipped")
+            return
 
-        prev_file_path = None
-        for pattern in prev_file_patterns:
-            if pattern.exists():
-                prev_file_path = pattern
-                break
+        prev_year, prev_month = previous_month(self.config.year, self.config.month.number)
+        scheduler = MonthScheduler(
+            self.base_path, self._find_month_result, self._can_compute_month, self._compute_month_result
+        )
+        if scheduler.lookup(prev_year, prev_month) is not None:
+            return
 
-        if prev_file_path is None:
-            print(f"\n📊 {prev_month}month incentive file not found.")
-            print(f"   {prev_month}month 자동으로 calculation합니다...")
-            
-            # previous month calculationto 필요한 file들 체크
-            if not self.check_required_files_for_month(prev_month_obj, prev_year):
-                print(f"\n❌ {prev_month}month calculation in progressproceed.")
-                print(f"   필요한 file들 first preparation해주세요.")
-                print(f"\n❌ {self.config.month.number}month calculationalso in progressproceed.")
-                print(f"   previous month data 필요하므with {prev_month}month first preparation해주세요.")
-                raise Exception(f"{prev_month}month data 없어 {self.config.month.number}month calculation in progressproceed.")
-            
-            print(f"\n✅ {prev_month}month calculationto 필요한 file 모두 있습니다.")
-            print(f"   {prev_month}month calculation started...")
-            
-            # previous month calculation기 created 및 실행
-            # previous month config file withload
-            prev_config_file = self.base_path / 'config_files' / f'config_{prev_month_obj.full_name}_{prev_year}.json'
-            if not prev_config_file.exists():
-                print(f"❌ {prev_month}month config file not found: {prev_config_file}")
-                raise Exception(f"{prev_month}month config file 없어 {self.config.month.number}month calculation in progressproceed.")
-            
-            # JSON file withload
-            import json
-            with open(prev_config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            
-            # previous_months Month 객체with 변환
-            prev_months_str = config_data.get('previous_months', [])
-            prev_months_obj = []
-            for month_str in prev_months_str:
-                # Month enum 찾기
-                for m in Month:
-                    if m.full_name == month_str:
-                        prev_months_obj.append(m)
-                        break
-            
-            # MonthConfig created
-            prev_config = MonthConfig(
-                month=prev_month_obj,
-                year=prev_year,
-                working_days=config_data.get('working_days', 22),
-                previous_months=prev_months_obj,
-                file_paths=config_data.get('file_paths', {}),
-                output_prefix=config_data.get('output_prefix', f'output_QIP_incentive_{prev_month_obj.full_name}_{prev_year}')
-            )
-            
-            prev_data_loader = CompleteDataLoader(prev_config)
-            prev_data = prev_data_loader.load_all_files()
-            
-            if not prev_data:
-                print(f"❌ {prev_month}month data load failed")
-                raise Exception(f"{prev_month}month data load failedwith {self.config.month.number}month calculation in progressproceed.")
-            
-            # previous month calculation기 created
-            prev_processor = CompleteQIPCalculator(prev_data, prev_config)
-            
-            # 재귀 방지 위해 previous monthof previous month은 체크하지 않음
-            prev_processor.calculate_all_incentives_without_check()
+        print(f"\n📊 {prev_month}month incentive file not found.")
+        print(f"   {prev_month}month 자동으로 calculation합니다...")
+
+        if not scheduler.ensure_ancestors(self.config.year, self.config.month.number):
+            print(f"\n❌ {prev_month}month calculation in progressproceed.")
+            print(f"   필요한 file들 first preparation해주세요.")
+            print(f"\n❌ {self.config.month.number}month calculationalso in progressproceed.")
+            print(f"   previous month data 필요하므with {prev_month}month first preparation해주세요.")
+            raise Exception(f"{prev_month}month data 없어 {self.config.month.number}month calculation in progressproceed.")
+
+    def _find_month_result(self, year: int, month: int) -> Optional[str]:
+        """월 결과 CSV 경로 (V9.0 → V8.02 → V8.01 순서, 없으면 None)"""
+        month_name = Month.from_number(month).full_name
+        for version in ('V9.0', 'V8.02', 'V8.01'):
+            path = self.base_path / 'output_files' / f'output_QIP_incentive_{month_name}_{year}_Complete_{version}_Complete.csv'
+            if path.exists():
+                return str(path)
+        return None
 
-            # 결and saved
-            output_path = self.base_path / 'output_files' / f'output_QIP_incentive_{prev_month_obj.full_name}_{prev_year}_Complete_V9.0_Complete.csv'
-            prev_processor.month_data.to_csv(output_path, index=False, encoding='utf-8-sig')
-            
-            print(f"✅ {prev_month}month calculation completed\n")
-    
-    def calculate_all_incentives_without_check(self):
-        """previous month 체크 없 incentive calculation (재귀 방지용)"""
-        print(f"📊 TYPE별 incentive calculation started...")
-        
-        # manager-부하 mapping created
-        subordinate_mapping = self.create_manager_subordinate_mapping()
-        
-        # same days한 with직 실행
-        self.calculate_auditor_trainer_incentive(subordinate_mapping)
-        self.calculate_assembly_inspector_incentive_type1_only()
-        self.calculate_line_leader_incentive_type1_only(subordinate_mapping)
-        self.calculate_head_incentive(subordinate_mapping)
-        self.calculate_type2_incentive()
-        
-        print(f"✅ incentive calculation completed")
+    def _month_config_path(self, year: int, month: int) -> Path:
+        return self.base_path / 'config_files' / f'config_{Month.from_number(month).full_name}_{year}.json'
+
+    def _can_compute_month(self, year: int, month: int) -> bool:
+        """월 재계산 가능 여부 (필요한 입력 file + config file)"""
+        if not self.check_required_files_for_month(Month.from_number(month), year):
+            return False
+        config_file = self._month_config_path(year, month)
+        if not config_file.exists():
+            print(f"❌ {month}month config file not found: {config_file}")
+            return False
+        return True
+
+    def _compute_month_result(self, year: int, month: int, is_root: bool) -> Optional[str]:
+        """월 재계산 (main()의 --config 실행과 같은 흐름) → 저장된 결과 CSV 경로"""
+        print(f"\n✅ {month}month calculationto 필요한 file 모두 있습니다.")
+        print(f"   {month}month calculation started...")
+
+        month_config = ConfigManager.load_config(str(self._month_config_path(year, month)))
+        month_data = CompleteDataLoader(month_config).load_all_files()
+        if not month_data:
+            print(f"❌ {month}month data load failed")
+            return None
+
+        month_calculator = CompleteQIPCalculator(month_data, month_config)
+        month_calculator.skip_previous_month_check = is_root
+        month_calculator.calculate_all_incentives()
+        month_calculator.generate_summary()
+        if not month_calculator.save_results():
+            print(f"❌ {month}month result save failed")
+            return None
+
+        print(f"✅ {month}month calculation completed\n")
+        return str(self.base_path / 'output_files' / f"{month_config.output_prefix}_Complete_V9.0_Complete.csv")
     
     def calculate_all_incentives(self):
         """모든 incentive calculation 실행"""
         print(f"\n🚀 {self.config.get_month_str('korean')} QIP incentive calculation started...")
 
+        # previous month continuity map은 run마다 새로 빌드
+        self.data_processor.reset_continuity_map()
+        stage = self.profiler.stage
+        rows = self._stage_rows
+
         # 0. data validation
-        self.validate_and_report_issues()
+        with stage('validate_and_report_issues', rows):
+            self.validate_and_report_issues()
 
         # 0.5. previous month data checking
-        self.ensure_previous_month_exists()
+        with stage('ensure_previous_month_exists', rows):
+            self.ensure_previous_month_exists()
 
         # 0.6. July incentive data withload (August calculation 시)
-        self.load_july_incentive_data()
+        with stage('load_july_incentive_data', rows):
+            self.load_july_incentive_data()
 
         # 1. 특별 케스 processing
-        self.handle_special_cases()
+        with stage('handle_special_cases', rows):
+            self.handle_special_cases()
 
         # 1.5. 승인휴 반영 및 attendance condition 재calculation (incentive calculation 전 필수!)
         # ⚠️ CRITICAL: approved leave를 포함한 정확한 absence rate로 condition 재평가
         print(f"\n🔄 Updating attendance conditions with approved leave...")
-        self.add_condition_evaluation_to_excel()
+        with stage('add_condition_evaluation_to_excel', rows):
+            self.add_condition_evaluation_to_excel()
 
         # 2. Type-1 Assembly Inspector calculation
-        self.calculate_assembly_inspector_incentive_type1_only()
+        with stage('assembly_inspector_type1', rows):
+            self.calculate_assembly_inspector_incentive_type1_only()
         
         # 3. manager-부하 mapping created
-        subordinate_mapping = self.create_manager_subordinate_mapping()
+        with stage('create_manager_subordinate_mapping', rows):
+            subordinate_mapping = self.create_manager_subordinate_mapping()
         
         # 4. Type-1 Auditor/Trainer calculation
-        self.calculate_auditor_trainer_incentive(subordinate_mapping)
+        with stage('auditor_trainer', rows):
+            self.calculate_auditor_trainer_incentive(subordinate_mapping)
         
         # 5. Type-1 Line Leader calculation
-        self.calculate_line_leader_incentive_type1_only(subordinate_mapping)
+        with stage('line_leader_type1', rows):
+            self.calculate_line_leader_incentive_type1_only(subordinate_mapping)
         
         # 5. Head(Group Leader) calculation
-        self.calculate_head_incentive(subordinate_mapping)
+        with stage('head', rows):
+            self.calculate_head_incentive(subordinate_mapping)
         
         # 6. manager calculation
-        self.calculate_managers_by_manual_logic_fixed(subordinate_mapping)
+        with stage('managers', rows):
+            self.calculate_managers_by_manual_logic_fixed(subordinate_mapping)
         
         # 6. Type-2 calculation
-        self.calculate_type2_incentive()
+        with stage('type2', rows):
+            self.calculate_type2_incentive()
         
         # 7. Type-3 calculation
-        self.calculate_type3_incentive()
+        with stage('type3', rows):
+            self.calculate_type3_incentive()
         
         # 8. QIP Talent Pool 보너스 apply
-        self.apply_talent_pool_bonus()
+        with stage('apply_talent_pool_bonus', rows):
+            self.apply_talent_pool_bonus()
         
         print(f"\n✅ {self.config.get_month_str('korean')} incentive calculation completed!")
     
+    def _stage_rows(self) -> Optional[int]:
+        """profiler 행 수 (month_data 행 수)"""
+        return len(self.month_data) if self.month_data is not None else None
+
+    def write_stage_profile(self, output_dir: str) -> Optional[str]:
+        """단계별 profile JSON 저장 (결과 CSV 옆)"""
+        profile_file = os.path.join(output_dir, f"{self.config.output_prefix}_stage_profile.json")
+        try:
+            self.profiler.write(profile_file, year=self.config.year, month=self.config.month.full_name)
+            print(f"📈 Stage profile saved: {profile_file}")
+            return profile_file
+        except Exception as e:
+            print(f"⚠️ Stage profile write failed: {e}")
+            return None
+
     def handle_special_cases(self):
         """특별 케스 processing - 자same calculation"""
         # 특별 케스 제 calculate_assembly_inspector_incentive_type1_onlyand
@@ -2437,24 +2697,6 @@ class CompleteQIPCalculator:
         
         return special_cases
     
-    def check_subordinates_continuous_fail(self, manager_id: str, subordinate_mapping: Dict[str, List[str]]) -> bool:
-        """
-        부하employee in progress 3-month consecutive AQL failures 있지 checking
-        Returns: True if consecutive failures 있음, False if 없음
-        """
-        if manager_id not in subordinate_mapping:
-            return False
-
-        for sub_id in subordinate_mapping[manager_id]:
-            # FIX: Type-safe comparison - Employee No might be int64 after save_results() conversion
-            sub_data = self.month_data[self.month_data['Employee No'].astype(str) == str(sub_id)]
-            if not sub_data.empty:
-                # FIX: Check if starts with 'YES' to match 'YES', 'YES_3MONTHS', 'YES_2MONTHS_AUG_SEP'
-                continuous_fail_value = str(sub_data.iloc[0].get('Continuous_FAIL', 'NO'))
-                if continuous_fail_value.startswith('YES'):
-                    return True
-        return False
-
     def get_auditor_area_employees(self, auditor_id: str, area_mapping: dict) -> List[str]:
         """
         AUDIT & TRAINING TEAM의 담당 구역 직원 목록 반환
@@ -2738,7 +2980,7 @@ class CompleteQIPCalculator:
                 if not condition_4_pass: failed_conditions.append('4')
                 if not condition_8_pass: failed_conditions.append('8')
                 pass_rate = 0
-                print(f"    → {row.get('Full Name', 'Unknown')} failed conditions: {', '.join(failed_conditions)}")
+                run_log.detail('model_master.failed_conditions', lambda: f"    → {row.get('Full Name', 'Unknown')} failed conditions: {', '.join(failed_conditions)}")
 
 
             # Model Master 전체 factory reject율 apply
@@ -2752,18 +2994,18 @@ class CompleteQIPCalculator:
                 if not condition_3_pass: failed_conditions.append('3')
                 if not condition_4_pass: failed_conditions.append('4')
                 if not condition_8_pass: failed_conditions.append('8(reject율)')
-                print(f"    → {row.get('Full Name', 'Unknown')} (Model Master): condition 미충족 [{', '.join(failed_conditions)}] → 0 VND")
+                run_log.detail('model_master.zero', lambda: f"    → {row.get('Full Name', 'Unknown')} (Model Master): condition 미충족 [{', '.join(failed_conditions)}] → 0 VND")
             elif total_factory_reject_rate >= 3.0:  # 전체 factory reject율 3% 상
                 incentive = 0
                 self.month_data.loc[idx, 'Continuous_Months'] = 0
-                print(f"    → {row.get('Full Name', 'Unknown')} (Model Master): 전체 factory AQL reject율 {total_factory_reject_rate:.1f}% → 0 VND")
+                run_log.detail('model_master.zero', lambda: f"    → {row.get('Full Name', 'Unknown')} (Model Master): 전체 factory AQL reject율 {total_factory_reject_rate:.1f}% → 0 VND")
             else:
                 # MODEL MASTER ASSEMBLY INSPECTORand 같은 Progressive Table 사용
                 # position_condition_matrix.jsonof incentive_progression.TYPE_1_PROGRESSIVE apply
                 continuous_months = self.data_processor.calculate_continuous_months_from_history(emp_id, self.month_data)
                 incentive = self.get_assembly_inspector_amount(continuous_months)
                 self.month_data.loc[idx, 'Continuous_Months'] = continuous_months
-                print(f"    → {row.get('Full Name', 'Unknown')} (Model Master): {continuous_months}month consecutive → {incentive:,} VND")
+                run_log.detail('model_master.paid', lambda: f"    → {row.get('Full Name', 'Unknown')} (Model Master): {continuous_months}month consecutive → {incentive:,} VND")
 
             self.month_data.loc[idx, incentive_col] = incentive
         
@@ -2852,16 +3094,16 @@ class CompleteQIPCalculator:
                 incentive = 0
                 self.month_data.loc[idx, 'Continuous_Months'] = 0
                 failed = [k for k,v in conditions_met.items() if not v]
-                print(f"    → {row.get('Full Name', 'Unknown')} failed conditions: {failed} → 0 VND")
+                run_log.detail('auditor.failed_conditions', lambda: f"    → {row.get('Full Name', 'Unknown')} failed conditions: {failed} → 0 VND")
             elif area_reject_rate >= 3.0:  # in charge area reject율 3% 상with 변경
                 incentive = 0
                 self.month_data.loc[idx, 'Continuous_Months'] = 0
-                print(f"    → {row.get('Full Name', 'Unknown')}: in charge area AQL reject율 {area_reject_rate:.1f}% → 0 VND")
+                run_log.detail('auditor.area_reject_zero', lambda: f"    → {row.get('Full Name', 'Unknown')}: in charge area AQL reject율 {area_reject_rate:.1f}% → 0 VND")
             elif has_continuous_fail_in_factory:  # in charge factoryto 3-month consecutive failures 있음
                 incentive = 0
                 self.month_data.loc[idx, 'Continuous_Months'] = 0
                 fail_count = continuous_fail_by_factory.get(auditor_factory, 0)
-                print(f"    → {row.get('Full Name', 'Unknown')}: in charge factory({auditor_factory})to 3-month consecutive AQL failures {fail_count}명 → 0 VND")
+                run_log.detail('auditor.factory_continuous_fail_zero', lambda: f"    → {row.get('Full Name', 'Unknown')}: in charge factory({auditor_factory})to 3-month consecutive AQL failures {fail_count}명 → 0 VND")
             else:
                 # Assembly Inspectorand same days한 consecutive 충족 month basis apply
                 continuous_months = self.data_processor.calculate_continuous_months_from_history(emp_id, self.month_data)
@@ -2871,7 +3113,7 @@ class CompleteQIPCalculator:
                 self.month_data.loc[idx, 'Continuous_Months'] = continuous_months
 
                 if continuous_months > 0:
-                    print(f"    → {row.get('Full Name', 'Unknown')}: {continuous_months}month consecutive → {incentive:,} VND")
+                    run_log.detail('auditor.paid', lambda: f"    → {row.get('Full Name', 'Unknown')}: {continuous_months}month consecutive → {incentive:,} VND")
 
             self.month_data.loc[idx, incentive_col] = incentive
         
@@ -2893,77 +3135,29 @@ class CompleteQIPCalculator:
         if area_mapping and auditor_id in area_mapping.get('model_master', {}).get('employees', {}):
             # Model Master 전체 area in charge
             area_config = area_mapping['model_master']['employees'][auditor_id]
-            conditions = area_config.get('conditions', [])
         elif area_mapping and auditor_id in area_mapping.get('auditor_trainer_areas', {}):
             #  days반 Auditor/Trainer
             area_config = area_mapping['auditor_trainer_areas'][auditor_id]
-            conditions = area_config.get('conditions', [])
         else:
             # mapping 없으면 부하employee basedwith calculation (fallback)
             return self.calculate_area_aql_reject_rate_by_subordinates(auditor_id, subordinate_mapping)
         
-        # AQL data withload
-        aql_data = self.load_aql_data_for_area_calculation()
-        if aql_data is None or aql_data.empty:
-            return 0.0
-        
-        # conditions 미 위from configurationdone
-        
-        # conditionto 맞 data 필터링
-        filtered_data = pd.DataFrame()
-        for condition in conditions:
-            if condition['type'] == 'ALL':
-                # 전체 data 사용
-                filtered_data = aql_data
-                break
-            elif condition['type'] == 'AND':
-                # AND conditionwith 필터링
-                temp_data = aql_data.copy()
-                for filter_item in condition['filters']:
-                    col = filter_item['column']
-                    val = filter_item['value']
-                    if col in temp_data.columns:
-                        temp_data = temp_data[temp_data[col] == val]
-                if not filtered_data.empty:
-                    filtered_data = pd.concat([filtered_data, temp_data], ignore_index=True)
-                else:
-                    filtered_data = temp_data
-            elif condition['type'] == 'OR':
-                # OR conditionwith 필터링
-                for filter_item in condition['filters']:
-                    col = filter_item['column']
-                    val = filter_item['value']
-                    if col in aql_data.columns:
-                        temp_data = aql_data[aql_data[col] == val]
-                        if not filtered_data.empty:
-                            filtered_data = pd.concat([filtered_data, temp_data], ignore_index=True)
-                        else:
-                            filtered_data = temp_data
-        
-        # reject율 calculation
-        if filtered_data.empty:
+        # 전체 담당자 일괄 집계 (month, mapping hash별 memoize)
+        stats = self.get_area_reject_stats(area_mapping).get(auditor_id)
+        if stats is None or stats.total_inspections == 0:
             return 0.0
-        
-        total_inspections = len(filtered_data)
-        # Result column 름 찾기 (대소문자 구분 없)
-        result_col = None
-        for col in filtered_data.columns:
-            if col.upper() == 'RESULT':
-                result_col = col
-                break
-        
-        if result_col:
-            # FAIL 찾기 (대소문자 구분 없)
-            total_failures = len(filtered_data[filtered_data[result_col].str.upper() == 'FAIL'])
-        else:
-            total_failures = 0
-        
-        if total_inspections > 0:
-            reject_rate = (total_failures / total_inspections) * 100
-            print(f"    → {auditor_id} ({area_config.get('name', 'Unknown')}): in charge area inspection {total_inspections}cases, failure {total_failures}cases, reject율 {reject_rate:.2f}%")
-            return reject_rate
-        
-        return 0.0
+
+        reject_rate = stats.reject_rate
+        print(f"    → {auditor_id} ({area_config.get('name', 'Unknown')}): in charge area inspection {stats.total_inspections}cases, failure {stats.total_failures}cases, reject율 {reject_rate:.2f}%")
+        return reject_rate
+
+    def get_area_reject_stats(self, area_mapping: Dict) -> Dict:
+        """mapping에 등록된 모든 담당자의 구역 AQL 집계 ({employee_id: AreaRejectStats})"""
+        cache_key = (self.config.year, self.config.month.number, mapping_hash(area_mapping))
+        if cache_key not in self._area_reject_stats_cache:
+            aql_data = self.load_aql_data_for_area_calculation()
+            self._area_reject_stats_cache[cache_key] = evaluate_area_reject_stats(aql_data, area_mapping)
+        return self._area_reject_stats_cache[cache_key]
     
     def calculate_area_aql_reject_rate_by_subordinates(self, auditor_id: str, subordinate_mapping: Dict[str, List[str]]) -> float:
         """
@@ -2976,10 +3170,11 @@ class CompleteQIPCalculator:
         total_failures = 0
         aql_col = f"{self.config.get_month_str('capital')} AQL Failures"
         
+        org_graph = self._get_org_graph(subordinate_mapping)
         for sub_id in subordinate_mapping[auditor_id]:
-            sub_data = self.month_data[self.month_data['Employee No'] == sub_id]
-            if not sub_data.empty:
-                failures = sub_data.iloc[0].get(aql_col, 0)
+            pos = org_graph.row_position(sub_id, match='raw')
+            if pos is not None:
+                failures = self._row_value(pos, aql_col, 0)
                 total_failures += failures
                 total_inspections += 100  # 정: 각 employee당 평균 100items inspection
         
@@ -2999,6 +3194,7 @@ class CompleteQIPCalculator:
     def load_auditor_trainer_area_mapping(self) -> Dict:
         """
         Auditor/Trainer in charge area mapping JSON file withload
+        파일 mtime이 같으면 캐시된 내용 반환 (읽기 전용으로 사용)
         """
         try:
             # config_files 폴더from 찾기
@@ -3009,8 +3205,13 @@ class CompleteQIPCalculator:
                 json_path = Path('config_files/auditor_trainer_area_mapping.json')
             
             if json_path.exists():
+                signature = (str(json_path.resolve()), json_path.stat().st_mtime)
+                if self._area_mapping_cache is not None and self._area_mapping_cache[0] == signature:
+                    return self._area_mapping_cache[1]
                 with open(json_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    area_mapping = json.load(f)
+                self._area_mapping_cache = (signature, area_mapping)
+                return area_mapping
             else:
                 print("⚠️ auditor_trainer_area_mapping.json file not found.")
         except Exception as e:
@@ -3020,18 +3221,20 @@ class CompleteQIPCalculator:
     def load_aql_data_for_area_calculation(self) -> pd.DataFrame:
         """
         in charge area calculation 위한 AQL data withload
-        AQL history 폴더from file withload
+        AQL history 폴더from file withload (월별로 한 번 정규화 후 복사본 반환)
         """
         try:
             # AQL history file 경with configuration
             month_upper = self.config.get_month_str('capital').upper()
             year = self.config.year
             file_path = self.base_path / 'input_files' / 'AQL history' / f'1.HSRG AQL REPORT-{month_upper}.{year}.csv'
-            
-            if file_path.exists():
-                # file withload
-                df = pd.read_csv(file_path, encoding='utf-8-sig')
-                
+
+            cached = self._area_aql_frame_cache.get(str(file_path))
+            if cached is not None:
+                return cached.copy()
+
+            df = read_aql_report(file_path)
+            if df is not None:
                 # 빈 행 제거 (모든 value NaN인 행)
                 df = df.dropna(how='all')
                 
@@ -3058,7 +3261,8 @@ class CompleteQIPCalculator:
                         df['REPACKING PO'] = 'NORMAL PO'
                         print(f"  ℹ️ REPACKING PO column not found - treating all {len(df)} records as NORMAL PO")
 
-                return df
+                self._area_aql_frame_cache[str(file_path)] = df
+                return df.copy()
             else:
                 print(f"⚠️ AQL history file not found: {file_path}")
                 
@@ -3070,102 +3274,147 @@ class CompleteQIPCalculator:
     def check_subordinates_continuous_fail(self, manager_id: str, subordinate_mapping: Dict[str, List[str]]) -> bool:
         """
         부하employee in progress 3-month consecutive AQL failures 있지 checking
+        Returns: True if consecutive failures 있음, False if 없음
         """
         if manager_id not in subordinate_mapping:
             return False
 
+        org_graph = self._get_org_graph(subordinate_mapping)
         for sub_id in subordinate_mapping[manager_id]:
-            # FIX: Type-safe comparison - Employee No might be int64 after save_results() conversion
-            sub_data = self.month_data[self.month_data['Employee No'].astype(str) == str(sub_id)]
-            if not sub_data.empty:
+            # Type-safe: str(Employee No) 인덱스 조회 (save_results() 후 int64여도 동작)
+            pos = org_graph.row_position(sub_id)
+            if pos is not None:
                 # FIX: Check if starts with 'YES' to match 'YES', 'YES_3MONTHS', 'YES_2MONTHS_AUG_SEP'
-                continuous_fail_value = str(sub_data.iloc[0].get('Continuous_FAIL', 'NO'))
+                continuous_fail_value = str(self._row_value(pos, 'Continuous_FAIL', 'NO'))
                 if continuous_fail_value.startswith('YES'):
                     return True
 
         return False
+
+    def _get_org_graph(self, subordinate_mapping: Dict[str, List[str]]) -> OrgGraph:
+        """subordinate_mapping에 대응하는 OrgGraph 반환 (다른 매핑이면 새로 빌드)"""
+        org_graph = self.org_graph
+        if org_graph is None or not org_graph.is_for(self.month_data, subordinate_mapping):
+            org_graph = OrgGraph(self.month_data, subordinate_mapping)
+            self.org_graph = org_graph
+        return org_graph
+
+    def _row_value(self, pos: int, col: str, default: Any = None) -> Any:
+        """month_data 행 위치의 현재 값 (컬럼 없으면 default)"""
+        if col not in self.month_data.columns:
+            return default
+        return self.month_data[col].iat[pos]
     
     def calculate_aql_inspector_incentive(self, aql_mask, incentive_col: str, aql_col: str):
-        """Type-1 AQL Inspector 3-part incentive calculation"""
+        """Type-1 AQL Inspector 3-part incentive calculation (column 단위)"""
         print("\n📊 TYPE-1 AQL INSPECTOR 3-part incentive calculation...")
         
-        # AQL Inspector configuration withload
+        # AQL Inspector configuration withload (1회)
         aql_config = self.load_aql_inspector_config()
         if not aql_config:
             print("⚠️ AQL Inspector configuration file not found.")
             return
-        
-        for idx, row in self.month_data[aql_mask].iterrows():
-            # 미 calculationdone 경우 스킵
-            if row[incentive_col] > 0:
-                continue
-            
-            emp_id = row.get('Employee No', '')
-            
-            # Stop working employeealso 정상 calculation (exclude하지 않음)
 
-            # Single Source of Truth: 새 표준 컬럼(cond_1~10) 사용
-            # 출근 조건 체크 (C1: 출근율, C2: 무단결근, C3: 실근무일, C4: 최소근무일)
-            attendance_fail = (
-                row.get('cond_1_attendance_rate') == 'FAIL' or
-                row.get('cond_2_unapproved_absence') == 'FAIL' or
-                row.get('cond_3_actual_working_days') == 'FAIL' or
-                row.get('cond_4_minimum_days') == 'FAIL'
-            )
-            
-            # AQL Inspector 5PRS conditions apply 안 함
-            # prs_pass = row.get('5prs condition 1 - there is  enough 5 prs validation qty or pass rate is over 95%') == 'yes'
-            
-            # AQL condition: 당month failure cases수 0cases, 3-month consecutive failure 아님
-            aql_fail = row.get(aql_col, 0) > 0
-            continuous_fail = row.get('Continuous_FAIL', 'NO') == 'YES'
-            
-            # AQL INSPECTOR attendance condition(1-4) + 당month AQL condition(5)only 체크
-            # 3-Part calculation은 default condition 충족 시toonly 실행
-            if attendance_fail or aql_fail:
-                incentive = 0
-                # condition 미충족 시 Continuous_Months = 0
-                self.month_data.loc[idx, 'Continuous_Months'] = 0
-                fail_reason = []
-                if attendance_fail:
-                    fail_reason.append("attendance condition 미충족")
-                if aql_fail:
-                    fail_reason.append("당month AQL failure")
-                print(f"    → {row.get('Full Name', 'Unknown')}: {', '.join(fail_reason)} → 0 VND")
-                self.month_data.loc[idx, incentive_col] = incentive
-                continue
-            
-            # Part 1, Part 3 consecutive month성 month 수 calculation
-            part1_months, part3_months = self.get_aql_inspector_continuous_months(emp_id, aql_config)
-            
-            # Part 1: AQL inspection 평 결and incentive
-            part1_amount = self.calculate_aql_part1_amount(part1_months, aql_config)
-            
-            # Part 2: CFA 자격증 incentive
-            part2_amount = self.calculate_aql_part2_amount(emp_id, aql_config)
-            
-            # Part 3: HWK 클레임 방지 incentive
-            part3_amount = self.calculate_aql_part3_amount(part3_months, aql_config)
-            
-            # 총 incentive calculation
-            total_incentive = part1_amount + part2_amount + part3_amount
+        data = self.month_data
+        aql_mask = np.asarray(aql_mask, dtype=bool)
 
-            self.month_data.loc[idx, incentive_col] = total_incentive
+        # 미 calculationdone 경우 스킵 (Stop working employee도 정상 calculation)
+        current = pd.to_numeric(data[incentive_col], errors='coerce').to_numpy()
+        target = aql_mask & ~(current > 0)
+        if not target.any():
+            return
 
-            # Continuous_Months column updated (Part 1 basis)
-            self.month_data.loc[idx, 'Continuous_Months'] = part1_months
+        # 출근 조건 (C1~C4) + 당월 AQL 실패 (C5)만 체크, 5PRS 조건 미적용
+        attendance_fail = self._condition_fail_mask(['cond_1_attendance_rate', 'cond_2_unapproved_absence',
+                                                     'cond_3_actual_working_days', 'cond_4_minimum_days'])
+        if aql_col in data.columns:
+            aql_fail = (pd.to_numeric(data[aql_col], errors='coerce') > 0).to_numpy()
+        else:
+            aql_fail = np.zeros(len(data), dtype=bool)
+
+        failed = target & (attendance_fail | aql_fail)
+
+        def fail_message(pos: int) -> str:
+            fail_reason = []
+            if attendance_fail[pos]:
+                fail_reason.append("attendance condition 미충족")
+            if aql_fail[pos]:
+                fail_reason.append("당month AQL failure")
+            return f"    → {self._row_value(pos, 'Full Name', 'Unknown')}: {', '.join(fail_reason)} → 0 VND"
+
+        for pos in np.flatnonzero(failed):
+            run_log.detail('aql_inspector.condition_fail', lambda: fail_message(pos))
+
+        # 3-Part calculation: default condition 충족 직원만
+        eligible = np.flatnonzero(target & ~failed)
+        emp_ids = data['Employee No'].tolist() if 'Employee No' in data.columns else [''] * len(data)
+        inspectors = aql_config.get('aql_inspectors', {})
+
+        part1_months = np.zeros(len(eligible), dtype=int)
+        part3_months = np.zeros(len(eligible), dtype=int)
+        cfa_certified = np.zeros(len(eligible), dtype=bool)
+        for k, pos in enumerate(eligible):
+            part1_months[k], part3_months[k] = self.get_aql_inspector_continuous_months(emp_ids[pos], aql_config)
+            cfa_certified[k] = emp_ids[pos] in inspectors and inspectors[emp_ids[pos]].get('cfa_certified', False)
+
+        parts = aql_config.get('parts', {})
+        part1_table = parts.get('part1', {}).get('incentive_table', {}).get('sustained_performance', {}).get('amounts', {})
+        part1_amounts = self._progression_amounts(part1_table, part1_months, 150000)
+        part2_amounts = np.where(cfa_certified, parts.get('part2', {}).get('amount', 700000), 0)
+        part3_amounts = self._progression_amounts(parts.get('part3', {}).get('incentive_table', {}), part3_months, 0)
+        totals = part1_amounts + part2_amounts + part3_amounts
+
+        # 기록: 미충족 0 VND / Continuous_Months 0, 충족 3-part 합계 / Part 1 개월 수
+        incentives = np.zeros(len(data), dtype=object)
+        continuous = np.zeros(len(data), dtype=object)
+        incentives[eligible] = totals
+        continuous[eligible] = part1_months
+        target_positions = np.flatnonzero(target)
+        self._assign_positions(target_positions, incentive_col, incentives[target_positions])
+        self._assign_positions(target_positions, 'Continuous_Months', continuous[target_positions])
+
+        run_log.count('aql_inspector.paid', len(eligible))
+        if run_log.verbose:
+            for k, pos in enumerate(eligible):
+                print(f"    → {self._row_value(pos, 'Full Name', 'Unknown')} ({emp_ids[pos]}): "
+                      f"Part 1 ({part1_months[k]}month) {part1_amounts[k]:,} + Part 2 (CFA) {part2_amounts[k]:,} + "
+                      f"Part 3 ({part3_months[k]}month) {part3_amounts[k]:,} = {totals[k]:,} VND")
 
-            # debugging 출력
-            print(f"    → {row.get('Full Name', 'Unknown')} ({emp_id}):")
-            print(f"      Part 1 ({part1_months}month): {part1_amount:,} VND")
-            print(f"      Part 2 (CFA): {part2_amount:,} VND")
-            print(f"      Part 3 ({part3_months}month): {part3_amount:,} VND")
-            print(f"      총액: {total_incentive:,} VND")
-        
         # 통계 출력
         receiving_count = (self.month_data[aql_mask][incentive_col] > 0).sum()
         total_amount = self.month_data[aql_mask][incentive_col].sum()
         print(f"  → AQL Inspector 수령 인원: {receiving_count}명, 총액: {total_amount:,.0f} VND")
+
+    @staticmethod
+    def _progression_amounts(table: Dict, months: np.ndarray, default: int, cap: Optional[int] = None) -> np.ndarray:
+        """
+        {'개월 수': 금액} 표 → 개월 수 배열별 금액 (NumPy lookup 배열)
+
+        table.get(str(months), default)와 같은 결과, cap이 있으면 cap 이상은 cap 개월 금액
+        """
+        months = np.asarray(months, dtype=int)
+        if cap is not None:
+            months = np.minimum(months, cap)
+        result = np.full(len(months), default, dtype=object)
+        valid = months >= 0
+        if valid.any():
+            lookup = np.array([table.get(str(m), default) for m in range(int(months[valid].max()) + 1)], dtype=object)
+            result[valid] = lookup[months[valid]]
+        return result
+
+    def _condition_fail_mask(self, cond_cols: List[str]) -> np.ndarray:
+        """cond 컬럼 중 하나라도 'FAIL'인 행 (없는 컬럼은 무시)"""
+        fail = np.zeros(len(self.month_data), dtype=bool)
+        for cond_col in cond_cols:
+            if cond_col in self.month_data.columns:
+                fail |= (self.month_data[cond_col] == 'FAIL').to_numpy()
+        return fail
+
+    def _assign_positions(self, positions: np.ndarray, col: str, values):
+        """행 위치별 값 기록 (행 단위 .loc 기록과 같은 결과, 없는 컬럼은 생성)"""
+        if len(positions) == 0:
+            return
+        self.month_data.loc[self.month_data.index[positions], col] = list(values)
     
     def load_aql_inspector_config(self) -> Dict:
         """AQL Inspector incentive configuration withload"""
@@ -3196,35 +3445,11 @@ class CompleteQIPCalculator:
             # 최대value 제한
             part1_months = min(part1_months, 15)
             part3_months = min(part3_months, 15)
-            
-            return part1_months, part3_months
-        
-        # new employee인 경우
-        return 1, 1
-    
-    def calculate_aql_part1_amount(self, months: int, aql_config: Dict) -> int:
-        """Part 1: AQL inspection 평 결and incentive calculation"""
-        part1_config = aql_config.get('parts', {}).get('part1', {})
-        amounts = part1_config.get('incentive_table', {}).get('sustained_performance', {}).get('amounts', {})
-        
-        # 문자열 키 정수with 변환하여 조회
-        return amounts.get(str(months), 150000)
-    
-    def calculate_aql_part2_amount(self, emp_id: str, aql_config: Dict) -> int:
-        """Part 2: CFA 자격증 incentive calculation"""
-        # employee별 CFA 자격증 보유 여부 checking
-        if emp_id in aql_config.get('aql_inspectors', {}):
-            if aql_config['aql_inspectors'][emp_id].get('cfa_certified', False):
-                return aql_config.get('parts', {}).get('part2', {}).get('amount', 700000)
-        return 0
-    
-    def calculate_aql_part3_amount(self, months: int, aql_config: Dict) -> int:
-        """Part 3: HWK 클레임 방지 incentive calculation"""
-        part3_config = aql_config.get('parts', {}).get('part3', {})
-        amounts = part3_config.get('incentive_table', {})
+            
+            return part1_months, part3_months
         
-        # 문자열 키 정수with 변환하여 조회
-        return amounts.get(str(months), 0)
+        # new employee인 경우
+        return 1, 1
     
     def get_assembly_inspector_amount(self, continuous_months: int) -> int:
         """consecutive 충족 month 수to 따른 Assembly Inspector incentive amount 결정 테블은 Assembly Inspector, Model Master, Audit & Training
@@ -3234,26 +3459,28 @@ class CompleteQIPCalculator:
         Condition 1: consecutivewith performance 유지 시 (2-month 상)
         Condition 2: 1-monthonly month성 시 150,000 VND 고정
         """
+        return self.assembly_inspector_amounts([continuous_months])[0]
+
+    def assembly_inspector_amounts(self, continuous_months) -> np.ndarray:
+        """
+        연속 개월 수 배열 → Assembly Inspector incentive 금액 배열 (get_assembly_inspector_amount 일괄 버전)
+
+        TYPE_1_PROGRESSIVE progression_table 조회, max_months 이상은 max_months 금액
+        """
         # JSON configurationfrom incentive 테블 져오기 (필수)
         if not hasattr(self, 'position_matrix') or 'incentive_progression' not in self.position_matrix:
             print(f"⚠️ Warning: position_condition_matrix.jsonto incentive_progression 없습니다")
-            return 0
+            return np.zeros(len(continuous_months), dtype=object)
 
         progression = self.position_matrix['incentive_progression'].get('TYPE_1_PROGRESSIVE', {})
         table = progression.get('progression_table', {})
 
         if not table:
             print(f"⚠️ Warning: progression_table 비어있습니다")
-            return 0
-
-        max_months = progression.get('max_months', 12)
+            return np.zeros(len(continuous_months), dtype=object)
 
         # 최대 month수 상은 최대 amount
-        if continuous_months >= max_months:
-            return table.get(str(max_months), 0)
-
-        # 테블from amount 찾기
-        return table.get(str(continuous_months), 0)
+        return self._progression_amounts(table, continuous_months, 0, cap=progression.get('max_months', 12))
     
     def calculate_assembly_inspector_incentive_type1_only(self):
         """Type-1 Assembly Inspector 및 AQL Inspector incentive calculation
@@ -3299,76 +3526,50 @@ class CompleteQIPCalculator:
         if aql_mask.any():
             self.calculate_aql_inspector_incentive(aql_mask, incentive_col, aql_col)
         
-        # Assembly Inspector processing
-        for idx, row in self.month_data[assembly_mask].iterrows():
-            # 미 calculationdone 경우 스킵
-            if row[incentive_col] > 0:
-                continue
-            
-            # Stop working employeealso 정상 calculation (exclude하지 않음)
-            
-            # emp_id first 정of (debugging 목적with 사용done)
-            emp_id = row.get('Employee No', '')
-
-            # ========================================
-            # 100% 조건 충족 규칙 적용
-            # ========================================
-            # 인센티브는 모든 적용 가능한 조건을 100% 충족할 때만 지급
-            # conditions_pass_rate가 100.0이 아니면 무조건 0 VND
-
-            pass_rate = row.get('conditions_pass_rate', 0)
-
-            if pass_rate < 100.0:
-                # 조건 미충족: 인센티브 0, Continuous_Months 리셋
-                incentive = 0
-                self.month_data.loc[idx, 'Continuous_Months'] = 0
-
-                # 디버깅: 어떤 조건이 실패했는지 기록
-                failed_conditions = []
-                if row.get('cond_1_attendance_rate') == 'FAIL':
-                    failed_conditions.append('출근율<88%')
-                if row.get('cond_2_unapproved_absence') == 'FAIL':
-                    failed_conditions.append('무단결근>2일')
-                if row.get('cond_3_actual_working_days') == 'FAIL':
-                    failed_conditions.append('실제근무일=0')
-                if row.get('cond_4_minimum_days') == 'FAIL':
-                    failed_conditions.append('최소근무일<12')
-                if row.get('cond_5_aql_personal_failure') == 'FAIL':
-                    failed_conditions.append('개인AQL실패>0')
-                if row.get('cond_6_aql_continuous') == 'FAIL':
-                    failed_conditions.append('3개월연속AQL실패')
-                if row.get('cond_7_aql_team_area') == 'FAIL':
-                    failed_conditions.append('팀/지역AQL실패')
-                if row.get('cond_8_area_reject') == 'FAIL':
-                    failed_conditions.append('지역불량률≥3%')
-                if row.get('cond_9_5prs_pass_rate') == 'FAIL':
-                    failed_conditions.append('5PRS합격률<95%')
-                if row.get('cond_10_5prs_inspection_qty') == 'FAIL':
-                    failed_conditions.append('5PRS검사량<100')
+        # Assembly Inspector processing (column 단위, Stop working employee도 정상 calculation)
+        data = self.month_data
+        current = pd.to_numeric(data[incentive_col], errors='coerce').to_numpy()
+        target = assembly_mask.to_numpy() & ~(current > 0)
+        target_positions = np.flatnonzero(target)
 
-                if failed_conditions:
-                    print(f"      {row.get('Full Name', emp_id)}: 조건 미충족 → 0 VND (실패: {', '.join(failed_conditions)})")
+        if len(target_positions):
+            # 100% 조건 충족 규칙: conditions_pass_rate가 100.0 미만이면 0 VND + Continuous_Months 리셋
+            if 'conditions_pass_rate' in data.columns:
+                condition_fail = (pd.to_numeric(data['conditions_pass_rate'], errors='coerce') < 100.0).to_numpy()
             else:
-                # consecutive 충족 month 수 calculation
-                continuous_months = self.data_processor.calculate_continuous_months_from_history(emp_id, self.month_data)
+                condition_fail = np.ones(len(data), dtype=bool)
+
+            failed_labels = [
+                ('cond_1_attendance_rate', '출근율<88%'), ('cond_2_unapproved_absence', '무단결근>2일'),
+                ('cond_3_actual_working_days', '실제근무일=0'), ('cond_4_minimum_days', '최소근무일<12'),
+                ('cond_5_aql_personal_failure', '개인AQL실패>0'), ('cond_6_aql_continuous', '3개월연속AQL실패'),
+                ('cond_7_aql_team_area', '팀/지역AQL실패'), ('cond_8_area_reject', '지역불량률≥3%'),
+                ('cond_9_5prs_pass_rate', '5PRS합격률<95%'), ('cond_10_5prs_inspection_qty', '5PRS검사량<100'),
+            ]
+            emp_ids = data['Employee No'].tolist() if 'Employee No' in data.columns else [''] * len(data)
+            for pos in np.flatnonzero(target & condition_fail):
+                failed_conditions = [label for cond_col, label in failed_labels
+                                     if self._row_value(pos, cond_col) == 'FAIL']
+                if failed_conditions:
+                    run_log.detail('assembly_inspector.condition_fail', lambda: f"      {self._row_value(pos, 'Full Name', emp_ids[pos])}: 조건 미충족 → 0 VND (실패: {', '.join(failed_conditions)})")
 
-                # consecutive 충족 month 수to 따른 차etc. 지급
-                incentive = self.get_assembly_inspector_amount(continuous_months)
+            # 충족 직원: 이전 달 continuity map 조회 → progression table 금액
+            eligible = np.flatnonzero(target & ~condition_fail)
+            continuous_months = self.data_processor.continuous_months_for(emp_ids[pos] for pos in eligible)
 
-                # Continuous_Months column updated
-                self.month_data.loc[idx, 'Continuous_Months'] = continuous_months
+            amounts = self.assembly_inspector_amounts(continuous_months)
 
-                # debugging 위한 출력
-                if continuous_months > 0:
-                    print(f"    → {row.get('Full Name', 'Unknown')} ({emp_id}): {continuous_months}month consecutive → {incentive:,} VND")
+            incentives = np.zeros(len(data), dtype=object)
+            continuous = np.zeros(len(data), dtype=object)
+            incentives[eligible] = amounts
+            continuous[eligible] = continuous_months
+            self._assign_positions(target_positions, 'Continuous_Months', continuous[target_positions])
+            self._assign_positions(target_positions, incentive_col, incentives[target_positions])
 
-            self.month_data.loc[idx, incentive_col] = incentive
-            
-            # debugging: 619060201 employee checking
-            if emp_id == '619060201':
-                print(f"    [debug] 619060201 updated: {incentive_col} = {incentive:,.0f} VND")
-                actual_value = self.month_data.loc[idx, incentive_col]
-                print(f"    [debug] 실제 saveddone value: {actual_value:,.0f} VND")
+            if len(eligible):
+                distribution = pd.Series(continuous_months).value_counts().sort_index()
+                print(f"    → {len(eligible)}명 consecutive month 분포: "
+                      + ', '.join(f"{months}month×{count}" for months, count in distribution.items()))
         
         # 통계 출력
         receiving_count = (self.month_data[assembly_mask][incentive_col] > 0).sum()
@@ -3431,6 +3632,12 @@ class CompleteQIPCalculator:
         # 퇴사자 필터링 카운터
         excluded_resigned_count = 0
 
+        # Full Name → 첫 번째 행 위치 (상사 조회를 dict 조회로)
+        first_pos_by_name = {}
+        for pos, name in enumerate(self.month_data['Full Name'].tolist()):
+            if isinstance(name, str):
+                first_pos_by_name.setdefault(name, pos)
+
         for _, row in self.month_data.iterrows():
             boss_name = row.get(boss_col)
             if pd.notna(boss_name) and boss_name.strip():
@@ -3453,17 +3660,15 @@ class CompleteQIPCalculator:
                     boss_name_matches[boss_name] += 1
 
                 # 상사의 Employee No 찾기
-                boss_data = self.month_data[
-                    self.month_data['Full Name'] == boss_name
-                ]
+                boss_pos = first_pos_by_name.get(boss_name)
 
                 # 디버그: 문제 직원인 경우 상세 출력
-                if boss_name in debug_names.values() and not boss_data.empty:
-                    boss_id_test = boss_data.iloc[0].get('Employee No', '')
-                    print(f"  [DEBUG] Boss '{boss_name}' 찾음, boss_id = {boss_id_test} (type: {type(boss_id_test)})")
+                if boss_name in debug_names.values() and boss_pos is not None:
+                    boss_id_test = self._row_value(boss_pos, 'Employee No', '')
+                    run_log.detail('debug.subordinate_mapping', lambda: f"  [DEBUG] Boss '{boss_name}' 찾음, boss_id = {boss_id_test} (type: {type(boss_id_test)})")
 
-                if not boss_data.empty:
-                    boss_id = boss_data.iloc[0].get('Employee No', '')
+                if boss_pos is not None:
+                    boss_id = self._row_value(boss_pos, 'Employee No', '')
                     # Employee No를 int로 변환 (일관성 유지)
                     if boss_id:
                         try:
@@ -3480,18 +3685,18 @@ class CompleteQIPCalculator:
                         # 디버그: 문제 LINE LEADER의 부하직원 카운트
                         if boss_id in debug_employees:
                             debug_found[boss_id] += 1
-                            print(f"  [DEBUG] {boss_id}의 부하직원 추가: {emp_id}")
+                            run_log.detail('debug.subordinate_mapping', lambda: f"  [DEBUG] {boss_id}의 부하직원 추가: {emp_id}")
                     else:
                         if boss_name in debug_names.values():
-                            print(f"  [DEBUG] Boss '{boss_name}' 찾았지만 boss_id가 비어있음!")
+                            run_log.detail('debug.subordinate_mapping', lambda: f"  [DEBUG] Boss '{boss_name}' 찾았지만 boss_id가 비어있음!")
                 else:
                     # 디버그: boss_name이 문제 직원 이름인 경우 출력
                     for debug_id, debug_name in debug_names.items():
                         if boss_name == debug_name:
-                            print(f"  [DEBUG] '{boss_name}'를 상사로 가진 직원 발견, 하지만 month_data에서 '{boss_name}' 찾을 수 없음!")
-                            # month_data에 이 이름이 있는지 확인
-                            name_exists = (self.month_data['Full Name'] == boss_name).any()
-                            print(f"  [DEBUG] month_data에 '{boss_name}' 존재 여부: {name_exists}")
+                            run_log.detail('debug.subordinate_mapping', lambda: (
+                                f"  [DEBUG] '{boss_name}'를 상사로 가진 직원 발견, 하지만 month_data에서 '{boss_name}' 찾을 수 없음!\n"
+                                f"  [DEBUG] month_data에 '{boss_name}' 존재 여부: {(self.month_data['Full Name'] == boss_name).any()}"
+                            ))
 
         if excluded_resigned_count > 0:
             print(f"  → 퇴사자 제외: {excluded_resigned_count}명 (계산 월 이전 퇴사)")
@@ -3505,10 +3710,13 @@ class CompleteQIPCalculator:
         for debug_id in debug_employees:
             count = debug_found.get(debug_id, 0)
             if count > 0:
-                print(f"  [DEBUG] Employee {debug_id}: {count}명의 부하직원 매핑됨")
+                run_log.detail('debug.subordinate_mapping', lambda: f"  [DEBUG] Employee {debug_id}: {count}명의 부하직원 매핑됨")
             else:
-                print(f"  [DEBUG] Employee {debug_id}: 부하직원 없음 (boss로 인식되지 않음)")
+                run_log.detail('debug.subordinate_mapping', lambda: f"  [DEBUG] Employee {debug_id}: 부하직원 없음 (boss로 인식되지 않음)")
         
+        # 조직 그래프 인덱스 빌드 (팀 탐색용)
+        self.org_graph = OrgGraph(self.month_data, subordinate_mapping)
+
         print(f"✅ mapping completed: {len(subordinate_mapping)} employeesof manager")
         return subordinate_mapping
     
@@ -3558,14 +3766,16 @@ class CompleteQIPCalculator:
 
             # 디버그: 문제 직원인 경우 출근 조건 값 출력
             if leader_id in {619020468, 621110013}:
-                print(f"    [DEBUG] {row.get('Full Name')} ({leader_id}):")
-                print(f"       cond1={cond1}, cond2={cond2}, cond3={cond3}, cond4={cond4}")
-                print(f"       attendance_fail={attendance_fail}")
+                run_log.detail('debug.line_leader', lambda: (
+                    f"    [DEBUG] {row.get('Full Name')} ({leader_id}):\n"
+                    f"       cond1={cond1}, cond2={cond2}, cond3={cond3}, cond4={cond4}\n"
+                    f"       attendance_fail={attendance_fail}"
+                ))
 
             # attendance condition 미충족 시 incentive 0
             if attendance_fail:
                 incentive = 0
-                print(f"    → Line Leader {row.get('Full Name', 'Unknown')} ({leader_id}): attendance condition 미충족")
+                run_log.detail('line_leader.attendance_fail', lambda: f"    → Line Leader {row.get('Full Name', 'Unknown')} ({leader_id}): attendance condition 미충족")
             # 부하employee incentive calculation
             elif leader_id in subordinate_mapping:
                 subordinates = subordinate_mapping[leader_id]
@@ -3575,25 +3785,25 @@ class CompleteQIPCalculator:
 
                 # 디버그: 문제 직원인 경우
                 if leader_id in {619020468, 621110013}:
-                    print(f"       부하직원 수: {len(subordinates)}")
+                    run_log.detail('debug.line_leader', lambda: f"       부하직원 수: {len(subordinates)}")
 
+                org_graph = self._get_org_graph(subordinate_mapping)
                 for sub_id in subordinates:
-                    # Employee No 타입 일치를 위해 str로 변환하여 검색
-                    sub_data = self.month_data[self.month_data['Employee No'] == str(sub_id)]
+                    # Employee No 타입 일치를 위해 str로 변환하여 검색 (인덱스 조회)
+                    pos = org_graph.row_position(sub_id)
 
                     # 디버그: 부하직원을 찾지 못하는 경우
-                    if leader_id in {619020468, 621110013} and sub_data.empty:
-                        print(f"       [WARNING] 부하직원 {sub_id} (type: {type(sub_id)}) 찾을 수 없음!")
-                        # Employee No 컬럼의 타입 확인
-                        sample_emp_no = self.month_data['Employee No'].iloc[0]
-                        print(f"       month_data Employee No 타입: {type(sample_emp_no)}")
-
-                    if not sub_data.empty:
-                        sub_row = sub_data.iloc[0]
+                    if leader_id in {619020468, 621110013} and pos is None:
+                        run_log.detail('debug.line_leader', lambda: (
+                            f"       [WARNING] 부하직원 {sub_id} (type: {type(sub_id)}) 찾을 수 없음!\n"
+                            f"       month_data Employee No 타입: {type(self.month_data['Employee No'].iloc[0])}"
+                        ))
+
+                    if pos is not None:
                         # Type-1 부하employeeonly calculation
-                        if sub_row.get('ROLE TYPE STD') == 'TYPE-1':
+                        if self._row_value(pos, 'ROLE TYPE STD') == 'TYPE-1':
                             total_count += 1
-                            sub_incentive = float(sub_row.get(incentive_col, 0))
+                            sub_incentive = float(self._row_value(pos, incentive_col, 0))
                             if sub_incentive > 0:
                                 receiving_count += 1
                                 total_sub_incentive += sub_incentive
@@ -3607,7 +3817,7 @@ class CompleteQIPCalculator:
                         # condition 7: 팀/area AQL (부하employee AQL 체크)
                         if 7 in applicable_conditions:
                             should_check_subordinates = True
-                            print(f"    → Line Leader - JSON based condition 7 apply")
+                            run_log.detail('line_leader.condition7_applied', lambda: f"    → Line Leader - JSON based condition 7 apply")
                 else:
                     # 폴백: existing with직
                     should_check_subordinates = True
@@ -3619,7 +3829,7 @@ class CompleteQIPCalculator:
                 
                 if has_continuous_fail:
                     incentive = 0
-                    print(f"    → Line Leader {row.get('Full Name', 'Unknown')}: 부하employee in progress 3-month consecutive AQL failures 있음 (condition 7 미충족)")
+                    run_log.detail('line_leader.subordinate_continuous_fail', lambda: f"    → Line Leader {row.get('Full Name', 'Unknown')}: 부하employee in progress 3-month consecutive AQL failures 있음 (condition 7 미충족)")
                 elif total_count > 0 and receiving_count > 0:
                     # 12% calculation 및 incentive 수령 비율 반영
                     receiving_ratio = receiving_count / total_count
@@ -3683,7 +3893,7 @@ class CompleteQIPCalculator:
             # attendance condition 미충족 시 incentive 0
             if attendance_fail:
                 incentive = 0
-                print(f"    → Head/Group Leader {row.get('Full Name', 'Unknown')} ({head_id}): attendance condition 미충족")
+                run_log.detail('head_leader.attendance_fail', lambda: f"    → Head/Group Leader {row.get('Full Name', 'Unknown')} ({head_id}): attendance condition 미충족")
             else:
                 # 자신of 팀 내 Line Leader들 찾기 및 평균 calculation
                 line_leaders = self._find_team_line_leaders(head_id, subordinate_mapping)
@@ -3698,7 +3908,7 @@ class CompleteQIPCalculator:
                 if avg_incentive > 0:
                     # Line Leader 평균of 2배
                     incentive = int(avg_incentive * 2)
-                    print(f"    → Head/Group Leader {row.get('Full Name', 'Unknown')} ({head_id}): Line Leader 평균 {avg_incentive:,.0f} × 2 = {incentive:,} VND")
+                    run_log.detail('head_leader.paid_team_average', lambda: f"    → Head/Group Leader {row.get('Full Name', 'Unknown')} ({head_id}): Line Leader 평균 {avg_incentive:,.0f} × 2 = {incentive:,} VND")
                 else:
                     # Fallback: 전체 TYPE-1 LINE LEADER 평균 사용
                     all_line_leaders = self.month_data[
@@ -3710,10 +3920,10 @@ class CompleteQIPCalculator:
                     if len(receiving_ll) > 0:
                         avg_incentive = int(receiving_ll[incentive_col].mean())
                         incentive = int(avg_incentive * 2)
-                        print(f"    → Head/Group Leader {row.get('Full Name', 'Unknown')} ({head_id}): 전체 LINE LEADER 평균 {avg_incentive:,.0f} × 2 = {incentive:,} VND (Fallback)")
+                        run_log.detail('head_leader.paid_fallback_average', lambda: f"    → Head/Group Leader {row.get('Full Name', 'Unknown')} ({head_id}): 전체 LINE LEADER 평균 {avg_incentive:,.0f} × 2 = {incentive:,} VND (Fallback)")
                     else:
                         incentive = 0
-                        print(f"    → Head/Group Leader {row.get('Full Name', 'Unknown')} ({head_id}): LINE LEADER 없음 → 0 VND")
+                        run_log.detail('head_leader.no_line_leader', lambda: f"    → Head/Group Leader {row.get('Full Name', 'Unknown')} ({head_id}): LINE LEADER 없음 → 0 VND")
             
             self.month_data.loc[idx, incentive_col] = incentive
         
@@ -3781,7 +3991,7 @@ class CompleteQIPCalculator:
                     if not condition_2_pass: failed_conditions.append('2')
                     if not condition_3_pass: failed_conditions.append('3')
                     if not condition_4_pass: failed_conditions.append('4')
-                    print(f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): condition 미충족 [{', '.join(failed_conditions)}]")
+                    run_log.detail('manager.condition_fail', lambda: f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): condition 미충족 [{', '.join(failed_conditions)}]")
                 else:
                     # JSON configurationfrom calculation 방법 checking
                     position_code = row.get('FINAL QIP POSITION NAME CODE', '')
@@ -3799,7 +4009,7 @@ class CompleteQIPCalculator:
                                 line_leaders, manager_id, config['name']
                             )
                             incentive = int(avg_incentive * multiplier)
-                            print(f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): Line Leader 평균 {avg_incentive:,.0f} × {multiplier} = {incentive:,} VND")
+                            run_log.detail('manager.paid_team_average', lambda: f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): Line Leader 평균 {avg_incentive:,.0f} × {multiplier} = {incentive:,} VND")
                         else:
                             # Fallback: 전체 TYPE-1 LINE LEADER 평균 사용
                             all_line_leaders = self.month_data[
@@ -3811,10 +4021,10 @@ class CompleteQIPCalculator:
                             if len(receiving_ll) > 0:
                                 avg_incentive = int(receiving_ll[incentive_col].mean())
                                 incentive = int(avg_incentive * multiplier)
-                                print(f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): 전체 LINE LEADER 평균 {avg_incentive:,.0f} × {multiplier} = {incentive:,} VND")
+                                run_log.detail('manager.paid_fallback_average', lambda: f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): 전체 LINE LEADER 평균 {avg_incentive:,.0f} × {multiplier} = {incentive:,} VND")
                             else:
                                 incentive = 0
-                                print(f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): LINE LEADER 없음 → 0 VND")
+                                run_log.detail('manager.no_line_leader', lambda: f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): LINE LEADER 없음 → 0 VND")
                     else:
                         # existing with직 (고정 amount etc.)
                         min_amt = incentive_config.get('min', 0)
@@ -3822,7 +4032,7 @@ class CompleteQIPCalculator:
 
                         if min_amt > 0 and min_amt == max_amt:
                             incentive = min_amt
-                            print(f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): JSON 고정value → {incentive:,} VND")
+                            run_log.detail('manager.paid_fixed_amount', lambda: f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): JSON 고정value → {incentive:,} VND")
                         else:
                             # Line Leader 평균 based calculation (Fallback)
                             line_leaders = self._find_team_line_leaders(manager_id, subordinate_mapping)
@@ -3832,7 +4042,7 @@ class CompleteQIPCalculator:
                                     line_leaders, manager_id, config['name']
                                 )
                                 incentive = int(avg_incentive * config['multiplier'])
-                                print(f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): Line Leader 평균 based (fallback) → {incentive:,} VND")
+                                run_log.detail('manager.paid_team_average_fallback', lambda: f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): Line Leader 평균 based (fallback) → {incentive:,} VND")
                             else:
                                 # Fallback: 전체 TYPE-1 LINE LEADER 평균 사용
                                 all_line_leaders = self.month_data[
@@ -3844,13 +4054,13 @@ class CompleteQIPCalculator:
                                 if len(receiving_ll) > 0:
                                     avg_incentive = int(receiving_ll[incentive_col].mean())
                                     incentive = int(avg_incentive * config['multiplier'])
-                                    print(f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): 전체 LINE LEADER 평균 {avg_incentive:,.0f} × {config['multiplier']} = {incentive:,} VND")
+                                    run_log.detail('manager.paid_fallback_average', lambda: f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): 전체 LINE LEADER 평균 {avg_incentive:,.0f} × {config['multiplier']} = {incentive:,} VND")
                                 else:
                                     if min_amt > 0:
                                         incentive = min_amt
                                     else:
                                         incentive = 0
-                                        print(f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): LINE LEADER 없음 → 0 VND")
+                                        run_log.detail('manager.no_line_leader', lambda: f"      → {config['name']} {row.get('Full Name', 'Unknown')} ({manager_id}): LINE LEADER 없음 → 0 VND")
 
                 self.month_data.loc[idx, incentive_col] = incentive
         
@@ -3869,48 +4079,10 @@ class CompleteQIPCalculator:
     
     def _find_team_line_leaders(self, manager_id: str, subordinate_mapping: Dict[str, List[str]]) -> List:
         """팀 내 모든 Line Leader 찾기 (직접 부하 + 부하of 부하)"""
-        line_leaders = []
-        visited = set()
-
-        # DEBUG: manager_id와 subordinate_mapping 타입 확인
-        print(f"      [DEBUG] _find_team_line_leaders called: manager_id={manager_id} (type: {type(manager_id)})")
-        print(f"      [DEBUG] manager_id in subordinate_mapping: {manager_id in subordinate_mapping}")
-        if manager_id in subordinate_mapping:
-            print(f"      [DEBUG] Subordinates: {subordinate_mapping[manager_id]}")
-
-        def find_line_leaders_recursive(boss_id: str, depth: int = 0):
-            if depth > 5 or boss_id in visited:  # 무한 루프 방지
-                return
-            visited.add(boss_id)
-
-            if boss_id in subordinate_mapping:
-                for sub_id in subordinate_mapping[boss_id]:
-                    # DEBUG: 타입 확인
-                    print(f"      [DEBUG] Looking for sub_id={sub_id} (type: {type(sub_id)})")
-                    print(f"      [DEBUG] month_data['Employee No'].dtype: {self.month_data['Employee No'].dtype}")
-
-                    # FIX: month_data['Employee No']는 str 타입이므로 sub_id를 str로 변환하여 비교
-                    sub_data = self.month_data[self.month_data['Employee No'] == str(sub_id)]
-                    print(f"      [DEBUG] sub_data found: {len(sub_data)} rows")
-
-                    if not sub_data.empty:
-                        sub_row = sub_data.iloc[0]
-                        position = str(sub_row.get('QIP POSITION 1ST  NAME', '')).upper()
-                        role_type = sub_row.get('ROLE TYPE STD', '')
-
-                        print(f"      [DEBUG] Checking subordinate {sub_id}: position={position}, role_type={role_type}")
-
-                        if (role_type == 'TYPE-1' and
-                            'LINE' in position and 'LEADER' in position):
-                            line_leaders.append(sub_row.to_dict())
-                            print(f"      [DEBUG] ✅ Found LINE LEADER: {sub_row.get('Full Name')}")
-
-                        # 재귀적with 부하of 부하 탐색
-                        find_line_leaders_recursive(sub_id, depth + 1)
-
-        find_line_leaders_recursive(manager_id)
-        print(f"      [DEBUG] Found {len(line_leaders)} LINE LEADER(s)")
-        return line_leaders
+        # OrgGraph: 하위 조직 순회 결과 캐시 (깊이 5 제한, 순서 동일)
+        org_graph = self._get_org_graph(subordinate_mapping)
+        positions = org_graph.get_team_line_leader_positions(manager_id)
+        return [self.month_data.iloc[pos].to_dict() for pos in positions]
     
     def _calculate_line_leader_average_unified(self, line_leaders: List, manager_id: str, position: str) -> float:
         """Line Leader 평균 incentive calculation"""
@@ -3961,119 +4133,130 @@ class CompleteQIPCalculator:
         print(f"  → 전체 TYPE-2 수령 인원: {receiving_count}명, 총액: {total_amount:,.0f} VND")
 
     def calculate_type2_non_group_leaders(self):
-        """TYPE-2 GROUP LEADER exclude한 모든 employee calculation"""
-        type2_mask = self.month_data['ROLE TYPE STD'] == 'TYPE-2'
+        """TYPE-2 GROUP LEADER exclude한 모든 employee calculation (column 단위)"""
+        incentive_col = f"{self.config.get_month_str('capital')}_Incentive"
+        data = self.month_data
 
-        # Type-1 참조 맵 created
+        # Type-1 참조 맵 created (한 번)
         type1_reference = self._create_type1_reference_map()
 
         # TYPE-2 포지션 matching rule withload
         type2_mapping = self.load_type2_position_mapping()
 
-        # 부하employee mapping (GROUP LEADER 계산용)
-        subordinate_mapping = self.create_manager_subordinate_mapping()
-
-        incentive_col = f"{self.config.get_month_str('capital')}_Incentive"
-
-        # GROUP LEADER exclude한 employee들only calculation
-        for idx, row in self.month_data[type2_mask].iterrows():
-            # 미 calculationdone 경우 스킵
-            if row[incentive_col] > 0:
-                continue
-
-            position = row.get('QIP POSITION 1ST  NAME', '')
-            position_upper = position.upper() if pd.notna(position) else ''
-            emp_id = row.get('Employee No', '')
-
-            # GROUP LEADER STEP 2from processing하므with 여기서 스킵
-            if position_upper == 'GROUP LEADER' or (position_upper == 'QA3A'):
-                continue
-
-            # Stop Working Date 체크 추
-            stop_working_check = False
-            if 'Stop working Date' in row.index:
-                stop_date_str = row.get('Stop working Date')
-                if pd.notna(stop_date_str) and stop_date_str != '':
-                    try:
-                        if '.' in str(stop_date_str):
-                            stop_date = pd.to_datetime(stop_date_str, format='%Y.%m.%d', errors='coerce')
-                        else:
-                            stop_date = pd.to_datetime(stop_date_str, errors='coerce')
-
-                        calc_month_start = pd.Timestamp(self.config.year, self.config.month.number, 1)
-                        if pd.notna(stop_date) and stop_date < calc_month_start:
-                            stop_working_check = True
-                    except:
-                        pass
-
-            # ========================================
-            # 100% 조건 충족 규칙 적용 (TYPE-2)
-            # ========================================
-            # TYPE-2는 출근 조건만 적용되지만, 적용되는 조건은 100% 충족해야 함
+        type2_mask = (data['ROLE TYPE STD'] == 'TYPE-2').to_numpy()
+        positions = data['QIP POSITION 1ST  NAME'] if 'QIP POSITION 1ST  NAME' in data.columns \
+            else pd.Series('', index=data.index)
+        position_upper = np.array([p.upper() if pd.notna(p) else '' for p in positions.tolist()], dtype=object)
 
-            pass_rate = row.get('conditions_pass_rate', 0)
-
-            # 100% 충족 규칙: 적용 가능한 모든 조건을 충족해야 함
-            if pass_rate < 100.0:
-                # 조건 미충족: 0 VND
-                # (Continuous_Months는 TYPE-2에 적용되지 않음)
-                incentive = 0
+        # 미 calculationdone 경우 스킵, GROUP LEADER는 STEP 2from processing
+        current = pd.to_numeric(data[incentive_col], errors='coerce').to_numpy()
+        target = type2_mask & ~(current > 0) & ~np.isin(position_upper, ['GROUP LEADER', 'QA3A'])
+        if not target.any():
+            return
 
-                # 디버깅: 어떤 조건이 실패했는지
-                failed_conditions = []
-                if row.get('cond_1_attendance_rate') == 'FAIL':
-                    failed_conditions.append('출근율<88%')
-                if row.get('cond_2_unapproved_absence') == 'FAIL':
-                    failed_conditions.append('무단결근>2일')
-                if row.get('cond_3_actual_working_days') == 'FAIL':
-                    failed_conditions.append('실제근무일=0')
-                if row.get('cond_4_minimum_days') == 'FAIL':
-                    failed_conditions.append('최소근무일<12')
+        # Stop Working Date 체크 (값별 1회 파싱)
+        calc_month_start = pd.Timestamp(self.config.year, self.config.month.number, 1)
+        stopped_cache = {}
 
-                if failed_conditions:
-                    print(f"      TYPE-2 {position} {row.get('Full Name', emp_id)}: 조건 미충족 → 0 VND (실패: {', '.join(failed_conditions)})")
-            elif stop_working_check:
-                incentive = 0
-            else:
-                # matchingdone TYPE-1 포지션 찾기
-                mapped_position = self.get_mapped_type1_position(position_upper, row, type2_mapping)
-
-                # LINE LEADER calculation
-                if 'LINE' in position_upper and 'LEADER' in position_upper:
-                    # LINE LEADER TYPE-1of LINE LEADER 평균 사용
-                    if mapped_position and mapped_position in type1_reference:
-                        incentive = type1_reference[mapped_position]
+        def stopped_before_month(value) -> bool:
+            if pd.isna(value) or value == '':
+                return False
+            if value not in stopped_cache:
+                try:
+                    if '.' in str(value):
+                        stop_date = pd.to_datetime(value, format='%Y.%m.%d', errors='coerce')
                     else:
-                        # defaultvalue 사용
-                        incentive = 107360  # position_condition_matrix.json 참조
+                        stop_date = pd.to_datetime(value, errors='coerce')
+                    stopped_cache[value] = bool(pd.notna(stop_date) and stop_date < calc_month_start)
+                except:
+                    stopped_cache[value] = False
+            return stopped_cache[value]
 
-                # SUPERVISOR 특별 processing - TYPE-1 평균 0 days 때 independent calculation
-                elif 'SUPERVISOR' in position_upper:
-                    # TYPE-1 SUPERVISOR 평균 checking
-                    type1_supervisor_avg = type1_reference.get(position_upper, 0)
+        stop_values = data['Stop working Date'].tolist() if 'Stop working Date' in data.columns else [None] * len(data)
+        stopped = np.array([target[pos] and stopped_before_month(v) for pos, v in enumerate(stop_values)], dtype=bool)
 
-                    if type1_supervisor_avg > 0:
-                        # TYPE-1 평균 있으면 그대with 사용
-                        incentive = type1_supervisor_avg
-                    else:
-                        # TYPE-1 평균 0면 independent적with calculation
-                        incentive = self.calculate_type2_supervisor_independent(position_upper)
-                        if incentive > 0:
-                            print(f"  → TYPE-2 {position} {row.get('Full Name', 'Unknown')} ({emp_id}): independent calculation → {incentive:,} VND")
-
-                elif mapped_position and mapped_position in type1_reference:
-                    incentive = type1_reference[mapped_position]
-                elif position_upper in type1_reference:
-                    # 직접 matching
-                    incentive = type1_reference[position_upper]
-                else:
-                    incentive = 0
-                    print(f"  ⚠️ TYPE-2 '{position}'to for matching failure → 0VND")
+        # 100% 조건 충족 규칙 (TYPE-2는 출근 조건만 적용되지만 적용 조건은 100% 충족)
+        if 'conditions_pass_rate' in data.columns:
+            pass_rate = pd.to_numeric(data['conditions_pass_rate'], errors='coerce').to_numpy()
+            condition_fail = pass_rate < 100.0
+        else:
+            condition_fail = np.ones(len(data), dtype=bool)
+
+        # 실패 조건 컬럼별 mask로 먼저 집계, 직원별 메시지(행 조회)는 --verbose일 때만 생성
+        condition_labels = [('cond_1_attendance_rate', '출근율<88%'), ('cond_2_unapproved_absence', '무단결근>2일'),
+                            ('cond_3_actual_working_days', '실제근무일=0'), ('cond_4_minimum_days', '최소근무일<12')]
+        condition_failed = {col: (data[col] == 'FAIL').to_numpy() if col in data.columns else np.zeros(len(data), dtype=bool)
+                            for col, _ in condition_labels}
+        failed_rows = target & condition_fail & np.logical_or.reduce(list(condition_failed.values()))
+
+        def type2_fail_message(pos: int) -> str:
+            row = data.iloc[pos]
+            failed_conditions = [label for col, label in condition_labels if condition_failed[col][pos]]
+            return f"      TYPE-2 {positions.iat[pos]} {row.get('Full Name', row.get('Employee No', ''))}: 조건 미충족 → 0 VND (실패: {', '.join(failed_conditions)})"
+
+        for pos in np.flatnonzero(failed_rows):
+            run_log.detail('type2.condition_fail', lambda: type2_fail_message(pos))
+
+        # 포지션(+ QA TEAM 코드) 조합별 TYPE-1 matching 금액 (조합당 1회)
+        qip_codes = data['FINAL QIP POSITION NAME CODE'].tolist() if 'FINAL QIP POSITION NAME CODE' in data.columns \
+            else [''] * len(data)
+        amount_cache = {}
+        INDEPENDENT = None  # TYPE-1 SUPERVISOR 평균 0 → independent calculation
+
+        def mapped_amount(position, pos_upper: str, qip_code):
+            if 'SUPERVISOR' in pos_upper and not ('LINE' in pos_upper and 'LEADER' in pos_upper):
+                type1_supervisor_avg = type1_reference.get(pos_upper, 0)
+                return type1_supervisor_avg if type1_supervisor_avg > 0 else INDEPENDENT
+
+            mapped_position = self.get_mapped_type1_position(
+                pos_upper, {'FINAL QIP POSITION NAME CODE': qip_code}, type2_mapping
+            )
+            if 'LINE' in pos_upper and 'LEADER' in pos_upper:
+                # LINE LEADER TYPE-1of LINE LEADER 평균, 없으면 defaultvalue (position_condition_matrix.json 참조)
+                return type1_reference[mapped_position] if mapped_position and mapped_position in type1_reference else 107360
+            if mapped_position and mapped_position in type1_reference:
+                return type1_reference[mapped_position]
+            if pos_upper in type1_reference:
+                return type1_reference[pos_upper]
+            print(f"  ⚠️ TYPE-2 '{position}'to for matching failure → 0VND")
+            return 0
 
-            self.month_data.loc[idx, incentive_col] = incentive
+        eligible = target & ~condition_fail & ~stopped
+        amounts = np.zeros(len(data), dtype=object)
+        independent_rows = []
+        for pos in np.flatnonzero(eligible):
+            pos_upper = position_upper[pos]
+            code = qip_codes[pos] if pos_upper == 'QA TEAM' and pd.notna(qip_codes[pos]) else None
+            key = (pos_upper, code)
+            if key not in amount_cache:
+                amount_cache[key] = mapped_amount(positions.iat[pos], pos_upper, code)
+            if amount_cache[key] is INDEPENDENT:
+                independent_rows.append(pos)
+            else:
+                amounts[pos] = amount_cache[key]
+
+        # 기록: independent SUPERVISOR는 행 순서상 앞선 TYPE-2 결과만 반영된 상태에서 계산 (기존 행 단위 순서와 동일)
+        target_positions = np.flatnonzero(target)
+        col_idx = data.columns.get_loc(incentive_col)
+        written = 0
+        for pos in independent_rows:
+            before = target_positions[written:np.searchsorted(target_positions, pos)]
+            if len(before):
+                data.iloc[before, col_idx] = list(amounts[before])
+            written += len(before)
+
+            incentive = self.calculate_type2_supervisor_independent(position_upper[pos])
+            if incentive > 0:
+                print(f"  → TYPE-2 {positions.iat[pos]} {data['Full Name'].iat[pos] if 'Full Name' in data.columns else 'Unknown'} "
+                      f"({data['Employee No'].iat[pos]}): independent calculation → {incentive:,} VND")
+            amounts[pos] = incentive
+
+        rest = target_positions[written:]
+        if len(rest):
+            data.iloc[rest, col_idx] = list(amounts[rest])
 
     def calculate_type2_group_leaders_final(self):
-        """TYPE-2 GROUP LEADER 최종 calculation (STEP 2)"""
+        """TYPE-2 GROUP LEADER 최종 calculation (STEP 2, column 단위)"""
         type2_group_mask = (
             (self.month_data['ROLE TYPE STD'] == 'TYPE-2') &
             ((self.month_data['QIP POSITION 1ST  NAME'] == 'GROUP LEADER') |
@@ -4112,74 +4295,30 @@ class CompleteQIPCalculator:
         print(f"    TYPE-1 LINE LEADER 평균: {type1_line_avg:,.0f} VND")
         print(f"    TYPE-2 LINE LEADER 평균: {type2_line_avg:,.0f} VND")
 
-        # 각 GROUP LEADER calculation
-        for idx, row in self.month_data[type2_group_mask].iterrows():
-            emp_id = row.get('Employee No', '')
-            name = row.get('Full Name', '')
-
-            # 모든 GROUP LEADER 출력with ĐINH KIM NGOAN include checking
-            print(f"    processing in progress: {name} ({emp_id}) - Type: {type(emp_id)}")
-
-            # ĐINH KIM NGOAN 특별 debugging - 다양한 형태with checking
-            if str(emp_id) == '617100049' or emp_id == 617100049 or name.startswith('ĐINH KIM NGOAN'):
-                print(f"\n    🔍 ĐINH KIM NGOAN 발견! 특별 debugging:")
-                print(f"      emp_id: {emp_id} (type: {type(emp_id)})")
-                print(f"      name: {name}")
-                print(f"      current September_Incentive: {self.month_data.loc[idx, incentive_col]}")
-                print(f"      condition1 (cond_1): {row.get('cond_1_attendance_rate', 'PASS')}")
-                print(f"      condition2 (cond_2): {row.get('cond_2_unapproved_absence', 'PASS')}")
-                print(f"      condition3 (cond_3): {row.get('cond_3_actual_working_days', 'PASS')}")
-                print(f"      condition4 (cond_4): {row.get('cond_4_minimum_days', 'PASS')}")
-
-            # attendance condition 체크
-            attendance_fail = (
-                row.get('cond_1_attendance_rate') == 'FAIL' or
-                row.get('cond_2_unapproved_absence') == 'FAIL' or
-                row.get('cond_3_actual_working_days') == 'FAIL' or
-                row.get('cond_4_minimum_days') == 'FAIL'  # Phase 1: Single Source of Truth
-            )
-
-            # debugging용 current value checking
-            current_value = self.month_data.loc[idx, incentive_col]
-
-            # ĐINH KIM NGOAN 특별 추적
-            if str(emp_id) == '617100049' or emp_id == 617100049 or name.startswith('ĐINH KIM NGOAN'):
-                print(f"      [DEBUG] current value(무시done): {current_value}")
-                print(f"      [DEBUG] attendance_fail: {attendance_fail}")
-                print(f"      [DEBUG] type1_line_avg: {type1_line_avg}")
-                print(f"      [DEBUG] type2_line_avg: {type2_line_avg}")
+        if not type2_group_mask.any():
+            return
 
-            # 무condition 재calculation - existing value 완전 무시
-            if attendance_fail:
-                incentive = 0
-                if str(emp_id) == '617100049' or emp_id == 617100049 or name.startswith('ĐINH KIM NGOAN'):
-                    print(f"      ❌ attendance_fail = True → 0VND")
-            elif type1_line_avg > 0:
-                # TYPE-1 LINE LEADER 평균 × 2 사용
-                incentive = int(type1_line_avg * 2)
-                if str(emp_id) == '617100049' or emp_id == 617100049 or name.startswith('ĐINH KIM NGOAN'):
-                    print(f"      → TYPE-1 LINE LEADER 평균 × 2: {type1_line_avg} × 2 = {incentive}")
-            elif type2_line_avg > 0:
-                # TYPE-2 LINE LEADER 평균 × 2 (fallback)
-                incentive = int(type2_line_avg * 2)
-                if str(emp_id) == '617100049' or emp_id == 617100049 or name.startswith('ĐINH KIM NGOAN'):
-                    print(f"      → TYPE-2 LINE LEADER 평균 × 2 (fallback): {type2_line_avg} × 2 = {incentive}")
-            else:
-                # defaultvalue (LINE LEADER defaultvalue × 2)
-                incentive = 107360 * 2
-                if str(emp_id) == '617100049' or emp_id == 617100049 or name.startswith('ĐINH KIM NGOAN'):
-                    print(f"      → defaultvalue 사용: 107360 × 2 = {incentive}")
+        # 조건 충족 시 금액 (모든 GROUP LEADER 동일): TYPE-1 LINE 평균 × 2 → TYPE-2 LINE 평균 × 2 → defaultvalue × 2
+        if type1_line_avg > 0:
+            group_leader_amount = int(type1_line_avg * 2)
+        elif type2_line_avg > 0:
+            group_leader_amount = int(type2_line_avg * 2)
+        else:
+            group_leader_amount = 107360 * 2
 
-            self.month_data.loc[idx, incentive_col] = incentive
+        # attendance condition 체크 (무condition 재calculation - existing value 완전 무시)
+        group_data = self.month_data[type2_group_mask]
+        attendance_fail = np.zeros(len(group_data), dtype=bool)
+        for cond_col in ('cond_1_attendance_rate', 'cond_2_unapproved_absence',
+                         'cond_3_actual_working_days', 'cond_4_minimum_days'):
+            if cond_col in group_data.columns:
+                attendance_fail |= (group_data[cond_col] == 'FAIL').to_numpy()
 
-            if str(emp_id) == '617100049' or emp_id == 617100049 or name.startswith('ĐINH KIM NGOAN'):
-                print(f"      최종 calculationvalue: {incentive}")
+        amounts = np.where(attendance_fail, 0, group_leader_amount)
+        self.month_data.loc[type2_group_mask, incentive_col] = amounts
 
-            # debugging 정보 - 모든 GROUP LEADER 출력
-            print(f"    {name} ({emp_id}):")
-            print(f"      condition 충족: {'NO' if attendance_fail else 'YES'}")
-            print(f"      TYPE-1 LINE 평균: {type1_line_avg:,.0f}, TYPE-2 LINE 평균: {type2_line_avg:,.0f}")
-            print(f"      calculationdone incentive: {incentive:,.0f} VND")
+        print(f"    GROUP LEADER 조건 충족: {int((~attendance_fail).sum())}명 × {group_leader_amount:,.0f} VND, "
+              f"미충족: {int(attendance_fail.sum())}명 → 0 VND")
 
     def calculate_type2_group_leader_independent(self, emp_id: str, subordinate_mapping: Dict[str, List[str]]) -> int:
         """TYPE-2 GROUP LEADER independent incentive calculation
@@ -4638,8 +4777,20 @@ class CompleteQIPCalculator:
 
         print(f"✅ consecutive months 추적 column 추가 완료 (Next_Month_Expected include)")
 
+    def get_attendance_index(self):
+        """attendance index 반환 (run당 1회만 file 읽기)"""
+        if not self._attendance_index_loaded:
+            self._attendance_index_loaded = True
+            if AttendanceIndex is not None:
+                self._attendance_index = AttendanceIndex.from_csv(self.config.get_file_path('attendance'))
+        return self._attendance_index
+
     def calculate_approved_leave_days(self, emp_no: str) -> int:
         """employeeof 승인done 휴  days수 calculation (AR1 아닌 모든 Reason Description)"""
+        if AttendanceIndex is not None:
+            attendance_index = self.get_attendance_index()
+            return attendance_index.get_approved_leave_days(emp_no) if attendance_index else 0
+
         try:
             # attendance file 경with 져오기
             attendance_path = self.config.get_file_path('attendance')
@@ -4669,7 +4820,7 @@ class CompleteQIPCalculator:
             return 0
 
     def add_condition_evaluation_to_excel(self):
-        """10 conditions 평 결and Excelto 추"""
+        """10 conditions 평 결and Excelto 추 (조건별 컬럼 단위 일괄 평가)"""
         print("\n📊 10items Adding condition evaluation results to Excel...")
 
         if not POSITION_CONDITION_MATRIX:
@@ -4679,317 +4830,248 @@ class CompleteQIPCalculator:
         # first attendance_rate column 없으면 calculation하여 추
         if '출근율_Attendance_Rate_Percent' not in self.month_data.columns:
             print("  → attendance_rate column Calculating (승인휴 반영)...")
-            self.month_data['출근율_Attendance_Rate_Percent'] = 0.0
-            self.month_data['Approved Leave Days'] = 0
-            self.month_data['결근율_Absence_Rate_Percent'] = 0.0
-
-            for idx in self.month_data.index:
-                emp_no = self.month_data.loc[idx, 'Employee No']
-                total_days = self.month_data.loc[idx, 'Total Working Days'] if 'Total Working Days' in self.month_data.columns else 27
-                actual_days = self.month_data.loc[idx, 'Actual Working Days'] if 'Actual Working Days' in self.month_data.columns else 0
-
-                # 승인휴  days수 calculation
-                approved_leave_days = self.calculate_approved_leave_days(emp_no)
-                self.month_data.loc[idx, 'Approved Leave Days'] = approved_leave_days
-
-                # ✅ FIXED: 출근율 = (실제 근무일 / (총 근무일 - 승인휴가)) × 100
-                # 승인휴가는 "근무하지 않은 날"이므로 분모에서 제외해야 함
-                if total_days > 0:
-                    # 근무해야 할 일수 = 총 근무일 - 승인휴가
-                    expected_working_days = total_days - approved_leave_days
-
-                    if expected_working_days > 0:
-                        # 출근율 = 실제 근무일 / 근무해야 할 일수
-                        attendance_rate = (actual_days / expected_working_days) * 100
-
-                        # 결근일 = 근무해야 할 일수 - 실제 근무일
-                        absence_days = expected_working_days - actual_days
-                        absence_days = max(0, absence_days)
-                        absence_rate = (absence_days / expected_working_days) * 100
-                    else:
-                        # 모두 승인휴가인 경우 (근무해야 할 일수가 0)
-                        attendance_rate = 100
-                        absence_days = 0
-                        absence_rate = 0
-
-                    # 100% 초and 방지
-                    attendance_rate = min(100, max(0, attendance_rate))
-                else:
-                    attendance_rate = 0
-                    absence_rate = 0
-                    absence_days = 0
-
-                self.month_data.loc[idx, '출근율_Attendance_Rate_Percent'] = attendance_rate
-                self.month_data.loc[idx, '결근율_Absence_Rate_Percent'] = absence_rate
-
-                # 레거시 컬럼 삭제:                 # attendancy condition 3also updated (absence rate > 12%)
-                # 레거시 컬럼 삭제: self.month_data.loc[idx, 'attendancy condition 3 - absent % is over 12%'] = 'yes' if absence_rate > 12 else 'no'
-
+            self._add_attendance_rate_columns()
             print(f"  ✅ 승인휴 반영 completed - 평균 승인휴: {self.month_data['Approved Leave Days'].mean():.1f} days")
 
         # 조건 평가 컬럼 초기화 (object dtype으로 설정하여 'N/A' 문자열 저장 가능하도록)
-        condition_columns = [
-            'cond_1_attendance_rate', 'cond_2_unapproved_absence', 'cond_3_actual_working_days',
-            'cond_4_minimum_days', 'cond_5_aql_personal_failure', 'cond_6_aql_continuous',
-            'cond_7_aql_team_area', 'cond_8_area_reject', 'cond_9_5prs_pass_rate', 'cond_10_5prs_inspection_qty'
-        ]
-        for col in condition_columns:
+        for col in CONDITION_COLUMNS:
             self.month_data[col] = None  # Initialize as None to create object dtype
             self.month_data[col] = self.month_data[col].astype('object')
 
+        data = self.month_data
+        n = len(data)
+
         # Interim vs Final report 판정 (조건 1&4 예외 처리용)
         from datetime import datetime
         current_date = datetime.now()
         is_current_month = (current_date.year == self.config.year and
                            current_date.month == self.config.month.number)
 
-        # 각 employee별with 10 conditions 평
-        for idx in self.month_data.index:
-            emp_type = self.month_data.loc[idx, 'ROLE TYPE STD']
-            position = self.month_data.loc[idx, 'QIP POSITION 1ST  NAME']
-            position_code = self.month_data.loc[idx, 'FINAL QIP POSITION NAME CODE']
+        emp_types = data['ROLE TYPE STD'].tolist()
+        positions = data['QIP POSITION 1ST  NAME'].tolist()
+
+        # Determine if this is an interim report based on position type
+        # (QC Assembly Inspector: 15일 기준, 그 외: 20일 기준 / 지난 달은 항상 full conditions)
+        is_interim = np.zeros(n, dtype=bool)
+        if is_current_month:
+            codes = data['FINAL QIP POSITION NAME CODE'].tolist()
+            full_names = data['Full Name'].tolist()
+            for pos in range(n):
+                is_qc_assembly = self._is_qc_assembly_position(positions[pos], codes[pos])
+                cutoff_day = 15 if is_qc_assembly else 20
+                is_interim[pos] = current_date.day < cutoff_day
+                if is_interim[pos] and is_qc_assembly:
+                    print(f"  ℹ️ QC Assembly Inspector Interim report: {full_names[pos]} (day {current_date.day} < {cutoff_day}) - 조건 1&4 예외 처리")
+
+        # position_condition_matrix.json 적용 조건: (type, position) 조합별 한 번 조회
+        applicable = build_applicability_masks(emp_types, positions, self._get_applicable_conditions)
+
+        # condition 1: attendance율 >= 88%
+        # 근무해야 할 날(Total - Approved Leave)이 0 이하면 평가 불가 (예: 전체 기간 출산휴가)
+        attendance_rate = column_values(data, '출근율_Attendance_Rate_Percent', 0)
+        expected_working_days = (column_values(data, 'Total Working Days', 0) -
+                                 column_values(data, 'Approved Leave Days', 0))
+        interim_1 = is_interim & applicable[1]
+        with np.errstate(invalid='ignore'):
+            cond_1 = judge(applicable[1], attendance_rate >= 88,
+                           not_evaluable=interim_1 | (expected_working_days <= 0))
+
+        # condition 2: 무단결근 <= 2 days (NaN = 출결 데이터 없는 신입사원)
+        unapproved_absence = column_values(data, 'Unapproved Absences', 0)
+        with np.errstate(invalid='ignore'):
+            cond_2 = judge(applicable[2], unapproved_absence <= 2,
+                           not_evaluable=pd.isna(unapproved_absence))
+
+        # condition 3: 실근무 days > 0 / condition 4: minimum근무 days >= 12
+        actual_working_days = column_values(data, 'Actual Working Days', 0)
+        with np.errstate(invalid='ignore'):
+            cond_3 = judge(applicable[3], actual_working_days > 0)
+            cond_4 = judge(applicable[4], actual_working_days >= 12,
+                           not_evaluable=is_interim & applicable[4])
+
+        # condition 5: items인 AQL 당month failure = 0
+        aql_col = f"{self.config.get_month_str('capital')} AQL Failures"
+        aql_fail = column_values(data, aql_col, 0)
+        cond_5 = judge(applicable[5], aql_fail == 0)
+
+        # condition 6: 3-month consecutive AQL failure 없음
+        continuous_fail = column_values(data, 'Continuous_FAIL', 'NO')
+        cond_6 = judge(applicable[6], continuous_fail != 'YES')
+
+        # condition 7: 팀/area AQL (LINE LEADER / AUDIT & TRAINING만 실제 판정)
+        team_aql_fail = self._evaluate_team_area_aql_fail(applicable[7], positions)
+        cond_7 = judge(applicable[7], ~team_aql_fail)
+        cond_7_value = np.where(applicable[7], np.where(team_aql_fail, 'YES', 'NO'), NOT_APPLICABLE).astype(object)
+
+        # condition 8: in chargearea reject < 3%
+        reject_rate = column_values(data, 'Area_Reject_Rate', 0)
+        with np.errstate(invalid='ignore'):
+            cond_8 = judge(applicable[8], reject_rate < 3)
+        cond_8_value = [reject_rate[pos] if applicable[8][pos] else NOT_APPLICABLE for pos in range(n)]
+
+        # condition 9: 5PRS passed율 >= 95% / condition 10: 5PRS inspection량 >= 100
+        prs_pass_rate = column_values(data, '5PRS_Pass_Rate', 0)
+        prs_qty = column_values(data, '5PRS_Inspection_Qty', 0)
+        with np.errstate(invalid='ignore'):
+            cond_9 = judge(applicable[9], prs_pass_rate >= 95)
+            cond_10 = judge(applicable[10], prs_qty >= 100)
+
+        # 결과 일괄 기록 ('N/A' 대신 'NOT_APPLICABLE' - pandas가 'N/A'를 NaN으로 변환하는 문제 회피)
+        results = [cond_1, cond_2, cond_3, cond_4, cond_5, cond_6, cond_7, cond_8, cond_9, cond_10]
+        for col, result in zip(CONDITION_COLUMNS, results):
+            data[col] = pd.Series(result, index=data.index, dtype=object)
+
+        # 값/기준 컬럼 (기존 행 단위 기록 순서대로 생성)
+        value_columns = [
+            ('cond_1_value', attendance_rate),
+            ('cond_1_threshold', ['N/A (Interim)' if flag else 88 for flag in interim_1]),
+            ('cond_2_value', unapproved_absence),
+            ('cond_2_threshold', [2] * n),
+            ('cond_3_value', actual_working_days),
+            ('cond_3_threshold', [0] * n),
+            ('cond_4_value', actual_working_days),
+            ('cond_4_threshold', ['N/A (Interim)' if flag else 12 for flag in is_interim]),
+            ('cond_5_value', aql_fail),
+            ('cond_5_threshold', [0] * n),
+            ('cond_6_value', continuous_fail),
+            ('cond_6_threshold', ['NO'] * n),
+            ('cond_7_value', cond_7_value),
+            ('cond_7_threshold', ['NO'] * n),
+            ('cond_8_value', cond_8_value),
+            ('cond_8_threshold', [3] * n),
+            ('cond_9_value', prs_pass_rate),
+            ('cond_9_threshold', [95] * n),
+            ('cond_10_value', prs_qty),
+            ('cond_10_threshold', [100] * n),
+        ]
+        for col, values in value_columns:
+            assign_like_loc(data, col, values)
 
-            # Check if this is QC Assembly Inspector type
-            is_qc_assembly = False
-            if pd.notna(position):
-                position_upper = str(position).upper()
-                is_qc_assembly = (
-                    ('QC' in position_upper and 'ASSEMBLY' in position_upper and 'INSPECTOR' in position_upper) or
-                    ('ASSEMBLY' in position_upper and 'INSPECTOR' in position_upper)
-                )
-            if pd.notna(position_code):
-                position_code_upper = str(position_code).upper()
-                if position_code_upper.startswith('A') and len(position_code_upper) >= 2 and position_code_upper[1].isdigit():
-                    is_qc_assembly = True  # A1-A5 codes
+        # 전체 condition 충족 비율 calculation (NOT_APPLICABLE인 조건은 제외)
+        applicable_count, passed_count, pass_rate = summarize_conditions(results)
+        assign_like_loc(data, 'conditions_applicable', applicable_count)
+        assign_like_loc(data, 'conditions_passed', passed_count)
+        assign_like_loc(data, 'conditions_pass_rate', pass_rate)
 
-            # Determine if this is an interim report based on position type
-            if is_current_month:
-                cutoff_day = 15 if is_qc_assembly else 20
-                is_interim_report = current_date.day < cutoff_day
+        print(f"✅ 10 conditions 평 결and 추가 완료")
 
-                # Log only for QC Assembly Inspector types
-                if is_interim_report and is_qc_assembly:
-                    print(f"  ℹ️ QC Assembly Inspector Interim report: {self.month_data.loc[idx, 'Full Name']} (day {current_date.day} < {cutoff_day}) - 조건 1&4 예외 처리")
-            else:
-                # Past month: always apply full conditions
-                is_interim_report = False
-
-            # position_condition_matrix.jsonfrom 해당 positionof condition configuration 져오기
-            pos_config = get_position_config_from_matrix(emp_type, position)
-
-            if not pos_config:
-                # defaultvalue configuration (default 사용)
-                type_matrix = POSITION_CONDITION_MATRIX.get('position_matrix', {}).get(emp_type, {})
-                pos_config = type_matrix.get('default', {})
-
-            applicable_conditions = pos_config.get('applicable_conditions', [])
-
-            # 10 conditions 각각 평
-            # condition 1: attendance율 >= 88%
-            attendance_rate = self.month_data.loc[idx, '출근율_Attendance_Rate_Percent'] if '출근율_Attendance_Rate_Percent' in self.month_data.columns else 0
-
-            # Expected working days 확인 (Total - Approved Leave)
-            # 근무해야 할 날이 0 이하면 출근율 조건 평가 불가 (예: 전체 기간 출산휴가)
-            total_days = self.month_data.loc[idx, 'Total Working Days'] if 'Total Working Days' in self.month_data.columns else 0
-            approved_leave = self.month_data.loc[idx, 'Approved Leave Days'] if 'Approved Leave Days' in self.month_data.columns else 0
-            expected_working_days = total_days - approved_leave
-
-            # Interim report (20일 이전)에는 조건 1 예외 처리
-            if is_interim_report and 1 in applicable_conditions:
-                # Interim report: 조건 1을 NOT_APPLICABLE로 처리 (중간 보고서에서는 출근율 조건 완화)
-                cond_1_result = 'NOT_APPLICABLE'
-                cond_1_applicable = 'NOT_APPLICABLE'
-                cond_1_threshold = 'N/A (Interim)'
-            elif expected_working_days <= 0:
-                # 근무해야 할 날이 없으므로 출근율 조건 평가 불가
-                cond_1_result = 'NOT_APPLICABLE'
-                cond_1_applicable = 'Y' if 1 in applicable_conditions else 'NOT_APPLICABLE'
-                cond_1_threshold = 88
-            else:
-                cond_1_result = 'PASS' if attendance_rate >= 88 else 'FAIL'
-                cond_1_applicable = 'Y' if 1 in applicable_conditions else 'NOT_APPLICABLE'
-                cond_1_threshold = 88
+    def _add_attendance_rate_columns(self):
+        """출근율/결근율/승인휴가 컬럼 계산 (승인휴가는 근무하지 않은 날이므로 분모에서 제외)"""
+        data = self.month_data
+        emp_nos = data['Employee No'].tolist()
+        approved_leave = np.array([self.calculate_approved_leave_days(emp_no) for emp_no in emp_nos])
+        total_days = column_values(data, 'Total Working Days', 27)
+        actual_days = column_values(data, 'Actual Working Days', 0)
+
+        # ✅ FIXED: 출근율 = (실제 근무일 / (총 근무일 - 승인휴가)) × 100
+        expected_working_days = total_days - approved_leave
+        with np.errstate(divide='ignore', invalid='ignore'):
+            has_expected = (total_days > 0) & (expected_working_days > 0)
+            attendance_rate = np.where(has_expected, actual_days / expected_working_days * 100, 100)
+            absence_days = expected_working_days - actual_days
+            absence_days = np.where(absence_days > 0, absence_days, 0)
+            absence_rate = np.where(has_expected, absence_days / expected_working_days * 100, 0)
+
+            # 100% 초과 방지 (NaN → 0, 기존 min(100, max(0, x))와 동일)
+            attendance_rate = np.where(attendance_rate > 0, attendance_rate, 0)
+            attendance_rate = np.where(attendance_rate < 100, attendance_rate, 100)
+            attendance_rate = np.where(total_days > 0, attendance_rate, 0)
+
+        data['출근율_Attendance_Rate_Percent'] = pd.Series(attendance_rate, index=data.index, dtype='float64')
+        data['Approved Leave Days'] = pd.Series(approved_leave.tolist(), index=data.index)
+        data['결근율_Absence_Rate_Percent'] = pd.Series(absence_rate, index=data.index, dtype='float64')
 
-            # 'N/A' 대신 'NOT_APPLICABLE' 사용 (pandas가 'N/A'를 NaN으로 변환하는 문제 해결)
-            self.month_data.loc[idx, 'cond_1_attendance_rate'] = cond_1_applicable if cond_1_applicable == 'NOT_APPLICABLE' else cond_1_result
-            self.month_data.loc[idx, 'cond_1_value'] = attendance_rate
-            self.month_data.loc[idx, 'cond_1_threshold'] = cond_1_threshold
+    @staticmethod
+    def _is_qc_assembly_position(position, position_code) -> bool:
+        """QC Assembly Inspector 여부 (position 이름 또는 A1~A5 코드)"""
+        is_qc_assembly = False
+        if pd.notna(position):
+            position_upper = str(position).upper()
+            is_qc_assembly = (
+                ('QC' in position_upper and 'ASSEMBLY' in position_upper and 'INSPECTOR' in position_upper) or
+                ('ASSEMBLY' in position_upper and 'INSPECTOR' in position_upper)
+            )
+        if pd.notna(position_code):
+            position_code_upper = str(position_code).upper()
+            if position_code_upper.startswith('A') and len(position_code_upper) >= 2 and position_code_upper[1].isdigit():
+                is_qc_assembly = True  # A1-A5 codes
+        return is_qc_assembly
 
-            # condition 2: 무단결근 <= 2 days
-            unapproved_absence = self.month_data.loc[idx, 'Unapproved Absences'] if 'Unapproved Absences' in self.month_data.columns else 0
+    @staticmethod
+    def _get_applicable_conditions(emp_type, position) -> List[int]:
+        """position_condition_matrix.json의 applicable_conditions (없으면 type default)"""
+        pos_config = get_position_config_from_matrix(emp_type, position)
+        if not pos_config:
+            type_matrix = POSITION_CONDITION_MATRIX.get('position_matrix', {}).get(emp_type, {})
+            pos_config = type_matrix.get('default', {})
+        return pos_config.get('applicable_conditions', [])
+
+    def _evaluate_team_area_aql_fail(self, applicable_7: np.ndarray, positions: List) -> np.ndarray:
+        """
+        조건 7 판정용: 부하/담당 구역 직원 중 3개월 연속 AQL 실패자 존재 여부
 
-            # NaN 처리 추가 (출결 데이터 없는 신입사원)
-            if pd.isna(unapproved_absence):
-                cond_2_result = 'NOT_APPLICABLE'  # 출결 데이터 없음
-            else:
-                cond_2_result = 'PASS' if unapproved_absence <= 2 else 'FAIL'
-
-            cond_2_applicable = 'Y' if 2 in applicable_conditions else 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_2_unapproved_absence'] = cond_2_applicable if cond_2_applicable == 'NOT_APPLICABLE' else cond_2_result
-            self.month_data.loc[idx, 'cond_2_value'] = unapproved_absence
-            self.month_data.loc[idx, 'cond_2_threshold'] = 2
-
-            # condition 3: 실근무 days > 0
-            actual_working_days = self.month_data.loc[idx, 'Actual Working Days'] if 'Actual Working Days' in self.month_data.columns else 0
-            cond_3_result = 'PASS' if actual_working_days > 0 else 'FAIL'
-            cond_3_applicable = 'Y' if 3 in applicable_conditions else 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_3_actual_working_days'] = cond_3_applicable if cond_3_applicable == 'NOT_APPLICABLE' else cond_3_result
-            self.month_data.loc[idx, 'cond_3_value'] = actual_working_days
-            self.month_data.loc[idx, 'cond_3_threshold'] = 0
-
-            # condition 4: minimum근무 days >= 12
-            # Interim report (20일 이전)에는 조건 4 예외 처리
-            if is_interim_report and 4 in applicable_conditions:
-                # Interim report: 조건 4를 NOT_APPLICABLE로 처리 (다른 조건만으로 100% 평가)
-                cond_4_result = 'NOT_APPLICABLE'
-                cond_4_applicable = 'NOT_APPLICABLE'
+        - LINE LEADER: 직속 부하 (MST direct boss name 기준)
+        - AUDIT & TRAINING TEAM: 담당 구역 직원 (MODEL MASTER는 전체 구역이므로 제외)
+        """
+        data = self.month_data
+        team_aql_fail = np.zeros(len(data), dtype=bool)
+        if not applicable_7.any():
+            return team_aql_fail
+
+        emp_ids = data['Employee No'].astype(str).tolist()
+
+        # str(Employee No) → 첫 행의 Continuous_FAIL이 'YES'로 시작하는지
+        # ('YES', 'YES_3MONTHS', 'YES_2MONTHS_AUG_SEP' 모두 포함)
+        continuous_fail_values = data['Continuous_FAIL'].tolist() if 'Continuous_FAIL' in data.columns else ['NO'] * len(data)
+        has_continuous_fail = {}
+        for emp_id, value in zip(emp_ids, continuous_fail_values):
+            if emp_id not in has_continuous_fail:
+                has_continuous_fail[emp_id] = str(value).startswith('YES')
+
+        area_mapping = None
+        for pos in np.flatnonzero(applicable_7):
+            position_value = positions[pos]
+            position = str(position_value).upper() if pd.notna(position_value) else ''
+            emp_id = emp_ids[pos]
+
+            if 'LINE' in position and 'LEADER' in position:
+                team_ids = self._get_direct_report_ids().get(emp_id, [])
+            elif ('AUDIT' in position or 'TRAINING' in position) and 'MODEL MASTER' not in position:
+                if area_mapping is None:
+                    area_mapping_file = Path('config_files') / 'auditor_trainer_area_mapping.json'
+                    area_mapping = self.load_auditor_trainer_area_mapping() if area_mapping_file.exists() else {}
+                team_ids = self.get_auditor_area_employees(emp_id, area_mapping) if area_mapping else []
             else:
-                # Final report 또는 조건 미적용 position
-                cond_4_result = 'PASS' if actual_working_days >= 12 else 'FAIL'
-                cond_4_applicable = 'Y' if 4 in applicable_conditions else 'NOT_APPLICABLE'
-
-            self.month_data.loc[idx, 'cond_4_minimum_days'] = cond_4_applicable if cond_4_applicable == 'NOT_APPLICABLE' else cond_4_result
-            self.month_data.loc[idx, 'cond_4_value'] = actual_working_days
-            self.month_data.loc[idx, 'cond_4_threshold'] = 12 if not is_interim_report else 'N/A (Interim)'
+                continue
 
-            # condition 5: items인 AQL 당month failure = 0
-            aql_col = f"{self.config.get_month_str('capital')} AQL Failures"
-            aql_fail = self.month_data.loc[idx, aql_col] if aql_col in self.month_data.columns else 0
-            cond_5_result = 'PASS' if aql_fail == 0 else 'FAIL'
-            cond_5_applicable = 'Y' if 5 in applicable_conditions else 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_5_aql_personal_failure'] = cond_5_applicable if cond_5_applicable == 'NOT_APPLICABLE' else cond_5_result
-            self.month_data.loc[idx, 'cond_5_value'] = aql_fail
-            self.month_data.loc[idx, 'cond_5_threshold'] = 0
-
-            # condition 6: 3-month consecutive AQL failure 없음
-            continuous_fail = self.month_data.loc[idx, 'Continuous_FAIL'] if 'Continuous_FAIL' in self.month_data.columns else 'NO'
-            cond_6_result = 'PASS' if continuous_fail != 'YES' else 'FAIL'
-            cond_6_applicable = 'Y' if 6 in applicable_conditions else 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_6_aql_continuous'] = cond_6_applicable if cond_6_applicable == 'NOT_APPLICABLE' else cond_6_result
-            self.month_data.loc[idx, 'cond_6_value'] = continuous_fail
-            self.month_data.loc[idx, 'cond_6_threshold'] = 'NO'
-
-            # condition 7: 팀/area AQL (3-month consecutive failure 없음)
-            # condition은 LINE LEADER나 특정 포지션toonly apply
-            team_aql_fail = False  # defaultvalue
-            if 7 in applicable_conditions:
-                # LINE LEADERof 경우 부하employee in progress 3-month consecutive failures checking
-                emp_id = str(self.month_data.loc[idx, 'Employee No'])
-                position_value = self.month_data.loc[idx, 'QIP POSITION 1ST  NAME']
-                position = str(position_value).upper() if pd.notna(position_value) else ''
-
-                if 'LINE' in position and 'LEADER' in position:
-                    # subordinate_mapping 있으면 사용, 없으면 created
-                    if not hasattr(self, 'subordinate_mapping_cache'):
-                        subordinate_mapping = {}
-                        for _, row_inner in self.month_data.iterrows():
-                            manager_id_raw = row_inner.get('MST direct boss name', '')
-                            # Convert to int if it's a float to match Employee No format
-                            if pd.notna(manager_id_raw):
-                                try:
-                                    manager_id = str(int(manager_id_raw))
-                                except (ValueError, TypeError):
-                                    manager_id = str(manager_id_raw)
-                            else:
-                                manager_id = ''
-
-                            sub_id = str(row_inner['Employee No'])
-                            if manager_id and sub_id:
-                                if manager_id not in subordinate_mapping:
-                                    subordinate_mapping[manager_id] = []
-                                subordinate_mapping[manager_id].append(sub_id)
-                        self.subordinate_mapping_cache = subordinate_mapping
-
-                    # 부하employee in progress consecutive failures checking
-                    if emp_id in self.subordinate_mapping_cache:
-                        for sub_id in self.subordinate_mapping_cache[emp_id]:
-                            # FIX: Convert both sides to string for type-safe comparison
-                            # Employee No might be int64 after save_results() numeric conversion
-                            sub_data = self.month_data[self.month_data['Employee No'].astype(str) == str(sub_id)]
-                            if not sub_data.empty:
-                                # FIX: Check if Continuous_FAIL starts with 'YES' to match 'YES', 'YES_3MONTHS', 'YES_2MONTHS_AUG_SEP'
-                                continuous_fail_value = str(sub_data.iloc[0].get('Continuous_FAIL', 'NO'))
-                                if continuous_fail_value.startswith('YES'):
-                                    team_aql_fail = True
-                                    break
+            team_aql_fail[pos] = any(has_continuous_fail.get(str(sub_id), False) for sub_id in team_ids)
 
-                # AUDIT & TRAINING TEAM의 경우 담당 구역 직원 중 3개월 연속 실패 확인
-                # MODEL MASTER는 전체 구역 담당이므로 제외
-                elif ('AUDIT' in position or 'TRAINING' in position) and 'MODEL MASTER' not in position:
-                    # auditor_trainer_area_mapping.json 로드
-                    area_mapping_file = Path('config_files') / 'auditor_trainer_area_mapping.json'
-                    if area_mapping_file.exists():
-                        with open(area_mapping_file, 'r', encoding='utf-8') as f:
-                            area_mapping = json.load(f)
-
-                        # 담당 구역 직원 가져오기
-                        area_employees = self.get_auditor_area_employees(emp_id, area_mapping)
-
-                        # 담당 구역 직원 중 3개월 연속 실패자 확인
-                        for area_emp_id in area_employees:
-                            area_emp_data = self.month_data[self.month_data['Employee No'].astype(str) == str(area_emp_id)]
-                            if not area_emp_data.empty:
-                                continuous_fail_value = str(area_emp_data.iloc[0].get('Continuous_FAIL', 'NO'))
-                                if continuous_fail_value.startswith('YES'):
-                                    team_aql_fail = True
-                                    break
+        return team_aql_fail
 
-                cond_7_result = 'PASS' if not team_aql_fail else 'FAIL'
-                self.month_data.loc[idx, 'cond_7_aql_team_area'] = cond_7_result
-                self.month_data.loc[idx, 'cond_7_value'] = 'YES' if team_aql_fail else 'NO'
+    def _get_direct_report_ids(self) -> Dict[str, List[str]]:
+        """MST direct boss name(상사 ID) 기준 직속 부하 매핑 (첫 호출 시 생성 후 재사용)"""
+        if not hasattr(self, 'subordinate_mapping_cache'):
+            subordinate_mapping = {}
+            if 'MST direct boss name' in self.month_data.columns:
+                boss_values = self.month_data['MST direct boss name'].tolist()
             else:
-                self.month_data.loc[idx, 'cond_7_aql_team_area'] = 'NOT_APPLICABLE'
-                self.month_data.loc[idx, 'cond_7_value'] = 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_7_threshold'] = 'NO'
+                boss_values = [''] * len(self.month_data)
 
-            # condition 8: in chargearea reject < 3%
-            if 8 in applicable_conditions:
-                reject_rate = self.month_data.loc[idx, 'Area_Reject_Rate'] if 'Area_Reject_Rate' in self.month_data.columns else 0
-                # PASS = reject rate < 3%, FAIL = reject rate >= 3%
-                cond_8_result = 'PASS' if reject_rate < 3 else 'FAIL'
-                self.month_data.loc[idx, 'cond_8_area_reject'] = cond_8_result
-                self.month_data.loc[idx, 'cond_8_value'] = reject_rate
-            else:
-                self.month_data.loc[idx, 'cond_8_area_reject'] = 'NOT_APPLICABLE'
-                self.month_data.loc[idx, 'cond_8_value'] = 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_8_threshold'] = 3
-
-            # condition 9: 5PRS passed율 >= 95%
-            prs_pass_rate = self.month_data.loc[idx, '5PRS_Pass_Rate'] if '5PRS_Pass_Rate' in self.month_data.columns else 0
-            cond_9_result = 'PASS' if prs_pass_rate >= 95 else 'FAIL'
-            cond_9_applicable = 'Y' if 9 in applicable_conditions else 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_9_5prs_pass_rate'] = cond_9_applicable if cond_9_applicable == 'NOT_APPLICABLE' else cond_9_result
-            self.month_data.loc[idx, 'cond_9_value'] = prs_pass_rate
-            self.month_data.loc[idx, 'cond_9_threshold'] = 95
-
-            # condition 10: 5PRS inspection량 >= 100
-            prs_qty = self.month_data.loc[idx, '5PRS_Inspection_Qty'] if '5PRS_Inspection_Qty' in self.month_data.columns else 0
-            cond_10_result = 'PASS' if prs_qty >= 100 else 'FAIL'
-            cond_10_applicable = 'Y' if 10 in applicable_conditions else 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_10_5prs_inspection_qty'] = cond_10_applicable if cond_10_applicable == 'NOT_APPLICABLE' else cond_10_result
-            self.month_data.loc[idx, 'cond_10_value'] = prs_qty
-            self.month_data.loc[idx, 'cond_10_threshold'] = 100
-
-            # 전체 condition 충족 비율 calculation
-            applicable_count = 0
-            passed_count = 0
-            for i in range(1, 11):
-                cond_col = f'cond_{i}_' + ['attendance_rate', 'unapproved_absence', 'actual_working_days', 'minimum_days',
-                                           'aql_personal_failure', 'aql_continuous', 'aql_team_area', 'area_reject',
-                                           '5prs_pass_rate', '5prs_inspection_qty'][i-1]
-                if cond_col in self.month_data.columns:
-                    result = self.month_data.loc[idx, cond_col]
-                    # NOT_APPLICABLE인 조건은 제외 (interim report 조건 4 등)
-                    if result not in ['N/A', 'NOT_APPLICABLE', None] and pd.notna(result):
-                        applicable_count += 1
-                        if result == 'PASS':
-                            passed_count += 1
-
-            self.month_data.loc[idx, 'conditions_applicable'] = applicable_count
-            self.month_data.loc[idx, 'conditions_passed'] = passed_count
-            self.month_data.loc[idx, 'conditions_pass_rate'] = (passed_count / applicable_count * 100) if applicable_count > 0 else 0
+            for manager_id_raw, sub_no in zip(boss_values, self.month_data['Employee No'].tolist()):
+                # Convert to int if it's a float to match Employee No format
+                if pd.notna(manager_id_raw):
+                    try:
+                        manager_id = str(int(manager_id_raw))
+                    except (ValueError, TypeError):
+                        manager_id = str(manager_id_raw)
+                else:
+                    manager_id = ''
 
-        print(f"✅ 10 conditions 평 결and 추가 완료")
+                sub_id = str(sub_no)
+                if manager_id and sub_id:
+                    subordinate_mapping.setdefault(manager_id, []).append(sub_id)
+            self.subordinate_mapping_cache = subordinate_mapping
+        return self.subordinate_mapping_cache
 
     def add_aql_statistics_to_excel(self):
         """AQL 통계 정보 Excelto 추"""
@@ -5061,8 +5143,14 @@ class CompleteQIPCalculator:
         print(f"     • FAIL 1cases 상: {aql_fail_count}명")
         print(f"     • PASSonly: {aql_with_data - aql_fail_count}명")
 
-    def save_results(self):
-        """결and saved"""
+    def save_results(self, affected_employees: Optional[set] = None):
+        """
+        결and saved
+
+        Args:
+            affected_employees: --incremental patch 모드의 입력 변경 직원 + 상위 관리자
+                                (None이면 모든 결과 파일을 새로 저장)
+        """
         print(f"\n💾 결과 파일 saved in progress...")
 
         try:
@@ -5072,6 +5160,7 @@ class CompleteQIPCalculator:
             import json
             output_dir = "output_files"
             os.makedirs(output_dir, exist_ok=True)
+            self.write_stage_profile(output_dir)
             
             # previous month incentive data 병합
             if self.config.previous_months:
@@ -5082,7 +5171,8 @@ class CompleteQIPCalculator:
 
                 if os.path.exists(prev_file_path):
                     try:
-                        prev_incentive_data = pd.read_csv(prev_file_path, encoding='utf-8-sig')
+                        prev_year = self.config.year if prev_month.number < self.config.month.number else self.config.year - 1
+                        prev_incentive_data = self.data_processor.read_previous_output(prev_file_path, prev_year, prev_month)
                         
                         # Employee No 숫자with 변환하여 mapping
                         prev_incentive_data['Employee No'] = pd.to_numeric(prev_incentive_data['Employee No'], errors='coerce')
@@ -5160,23 +5250,21 @@ class CompleteQIPCalculator:
 
             # CSV saved (condition 평 후)
             csv_file = os.path.join(output_dir, f"{self.config.output_prefix}_Complete_V9.0_Complete.csv")
+            if affected_employees is not None and os.path.exists(csv_file):
+                return self._save_patched_results(output_dir, csv_file, affected_employees)
             self.month_data.to_csv(csv_file, index=False, encoding='utf-8-sig')
 
             # CSV file created validation
             if os.path.exists(csv_file) and os.path.getsize(csv_file) > 0:
                 print(f"✅ CSV file 저장 완료: {csv_file}")
+                # 다음 달 계산용 이력 기록 (연속 개월/인센티브)
+                self.data_processor.record_history(csv_file, self.month_data)
             else:
                 print(f"⚠️ CSV file created failure: {csv_file}")
 
-            # Excel saved
+            # Excel saved (background, 완료/실패는 self.excel_export handle로 확인)
             excel_file = os.path.join(output_dir, f"{self.config.output_prefix}_Complete_V9.0_Complete.xlsx")
-            self.month_data.to_excel(excel_file, index=False)
-            
-            # Excel file created validation
-            if os.path.exists(excel_file) and os.path.getsize(excel_file) > 0:
-                print(f"✅ Excel file 저장 완료: {excel_file}")
-            else:
-                print(f"⚠️ Excel file created failure: {excel_file}")
+            self.excel_export = export_excel_async(self.month_data, excel_file)
             
             # 메타data saved (condition 충족 상세 정보)
             metadata_file = self.save_calculation_metadata(output_dir)
@@ -5198,211 +5286,114 @@ class CompleteQIPCalculator:
             traceback.print_exc()
             return False
     
-    def save_calculation_metadata(self, output_dir: str) -> Optional[str]:
-        """calculation 메타data JSONwith saved (condition 충족 상세 정보 include)"""
+    def _save_patched_results(self, output_dir: str, csv_file: str, affected_employees: set) -> bool:
+        """
+        --incremental patch 저장: 기존 결과와 달라진 행만 반영
+
+        - CSV: 행 단위 비교, 바뀐 행이 없으면 CSV/Excel/ledger/다음 달 파일 모두 그대로 둠
+        - Excel: 바뀐 행이 있으면 background에서 다시 저장 (openpyxl 부분 수정이 전체 저장보다 느림)
+        - metadata: 바뀐 행 + 입력 변경 직원/상위 관리자 + 구역 reject율 기반 직원만 다시 생성
+        """
+        import csv
+        import io
+
+        new_text = self.month_data.to_csv(index=False)
+        with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+            old_text = f.read()
+
+        old_rows = list(csv.reader(io.StringIO(old_text)))
+        new_rows = list(csv.reader(io.StringIO(new_text)))
+        if old_rows[:1] != new_rows[:1] or len(old_rows) != len(new_rows):
+            changed_rows = None  # 컬럼/직원 구성이 바뀜 → 전체
+        else:
+            changed_rows = {pos for pos, (old, new) in enumerate(zip(old_rows[1:], new_rows[1:])) if old != new}
+
+        positions = self.month_data['QIP POSITION 1ST  NAME'].astype(str).str.upper() \
+            if 'QIP POSITION 1ST  NAME' in self.month_data.columns else pd.Series('', index=self.month_data.index)
+        area_based = (self.month_data['ROLE TYPE STD'] == 'TYPE-1') & (
+            positions.str.contains('MODEL MASTER', regex=False)
+            | positions.str.contains('AUDIT', regex=False)
+            | positions.str.contains('TRAINING', regex=False)
+        )
+        regenerate = {
+            pos for pos, (emp_no, area) in enumerate(zip(self.month_data['Employee No'].tolist(), area_based.tolist()))
+            if area or normalize_employee_key(emp_no) in affected_employees
+        }
+
+        if changed_rows is None:
+            print(f"  → incremental: result layout changed, all rows rewritten")
+        else:
+            print(f"  → incremental: {len(changed_rows)} result rows changed "
+                  f"({len(affected_employees)} employees affected by input changes)")
+
+        if changed_rows != set():
+            with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
+                f.write(new_text)
+            print(f"✅ CSV file 저장 완료: {csv_file}")
+            self.data_processor.record_history(csv_file, self.month_data)
+
+            excel_file = os.path.join(output_dir, f"{self.config.output_prefix}_Complete_V9.0_Complete.xlsx")
+            self.excel_export = export_excel_async(self.month_data, excel_file)
+        else:
+            print(f"  → CSV/Excel unchanged: {csv_file}")
+
+        reuse = None
+        metadata_file = os.path.join(output_dir, f"{self.config.output_prefix}_metadata.json")
+        if changed_rows is not None and os.path.exists(metadata_file):
+            try:
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    reuse = (json.load(f), changed_rows | regenerate)
+            except (OSError, ValueError):
+                reuse = None
+        metadata_file = self.save_calculation_metadata(output_dir, reuse=reuse if reuse is not None else ({}, set()))
+        if metadata_file:
+            print(f"✅ 메타data file 저장 완료: {metadata_file}")
+
+        if changed_rows != set():
+            self.prepare_next_month_file(csv_file)
+        return True
+
+    def save_calculation_metadata(self, output_dir: str, reuse: Optional[Tuple[Dict, set]] = None) -> Optional[str]:
+        """
+        calculation 메타data JSONwith saved (condition 충족 상세 정보 include)
+
+        Args:
+            reuse: (기존 metadata, 다시 만들 행 위치 집합) - --incremental patch 모드
+        """
         try:
-            import json
+            import io
             import os
             
-            metadata = {}
             incentive_col = f"{self.config.get_month_str('capital')}_Incentive"
+            aql_col = f"{self.config.get_month_str('capital')} AQL Failures"
+            entries = iter_metadata_entries(
+                self.month_data, incentive_col, aql_col,
+                model_master_reject_rate=getattr(self, 'model_master_reject_rate', 0.0),
+                auditor_area_reject_rates=getattr(self, 'auditor_area_reject_rates', None),
+                reuse=reuse
+            )
             
-            for _, row in self.month_data.iterrows():
-                emp_id = str(row['Employee No'])
-                amount = row[incentive_col] if pd.notna(row[incentive_col]) else 0
-                
-                # default 정보
-                # Position column same적 processing
-                position_value = ''
-                if 'QIP POSITION 1ST  NAME' in row.index:
-                    position_value = row['QIP POSITION 1ST  NAME']
-                elif 'Position' in row.index:
-                    position_value = row['Position']
-                elif 'POSITION' in row.index:
-                    position_value = row['POSITION']
-                
-                emp_metadata = {
-                    'name': row['Full Name'],
-                    'position': position_value,
-                    'type': row['ROLE TYPE STD'],
-                    'amount': float(amount),
-                    'calculation_basis': '',
-                    'conditions': {}
-                }
-                
-                # condition 충족 정보 구성
-                # attendance condition
-                emp_metadata['conditions']['attendance'] = {
-                    '출근율_Attendance_Rate_Percent': {
-                        'passed': row.get('결근율_Absence_Rate_Percent', 0) <= 12 if pd.notna(row.get('결근율_Absence_Rate_Percent')) else True,
-                        'value': 100 - row.get('결근율_Absence_Rate_Percent', 0) if pd.notna(row.get('결근율_Absence_Rate_Percent')) else 100,
-                        'threshold': 88,
-                        'applicable': True
-                    },
-                    'unapproved_absence': {
-                        'passed': row.get('Unapproved Absences', 0) <= 2 if pd.notna(row.get('Unapproved Absences')) else True,
-                        'value': int(row.get('Unapproved Absences', 0)) if pd.notna(row.get('Unapproved Absences')) else 0,
-                        'threshold': 2,
-                        'applicable': True
-                    },
-                    'working_days': {
-                        'passed': row.get('Actual Working Days', 0) > 0 if pd.notna(row.get('Actual Working Days')) else False,
-                        'value': int(row.get('Actual Working Days', 0)) if pd.notna(row.get('Actual Working Days')) else 0,
-                        'threshold': 1,
-                        'applicable': True
-                    },
-                    'minimum_days': {
-                        'passed': row.get('Actual Working Days', 0) >= 12 if pd.notna(row.get('Actual Working Days')) else False,
-                        'value': int(row.get('Actual Working Days', 0)) if pd.notna(row.get('Actual Working Days')) else 0,
-                        'threshold': 12,
-                        'applicable': True
-                    }
-                }
-                
-                # AQL condition (TYPE-1only)
-                if row['ROLE TYPE STD'] == 'TYPE-1':
-                    # MODEL MASTER 특별 processing
-                    if 'MODEL MASTER' in str(position_value).upper():
-                        # Model Master 전체 factory reject율 사용
-                        area_reject_rate = 0.0
-                        if hasattr(self, 'model_master_reject_rate'):
-                            area_reject_rate = self.model_master_reject_rate
-                        
-                        emp_metadata['conditions']['aql'] = {
-                            'monthly_failure': {
-                                'passed': row.get(f'{self.config.get_month_str("capital")} AQL Failures', 0) == 0 if pd.notna(row.get(f'{self.config.get_month_str("capital")} AQL Failures')) else True,
-                                'value': int(row.get(f'{self.config.get_month_str("capital")} AQL Failures', 0)) if pd.notna(row.get(f'{self.config.get_month_str("capital")} AQL Failures')) else 0,
-                                'threshold': 0,
-                                'applicable': False  # Model Master items인 AQL 체크 안함
-                            },
-                            '3월_continuous': {
-                                'passed': row.get('Continuous_FAIL', 'NO') != 'YES' if pd.notna(row.get('Continuous_FAIL')) else True,
-                                'value': row.get('Continuous_FAIL', 'NO'),
-                                'threshold': 'NO',
-                                'applicable': True
-                            },
-                            'subordinate_aql': {
-                                'passed': True,
-                                'value': 'N/A',
-                                'threshold': 'N/A',
-                                'applicable': False
-                            },
-                            'area_reject_rate': {
-                                'passed': area_reject_rate < 3.0,
-                                'value': round(area_reject_rate, 2),
-                                'threshold': 3.0,
-                                'applicable': True
-                            }
-                        }
-                        
-                        # 미지급 사유 추
-                        if amount == 0 and area_reject_rate >= 3.0:
-                            emp_metadata['calculation_basis'] = f'전체 factory AQL reject율 {area_reject_rate:.1f}% (basis: 3% 미only)'
-                        elif amount == 0:
-                            emp_metadata['calculation_basis'] = '기타 condition 미충족'
-                        else:
-                            emp_metadata['calculation_basis'] = 'Model Master incentive'
-                    # AUDIT & TRAINING TEAM 특별 processing
-                    elif 'AUDIT' in str(position_value).upper() or 'TRAINING' in str(position_value).upper():
-                        # in charge area reject율 calculation
-                        emp_id_str = str(row['Employee No'])
-                        area_reject_rate = 0.0
-                        
-                        # in charge area reject율 져오기 (미 calculationdone value 참조해야 함)
-                        if hasattr(self, 'auditor_area_reject_rates') and emp_id_str in self.auditor_area_reject_rates:
-                            area_reject_rate = self.auditor_area_reject_rates[emp_id_str]
-                        
-                        emp_metadata['conditions']['aql'] = {
-                            'monthly_failure': {
-                                'passed': row.get(f'{self.config.get_month_str("capital")} AQL Failures', 0) == 0 if pd.notna(row.get(f'{self.config.get_month_str("capital")} AQL Failures')) else True,
-                                'value': int(row.get(f'{self.config.get_month_str("capital")} AQL Failures', 0)) if pd.notna(row.get(f'{self.config.get_month_str("capital")} AQL Failures')) else 0,
-                                'threshold': 0,
-                                'applicable': True
-                            },
-                            '3월_continuous': {
-                                'passed': row.get('Continuous_FAIL', 'NO') != 'YES' if pd.notna(row.get('Continuous_FAIL')) else True,
-                                'value': row.get('Continuous_FAIL', 'NO'),
-                                'threshold': 'NO',
-                                'applicable': True
-                            },
-                            'subordinate_aql': {
-                                'passed': True,  # 부하employee AQL은 별also 체크
-                                'value': 'N/A',
-                                'threshold': 'N/A',
-                                'applicable': True
-                            },
-                            'area_reject_rate': {
-                                'passed': area_reject_rate < 3.0,
-                                'value': round(area_reject_rate, 2),
-                                'threshold': 3.0,
-                                'applicable': True
-                            }
-                        }
-                        
-                        # 미지급 사유 추
-                        if amount == 0 and area_reject_rate >= 3.0:
-                            emp_metadata['calculation_basis'] = f'in charge area AQL reject율 {area_reject_rate:.1f}% (basis: 3% 미only)'
-                        elif amount == 0:
-                            emp_metadata['calculation_basis'] = '기타 condition 미충족'
-                        else:
-                            emp_metadata['calculation_basis'] = 'Auditor/Trainer incentive'
-                    # AQL INSPECTOR 특별 processing
-                    elif 'AQL INSPECTOR' in str(position_value):
-                        aql_col = f'{self.config.get_month_str("capital")} AQL Failures'
-                        emp_metadata['conditions']['aql'] = {
-                            'monthly_failure': {
-                                'passed': amount > 0,  # incentive 받았으면 passedwith 간주
-                                'value': 0 if amount > 0 else int(row.get(aql_col, 0)) if pd.notna(row.get(aql_col)) else 0,
-                                'threshold': 0,
-                                'applicable': True
-                            },
-                            '3월_continuous': {'applicable': False},
-                            'subordinate_aql': {'applicable': False},
-                            'area_reject_rate': {'applicable': False}
-                        }
-                        emp_metadata['calculation_basis'] = 'AQL Inspector 3-part incentive'
-                    else:
-                        aql_col = f'{self.config.get_month_str("capital")} AQL Failures'
-                        emp_metadata['conditions']['aql'] = {
-                            'monthly_failure': {
-                                'passed': row.get(aql_col, 0) == 0 if pd.notna(row.get(aql_col)) else True,
-                                'value': int(row.get(aql_col, 0)) if pd.notna(row.get(aql_col)) else 0,
-                                'threshold': 0,
-                                'applicable': True
-                            },
-                            '3월_continuous': {
-                                'passed': row.get('Continuous_FAIL', 'NO') != 'YES' if pd.notna(row.get('Continuous_FAIL')) else True,
-                                'value': row.get('Continuous_FAIL', 'NO'),
-                                'threshold': 'NO',
-                                'applicable': True
-                            }
-                        }
-                
-                # 5PRS conditions (TYPE-1, TYPE-2  days부)
-                if row['ROLE TYPE STD'] in ['TYPE-1', 'TYPE-2'] and 'AQL INSPECTOR' not in str(position_value):
-                    emp_metadata['conditions']['5prs'] = {
-                        'volume': {
-                            'passed': row.get('Total Valiation Qty', 0) >= 100 if pd.notna(row.get('Total Valiation Qty')) else False,
-                            'value': int(row.get('Total Valiation Qty', 0)) if pd.notna(row.get('Total Valiation Qty')) else 0,
-                            'threshold': 100,
-                            'applicable': True
-                        },
-                        'pass_rate': {
-                            'passed': row.get('Pass %', 0) >= 95 if pd.notna(row.get('Pass %')) else False,
-                            'value': float(row.get('Pass %', 0)) if pd.notna(row.get('Pass %')) else 0,
-                            'threshold': 95,
-                            'applicable': True
-                        }
-                    }
-                else:
-                    emp_metadata['conditions']['5prs'] = {'applicable': False}
-                
-                metadata[emp_id] = emp_metadata
-            
-            # JSON filewith saved
+            # JSON + JSONL(직원별 lazy load용) 스트리밍 saved
             metadata_file = os.path.join(output_dir, f"{self.config.output_prefix}_metadata.json")
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
+            jsonl_file = jsonl_path_for(metadata_file)
+            if reuse is not None and os.path.exists(metadata_file) and os.path.exists(jsonl_file):
+                # patch 모드: 내용이 같으면 기존 파일 유지
+                json_buffer, jsonl_buffer = io.StringIO(), io.StringIO()
+                write_metadata(entries, json_buffer, jsonl_buffer)
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    if f.read() == json_buffer.getvalue():
+                        print("  → metadata unchanged")
+                        return metadata_file
+                with open(metadata_file, 'w', encoding='utf-8') as f:
+                    f.write(json_buffer.getvalue())
+                with open(jsonl_file, 'w', encoding='utf-8') as f:
+                    f.write(jsonl_buffer.getvalue())
+            else:
+                with open(metadata_file, 'w', encoding='utf-8') as f_json, \
+                        open(jsonl_file, 'w', encoding='utf-8') as f_jsonl:
+                    write_metadata(entries, f_json, f_jsonl)
+            # JSON을 닫은 뒤 JSONL에 형식 버전 + JSON 크기 기록 (load_metadata가 lazy 로드 여부 판단)
+            seal_jsonl(metadata_file)
             
             # file created validation
             if os.path.exists(metadata_file) and os.path.getsize(metadata_file) > 0:
@@ -6436,9 +6427,13 @@ class CompleteQIPCalculator:
 
 class CompleteDataLoader:
     """data with더 클래스 (improved 버전 - 자same 변환 지VND)"""
+
+    # 입력 CSV 디스크 캐시 사용 여부 (--no-input-cache로 비활성화)
+    use_input_cache = True
     
     def __init__(self, config: MonthConfig):
         self.config = config
+        self.input_cache = InputFileCache() if (self.use_input_cache and InputFileCache is not None) else None
         self.file_mapping = {
             f"{config.month.full_name}_basic": config.get_file_path("basic_manpower"),
             f"{config.previous_months[-1].full_name}_incentive" if config.previous_months else "prev_incentive":
@@ -6451,6 +6446,9 @@ class CompleteDataLoader:
         # 자same 변환 configuration withload
         self.auto_convert_config = self.load_auto_convert_config()
         self.attendance_converter = None
+
+        # file_key → 실제로 읽은 file 경로 (attendance 자동 변환 반영)
+        self.resolved_paths = {}
     
     def load_auto_convert_config(self) -> Dict:
         """자same 변환 configuration withload"""
@@ -6520,27 +6518,30 @@ class CompleteDataLoader:
         """단 days file withing (자same 변환 지VND)"""
         # attendance fileof 경우 자same 변환 processing
         file_path = self.get_attendance_file_path(file_path, file_key)
+        self.resolved_paths[file_key] = file_path
         
         if not file_path or not os.path.exists(file_path):
             print(f"⚠️ file not found: {file_path}")
             return None
         
         try:
-            # 다양한 인코ingand 구분자 attempt
-            for enc in ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr']:
-                for sep in [',', ';', '\t', '|']:
-                    try:
-                        df = pd.read_csv(file_path, sep=sep, encoding=enc)
-                        if len(df) > 0 and len(df.columns) > 1:
-                            # AQL fileof 경우 빈 행 제거 후 cases수 표시
-                            if 'aql' in file_key.lower():
-                                valid_df = df.dropna(how='all')
-                                print(f"✅ {file_key} loaded successfully: {len(valid_df)} cases")
-                            else:
-                                print(f"✅ {file_key} loaded successfully: {len(df)} cases")
-                            return df
-                    except:
-                        continue
+            if self.input_cache is not None:
+                # 캐시 우선 (원본 변경 시 자same 재파싱)
+                df = self.input_cache.load_csv(file_path)
+                if df is not None:
+                    self._print_loaded(file_key, df)
+                    return df
+            else:
+                # 다양한 인코ingand 구분자 attempt
+                for enc in ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr']:
+                    for sep in [',', ';', '\t', '|']:
+                        try:
+                            df = pd.read_csv(file_path, sep=sep, encoding=enc)
+                            if len(df) > 0 and len(df.columns) > 1:
+                                self._print_loaded(file_key, df)
+                                return df
+                        except:
+                            continue
             
             print(f"❌ {file_key} load failed")
             return None
@@ -6549,6 +6550,15 @@ class CompleteDataLoader:
             print(f"❌ file withload 오류 ({file_key}): {e}")
             return None
     
+    def _print_loaded(self, file_key: str, df: pd.DataFrame):
+        """withload 결과 출력"""
+        # AQL fileof 경우 빈 행 제거 후 cases수 표시
+        if 'aql' in file_key.lower():
+            valid_df = df.dropna(how='all')
+            print(f"✅ {file_key} loaded successfully: {len(valid_df)} cases")
+        else:
+            print(f"✅ {file_key} loaded successfully: {len(df)} cases")
+
     def load_all_files(self) -> Dict[str, pd.DataFrame]:
         """모든 file withload"""
         print(f"\n📂 {self.config.get_month_str('korean')} data file withing in progress...")
@@ -6561,6 +6571,8 @@ class CompleteDataLoader:
                     data[file_key] = df
         
         print(f"✅ 총 {len(data)}items file loaded successfully")
+        if self.input_cache is not None:
+            print(f"  → input cache: {self.input_cache.hits} hit, {self.input_cache.misses} parsed")
         return data
 
 
@@ -6742,6 +6754,152 @@ def init_command():
     return None
 
 
+def parse_month_range(month_range: str) -> List[Tuple[int, int]]:
+    """'2025-07:2025-11' → [(2025, 7), (2025, 8), ..., (2025, 11)]"""
+    start_str, _, end_str = month_range.partition(':')
+    start_year, start_month = (int(v) for v in start_str.split('-'))
+    end_year, end_month = (int(v) for v in (end_str or start_str).split('-'))
+
+    months = []
+    year, month = start_year, start_month
+    while (year, month) <= (end_year, end_month):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def runtime_settings() -> Dict:
+    """CLI 스위치로 바뀌는 class 설정 + 로그 레벨 (batch worker에 그대로 전달)"""
+    return {
+        'use_input_cache': CompleteDataLoader.use_input_cache,
+        'use_vectorized_attendance': DataProcessor.use_vectorized_attendance,
+        'use_history_ledger': DataProcessor.use_history_ledger,
+        'profile_stage': CompleteQIPCalculator.profile_stage,
+        'profiler_backend': CompleteQIPCalculator.profiler_backend,
+        'log_level': run_log.level,
+    }
+
+
+def apply_runtime_settings(settings: Dict):
+    """
+    runtime_settings() 값 적용 (batch pool initializer)
+
+    spawn 방식 worker(macOS 기본)는 모듈을 새로 import하므로 main()에서 바꾼 class 속성이 없습니다.
+    """
+    CompleteDataLoader.use_input_cache = settings['use_input_cache']
+    DataProcessor.use_vectorized_attendance = settings['use_vectorized_attendance']
+    DataProcessor.use_history_ledger = settings['use_history_ledger']
+    CompleteQIPCalculator.profile_stage = settings['profile_stage']
+    CompleteQIPCalculator.profiler_backend = settings['profiler_backend']
+    run_log.set_level(settings['log_level'])
+
+
+def _prepare_month_worker(config_file: str):
+    """batch mode worker: 월 독립 단계 (입력 로드 + attendance/5PRS/AQL condition 처리)"""
+    with run_log.quiet_output():
+        config = ConfigManager.load_config(config_file)
+        data = CompleteDataLoader(config).load_all_files()
+        if not data:
+            return config_file, None
+        return config_file, CompleteQIPCalculator(data, config)
+
+
+def run_batch(month_range: str, max_workers: Optional[int] = None) -> bool:
+    """
+    여러 달 일괄 재계산 (batch mode)
+
+    1단계: 월 독립 단계(입력 로드, attendance/5PRS/AQL condition)를 process pool에서 병렬 실행
+    2단계: 연속 개월/Previous_Incentive에 의존하는 계산과 저장을 오래된 월부터 순서대로 실행
+           (이전 달 결과는 save_results가 기록한 history ledger(.cache/history_ledger.sqlite)에서 조회)
+
+    결과는 월별 --config 실행을 순서대로 한 것과 같습니다.
+    준비 단계에서 이전 달 결과 파일을 읽은 월(legacy AQL 방식)은
+    이전 달 저장이 끝난 뒤 다시 준비합니다.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    months = parse_month_range(month_range)
+    config_files = {}
+    for year, month in months:
+        config_file = os.path.join('config_files', f"config_{Month.from_number(month).full_name}_{year}.json")
+        if os.path.exists(config_file):
+            config_files[(year, month)] = config_file
+        else:
+            print(f"⚠️ configuration file not found, skipped: {config_file}")
+
+    if not config_files:
+        print("❌ No configuration files in batch range")
+        return False
+
+    print(f"\n🚀 Batch mode: {len(config_files)} months, preparation in parallel...")
+    prepared = {}
+    # CLI 스위치(--no-input-cache 등)는 initializer로 worker에도 적용 (fork/spawn 모두 같은 설정)
+    pool = ProcessPoolExecutor(max_workers=max_workers, initializer=apply_runtime_settings,
+                               initargs=(runtime_settings(),))
+    with run_log.stage('batch prepare (parallel)'), pool:
+        futures = {key: pool.submit(_prepare_month_worker, path) for key, path in config_files.items()}
+        for key, future in futures.items():
+            try:
+                _, prepared[key] = future.result()
+            except Exception as e:
+                print(f"❌ {key[0]}-{key[1]:02d} preparation failed: {e}")
+                prepared[key] = None
+
+    succeeded = []
+    for key in sorted(config_files):
+        year, month = key
+        label = f"{year}-{month:02d}"
+        calculator = prepared.get(key)
+        print(f"\n{'=' * 60}\n📅 Batch: {label} calculation\n{'=' * 60}")
+        try:
+            if calculator is not None and calculator.prepared_with_previous_output and previous_month(year, month) in succeeded:
+                # 이전 달 결과가 이번 batch에서 새로 계산됨 → 새 결과로 다시 준비
+                print(f"  → {label}: previous month result changed in this batch, preparation 재실행")
+                config = calculator.config
+                calculator = CompleteQIPCalculator(CompleteDataLoader(config).load_all_files(), config)
+            if calculator is None:
+                print(f"❌ {label}: withloaddone data 없습니다.")
+                continue
+
+            with run_log.stage(f'{label} calculate'):
+                calculator.calculate_all_incentives()
+                calculator.generate_summary()
+            with run_log.stage(f'{label} save'):
+                saved = calculator.save_results()
+            if saved:
+                print(f"\n🎉 {calculator.config.get_month_str('korean')} incentive calculation 완료!")
+                succeeded.append(key)
+            else:
+                print("\n⚠️ 결and saved in progress  days부 오류 발생했습니다.")
+        except Exception as e:
+            print(f"\n❌ {label} 실행 in progress 오류 발생: {e}")
+            traceback.print_exc()
+
+    with run_log.stage('excel (background wait)'):
+        wait_for_exports()
+    print(f"\n✅ Batch completed: {len(succeeded)}/{len(config_files)} months")
+    return len(succeeded) == len(config_files)
+
+
+def plan_incremental_run(config: MonthConfig, loader: CompleteDataLoader, data: Dict[str, pd.DataFrame]):
+    """
+    --incremental 실행 계획
+
+    Returns:
+        (ChangeDetector, IncrementalPlan), history ledger 비활성화 시 (None, None)
+    """
+    if not DataProcessor.use_history_ledger:
+        print("⚠️ --incremental requires the history ledger, running full calculation")
+        return None, None
+
+    detector = ChangeDetector(config, data, loader.resolved_paths, HistoryLedger())
+    plan = detector.plan()
+    print(f"\n🔎 Incremental check: {plan.mode} ({plan.reason})")
+    if plan.mode == 'patch':
+        print(f"  → {len(plan.affected)} employees affected (changed + manager ancestors)")
+    return detector, plan
+
+
 def main():
     """메인 실행 함수"""
     print("="*60)
@@ -6756,7 +6914,49 @@ def main():
     parser = argparse.ArgumentParser(description='QIP Incentive Calculation System')
     parser.add_argument('--config', type=str, help='configuration file 경with')
     parser.add_argument('--init', action='store_true', help='자same configuration 초기화')
+    parser.add_argument('--legacy-attendance', action='store_true',
+                        help='기존 per-employee attendance 루프 사용 (parity 체크용)')
+    parser.add_argument('--no-input-cache', action='store_true',
+                        help='입력 CSV 캐시(.cache/input_frames) 사용 안 함')
+    parser.add_argument('--no-history-ledger', action='store_true',
+                        help='월별 이력 ledger(.cache/history_ledger.sqlite) 사용 안 함')
+    parser.add_argument('--batch', type=str, metavar='YYYY-MM:YYYY-MM',
+                        help='여러 달 일괄 재계산 (예: 2025-07:2025-11, 월 독립 단계 병렬 실행)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='--batch preparation 단계 process 수 (기본: CPU 수)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='이전 실행 대비 입력이 바뀐 직원 기준으로 결과 파일 patch (변경 없으면 생략)')
+    parser.add_argument('--quiet', action='store_true',
+                        help='경고/오류와 마지막 요약(집계 카운터, 단계별 시간)만 출력')
+    parser.add_argument('--verbose', action='store_true',
+                        help='직원별 상세 로그까지 출력 (기본은 카운터로 집계)')
+    parser.add_argument('--profile-stage', type=str, metavar='STAGE',
+                        help='한 단계만 상세 profiling (예: type2, create_manager_subordinate_mapping; '
+                             '결과는 *_stage_profile_<STAGE>.prof)')
+    parser.add_argument('--profiler', choices=['cprofile', 'pyinstrument'], default='cprofile',
+                        help='--profile-stage backend (pyinstrument는 설치된 경우)')
     args = parser.parse_args()
+
+    CompleteQIPCalculator.profile_stage = args.profile_stage
+    CompleteQIPCalculator.profiler_backend = args.profiler
+
+    if args.quiet:
+        run_log.set_level(WARNING)
+    elif args.verbose:
+        run_log.set_level(DEBUG)
+
+    if args.legacy_attendance:
+        DataProcessor.use_vectorized_attendance = False
+    if args.no_input_cache:
+        CompleteDataLoader.use_input_cache = False
+    if args.no_history_ledger:
+        DataProcessor.use_history_ledger = False
+
+    if args.batch:
+        with run_log.quiet_output():
+            run_batch(args.batch, args.workers)
+        run_log.summary()
+        return
     
     # config file 지정done 경우
     if args.config:
@@ -6822,26 +7022,50 @@ def main():
         if input("\nconfiguration saved하시겠습니까? (y/n): ").lower() == 'y':
             ConfigManager.save_config(config)
     
+    with run_log.quiet_output():
+        run_calculation_stages(config, args.incremental)
+    run_log.summary()
+
+
+def run_calculation_stages(config: MonthConfig, incremental: bool = False):
+    """한 달 계산 (load → calculate → summary → save, 단계별 시간은 run_log에 기록)"""
     try:
         # data withload
-        loader = CompleteDataLoader(config)
-        data = loader.load_all_files()
+        with run_log.stage('load'):
+            loader = CompleteDataLoader(config)
+            data = loader.load_all_files()
         
         if not data:
             print("❌ withloaddone data 없습니다.")
             return
+
+        detector, plan = plan_incremental_run(config, loader, data) if incremental else (None, None)
+        if plan is not None and plan.mode == 'up_to_date':
+            print(f"\n✅ {config.get_month_str('korean')} results are up to date, nothing to recalculate")
+            return
         
         # calculation기 초기화 및 실행
-        calculator = CompleteQIPCalculator(data, config)
+        with run_log.stage('prepare'):
+            calculator = CompleteQIPCalculator(data, config)
         
         # incentive calculation
-        calculator.calculate_all_incentives()
+        with run_log.stage('calculate'):
+            calculator.calculate_all_incentives()
         
         # 결and 요약
-        calculator.generate_summary()
+        with run_log.stage('summary'):
+            calculator.generate_summary()
         
         # 결and saved
-        if calculator.save_results():
+        affected = plan.affected if plan is not None and plan.mode == 'patch' else None
+        with run_log.stage('save'):
+            saved = calculator.save_results(affected_employees=affected)
+        if saved:
+            if detector is not None:
+                detector.record()
+            if calculator.excel_export is not None:
+                with run_log.stage('excel (background wait)'):
+                    calculator.excel_export.wait()
             print(f"\n🎉 {config.get_month_str('korean')} incentive calculation 완료!")
         else:
             print("\n⚠️ 결and saved in progress  days부 오류 발생했습니다.")
@@ -6850,7 +7074,6 @@ def main():
         print(f"\n❌ 실행 in progress 오류 발생: {e}")
         traceback.print_exc()
 
-
 if __name__ == "__main__":
     main()
 
@@ -13,6 +13,11 @@ import json
 from datetime import datetime
 import calendar
 
+try:
+    from aql_history_reader import read_aql_report, EMPLOYEE_ID_COLUMN
+except ImportError:
+    from src.aql_history_reader import read_aql_report, EMPLOYEE_ID_COLUMN
+
 # Month name mappings
 MONTH_NAMES = {
     1: 'january', 2: 'february', 3: 'march', 4: 'april',
@@ -123,13 +128,12 @@ def analyze_consecutive_failures(current_month, current_year):
         if df is None or df.empty:
             return set()
         fail_df = df[df['RESULT'].str.upper() == 'FAIL']
-        emp_ids = fail_df['EMPLOYEE NO'].astype(str).str.strip().str.replace(r'\.0$', '', regex=True)
-        return set(emp_ids.unique())
+        return set(fail_df[EMPLOYEE_ID_COLUMN].dropna().unique())
 
-    # Load data for each month
-    df_month2 = pd.read_csv(file_month2, encoding='utf-8-sig') if file_month2 else pd.DataFrame()
-    df_month1 = pd.read_csv(file_month1, encoding='utf-8-sig') if file_month1 else pd.DataFrame()
-    df_current = pd.read_csv(file_current, encoding='utf-8-sig') if file_current else pd.DataFrame()
+    # Load data for each month (shared AQL reader, one parse per file)
+    df_month2 = read_aql_report(file_month2) if file_month2 else None
+    df_month1 = read_aql_report(file_month1) if file_month1 else None
+    df_current = read_aql_report(file_current) if file_current else None
 
     # Extract failures
     fails_month2 = get_fail_employees(df_month2)
@@ -182,8 +186,8 @@ def update_excel_with_continuous_fail(excel_path, analysis_result):
     # Load Excel file
     df = pd.read_csv(excel_path, encoding='utf-8-sig')
 
-    # Standardize Employee No
-    df['emp_no_str'] = df['Employee No'].astype(str).str.strip().str.replace(r'\.0$', '', regex=True)
+    # Standardize Employee No (same 9-digit form as AQL EMPLOYEE_ID)
+    df['emp_no_str'] = df['Employee No'].astype(str).str.strip().str.replace(r'\.0$', '', regex=True).str.zfill(9)
 
     # Initialize Continuous_FAIL column
     df['Continuous_FAIL'] = 'NO'
@@ -0,0 +1,3288 @@
+
+    function showTotalWorkingDaysDetails() {
+        /* Excel data에서 actual 근무일 정보 fetch (Single Source of Truth) */
+        let workDays = [];
+        let holidays = [];
+        let totalWorkingDays = {%working_days%}; /* Config에서 가져온 actual 값 */
+        const daysInMonth = {%days_in_month%}; /* Python에서 계산된 실제 월 일수 */
+
+        if (window.excelDashboardData && window.excelDashboardData.attendance) {
+            /* actual 출근 data에서 근무일과 휴th 추출 */
+            const dailyData = window.excelDashboardData.attendance.daily_data;
+            totalWorkingDays = window.excelDashboardData.attendance.total_working_days;
+
+            /* thby data 분석 - total month range 확인 */
+            for (let day = 1; day <= daysInMonth; day++) {
+                if (dailyData && dailyData[day]) {
+                    if (dailyData[day].is_working_day) {
+                        workDays.push(day);
+                    } else {
+                        holidays.push(day);
+                    }
+                } else {
+                    /* data가 없는 날은 휴th로 처리 */
+                    holidays.push(day);
+                }
+            }
+            console.log('actual 근무일:', workDays);
+            console.log('휴th/data없음:', holidays);
+            console.log('total 근무일count:', totalWorkingDays);
+        } else {
+            /* Fallback: 기본 근무일 data use */
+            console.warn('Excel dashboard data가 not found. default value use.');
+            workDays = [2,3,4,5,6,9,10,11,12,13,16,17,18,19,20,23,24,25,26,27,30];
+            holidays = [1,7,8,14,15,21,22,28,29];
+        }
+
+        /* 요th 번역 fetch */
+        const weekdaysArray = getTranslation('workingDaysModal.weekdays', currentLanguage);
+        const weekdaySuffix = getTranslation('workingDaysModal.weekdaySuffix', currentLanguage);
+        const dayLabel = getTranslation('workingDaysModal.dayLabel', currentLanguage);
+        const employeeCountLabel = getTranslation('workingDaysModal.employeeCount', currentLanguage);
+        const noDataText = getTranslation('workingDaysModal.noData', currentLanguage);
+
+        /* Python에서 계산된 실제 요일 배열 (각 날짜의 요일 index) */
+        const weekdaysIndices = {%weekdays_array_js%};
+
+        const getWeekday = (day) => {
+            /* Python에서 전달받은 실제 요일 index 사용 (day는 1부터 시작) */
+            const dayIndex = weekdaysIndices[day - 1];
+            return weekdaysArray[dayIndex];
+        };
+
+        let calendarHTML = '<div class="calendar-grid">';
+        for (let day = 1; day <= daysInMonth; day++) {
+            const isWorkDay = workDays.includes(day);
+            const hasNoData = !isWorkDay;
+            const dayClass = isWorkDay ? 'work-day' : 'no-data';
+            const icon = isWorkDay ? '💼' : '';
+            const weekday = getWeekday(day);
+
+            /* Excel data에서 corresponding 날짜의 출근 인원 count fetch */
+            let attendanceCount = '';
+            if (isWorkDay && window.excelDashboardData && window.excelDashboardData.attendance && window.excelDashboardData.attendance.daily_data && window.excelDashboardData.attendance.daily_data[day]) {
+                const count = window.excelDashboardData.attendance.daily_data[day].count;
+                if (count > 0) {
+                    attendanceCount = `<div class="attendance-count">${count}${employeeCountLabel}</div>`;
+                }
+            } else if (hasNoData) {
+                attendanceCount = `<div class="attendance-count no-data-text">
+                    <i class="fas fa-times-circle"></i>
+                    <span>${noDataText}</span>
+                </div>`;
+            }
+
+            calendarHTML += `
+                <div class="calendar-day ${dayClass}">
+                    <div class="day-number">${day}</div>
+                    <div class="day-weekday">${weekday}${weekdaySuffix}</div>
+                    ${icon ? `<div class="day-icon">${icon}</div>` : ''}
+                    ${attendanceCount}
+                </div>
+            `;
+        }
+        calendarHTML += '</div>';
+
+        /* 모달 번역 텍스트 */
+        const modalTitle = getTranslation('workingDaysModal.title', currentLanguage);
+        const totalWorkingDaysLabel = getTranslation('workingDaysModal.totalWorkingDays', currentLanguage);
+        const totalDaysLabel = getTranslation('workingDaysModal.totalDays', currentLanguage);
+        const noDataLabel = getTranslation('workingDaysModal.noData', currentLanguage);
+        const legendWorkDay = getTranslation('workingDaysModal.legendWorkDay', currentLanguage);
+        const legendNoDataText = getTranslation('workingDaysModal.legendNoData', currentLanguage);
+
+        /* month 이름 fetch */
+        const yearText = {%year%};
+        const monthNames = {
+            'ko': '{%month_ko_name%}',
+            'en': '{%month_en_name%}',
+            'vi': '{%month_vi_name%}'
+        };
+        const monthText = monthNames[currentLanguage] || monthNames['en'];
+
+        const modalContent = `
+            <div class="unified-modal-header">
+                <h5 class="unified-modal-title">
+                    <i class="fas fa-calendar-alt me-2"></i> ${yearText} ${monthText} ${modalTitle}
+                </h5>
+                <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
+            </div>
+            <div class="modal-body">
+                <div class="row mb-4">
+                    <div class="col-md-4">
+                        <div class="stat-card text-center p-3 border rounded">
+                            <div class="stat-icon">💼</div>
+                            <div class="stat-label">${totalWorkingDaysLabel}</div>
+                            <div class="stat-value text-primary h3">${totalWorkingDays}${dayLabel}</div>
+                        </div>
+                    </div>
+                    <div class="col-md-4">
+                        <div class="stat-card text-center p-3 border rounded">
+                            <div class="stat-icon">📅</div>
+                            <div class="stat-label">${totalDaysLabel}</div>
+                            <div class="stat-value text-info h3">${daysInMonth}${dayLabel}</div>
+                        </div>
+                    </div>
+                    <div class="col-md-4">
+                        <div class="stat-card text-center p-3 border rounded">
+                            <div class="stat-icon">❌</div>
+                            <div class="stat-label">${noDataLabel}</div>
+                            <div class="stat-value text-secondary h3">${holidays.length}${dayLabel}</div>
+                        </div>
+                    </div>
+                </div>
+                ${calendarHTML}
+                <div class="mt-3">
+                    <span class="legend-badge legend-workday">💼 ${legendWorkDay}</span>
+                    <span class="legend-badge legend-nodata">❌ ${legendNoDataText}</span>
+                </div>
+            </div>
+        `;
+
+        let modal = document.getElementById('detailModal');
+        if (!modal) {
+            const modalHTML = `
+                <div class="modal fade" id="detailModal" tabindex="-1" aria-labelledby="detailModalLabel" aria-hidden="true" data-bs-backdrop="true" data-bs-keyboard="true">
+                    <div class="modal-dialog modal-xl">
+                        <div class="modal-content" id="detailModalContent"></div>
+                    </div>
+                </div>
+            `;
+            document.body.insertAdjacentHTML('beforeend', modalHTML);
+            modal = document.getElementById('detailModal');
+        }
+
+        document.getElementById('detailModalContent').innerHTML = modalContent;
+
+        /* Bootstrap 5 Modal 처리 */
+        const modalElement = document.getElementById('detailModal');
+
+        // existing 모달 인스턴스 정리
+        const existingModal = bootstrap.Modal.getInstance(modalElement);
+        if (existingModal) {
+            existingModal.dispose();
+        }
+
+        // 새 모달 인스턴스 creation with proper options
+        const bsModal = new bootstrap.Modal(modalElement, {
+            backdrop: 'static',  // 모달 내부 클릭시 닫히지 않도록 설정
+            keyboard: true,      // ESC 키로 닫기
+            focus: true
+        });
+
+        bsModal.show();
+
+        // 모달 닫기 이벤트 리스너 추가 (once: true로 중복 방지)
+        modalElement.addEventListener('hidden.bs.modal', function () {
+            // 모달이 닫힌 후 정리 작업
+            setTimeout(() => {
+                const backdrop = document.querySelector('.modal-backdrop');
+                if (backdrop) {
+                    backdrop.remove();
+                }
+                document.body.classList.remove('modal-open');
+                document.body.style.removeProperty('overflow');
+                document.body.style.removeProperty('padding-right');
+                document.body.style.overflow = '';  // 명시적으로 빈 문자열 설정
+            }, 50);
+        }, { once: true });
+    }
+
+    function showZeroWorkingDaysDetails() {
+        // Excel data use (Single Source of Truth)
+        let zeroWorkingEmployees = [];
+
+        if (window.excelDashboardData && window.excelDashboardData.modal_data && window.excelDashboardData.modal_data.zero_working_days_직원) {
+            // Excel에서 이미 필터링된 data use
+            zeroWorkingEmployees = window.excelDashboardData.modal_data.zero_working_days_직원;
+        } else if (window.employeeData) {
+            // Fallback to employeeData (TYPE-3 제외)
+            zeroWorkingEmployees = window.employeeData.filter(emp => {
+                // TYPE-3 제외 (incentive 대상 아님)
+                if (emp['type'] === 'TYPE-3' || emp['ROLE TYPE STD'] === 'TYPE-3') {
+                    return false;
+                }
+                const actualDays = parseFloat(emp['Actual Working Days'] || emp['actual_working_days'] || 0);
+                return actualDays === 0;
+            });
+        }
+
+        // 0일 근무자 분류 함수 (Option 1 + Option 3)
+        function classifyZeroWorkingEmployee(emp, lang) {
+            const remark = (emp['RE MARK'] || '').toLowerCase();
+            const pregnant = (emp['pregnant vacation-yes or no'] || '').toLowerCase();
+
+            // 출산휴가 (파란색 - 정당한 사유)
+            if (pregnant === 'yes' || remark.includes('maternity') || remark.includes('출산')) {
+                return {
+                    category: 'maternity',
+                    badge: getTranslation('zeroWorkingDaysModal.categories.maternity', lang),
+                    color: 'info',
+                    priority: 3
+                };
+            }
+
+            // 퇴사 (회색 - 정당한 사유)
+            if (remark.includes('stop working') || remark.includes('퇴사') || remark.includes('resign')) {
+                return {
+                    category: 'resigned',
+                    badge: getTranslation('zeroWorkingDaysModal.categories.resigned', lang),
+                    color: 'secondary',
+                    priority: 3
+                };
+            }
+
+            // 직무변경 (노란색 - 확인 필요)
+            if (remark.includes('change') || remark.includes('변경') || remark.includes('transfer')) {
+                return {
+                    category: 'jobChange',
+                    badge: getTranslation('zeroWorkingDaysModal.categories.jobChange', lang),
+                    color: 'warning',
+                    priority: 2
+                };
+            }
+
+            // 사유 없음 (빨간색 - 관리 필요)
+            return {
+                category: 'noReason',
+                badge: getTranslation('zeroWorkingDaysModal.categories.noReason', lang),
+                color: 'danger',
+                priority: 1
+            };
+        }
+
+        // 정렬 상태 관리 (기본값: priority로 정렬하여 관리 필요 케이스를 상단에 표시)
+        let sortColumn = 'priority';
+        let sortOrder = 'asc';
+
+        function sortData(column) {
+            if (sortColumn === column) {
+                sortOrder = sortOrder === 'asc' ? 'desc' : 'asc';
+            } else {
+                sortColumn = column;
+                sortOrder = 'asc';
+            }
+
+            zeroWorkingEmployees.sort((a, b) => {
+                let aVal, bVal;
+
+                switch(column) {
+                    case 'empNo':
+                        aVal = a['Employee No'] || '';
+                        bVal = b['Employee No'] || '';
+                        break;
+                    case 'name':
+                        aVal = a['Full Name'] || '';
+                        bVal = b['Full Name'] || '';
+                        break;
+                    case 'position':
+                        aVal = a['QIP POSITION 1ST NAME'] || '';  // Fixed: single space (normalized)
+                        bVal = b['QIP POSITION 1ST NAME'] || '';  // Fixed: single space (normalized)
+                        break;
+                    case 'totalDays':
+                        aVal = a['Total Working Days'] || {working_days};
+                        bVal = b['Total Working Days'] || {working_days};
+                        break;
+                    case 'actualDays':
+                        aVal = a['Actual Working Days'] || 0;
+                        bVal = b['Actual Working Days'] || 0;
+                        break;
+                    case 'stopDate':
+                        aVal = a['Stop working Date'] || '';
+                        bVal = b['Stop working Date'] || '';
+                        break;
+                    case 'pregnant':
+                        aVal = a['pregnant vacation-yes or no'] || '';
+                        bVal = b['pregnant vacation-yes or no'] || '';
+                        break;
+                    case 'remark':
+                        aVal = a['RE MARK'] || '';  // Fixed: no trailing space (normalized)
+                        bVal = b['RE MARK'] || '';  // Fixed: no trailing space (normalized)
+                        break;
+                    case 'status':
+                        // 새로운 분류 시스템 사용 (Option 1 + Option 3)
+                        const langStatus = currentLanguage || 'ko';
+                        const aClassificationStatus = classifyZeroWorkingEmployee(a, langStatus);
+                        const bClassificationStatus = classifyZeroWorkingEmployee(b, langStatus);
+                        aVal = aClassificationStatus.category; // 'maternity', 'resigned', 'jobChange', 'noReason'
+                        bVal = bClassificationStatus.category;
+                        break;
+                    case 'priority':
+                        // Priority 정렬 추가 (1=관리필요, 2=확인필요, 3=정당한사유)
+                        const lang = currentLanguage || 'ko';
+                        const aClassification = classifyZeroWorkingEmployee(a, lang);
+                        const bClassification = classifyZeroWorkingEmployee(b, lang);
+                        aVal = aClassification.priority;
+                        bVal = bClassification.priority;
+                        break;
+                }
+
+                if (typeof aVal === 'string') {
+                    return sortOrder === 'asc' ? aVal.localeCompare(bVal, 'ko') : bVal.localeCompare(aVal, 'ko');
+                } else {
+                    return sortOrder === 'asc' ? (aVal - bVal) : (bVal - aVal);
+                }
+            });
+
+            renderTable();
+        }
+
+        function renderTable() {
+            const lang = currentLanguage || 'ko';
+            let tableRows = '';
+
+            // 요약 통계 계산 (Option 3)
+            const total = zeroWorkingEmployees.length;
+            const maternity = zeroWorkingEmployees.filter(emp => {
+                const classification = classifyZeroWorkingEmployee(emp, lang);
+                return classification.category === 'maternity';
+            }).length;
+            const resigned = zeroWorkingEmployees.filter(emp => {
+                const classification = classifyZeroWorkingEmployee(emp, lang);
+                return classification.category === 'resigned';
+            }).length;
+            const jobChange = zeroWorkingEmployees.filter(emp => {
+                const classification = classifyZeroWorkingEmployee(emp, lang);
+                return classification.category === 'jobChange';
+            }).length;
+            const noReason = zeroWorkingEmployees.filter(emp => {
+                const classification = classifyZeroWorkingEmployee(emp, lang);
+                return classification.category === 'noReason';
+            }).length;
+
+            const legitimateReasons = maternity + resigned;
+
+            if (zeroWorkingEmployees.length === 0) {
+                tableRows = `<tr><td colspan="9" class="text-center py-4"><i class="fas fa-check-circle text-success fa-2x mb-2 d-block"></i>${getTranslation('zeroWorkingDaysModal.description', lang)}</td></tr>`;
+            } else {
+                tableRows = zeroWorkingEmployees.map(emp => {
+                    // Excel에서 가져온 필드 use (Single Source of Truth)
+                    const actualDays = emp['Actual Working Days'] || 0;
+
+                    // 출결 data file 기준 Total Days calculation
+                    const empNo = String(emp['Employee No'] || '').padStart(9, '0');
+                    let totalDays = 0;  // default value: 출결 data 없음
+
+                    // attendance raw data에서 corresponding 직원의 unique 날짜 count calculation
+                    if (window.attendanceRawData && window.attendanceRawData[empNo]) {
+                        totalDays = window.attendanceRawData[empNo].uniqueDates || 0;
+                    }
+                    // 출결 data가 없으면 0으로 표시 (fact 반영)
+
+                    const stopDate = emp['Stop working Date'] || '-';
+                    const position = emp['QIP POSITION 1ST NAME'] || '-';  // Fixed: single space (normalized)
+                    const pregnant = emp['pregnant vacation-yes or no'] || '';
+                    const remark = emp['RE MARK'] || '-';  // Fixed: no trailing space (normalized)
+
+                    // 새로운 분류 로직 사용 (Option 1)
+                    const classification = classifyZeroWorkingEmployee(emp, lang);
+                    const statusLabel = classification.badge;
+                    const statusClass = `bg-${classification.color}`;
+
+                    // 임신 휴가 번역
+                    const pregnantLabel = pregnant === 'yes'
+                        ? getTranslation('zeroWorkingDaysModal.statusLabels.yes', lang)
+                        : pregnant === 'no'
+                        ? getTranslation('zeroWorkingDaysModal.statusLabels.no', lang)
+                        : '-';
+
+                    return `
+                        <tr class="unified-table-row">
+                            <td class="unified-table-cell">${emp['Employee No'] || ''}</td>
+                            <td class="unified-table-cell">${emp['Full Name'] || ''}</td>
+                            <td class="unified-table-cell">${position}</td>
+                            <td class="unified-table-cell text-center">${totalDays}</td>
+                            <td class="unified-table-cell text-center">
+                                <span class="badge bg-danger">${actualDays}</span>
+                            </td>
+                            <td class="unified-table-cell text-center">
+                                <span class="badge ${statusClass}">${statusLabel}</span>
+                            </td>
+                            <td class="unified-table-cell text-center">${stopDate}</td>
+                            <td class="unified-table-cell text-center">${pregnantLabel}</td>
+                            <td class="unified-table-cell">${remark}</td>
+                        </tr>
+                    `;
+                }).join('');
+            }
+
+            const modalContent = `
+                <div class="unified-modal-header">
+                    <h5 class="unified-modal-title">
+                        <i class="fas fa-exclamation-triangle me-2"></i><span data-i18n="zeroWorkingDaysModal.title">${getTranslation('zeroWorkingDaysModal.title', lang)}</span>
+                    </h5>
+                    <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
+                </div>
+                <div class="modal-body">
+                    <div class="alert alert-light border-start border-4 border-danger mb-3">
+                        <div class="d-flex align-items-center">
+                            <i class="fas fa-info-circle text-danger me-2"></i>
+                            <span data-i18n="zeroWorkingDaysModal.description">${getTranslation('zeroWorkingDaysModal.description', lang)}</span>
+                        </div>
+                    </div>
+                    ${total > 0 ? `
+                    <div class="row mb-3">
+                        <div class="col-12">
+                            <div class="card border-0 shadow-sm">
+                                <div class="card-body">
+                                    <h6 class="card-title mb-3">
+                                        <i class="fas fa-chart-pie me-2"></i>
+                                        <span data-i18n="zeroWorkingDaysModal.summary.title">${getTranslation('zeroWorkingDaysModal.summary.title', lang)}</span>
+                                    </h6>
+                                    <div class="row g-2">
+                                        <div class="col-md-3 col-6">
+                                            <div class="p-2 bg-light rounded text-center">
+                                                <div class="fs-4 fw-bold text-primary">${total}</div>
+                                                <small class="text-muted" data-i18n="zeroWorkingDaysModal.summary.total">${getTranslation('zeroWorkingDaysModal.summary.total', lang)}</small>
+                                            </div>
+                                        </div>
+                                        <div class="col-md-3 col-6">
+                                            <div class="p-2 bg-danger bg-opacity-10 rounded text-center border border-danger">
+                                                <div class="fs-4 fw-bold text-danger">${noReason}</div>
+                                                <small class="text-danger" data-i18n="zeroWorkingDaysModal.summary.managementNeeded">${getTranslation('zeroWorkingDaysModal.summary.managementNeeded', lang)}</small>
+                                            </div>
+                                        </div>
+                                        <div class="col-md-3 col-6">
+                                            <div class="p-2 bg-warning bg-opacity-10 rounded text-center border border-warning">
+                                                <div class="fs-4 fw-bold text-warning">${jobChange}</div>
+                                                <small class="text-warning" data-i18n="zeroWorkingDaysModal.summary.reviewNeeded">${getTranslation('zeroWorkingDaysModal.summary.reviewNeeded', lang)}</small>
+                                            </div>
+                                        </div>
+                                        <div class="col-md-3 col-6">
+                                            <div class="p-2 bg-info bg-opacity-10 rounded text-center border border-info">
+                                                <div class="fs-4 fw-bold text-info">${legitimateReasons}</div>
+                                                <small class="text-info" data-i18n="zeroWorkingDaysModal.summary.legitimateReasons">${getTranslation('zeroWorkingDaysModal.summary.legitimateReasons', lang)}</small>
+                                                <div class="mt-1 small text-muted">
+                                                    <span data-i18n="zeroWorkingDaysModal.categories.maternity">${getTranslation('zeroWorkingDaysModal.categories.maternity', lang)}</span>: ${maternity} |
+                                                    <span data-i18n="zeroWorkingDaysModal.categories.resigned">${getTranslation('zeroWorkingDaysModal.categories.resigned', lang)}</span>: ${resigned}
+                                                </div>
+                                            </div>
+                                        </div>
+                                    </div>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                    ` : ''}
+                    <div class="table-responsive">
+                        <table class="table table-hover table-sm">
+                            <thead class="unified-table-header">
+                                <tr>
+                                    <th class="sortable-header ${sortColumn === 'empNo' ? sortOrder : ''}" onclick="window.zeroModalSort('empNo')" data-i18n="zeroWorkingDaysModal.headers.empNo">${getTranslation('zeroWorkingDaysModal.headers.empNo', lang)}</th>
+                                    <th class="sortable-header ${sortColumn === 'name' ? sortOrder : ''}" onclick="window.zeroModalSort('name')" data-i18n="zeroWorkingDaysModal.headers.name">${getTranslation('zeroWorkingDaysModal.headers.name', lang)}</th>
+                                    <th class="sortable-header ${sortColumn === 'position' ? sortOrder : ''}" onclick="window.zeroModalSort('position')" data-i18n="zeroWorkingDaysModal.headers.position">${getTranslation('zeroWorkingDaysModal.headers.position', lang)}</th>
+                                    <th class="text-center sortable-header ${sortColumn === 'totalDays' ? sortOrder : ''}" onclick="window.zeroModalSort('totalDays')" data-i18n="zeroWorkingDaysModal.headers.totalDays">${getTranslation('zeroWorkingDaysModal.headers.totalDays', lang)}</th>
+                                    <th class="text-center sortable-header ${sortColumn === 'actualDays' ? sortOrder : ''}" onclick="window.zeroModalSort('actualDays')" data-i18n="zeroWorkingDaysModal.headers.actualDays">${getTranslation('zeroWorkingDaysModal.headers.actualDays', lang)}</th>
+                                    <th class="text-center sortable-header ${sortColumn === 'status' ? sortOrder : ''}" onclick="window.zeroModalSort('status')" data-i18n="zeroWorkingDaysModal.headers.status">${getTranslation('zeroWorkingDaysModal.headers.status', lang)}</th>
+                                    <th class="text-center sortable-header ${sortColumn === 'stopDate' ? sortOrder : ''}" onclick="window.zeroModalSort('stopDate')" data-i18n="zeroWorkingDaysModal.headers.stopDate">${getTranslation('zeroWorkingDaysModal.headers.stopDate', lang)}</th>
+                                    <th class="text-center sortable-header ${sortColumn === 'pregnant' ? sortOrder : ''}" onclick="window.zeroModalSort('pregnant')" data-i18n="zeroWorkingDaysModal.headers.pregnantVacation">${getTranslation('zeroWorkingDaysModal.headers.pregnantVacation', lang)}</th>
+                                    <th class="sortable-header ${sortColumn === 'remark' ? sortOrder : ''}" onclick="window.zeroModalSort('remark')" data-i18n="zeroWorkingDaysModal.headers.remark">${getTranslation('zeroWorkingDaysModal.headers.remark', lang)}</th>
+                                </tr>
+                            </thead>
+                            <tbody>${tableRows}</tbody>
+                        </table>
+                    </div>
+                </div>
+            `;
+
+            // 모달이 없으면 creation
+            let modal = document.getElementById('detailModal');
+            if (!modal) {
+                const modalHTML = `
+                    <div class="modal fade" id="detailModal" tabindex="-1" aria-labelledby="detailModalLabel" aria-hidden="true" data-bs-backdrop="static" data-bs-keyboard="true" style="z-index: 1055;">
+                        <div class="modal-dialog modal-fullscreen" style="margin: 0; width: 100vw; height: 100vh;">
+                            <div class="modal-content" id="detailModalContent" style="height: 100%; border: none; border-radius: 0; display: flex; flex-direction: column;"></div>
+                        </div>
+                    </div>
+                `;
+                document.body.insertAdjacentHTML('beforeend', modalHTML);
+                modal = document.getElementById('detailModal');
+            }
+
+            document.getElementById('detailModalContent').innerHTML = modalContent;
+        }
+
+        // 전역 정렬 함count 등록
+        window.zeroModalSort = sortData;
+
+        // 초기 렌더링
+        renderTable();
+
+        // Bootstrap 5 Modal 처리
+        const modalElement = document.getElementById('detailModal');
+
+        // existing 모달 인스턴스 정리
+        const existingModal = bootstrap.Modal.getInstance(modalElement);
+        if (existingModal) {
+            existingModal.dispose();
+        }
+
+        // 새 모달 인스턴스 creation with proper options
+        const bsModal = new bootstrap.Modal(modalElement, {
+            backdrop: 'static',  // 모달 내부 클릭시 닫히지 않도록 설정
+            keyboard: true,      // ESC 키로 닫기
+            focus: true
+        });
+
+        bsModal.show();
+
+        // 모달 닫기 이벤트 리스너 추가 (once: true로 중복 방지)
+        modalElement.addEventListener('hidden.bs.modal', function () {
+            // 모달이 닫힌 후 정리 작업
+            setTimeout(() => {
+                const backdrop = document.querySelector('.modal-backdrop');
+                if (backdrop) {
+                    backdrop.remove();
+                }
+                document.body.classList.remove('modal-open');
+                document.body.style.removeProperty('overflow');
+                document.body.style.removeProperty('padding-right');
+                document.body.style.overflow = '';  // 명시적으로 빈 문자열 설정
+            }, 50);
+        }, { once: true });
+    }
+
+    function showAbsentWithoutInformDetails() {
+        let absentEmployees = window.employeeData.filter(emp => {
+            const unapproved = parseFloat(emp.unapproved_absences || emp['Unapproved Absences'] || 0);
+            // Filter >= 1 day to show all unapproved absences
+            return unapproved >= 1;
+        });
+
+        // 정렬 상태 관리
+        let sortColumn = 'days';
+        let sortOrder = 'desc';
+
+        function sortData(column) {
+            if (sortColumn === column) {
+                sortOrder = sortOrder === 'asc' ? 'desc' : 'asc';
+            } else {
+                sortColumn = column;
+                sortOrder = 'asc';
+            }
+
+            absentEmployees.sort((a, b) => {
+                let aVal, bVal;
+
+                switch(column) {
+                    case 'empNo':
+                        aVal = a['Employee No'] || '';
+                        bVal = b['Employee No'] || '';
+                        break;
+                    case 'name':
+                        aVal = a['Full Name'] || '';
+                        bVal = b['Full Name'] || '';
+                        break;
+                    case 'position':
+                        aVal = a['QIP POSITION 1ST NAME'] || '';  // Fixed: single space (normalized)
+                        bVal = b['QIP POSITION 1ST NAME'] || '';  // Fixed: single space (normalized)
+                        break;
+                    case 'days':
+                        aVal = parseFloat(a['Unapproved Absences'] || 0);
+                        bVal = parseFloat(b['Unapproved Absences'] || 0);
+                        break;
+                    case 'stopDate':
+                        aVal = a['Stop working Date'] || '';
+                        bVal = b['Stop working Date'] || '';
+                        break;
+                    case 'pregnant':
+                        aVal = a['pregnant vacation-yes or no'] || '';
+                        bVal = b['pregnant vacation-yes or no'] || '';
+                        break;
+                    case 'remark':
+                        aVal = a['RE MARK'] || '';  // Fixed: no trailing space (normalized)
+                        bVal = b['RE MARK'] || '';  // Fixed: no trailing space (normalized)
+                        break;
+                    case 'status':
+                        const aDays = parseFloat(a['Unapproved Absences'] || 0);
+                        const bDays = parseFloat(b['Unapproved Absences'] || 0);
+                        aVal = aDays > 2 ? 3 : (aDays === 2 ? 2 : 1);
+                        bVal = bDays > 2 ? 3 : (bDays === 2 ? 2 : 1);
+                        break;
+                }
+
+                if (typeof aVal === 'string') {
+                    return sortOrder === 'asc' ? aVal.localeCompare(bVal, 'ko') : bVal.localeCompare(aVal, 'ko');
+                } else {
+                    return sortOrder === 'asc' ? (aVal - bVal) : (bVal - aVal);
+                }
+            });
+
+            renderTable();
+        }
+
+        function renderTable() {
+            const lang = currentLanguage || 'ko';
+
+            // Calculate statistics before rendering
+            const total = absentEmployees.length;
+            const excluded = absentEmployees.filter(emp => {
+                const days = parseFloat(emp['Unapproved Absences'] || 0);
+                return days >= 3;
+            }).length;
+            const warning = absentEmployees.filter(emp => {
+                const days = parseFloat(emp['Unapproved Absences'] || 0);
+                return days === 2;
+            }).length;
+            const caution = total - excluded - warning;
+
+            let tableRows = absentEmployees.map(emp => {
+                const days = parseFloat(emp['Unapproved Absences'] || 0);
+                const position = emp['QIP POSITION 1ST NAME'] || '-';  // Fixed: single space (normalized)
+                const stopDate = emp['Stop working Date'] || '-';
+                const pregnant = emp['pregnant vacation-yes or no'] || '';
+                const remark = emp['RE MARK'] || '-';  // Fixed: no trailing space (normalized)
+
+                // 상태 및 스타th
+                let statusLabel, statusClass, daysBadgeClass;
+                if (days >= 3) {
+                    statusLabel = getTranslation('validationTab.status.excluded', lang);
+                    statusClass = 'bg-danger';
+                    daysBadgeClass = 'bg-danger';
+                } else if (days === 2) {
+                    statusLabel = getTranslation('validationTab.status.warning', lang);
+                    statusClass = 'bg-warning text-dark';
+                    daysBadgeClass = 'bg-warning text-dark';
+                } else {
+                    statusLabel = getTranslation('validationTab.status.caution', lang);
+                    statusClass = 'bg-info';
+                    daysBadgeClass = 'bg-info';
+                }
+
+                // 임신 휴가 번역
+                const pregnantLabel = pregnant === 'yes'
+                    ? getTranslation('zeroWorkingDaysModal.statusLabels.yes', lang)
+                    : pregnant === 'no'
+                    ? getTranslation('zeroWorkingDaysModal.statusLabels.no', lang)
+                    : '-';
+
+                return `
+                    <tr class="unified-table-row">
+                        <td class="unified-table-cell">${emp['Employee No'] || ''}</td>
+                        <td class="unified-table-cell">${emp['Full Name'] || ''}</td>
+                        <td class="unified-table-cell">${position}</td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge ${daysBadgeClass}">${days}</span>
+                        </td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge ${statusClass}">${statusLabel}</span>
+                        </td>
+                        <td class="unified-table-cell text-center">${stopDate}</td>
+                        <td class="unified-table-cell text-center">${pregnantLabel}</td>
+                        <td class="unified-table-cell">${remark}</td>
+                    </tr>
+                `;
+            }).join('');
+
+            // Add Total row if there are employees
+            if (total > 0) {
+                tableRows += `
+                    <tr class="table-active fw-bold" style="border-top: 2px solid #dee2e6;">
+                        <td colspan="3" class="unified-table-cell text-end">Total</td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge bg-secondary">${total}</span>
+                        </td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge bg-danger me-1">${excluded}</span>
+                            <span class="badge bg-warning text-dark me-1">${warning}</span>
+                            <span class="badge bg-info">${caution}</span>
+                        </td>
+                        <td colspan="3" class="unified-table-cell"></td>
+                    </tr>
+                `;
+            } else {
+                tableRows = `
+                    <tr>
+                        <td colspan="8" class="text-center py-5">
+                            <i class="fas fa-check-circle text-success fa-3x mb-3"></i>
+                            <div class="text-muted">무단결근자가 not found</div>
+                        </td>
+                    </tr>`;
+            }
+
+        // 통계 섹션 추가
+        const statsSection = total > 0 ? `
+            <div class="alert alert-light border-start border-4 border-warning mb-4">
+                <div class="row text-center">
+                    <div class="col-md-3">
+                        <div class="d-flex flex-column">
+                            <span class="text-muted small">${getTranslation('validationTab.stats.total', currentLanguage) || 'Total'}</span>
+                            <span class="fs-4 fw-bold text-dark">${total}</span>
+                        </div>
+                    </div>
+                    <div class="col-md-3">
+                        <div class="d-flex flex-column">
+                            <span class="text-muted small">${getTranslation('validationTab.stats.caution', currentLanguage) || 'Caution'} (1${getTranslation('validationTab.units.day', currentLanguage) || ' day'})</span>
+                            <span class="fs-4 fw-bold text-info">${caution}</span>
+                        </div>
+                    </div>
+                    <div class="col-md-3">
+                        <div class="d-flex flex-column">
+                            <span class="text-muted small">${getTranslation('validationTab.stats.warning', currentLanguage) || 'Warning'} (2${getTranslation('validationTab.units.days', currentLanguage) || ' days'})</span>
+                            <span class="fs-4 fw-bold text-warning">${warning}</span>
+                        </div>
+                    </div>
+                    <div class="col-md-3">
+                        <div class="d-flex flex-column">
+                            <span class="text-muted small">${getTranslation('validationTab.stats.excluded', currentLanguage) || 'Excluded'} (3${getTranslation('validationTab.units.days', currentLanguage) || ' days'}+)</span>
+                            <span class="fs-4 fw-bold text-danger">${excluded}</span>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        ` : '';
+
+            const modalContent = `
+                <div class="unified-modal-header" style="flex-shrink: 0;">
+                    <h5 class="unified-modal-title">
+                        <i class="fas fa-user-times me-2"></i><span data-i18n="validationTab.modals.absentWithoutInform.title">${getTranslation('validationTab.modals.absentWithoutInform.title', lang)}</span>
+                    </h5>
+                    <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
+                </div>
+                <div class="modal-body" style="flex: 1; overflow-y: auto; overflow-x: hidden;">
+                    <div class="alert alert-light border-start border-4 border-danger mb-3">
+                        <div class="d-flex align-items-center">
+                            <i class="fas fa-info-circle text-danger me-2"></i>
+                            <span data-i18n="validationTab.warnings.absentExclusion">${getTranslation('validationTab.warnings.absentExclusion', lang)}</span>
+                        </div>
+                    </div>
+                    <div class="table-responsive">
+                        <table class="table table-hover table-sm">
+                            <thead class="unified-table-header">
+                                <tr>
+                                    <th class="sortable-header ${sortColumn === 'empNo' ? sortOrder : ''}" onclick="window.absentModalSort('empNo')" data-i18n="validationTab.tableHeaders.empNo">${getTranslation('validationTab.tableHeaders.empNo', lang)}</th>
+                                    <th class="sortable-header ${sortColumn === 'name' ? sortOrder : ''}" onclick="window.absentModalSort('name')" data-i18n="validationTab.tableHeaders.name">${getTranslation('validationTab.tableHeaders.name', lang)}</th>
+                                    <th class="sortable-header ${sortColumn === 'position' ? sortOrder : ''}" onclick="window.absentModalSort('position')" data-i18n="validationTab.tableHeaders.position">${getTranslation('validationTab.tableHeaders.position', lang)}</th>
+                                    <th class="text-center sortable-header ${sortColumn === 'days' ? sortOrder : ''}" onclick="window.absentModalSort('days')" data-i18n="validationTab.tableHeaders.absentDays">${getTranslation('validationTab.tableHeaders.absentDays', lang)}</th>
+                                    <th class="text-center sortable-header ${sortColumn === 'status' ? sortOrder : ''}" onclick="window.absentModalSort('status')" data-i18n="validationTab.tableHeaders.status">${getTranslation('validationTab.tableHeaders.status', lang)}</th>
+                                    <th class="text-center sortable-header ${sortColumn === 'stopDate' ? sortOrder : ''}" onclick="window.absentModalSort('stopDate')" data-i18n="zeroWorkingDaysModal.headers.stopDate">${getTranslation('zeroWorkingDaysModal.headers.stopDate', lang)}</th>
+                                    <th class="text-center sortable-header ${sortColumn === 'pregnant' ? sortOrder : ''}" onclick="window.absentModalSort('pregnant')" data-i18n="zeroWorkingDaysModal.headers.pregnantVacation">${getTranslation('zeroWorkingDaysModal.headers.pregnantVacation', lang)}</th>
+                                    <th class="sortable-header ${sortColumn === 'remark' ? sortOrder : ''}" onclick="window.absentModalSort('remark')" data-i18n="zeroWorkingDaysModal.headers.remark">${getTranslation('zeroWorkingDaysModal.headers.remark', lang)}</th>
+                                </tr>
+                            </thead>
+                            <tbody>${tableRows}</tbody>
+                        </table>
+                    </div>
+                </div>
+            `;
+
+            document.getElementById('detailModalContent').innerHTML = modalContent;
+        }
+
+        // 모달 표시 처리 (sortData 호출 전에 creation)
+        let modal = document.getElementById('detailModal');
+        if (!modal) {
+            const modalHTML = `
+                <div class="modal fade" id="detailModal" tabindex="-1" aria-labelledby="detailModalLabel" aria-hidden="true" data-bs-backdrop="true" data-bs-keyboard="true">
+                    <div class="modal-dialog modal-fullscreen">
+                        <div class="modal-content" id="detailModalContent"></div>
+                    </div>
+                </div>
+            `;
+            document.body.insertAdjacentHTML('beforeend', modalHTML);
+            modal = document.getElementById('detailModal');
+        }
+
+        // 전역 정렬 함count 등록
+        window.absentModalSort = sortData;
+
+        // 초기 정렬 상태로 렌더링
+        sortData('days');
+
+        /* Bootstrap 5 Modal 처리 */
+        const modalElement = document.getElementById('detailModal');
+
+        // existing 모달 인스턴스 정리
+        const existingModal = bootstrap.Modal.getInstance(modalElement);
+        if (existingModal) {
+            existingModal.dispose();
+        }
+
+        // 새 모달 인스턴스 creation with proper options
+        const bsModal = new bootstrap.Modal(modalElement, {
+            backdrop: 'static',  // 모달 내부 클릭시 닫히지 않도록 설정
+            keyboard: true,      // ESC 키로 닫기
+            focus: true
+        });
+
+        bsModal.show();
+
+        // 모달 닫기 이벤트 리스너 추가 (once: true로 중복 방지)
+        modalElement.addEventListener('hidden.bs.modal', function () {
+            // 모달이 닫힌 후 정리 작업
+            setTimeout(() => {
+                const backdrop = document.querySelector('.modal-backdrop');
+                if (backdrop) {
+                    backdrop.remove();
+                }
+                document.body.classList.remove('modal-open');
+                document.body.style.removeProperty('overflow');
+                document.body.style.removeProperty('padding-right');
+                document.body.style.overflow = '';  // 명시적으로 빈 문자열 설정
+            }, 50);
+        }, { once: true });
+    }
+
+    function showMinimumDaysNotMetDetails() {
+        // Excel의 Minimum_Working_Days_Required use (Single Source of Truth)
+        const firstEmp = window.employeeData[0] || {};
+        const minimumRequired = firstEmp['Minimum_Working_Days_Required'] || 12;
+
+        // C4 조건 사용 (Single Source of Truth)
+        let notMetEmployees = window.employeeData.filter(emp => {
+            // TYPE-3 제외 (incentive 대상 아님)
+            if (emp['type'] === 'TYPE-3' || emp['ROLE TYPE STD'] === 'TYPE-3') {
+                return false;
+            }
+            // C4 조건: cond_4_minimum_days = 'FAIL'
+            return emp['cond_4_minimum_days'] === 'FAIL';
+        });
+
+        // 정렬 상태 관리
+        let sortColumn = 'actualDays';
+        let sortOrder = 'asc';
+
+        function renderTable() {
+            const lang = currentLanguage || 'ko';
+            const daysUnit = getTranslation('validationTab.units.days', lang);
+
+            // 정렬 apply
+            const sorted = [...notMetEmployees].sort((a, b) => {
+                let aVal, bVal;
+
+                switch(sortColumn) {
+                    case 'empNo':
+                        aVal = a.employee_no || a['Employee No'] || '';
+                        bVal = b.employee_no || b['Employee No'] || '';
+                        break;
+                    case 'name':
+                        aVal = a.full_name || a['Full Name'] || '';
+                        bVal = b.full_name || b['Full Name'] || '';
+                        break;
+                    case 'position':
+                        aVal = a['QIP POSITION 1ST NAME'] || '';  // Fixed: single space (normalized)
+                        bVal = b['QIP POSITION 1ST NAME'] || '';  // Fixed: single space (normalized)
+                        break;
+                    case 'type':
+                        aVal = a['type'] || a['ROLE TYPE STD'] || '';
+                        bVal = b['type'] || b['ROLE TYPE STD'] || '';
+                        break;
+                    case 'actualDays':
+                        aVal = parseFloat(a.actual_working_days || a['Actual Working Days'] || 0);
+                        bVal = parseFloat(b.actual_working_days || b['Actual Working Days'] || 0);
+                        break;
+                    case 'shortage':
+                        aVal = minimumRequired - parseFloat(a.actual_working_days || a['Actual Working Days'] || 0);
+                        bVal = minimumRequired - parseFloat(b.actual_working_days || b['Actual Working Days'] || 0);
+                        break;
+                    case 'status':
+                        aVal = parseFloat(a.actual_working_days || a['Actual Working Days'] || 0) >= minimumRequired ? 1 : 0;
+                        bVal = parseFloat(b.actual_working_days || b['Actual Working Days'] || 0) >= minimumRequired ? 1 : 0;
+                        break;
+                    default:
+                        aVal = 0;
+                        bVal = 0;
+                }
+
+                if (typeof aVal === 'string') {
+                    return sortOrder === 'asc' ? aVal.localeCompare(bVal) : bVal.localeCompare(aVal);
+                } else {
+                    return sortOrder === 'asc' ? aVal - bVal : bVal - aVal;
+                }
+            });
+
+            let tableRows = sorted.map(emp => {
+                const actualDays = parseFloat(emp.actual_working_days || emp['Actual Working Days'] || 0);
+                const shortage = minimumRequired - actualDays;
+                const percentage = (actualDays / minimumRequired * 100).toFixed(1);
+
+                // 더 직원확한 색상 구분
+                let progressColor = 'danger';
+                let textColor = 'text-white';
+                if (percentage >= 75) {
+                    progressColor = 'info';
+                    textColor = 'text-dark';  // 하늘색 배경에 검은색 텍스트
+                } else if (percentage >= 50) {
+                    progressColor = 'warning';
+                    textColor = 'text-dark';  // 노란색 배경에 검은색 텍스트
+                }
+                // percentage < 50은 danger (빨간색) 유지
+
+                const isMet = actualDays >= minimumRequired;
+
+                const empType = emp['type'] || emp['ROLE TYPE STD'] || '-';
+                const typeColor = empType === 'TYPE-3' ? 'bg-secondary' : (empType === 'TYPE-1' ? 'bg-primary' : 'bg-success');
+
+                return `
+                    <tr class="unified-table-row">
+                        <td style="padding: 12px 8px; font-weight: 500;">${emp['Employee No'] || ''}</td>
+                        <td style="padding: 12px 8px; font-weight: 500;">${emp['Full Name'] || ''}</td>
+                        <td style="padding: 12px 8px; font-size: 13px;">${emp['QIP POSITION 1ST NAME'] || '-'}</td>
+                        <td class="text-center" style="padding: 10px 8px;">
+                            <span class="badge ${typeColor}" style="font-size: 12px;">${empType}</span>
+                        </td>
+                        <td class="text-center" style="padding: 10px 8px;">
+                            <div class="d-flex align-items-center justify-content-center">
+                                <span class="badge bg-${progressColor} ${textColor}" style="font-size: 14px; padding: 8px 12px;">
+                                    ${actualDays}${daysUnit}
+                                </span>
+                            </div>
+                        </td>
+                        <td class="text-center" style="padding: 10px 8px;">
+                            <span class="badge bg-primary" style="font-size: 14px; padding: 8px 12px;">${minimumRequired}${daysUnit}</span>
+                        </td>
+                        <td class="text-center" style="padding: 10px 8px;">
+                            <span class="badge bg-danger" style="font-size: 14px; padding: 8px 12px;">-${shortage}${daysUnit}</span>
+                        </td>
+                        <td class="text-center" style="padding: 10px 8px;">
+                            <span class="badge ${isMet ? 'bg-success' : 'bg-danger'}" style="font-size: 13px; padding: 6px 10px;" data-i18n="validationTab.modals.minimumDaysNotMet.statusLabels.${isMet ? 'met' : 'notMet'}">
+                                ${isMet ? getTranslation('validationTab.modals.minimumDaysNotMet.statusLabels.met', lang) : getTranslation('validationTab.modals.minimumDaysNotMet.statusLabels.notMet', lang)}
+                            </span>
+                        </td>
+                    </tr>
+                `;
+            }).join('') || (() => {
+                // 리포트 타입에 따라 다른 메시지 표시
+                const isInterim = reportType === 'interim';
+                const messageKey = isInterim ? 'interimMessage' : 'emptyMessage';
+                const iconClass = isInterim ? 'fa-info-circle text-info' : 'fa-check-circle text-success';
+                return `<tr><td colspan="7" class="text-center py-4"><i class="fas ${iconClass} fa-2x mb-2 d-block"></i><div data-i18n="validationTab.modals.minimumDaysNotMet.${messageKey}">${getTranslation('validationTab.modals.minimumDaysNotMet.' + messageKey, lang)}</div></td></tr>`;
+            })();
+
+            return tableRows;
+        }
+
+        function setSorting(column) {
+            if (sortColumn === column) {
+                sortOrder = sortOrder === 'asc' ? 'desc' : 'asc';
+            } else {
+                sortColumn = column;
+                sortOrder = 'asc';
+            }
+
+            const tbody = document.querySelector('#detailModal tbody');
+            if (tbody) {
+                tbody.innerHTML = renderTable();
+            }
+
+            // 헤더 클래스 업데이트
+            document.querySelectorAll('#detailModal .sortable-header').forEach(th => {
+                th.classList.remove('asc', 'desc');
+            });
+            const currentHeader = document.querySelector(`#detailModal .sortable-header[data-sort="${column}"]`);
+            if (currentHeader) {
+                currentHeader.classList.add(sortOrder);
+            }
+        }
+
+        const lang = currentLanguage || 'ko';
+
+        const modalContent = `
+            <div class="unified-modal-header" style="flex-shrink: 0;">
+                <h5 class="unified-modal-title">
+                    <i class="fas fa-clock me-2"></i><span data-i18n="validationTab.modals.minimumDaysNotMet.title">${getTranslation('validationTab.modals.minimumDaysNotMet.title', lang)}</span>
+                </h5>
+                <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
+            </div>
+            <div class="modal-body" style="flex: 1; overflow-y: auto; overflow-x: hidden;">
+                <div class="alert alert-light border-start border-4 border-warning mb-3">
+                    <div class="d-flex align-items-center">
+                        <i class="fas fa-info-circle text-warning me-2"></i>
+                        <div>
+                            <div>
+                                <span data-i18n="validationTab.modals.minimumDaysNotMet.alertMessage">${getTranslation('validationTab.modals.minimumDaysNotMet.alertMessage', lang)}</span> ${minimumRequired}<span data-i18n="validationTab.units.days">${getTranslation('validationTab.units.days', lang)}</span>
+                            </div>
+                            <div class="text-muted small mt-1">
+                                <span data-i18n="validationTab.modals.minimumDaysNotMet.excludeNote">${getTranslation('validationTab.modals.minimumDaysNotMet.excludeNote', lang)}</span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                <div class="table-responsive">
+                    <table class="table table-hover" id="minimumDaysTable" style="font-size: 14px;">
+                        <thead class="unified-table-header">
+                            <tr>
+                                <th class="sortable-header" data-sort="empNo" onclick="window.minDaysSort('empNo')" style="min-width: 100px;" data-i18n="validationTab.modals.minimumDaysNotMet.headers.empNo">${getTranslation('validationTab.modals.minimumDaysNotMet.headers.empNo', lang)}</th>
+                                <th class="sortable-header" data-sort="name" onclick="window.minDaysSort('name')" style="min-width: 130px;" data-i18n="validationTab.modals.minimumDaysNotMet.headers.name">${getTranslation('validationTab.modals.minimumDaysNotMet.headers.name', lang)}</th>
+                                <th class="sortable-header" data-sort="position" onclick="window.minDaysSort('position')" style="min-width: 150px;" data-i18n="validationTab.modals.minimumDaysNotMet.headers.position">${getTranslation('validationTab.modals.minimumDaysNotMet.headers.position', lang)}</th>
+                                <th class="sortable-header" data-sort="type" onclick="window.minDaysSort('type')" style="min-width: 80px;" data-i18n="validationTab.modals.minimumDaysNotMet.headers.type">${getTranslation('validationTab.modals.minimumDaysNotMet.headers.type', lang)}</th>
+                                <th class="text-center sortable-header asc" data-sort="actualDays" onclick="window.minDaysSort('actualDays')" style="min-width: 110px;" data-i18n="validationTab.modals.minimumDaysNotMet.headers.actualDays">${getTranslation('validationTab.modals.minimumDaysNotMet.headers.actualDays', lang)}</th>
+                                <th class="text-center" style="min-width: 80px;" data-i18n="validationTab.modals.minimumDaysNotMet.headers.minimumRequired">${getTranslation('validationTab.modals.minimumDaysNotMet.headers.minimumRequired', lang)}</th>
+                                <th class="text-center sortable-header" data-sort="shortage" onclick="window.minDaysSort('shortage')" style="min-width: 70px;" data-i18n="validationTab.modals.minimumDaysNotMet.headers.shortage">${getTranslation('validationTab.modals.minimumDaysNotMet.headers.shortage', lang)}</th>
+                                <th class="text-center sortable-header" data-sort="status" onclick="window.minDaysSort('status')" style="min-width: 80px;" data-i18n="validationTab.modals.minimumDaysNotMet.headers.status">${getTranslation('validationTab.modals.minimumDaysNotMet.headers.status', lang)}</th>
+                            </tr>
+                        </thead>
+                        <tbody>${renderTable()}</tbody>
+                    </table>
+                </div>
+            </div>
+        `;
+
+        // 전역 정렬 함count 설정
+        window.minDaysSort = setSorting;
+
+        let modal = document.getElementById('detailModal');
+        if (!modal) {
+            const modalHTML = `
+                <div class="modal fade" id="detailModal" tabindex="-1" aria-labelledby="detailModalLabel" aria-hidden="true" data-bs-backdrop="true" data-bs-keyboard="true">
+                    <div class="modal-dialog modal-xl">
+                        <div class="modal-content" id="detailModalContent"></div>
+                    </div>
+                </div>
+            `;
+            document.body.insertAdjacentHTML('beforeend', modalHTML);
+            modal = document.getElementById('detailModal');
+        }
+
+        document.getElementById('detailModalContent').innerHTML = modalContent;
+
+        /* Bootstrap 5 Modal 처리 */
+        const modalElement = document.getElementById('detailModal');
+
+        // existing 모달 인스턴스 정리
+        const existingModal = bootstrap.Modal.getInstance(modalElement);
+        if (existingModal) {
+            existingModal.dispose();
+        }
+
+        // 새 모달 인스턴스 creation with proper options
+        const bsModal = new bootstrap.Modal(modalElement, {
+            backdrop: 'static',  // 모달 내부 클릭시 닫히지 않도록 설정
+            keyboard: true,      // ESC 키로 닫기
+            focus: true
+        });
+
+        bsModal.show();
+
+        // 모달 닫기 이벤트 리스너 추가 (once: true로 중복 방지)
+        modalElement.addEventListener('hidden.bs.modal', function () {
+            // 모달이 닫힌 후 정리 작업
+            setTimeout(() => {
+                const backdrop = document.querySelector('.modal-backdrop');
+                if (backdrop) {
+                    backdrop.remove();
+                }
+                document.body.classList.remove('modal-open');
+                document.body.style.removeProperty('overflow');
+                document.body.style.removeProperty('padding-right');
+                document.body.style.overflow = '';  // 명시적으로 빈 문자열 설정
+            }, 50);
+        }, { once: true });
+    }
+
+    function showAttendanceBelow88Details() {
+        // 출근율 88% 미만 직원 필터링 (TYPE-3 제외)
+        let below88Employees = window.employeeData.filter(emp => {
+            // TYPE-3 제외 (incentive 대상 아님)
+            if (emp['type'] === 'TYPE-3' || emp['ROLE TYPE STD'] === 'TYPE-3') {
+                return false;
+            }
+            const attendanceRate = parseFloat(emp['출근율_Attendance_Rate_Percent'] || emp['Attendance Rate'] || 0);
+            return attendanceRate < 88;
+        });
+
+        let sortColumn = 'attendanceRate';
+        let sortOrder = 'asc';
+
+        function sortData(column) {
+            if (sortColumn === column) {
+                sortOrder = sortOrder === 'asc' ? 'desc' : 'asc';
+            } else {
+                sortColumn = column;
+                sortOrder = column === 'attendanceRate' ? 'asc' : 'desc';
+            }
+            updateTableBody();
+        }
+
+        function updateTableBody() {
+            const tbody = document.querySelector('#attendanceModal tbody');
+            if (!tbody) return;
+
+            // 정렬
+            below88Employees.sort((a, b) => {
+                let aVal, bVal;
+                switch (sortColumn) {
+                    case 'empNo':
+                        aVal = a['Employee No'] || a['emp_no'];
+                        bVal = b['Employee No'] || b['emp_no'];
+                        break;
+                    case 'name':
+                        aVal = a['Full Name'] || a['name'];
+                        bVal = b['Full Name'] || b['name'];
+                        break;
+                    case 'position':
+                        aVal = a['QIP POSITION 1ST NAME'] || '';
+                        bVal = b['QIP POSITION 1ST NAME'] || '';
+                        break;
+                    case 'type':
+                        aVal = a['type'] || a['ROLE TYPE STD'] || '';
+                        bVal = b['type'] || b['ROLE TYPE STD'] || '';
+                        break;
+                    case 'attendanceRate':
+                        aVal = parseFloat(a['출근율_Attendance_Rate_Percent'] || 0);
+                        bVal = parseFloat(b['출근율_Attendance_Rate_Percent'] || 0);
+                        break;
+                    case 'actualDays':
+                        aVal = parseFloat(a['Actual Working Days'] || a['actual_working_days'] || 0);
+                        bVal = parseFloat(b['Actual Working Days'] || b['actual_working_days'] || 0);
+                        break;
+                    case 'totalDays':
+                        aVal = parseFloat(a['Total Working Days'] || {working_days});
+                        bVal = parseFloat(b['Total Working Days'] || {working_days});
+                        break;
+                    case 'resignDate':
+                        aVal = a['Stop working Date'] || '9999-12-31';
+                        bVal = b['Stop working Date'] || '9999-12-31';
+                        break;
+                }
+
+                if (typeof aVal === 'string') {
+                    return sortOrder === 'asc' ? aVal.localeCompare(bVal) : bVal.localeCompare(aVal);
+                }
+                return sortOrder === 'asc' ? aVal - bVal : bVal - aVal;
+            });
+
+            // 테이블 업데이트 (다국어 지원)
+            const lang = currentLanguage || 'ko';
+            const dayText = getTranslation('validationTab.units.day', lang);
+            const metText = getTranslation('validationTab.modals.attendanceBelow88.statusLabels.met', lang);
+            const notMetText = getTranslation('validationTab.modals.attendanceBelow88.statusLabels.notMet', lang);
+
+            tbody.innerHTML = '';
+            below88Employees.forEach(emp => {
+                const empNo = emp['Employee No'] || emp['emp_no'];
+                let name = emp['Full Name'] || emp['name'];
+                const attendanceRate = parseFloat(emp['Attendance Rate'] || emp['출근율_Attendance_Rate_Percent'] || 0).toFixed(1);
+                const actualDays = parseFloat(emp['Actual Working Days'] || emp['actual_working_days'] || 0);
+                const totalDays = parseFloat(emp['Total Working Days'] || {working_days});
+
+                // 조기 퇴사 확인 (해당 월 10일 이내 퇴사)
+                let earlyResignBadge = '';
+                let resignDateDisplay = '-';
+                const stopDate = emp['Stop working Date'];
+                if (stopDate) {
+                    resignDateDisplay = stopDate;
+                    try {
+                        // Parse date (MM/DD/YYYY or YYYY-MM-DD format)
+                        let resignDate;
+                        if (stopDate.includes('/')) {
+                            const parts = stopDate.split('/');
+                            resignDate = new Date(parts[2], parts[0] - 1, parts[1]); // MM/DD/YYYY
+                        } else {
+                            resignDate = new Date(stopDate); // YYYY-MM-DD
+                        }
+
+                        const resignDay = resignDate.getDate();
+                        const resignMonth = resignDate.getMonth() + 1;
+                        // Check if resigned in current month within first 10 days
+                        if (resignMonth === {%month_num%} && resignDay <= 10) {
+                            const badgeText = getTranslation('validationTab.modals.attendanceBelow88.earlyResignBadge', lang);
+                            const resignLabel = getTranslation('validationTab.modals.attendanceBelow88.resignationDate', lang);
+                            earlyResignBadge = `<span class="badge bg-warning text-dark ms-2" style="font-size: 11px;" title="${resignLabel}: ${stopDate}">⚠️ ${badgeText}</span>`;
+                        }
+                    } catch (e) {
+                        // Date parsing failed, ignore
+                    }
+                }
+
+                // 출근율에 따른 색상과 텍스트 색상 - 더 직원확한 구분
+                let badgeClass = 'bg-danger';
+                let textColor = 'text-white';
+                let customStyle = '';
+
+                if (attendanceRate >= 70) {
+                    badgeClass = 'bg-info';  // 70% 이상은 하늘색
+                    textColor = 'text-dark';
+                } else if (attendanceRate >= 50) {
+                    badgeClass = 'bg-warning';  // 50-70%는 노란색
+                    textColor = 'text-dark';
+                } else if (attendanceRate >= 30) {
+                    // 30-50%는 주황색 (커스텀 스타th)
+                    badgeClass = '';
+                    customStyle = 'background-color: #ff6b35 !important; color: white !important;';
+                }
+                // attendanceRate < 30은 bg-danger (빨간색) 유지
+
+                const conditionMet = attendanceRate >= 88;
+                const statusText = conditionMet ? metText : notMetText;
+                const statusBadge = conditionMet ? 'bg-success' : 'bg-danger';
+
+                const empType = emp['type'] || emp['ROLE TYPE STD'] || '-';
+                const typeColor = empType === 'TYPE-3' ? 'bg-secondary' : (empType === 'TYPE-1' ? 'bg-primary' : 'bg-success');
+                const position = emp['QIP POSITION 1ST NAME'] || '-';
+
+                const row = document.createElement('tr');
+                row.innerHTML = `
+                    <td style="padding: 10px; font-weight: 500;">${empNo}</td>
+                    <td style="padding: 10px; font-weight: 500;">${name}${earlyResignBadge}</td>
+                    <td style="padding: 10px; font-size: 13px;">${position}</td>
+                    <td style="padding: 10px;"><span class="badge ${typeColor}" style="font-size: 12px;">${empType}</span></td>
+                    <td style="padding: 10px;"><span class="badge ${badgeClass} ${textColor}" style="font-size: 14px; padding: 6px 10px; ${customStyle}">${attendanceRate}%</span></td>
+                    <td style="padding: 10px;">${actualDays}${dayText}</td>
+                    <td style="padding: 10px;">${totalDays}${dayText}</td>
+                    <td style="padding: 10px; font-size: 13px;">${resignDateDisplay}</td>
+                    <td style="padding: 10px;"><span class="badge ${statusBadge}" style="font-size: 13px; padding: 4px 8px;" data-i18n="validationTab.modals.attendanceBelow88.statusLabels.${conditionMet ? 'met' : 'notMet'}">${statusText}</span></td>
+                `;
+                tbody.appendChild(row);
+            });
+        }
+
+        function getSortIcon(column) {
+            if (sortColumn !== column) return '';
+            return sortOrder === 'asc' ? '▲' : '▼';
+        }
+
+        // Bootstrap 모달 HTML creation (다국어 지원)
+        const lang = currentLanguage || 'ko';
+
+        const modalHTML = `
+            <div class="modal fade" id="attendanceModal" tabindex="-1" role="dialog" aria-labelledby="attendanceModalLabel" aria-hidden="true" style="z-index: 1055;">
+                <div class="modal-dialog modal-fullscreen" role="document" style="margin: 0; width: 100vw; height: 100vh;">
+                    <div class="modal-content" style="height: 100%; border: none; border-radius: 0;">
+                        <div class="modal-header unified-modal-header" style="flex-shrink: 0;">
+                            <h5 class="modal-title unified-modal-title" id="attendanceModalLabel">
+                                <i class="fas fa-percentage me-2"></i><span data-i18n="validationTab.modals.attendanceBelow88.title">${getTranslation('validationTab.modals.attendanceBelow88.title', lang)}</span>
+                            </h5>
+                            <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
+                        </div>
+                        <div class="modal-body" style="flex: 1; overflow-y: auto; overflow-x: hidden;">
+                            <div class="mb-3">
+                                <div class="alert alert-light border-start border-4 border-warning">
+                                    <div class="d-flex align-items-center">
+                                        <i class="fas fa-info-circle text-warning me-2"></i>
+                                        <div>
+                                            <div>
+                                                <span data-i18n="validationTab.modals.attendanceBelow88.alertMessage">${getTranslation('validationTab.modals.attendanceBelow88.alertMessage', lang)}</span>
+                                            </div>
+                                            <div class="text-muted small mt-1">
+                                                <span data-i18n="validationTab.modals.attendanceBelow88.excludeNote">${getTranslation('validationTab.modals.attendanceBelow88.excludeNote', lang)}</span>
+                                            </div>
+                                        </div>
+                                    </div>
+                                </div>
+                                <p class="text-muted"><i class="fas fa-users me-2"></i><span data-i18n="common.total">${getTranslation('common.total', lang)}</span> ${below88Employees.length} <span data-i18n="common.people">${getTranslation('common.people', lang)}</span></p>
+                            </div>
+                            <div class="table-responsive">
+                                <table class="table table-hover" style="font-size: 14px;">
+                                    <thead class="unified-table-header">
+                                        <tr>
+                                            <th class="sortable-header" data-sort="empNo" style="min-width: 100px; padding: 12px; cursor: pointer;" data-i18n="validationTab.modals.attendanceBelow88.headers.empNo">${getTranslation('validationTab.modals.attendanceBelow88.headers.empNo', lang)} ${getSortIcon('empNo')}</th>
+                                            <th class="sortable-header" data-sort="name" style="min-width: 130px; padding: 12px; cursor: pointer;" data-i18n="validationTab.modals.attendanceBelow88.headers.name">${getTranslation('validationTab.modals.attendanceBelow88.headers.name', lang)} ${getSortIcon('name')}</th>
+                                            <th class="sortable-header" data-sort="position" style="min-width: 150px; padding: 12px; cursor: pointer;" data-i18n="validationTab.modals.attendanceBelow88.headers.position">${getTranslation('validationTab.modals.attendanceBelow88.headers.position', lang)} ${getSortIcon('position')}</th>
+                                            <th class="sortable-header" data-sort="type" style="min-width: 80px; padding: 12px; cursor: pointer;" data-i18n="validationTab.modals.attendanceBelow88.headers.type">${getTranslation('validationTab.modals.attendanceBelow88.headers.type', lang)} ${getSortIcon('type')}</th>
+                                            <th class="sortable-header" data-sort="attendanceRate" style="min-width: 100px; padding: 12px; cursor: pointer;" data-i18n="validationTab.modals.attendanceBelow88.headers.attendanceRate">${getTranslation('validationTab.modals.attendanceBelow88.headers.attendanceRate', lang)} ${getSortIcon('attendanceRate')}</th>
+                                            <th class="sortable-header" data-sort="actualDays" style="min-width: 110px; padding: 12px; cursor: pointer;" data-i18n="validationTab.modals.attendanceBelow88.headers.actualDays">${getTranslation('validationTab.modals.attendanceBelow88.headers.actualDays', lang)} ${getSortIcon('actualDays')}</th>
+                                            <th class="sortable-header" data-sort="totalDays" style="min-width: 100px; padding: 12px; cursor: pointer;" data-i18n="validationTab.modals.attendanceBelow88.headers.totalDays">${getTranslation('validationTab.modals.attendanceBelow88.headers.totalDays', lang)} ${getSortIcon('totalDays')}</th>
+                                            <th class="sortable-header" data-sort="resignDate" style="min-width: 100px; padding: 12px; cursor: pointer;" data-i18n="validationTab.modals.attendanceBelow88.resignationDate">${getTranslation('validationTab.modals.attendanceBelow88.resignationDate', lang)} ${getSortIcon('resignDate')}</th>
+                                            <th style="min-width: 90px; padding: 12px;" data-i18n="validationTab.modals.attendanceBelow88.headers.conditionMet">${getTranslation('validationTab.modals.attendanceBelow88.headers.conditionMet', lang)}</th>
+                                        </tr>
+                                    </thead>
+                                    <tbody></tbody>
+                                </table>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        `;
+
+        // existing 모달이 있으면 제거
+        const existingModal = document.getElementById('attendanceModal');
+        if (existingModal) {
+            const existingBsModal = bootstrap.Modal.getInstance(existingModal);
+            if (existingBsModal) {
+                existingBsModal.dispose();
+            }
+            existingModal.remove();
+        }
+
+        // 모달을 body에 추가
+        document.body.insertAdjacentHTML('beforeend', modalHTML);
+
+        // 모달 엘리먼트 참조
+        const modalElement = document.getElementById('attendanceModal');
+
+        // Bootstrap 모달 인스턴스 creation 및 표시
+        const bsModal = new bootstrap.Modal(modalElement, {
+            backdrop: 'static',  // 모달 내부 클릭시 닫히지 않도록 설정
+            keyboard: true,      // ESC 키로 닫기 활성화
+            focus: true
+        });
+
+        // 정렬 이벤트 추가
+        modalElement.querySelectorAll('.sortable-header').forEach(header => {
+            header.addEventListener('click', function() {
+                const column = this.getAttribute('data-sort');
+                sortData(column);
+
+                // 헤더 업데이트
+                modalElement.querySelectorAll('.sortable-header').forEach(h => {
+                    const col = h.getAttribute('data-sort');
+                    const icon = getSortIcon(col);
+                    h.innerHTML = h.textContent.replace(/[▲▼]/g, '').trim() + ' ' + icon;
+                });
+            });
+        });
+
+        // 초기 data load
+        updateTableBody();
+
+        // 모달 표시
+        bsModal.show();
+
+        // 백드롭 클릭 이벤트 직원시적 처리 (출근율 모달)
+        setTimeout(() => {
+            const backdrop = document.querySelector('.modal-backdrop');
+            if (backdrop) {
+                backdrop.style.cursor = 'pointer';
+                backdrop.addEventListener('click', function(e) {
+                    if (e.target === backdrop) {
+                        bsModal.hide();
+                    }
+                });
+            }
+        }, 100);
+
+        // 모달이 닫힐 때 DOM에서 제거
+        modalElement.addEventListener('hidden.bs.modal', function () {
+            modalElement.remove();
+        });
+    }
+
+
+    function showConsecutiveAqlFailDetails() {
+        // 전역 언어와 synchronization
+        let currentLang = (typeof window.currentLanguage !== 'undefined' ? window.currentLanguage : null) ||
+                         (typeof currentLanguage !== 'undefined' ? currentLanguage : null) ||
+                         'ko';
+
+        // 현재 보고서 월 가져오기 (from HTML data attributes)
+        const reportMonthNum = parseInt(document.getElementById('incentiveDataPeriod').getAttribute('data-month'));
+
+        // 월 약어 매핑 (1=Jan, 2=Feb, ..., 12=Dec)
+        const monthAbbr = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+        const monthKorean = ['1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월'];
+
+        // N-1, N-2, N-3 월 계산
+        const month_N = reportMonthNum;  // 현재 월
+        const month_N1 = month_N - 1 > 0 ? month_N - 1 : 12;  // 1개월 전
+        const month_N2 = month_N - 2 > 0 ? month_N - 2 : month_N - 2 + 12;  // 2개월 전
+        const month_N3 = month_N - 3 > 0 ? month_N - 3 : month_N - 3 + 12;  // 3개월 전
+
+        // 동적 월 패턴 생성
+        const pattern3Months = `${monthAbbr[month_N2-1]}-${monthAbbr[month_N1-1]}-${monthAbbr[month_N-1]}`;  // 예: Aug-Sep-Oct
+
+        // 언어별 월 패턴
+        const getMonthPattern = (lang, monthIdx1, monthIdx2) => {
+            if (lang === 'ko') {
+                return `${monthKorean[monthIdx1-1].replace('월','')}-${monthKorean[monthIdx2-1]}`;
+            } else if (lang === 'en') {
+                return `${monthAbbr[monthIdx1-1]}-${monthAbbr[monthIdx2-1]}`;
+            } else if (lang === 'vi') {
+                return `Tháng ${monthIdx1}-${monthIdx2}`;
+            }
+            return `${monthAbbr[monthIdx1-1]}-${monthAbbr[monthIdx2-1]}`;
+        };
+
+        const pattern2MonthsHigh = getMonthPattern(currentLang, month_N1, month_N);  // 최근 2개월
+        const pattern2MonthsMedium = getMonthPattern(currentLang, month_N2, month_N1);  // 중간 2개월
+
+        // Continuous_FAIL 필터링용 대문자 패턴
+        const filterPatternHigh = `${monthAbbr[month_N1-1].toUpperCase()}_${monthAbbr[month_N-1].toUpperCase()}`;  // 예: SEP_OCT
+        const filterPatternMedium = `${monthAbbr[month_N2-1].toUpperCase()}_${monthAbbr[month_N1-1].toUpperCase()}`;  // 예: AUG_SEP
+
+        // 3연속 개월 실패자와 2연속 개월 실패자 분리
+        const threeMonthFails = window.employeeData.filter(emp =>
+            emp['Continuous_FAIL'] === 'YES_3MONTHS'
+        );
+
+        const twoMonthFails = window.employeeData.filter(emp =>
+            emp['Continuous_FAIL'] && emp['Continuous_FAIL'].includes('2MONTHS')
+        );
+
+        // 번역 함count
+        const t = (key) => getTranslation(key, currentLang);
+
+        // Custom HTML for this specific modal
+        const existingModal = document.getElementById('consecutiveAqlFailModal');
+        if (existingModal) {
+            existingModal.remove();
+        }
+
+        let modalHTML = '<div id="consecutiveAqlFailModal" class="modal" style="display: block; position: fixed; z-index: 9999; left: 0; top: 0; width: 100%; height: 100%; overflow: auto; background-color: rgba(0,0,0,0.4);">';
+        modalHTML += '<div class="modal-content" style="background-color: #fefefe; margin: 5% auto; padding: 0; border: 1px solid #888; width: 80%; max-width: 1200px; border-radius: 10px;">';
+        modalHTML += '<div class="modal-header unified-modal-header">';
+        modalHTML += '<h5 class="modal-title unified-modal-title"><i class="fas fa-exclamation-triangle me-2"></i>' + t('validationTab.modals.aqlFail.consecutiveAqlFail.title') + '</h5>';
+        modalHTML += '<button type="button" class="btn-close" onclick="document.getElementById(&apos;consecutiveAqlFailModal&apos;).remove()"></button>';
+        modalHTML += '</div>';
+        modalHTML += '<div class="modal-body" style="padding: 20px;">';
+
+        // 3연속 개월 실패 섹션
+        modalHTML += '<div class="section-container" style="margin-bottom: 30px;">';
+        modalHTML += '<h3 style="color: #c0392b; margin-bottom: 15px;">🔴 ' + t('validationTab.modals.aqlFail.consecutiveAqlFail.threeMonthSection') + '</h3>';
+
+        if (threeMonthFails.length === 0) {
+            modalHTML += '<div class="alert alert-success" style="padding: 15px; background: #d4edda; color: #155724; border-radius: 5px;">';
+            modalHTML += '✅ ' + t('validationTab.modals.aqlFail.consecutiveAqlFail.noThreeMonth');
+            modalHTML += '</div>';
+        } else {
+            modalHTML += '<table style="width: 100%; border-collapse: collapse;">';
+            modalHTML += '<thead><tr style="background: #f8f9fa;">';
+            modalHTML += '<th style="border: 1px solid #dee2e6; padding: 8px;">' + t('validationTab.modals.aqlFail.consecutiveAqlFail.headers.empNo') + '</th>';
+            modalHTML += '<th style="border: 1px solid #dee2e6; padding: 8px;">' + t('validationTab.modals.aqlFail.consecutiveAqlFail.headers.name') + '</th>';
+            modalHTML += '<th style="border: 1px solid #dee2e6; padding: 8px;">' + t('validationTab.modals.aqlFail.consecutiveAqlFail.headers.position') + '</th>';
+            modalHTML += '<th style="border: 1px solid #dee2e6; padding: 8px;">' + t('validationTab.modals.aqlFail.consecutiveAqlFail.headers.supervisor') + '</th>';
+            modalHTML += '<th style="border: 1px solid #dee2e6; padding: 8px;">' + t('validationTab.modals.aqlFail.consecutiveAqlFail.headers.failPattern') + '</th>';
+            modalHTML += '</tr></thead><tbody>';
+
+            threeMonthFails.forEach(emp => {
+                modalHTML += '<tr>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['Employee No'] || emp['emp_no']) + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['Full Name'] || emp['name']) + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['QIP POSITION 1ST  NAME'] || emp['position'] || '-') + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['direct boss name'] || emp['MST direct boss name'] || emp['boss_name'] || '-') + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['AQL_Fail_Pattern'] || pattern3Months) + '</td>';
+                modalHTML += '</tr>';
+            });
+
+            modalHTML += '</tbody></table>';
+        }
+        modalHTML += '</div>';
+
+        // 2연속 개월 실패 섹션
+        modalHTML += '<div class="section-container">';
+        modalHTML += '<h3 style="color: #e67e22; margin-bottom: 15px;">⚠️ ' + t('validationTab.modals.aqlFail.consecutiveAqlFail.twoMonthSection') + '</h3>';
+
+        // 동적 월 패턴으로 필터링
+        const augSepFailsList = twoMonthFails.filter(emp => emp['Continuous_FAIL'].includes(filterPatternHigh));
+        const julAugFailsList = twoMonthFails.filter(emp => emp['Continuous_FAIL'].includes(filterPatternMedium));
+
+        if (twoMonthFails.length === 0) {
+            modalHTML += '<div class="alert alert-info" style="padding: 15px; background: #d1ecf1; color: #0c5460; border-radius: 5px;">';
+            modalHTML += t('validationTab.modals.aqlFail.consecutiveAqlFail.noTwoMonth');
+            modalHTML += '<br><br>';
+            modalHTML += '<strong>📊 상세 현황:</strong><br>';
+            modalHTML += '• ' + pattern2MonthsHigh + t('validationTab.modals.aqlFail.consecutiveAqlFail.summary.consecutiveFailure') + '<span style="color: #dc3545; font-weight: bold;">0</span>' + t('validationTab.modals.aqlFail.consecutiveAqlFail.summary.people') + '<br>';
+            modalHTML += '• ' + pattern2MonthsMedium + t('validationTab.modals.aqlFail.consecutiveAqlFail.summary.consecutiveFailure') + '<span style="color: #ffc107; font-weight: bold;">0</span>' + t('validationTab.modals.aqlFail.consecutiveAqlFail.summary.people');
+            modalHTML += '</div>';
+        } else {
+            modalHTML += '<table style="width: 100%; border-collapse: collapse;">';
+            modalHTML += '<thead><tr style="background: #f8f9fa;">';
+            modalHTML += '<th style="border: 1px solid #dee2e6; padding: 8px;">' + t('validationTab.modals.aqlFail.consecutiveAqlFail.headers.empNo') + '</th>';
+            modalHTML += '<th style="border: 1px solid #dee2e6; padding: 8px;">' + t('validationTab.modals.aqlFail.consecutiveAqlFail.headers.name') + '</th>';
+            modalHTML += '<th style="border: 1px solid #dee2e6; padding: 8px;">' + t('validationTab.modals.aqlFail.consecutiveAqlFail.headers.position') + '</th>';
+            modalHTML += '<th style="border: 1px solid #dee2e6; padding: 8px;">' + t('validationTab.modals.aqlFail.consecutiveAqlFail.headers.supervisor') + '</th>';
+            modalHTML += '<th style="border: 1px solid #dee2e6; padding: 8px;">' + t('validationTab.modals.aqlFail.consecutiveAqlFail.headers.failPattern') + '</th>';
+            modalHTML += '<th style="border: 1px solid #dee2e6; padding: 8px;">' + t('validationTab.modals.aqlFail.consecutiveAqlFail.headers.risk') + '</th>';
+            modalHTML += '</tr></thead><tbody>';
+
+            // 최근 2개월 연속 failed자를 먼저 표시 (높은 위험)
+            const augSepFails = twoMonthFails.filter(emp => emp['Continuous_FAIL'].includes(filterPatternHigh));
+            const julAugFails = twoMonthFails.filter(emp => emp['Continuous_FAIL'].includes(filterPatternMedium));
+
+            augSepFails.forEach(emp => {
+                modalHTML += '<tr style="background: #fff5f5;">';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['Employee No'] || emp['emp_no']) + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['Full Name'] || emp['name']) + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['QIP POSITION 1ST  NAME'] || emp['position'] || '-') + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['direct boss name'] || emp['MST direct boss name'] || emp['boss_name'] || '-') + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['AQL_Fail_Pattern'] || pattern2MonthsHigh) + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;"><span style="background: #dc3545; color: white; padding: 2px 8px; border-radius: 3px;">🔴 ' + t('validationTab.modals.aqlFail.consecutiveAqlFail.riskLevels.high') + '</span></td>';
+                modalHTML += '</tr>';
+            });
+
+            julAugFails.forEach(emp => {
+                modalHTML += '<tr>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['Employee No'] || emp['emp_no']) + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['Full Name'] || emp['name']) + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['QIP POSITION 1ST  NAME'] || emp['position'] || '-') + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['direct boss name'] || emp['MST direct boss name'] || emp['boss_name'] || '-') + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;">' + (emp['AQL_Fail_Pattern'] || pattern2MonthsMedium) + '</td>';
+                modalHTML += '<td style="border: 1px solid #dee2e6; padding: 8px;"><span style="background: #ffc107; color: #212529; padding: 2px 8px; border-radius: 3px;">🟡 ' + t('validationTab.modals.aqlFail.consecutiveAqlFail.riskLevels.medium') + '</span></td>';
+                modalHTML += '</tr>';
+            });
+
+            modalHTML += '</tbody></table>';
+
+            // 범례 추가
+            modalHTML += '<div style="margin-top: 15px; padding: 10px; background: #f8f9fa; border-radius: 5px;">';
+            modalHTML += '<strong>' + t('validationTab.modals.aqlFail.consecutiveAqlFail.riskExplanation.title') + '</strong><br>';
+            modalHTML += '🔴 <strong>' + t('validationTab.modals.aqlFail.consecutiveAqlFail.riskLevels.high') + ' (' + pattern2MonthsHigh + '):</strong> ' + t('validationTab.modals.aqlFail.consecutiveAqlFail.riskExplanation.highDesc') + '<br>';
+            modalHTML += '🟡 <strong>' + t('validationTab.modals.aqlFail.consecutiveAqlFail.riskLevels.medium') + ' (' + pattern2MonthsMedium + '):</strong> ' + t('validationTab.modals.aqlFail.consecutiveAqlFail.riskExplanation.mediumDesc');
+            modalHTML += '</div>';
+        }
+        modalHTML += '</div>';
+
+        // 요약 통계
+        modalHTML += '<div style="margin-top: 20px; padding: 15px; background: #e3f2fd; border-radius: 5px;">';
+        modalHTML += '<strong>📊 ' + t('validationTab.modals.aqlFail.consecutiveAqlFail.summary.title') + '</strong><br>';
+        modalHTML += '• ' + t('validationTab.modals.aqlFail.consecutiveAqlFail.summary.threeMonthFails') + ' <strong>' + threeMonthFails.length + t('validationTab.modals.aqlFail.consecutiveAqlFail.summary.people') + '</strong><br>';
+        modalHTML += '• ' + t('validationTab.modals.aqlFail.consecutiveAqlFail.summary.twoMonthFails') + ' <strong>' + twoMonthFails.length + t('validationTab.modals.aqlFail.consecutiveAqlFail.summary.people') + '</strong><br>';
+        modalHTML += '&nbsp;&nbsp;- <span style="color: #dc3545; font-weight: bold;">🔴 ' + pattern2MonthsHigh + t('validationTab.modals.aqlFail.consecutiveAqlFail.summary.consecutiveFailure') + augSepFailsList.length + t('validationTab.modals.aqlFail.consecutiveAqlFail.summary.people') + '</span><br>';
+        modalHTML += '&nbsp;&nbsp;- <span style="color: #ffc107; font-weight: bold;">🟡 ' + pattern2MonthsMedium + t('validationTab.modals.aqlFail.consecutiveAqlFail.summary.consecutiveFailure') + julAugFailsList.length + t('validationTab.modals.aqlFail.consecutiveAqlFail.summary.people') + '</span>';
+        modalHTML += '</div>';
+
+        // Close modal HTML
+        modalHTML += '</div>';
+        modalHTML += '</div>';
+        modalHTML += '</div>';
+
+        // Add modal to body
+        document.body.insertAdjacentHTML('beforeend', modalHTML);
+
+        // 언어 전환 함count 등록
+        window.switchConsecutiveLang = function(lang) {
+            // 전역 언어 상태 업데이트
+            if (typeof window.currentLanguage !== 'undefined') {
+                window.currentLanguage = lang;
+            }
+            if (typeof currentLanguage !== 'undefined') {
+                currentLanguage = lang;
+            }
+            // 모달 재creation
+            document.getElementById('consecutiveAqlFailModal').remove();
+            showConsecutiveAqlFailDetails();
+        };
+
+        // Add click outside to close functionality
+        const modal = document.getElementById('consecutiveAqlFailModal');
+        modal.onclick = function(event) {
+            if (event.대상 === modal) {
+                modal.remove();
+                delete window.switchConsecutiveLang;
+            }
+        };
+    }
+
+    function showAqlFailDetails() {
+        // AQL FAIL이 있는 직원 필터링
+        let aqlFailEmployees = window.employeeData.filter(emp => {
+            const aqlFailures = parseFloat(emp[window.aqlFailuresColumn] || emp['aql_failures'] || 0);
+            return aqlFailures > 0;
+        });
+
+        // 정렬 상태 관리
+        let sortColumn = 'failPercent';
+        let sortOrder = 'desc';
+        let modalDiv = null;
+        let backdrop = null;
+
+        // 현재 언어 상태 - 전역 언어와 synchronization
+        let currentLang = (typeof window.currentLanguage !== 'undefined' ? window.currentLanguage : null) ||
+                         (typeof currentLanguage !== 'undefined' ? currentLanguage : null) ||
+                         'ko';
+
+        function sortData(column) {
+            if (sortColumn === column) {
+                sortOrder = sortOrder === 'asc' ? 'desc' : 'asc';
+            } else {
+                sortColumn = column;
+                sortOrder = 'asc';
+            }
+
+            aqlFailEmployees.sort((a, b) => {
+                let aVal, bVal;
+
+                switch(column) {
+                    case 'empNo':
+                        aVal = a['Employee No'] || a.employee_no || '';
+                        bVal = b['Employee No'] || b.employee_no || '';
+                        break;
+                    case 'name':
+                        aVal = a['Full Name'] || a.full_name || '';
+                        bVal = b['Full Name'] || b.full_name || '';
+                        break;
+                    case 'supervisor':
+                        aVal = a['direct boss name'] || '';
+                        bVal = b['direct boss name'] || '';
+                        break;
+                    case 'inspectorId':
+                        aVal = a['MST direct boss name'] || '';
+                        bVal = b['MST direct boss name'] || '';
+                        break;
+                    case 'passCount':
+                        aVal = parseFloat(a['AQL_Pass_Count'] || 0);
+                        bVal = parseFloat(b['AQL_Pass_Count'] || 0);
+                        break;
+                    case 'failures':
+                        aVal = parseFloat(a[window.aqlFailuresColumn] || 0);
+                        bVal = parseFloat(b[window.aqlFailuresColumn] || 0);
+                        break;
+                    case 'failPercent':
+                        aVal = parseFloat(a['AQL_Fail_Percent'] || 0);
+                        bVal = parseFloat(b['AQL_Fail_Percent'] || 0);
+                        break;
+                    default:
+                        aVal = '';
+                        bVal = '';
+                }
+
+                if (typeof aVal === 'string') {
+                    return sortOrder === 'asc' ? aVal.localeCompare(bVal, 'ko') : bVal.localeCompare(aVal, 'ko');
+                } else {
+                    return sortOrder === 'asc' ? (aVal - bVal) : (bVal - aVal);
+                }
+            });
+
+            updateTableBody();
+        }
+
+        function switchLanguage(lang) {
+            currentLang = lang;
+            // 전역 언어 상태도 synchronization
+            if (typeof window.currentLanguage !== 'undefined') {
+                window.currentLanguage = lang;
+            }
+            if (typeof currentLanguage !== 'undefined') {
+                currentLanguage = lang;
+            }
+            updateAllModalContent();
+            // 언어 버튼 상태 업데이트
+            updateLanguageButtons();
+        }
+
+        function updateLanguageButtons() {
+            const buttons = document.querySelectorAll('#aqlFailModal .btn-group button');
+            buttons.forEach(btn => {
+                const btnLang = btn.getAttribute('onclick').match(/'(\w+)'/)[1];
+                if (btnLang === currentLang) {
+                    btn.classList.remove('btn-outline-primary');
+                    btn.classList.add('btn-primary');
+                } else {
+                    btn.classList.remove('btn-primary');
+                    btn.classList.add('btn-outline-primary');
+                }
+            });
+        }
+
+        function updateAllModalContent() {
+            // 모달 제목 업데이트
+            const titleEl = document.querySelector('#aqlFailModal .modal-title span[data-i18n]');
+            if (titleEl) {
+                titleEl.textContent = getTranslation('validationTab.modals.aqlFail.title', currentLang);
+            }
+
+            // Alert 메시지 업데이트
+            const alertEl = document.querySelector('#aqlFailModal .alert span[data-i18n="aqlFailAlert"]');
+            if (alertEl) {
+                alertEl.textContent = getTranslation('validationTab.modals.aqlFail.alertMessage', currentLang);
+            }
+
+            // 카운트 메시지 업데이트
+            const countEl = document.querySelector('#aqlFailModal .alert span[data-i18n="aqlFailCount"]');
+            if (countEl) {
+                // 현재 월 이름을 언어별로 생성
+                const monthNamesMap = {
+                    'ko': '{%month_ko_name%}',
+                    'en': '{%month_en_name%}',
+                    'vi': '{%month_vi_name%}'
+                };
+                const localizedMonth = monthNamesMap[currentLang] || monthNamesMap['en'];
+
+                const countMsg = getTranslation('validationTab.modals.aqlFail.totalCount', currentLang);
+                countEl.textContent = countMsg.replace('{' + '{count}' + '}', aqlFailEmployees.length).replace('{' + '{month}' + '}', localizedMonth);
+            }
+
+            // 테이블 헤더 업데이트
+            const headers = {
+                'empNo': 'validationTab.modals.aqlFail.headers.empNo',
+                'name': 'validationTab.modals.aqlFail.headers.name',
+                'supervisor': 'validationTab.modals.aqlFail.headers.supervisor',
+                'inspectorId': 'validationTab.modals.aqlFail.headers.inspectorId',
+                'aqlPass': 'validationTab.modals.aqlFail.headers.aqlPass',
+                'aqlFail': 'validationTab.modals.aqlFail.headers.aqlFail',
+                'failPercent': 'validationTab.modals.aqlFail.headers.failPercent'
+            };
+
+            Object.keys(headers).forEach(key => {
+                const headerEl = document.querySelector(`#aqlFailModal th[data-i18n="${key}"]`);
+                if (headerEl) {
+                    const iconSpan = headerEl.querySelector('.sort-icon');
+                    const icon = iconSpan ? iconSpan.textContent : '';
+                    headerEl.innerHTML = `<span data-i18n="${key}">${getTranslation(headers[key], currentLang)}</span><span class="sort-icon">${icon}</span>`;
+                }
+            });
+
+            // 라인리더 집계 섹션 헤더 업데이트
+            const lineLeaderTitleEl = document.querySelector('#aqlFailModal h6[data-i18n="lineLeaderTitle"]');
+            if (lineLeaderTitleEl) {
+                lineLeaderTitleEl.innerHTML = `<i class="fas fa-users me-2"></i><span data-i18n="lineLeaderTitle">${getTranslation('validationTab.modals.aqlFail.lineLeaderSummary.title', currentLang)}</span>`;
+            }
+
+            const lineLeaderDescEl = document.querySelector('#aqlFailModal p[data-i18n="lineLeaderDesc"]');
+            if (lineLeaderDescEl) {
+                lineLeaderDescEl.textContent = getTranslation('validationTab.modals.aqlFail.lineLeaderSummary.description', currentLang);
+            }
+
+            // 라인리더 테이블 헤더 업데이트
+            const lineLeaderHeaders = {
+                'leaderName': 'validationTab.modals.aqlFail.lineLeaderSummary.headers.leaderName',
+                'leaderSupervisor': 'validationTab.modals.aqlFail.lineLeaderSummary.headers.leaderSupervisor',
+                'subordinatePass': 'validationTab.modals.aqlFail.lineLeaderSummary.headers.subordinatePass',
+                'subordinateFail': 'validationTab.modals.aqlFail.lineLeaderSummary.headers.subordinateFail',
+                'failPercent': 'validationTab.modals.aqlFail.lineLeaderSummary.headers.failPercent'
+            };
+
+            Object.keys(lineLeaderHeaders).forEach(key => {
+                const headerEl = document.querySelector(`#lineLeaderTable th[data-i18n="${key}"]`);
+                if (headerEl) {
+                    headerEl.textContent = getTranslation(lineLeaderHeaders[key], currentLang);
+                }
+            });
+        }
+
+        function updateTableBody() {
+            const tbody = document.querySelector('#aqlFailModal tbody');
+            if (!tbody) return;
+
+            let tableRows = aqlFailEmployees.map(emp => {
+                const failures = parseFloat(emp[window.aqlFailuresColumn] || 0);
+                const supervisorName = emp['direct boss name'] || '-';
+                const supervisorId = emp['MST direct boss name'] || '-';
+
+                const totalTests = emp['AQL_Total_Tests'] || 10;
+                const passCount = emp['AQL_Pass_Count'] || Math.max(0, totalTests - failures);
+                const failPercent = emp['AQL_Fail_Percent'] ? emp['AQL_Fail_Percent'].toFixed(1) : ((failures / totalTests * 100).toFixed(1));
+
+                // failed율에 따른 색상 구분
+                let failBadgeClass = '';
+                let failBadgeText = '';
+                if (failPercent >= 30) {
+                    failBadgeClass = 'bg-danger';
+                    failBadgeText = currentLang === 'ko' ? `${failPercent}% (심각)` : currentLang === 'en' ? `${failPercent}% (Critical)` : `${failPercent}% (Nghiêm trọng)`;
+                } else if (failPercent >= 20) {
+                    failBadgeClass = 'bg-warning text-dark';
+                    failBadgeText = currentLang === 'ko' ? `${failPercent}% (경고)` : currentLang === 'en' ? `${failPercent}% (Warning)` : `${failPercent}% (Cảnh báo)`;
+                } else {
+                    failBadgeClass = 'bg-info';
+                    failBadgeText = `${failPercent}%`;
+                }
+
+                return `
+                    <tr class="unified-table-row">
+                        <td class="unified-table-cell">${emp['Employee No'] || ''}</td>
+                        <td class="unified-table-cell">${emp['Full Name'] || ''}</td>
+                        <td class="unified-table-cell">${supervisorName}</td>
+                        <td class="unified-table-cell text-center">${supervisorId}</td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge bg-success">${passCount}cases</span>
+                        </td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge bg-danger">${failures}cases</span>
+                        </td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge ${failBadgeClass}">${failBadgeText}</span>
+                        </td>
+                    </tr>
+                `;
+            }).join('');
+
+            const emptyMessage = currentLang === 'ko' ? 'AQL FAIL이 not found' : currentLang === 'en' ? 'No AQL FAIL records' : 'Không có bản ghi AQL FAIL';
+            tbody.innerHTML = tableRows || `<tr><td colspan="7" class="text-center text-muted">${emptyMessage}</td></tr>`;
+
+            // 정렬 아이콘 업데이트
+            document.querySelectorAll('#aqlFailModal th[data-sort]').forEach(th => {
+                const column = th.getAttribute('data-sort');
+                const sortIcon = th.querySelector('.sort-icon');
+                if (sortIcon) {
+                    if (sortColumn === column) {
+                        sortIcon.textContent = sortOrder === 'asc' ? ' ▲' : ' ▼';
+                    } else {
+                        sortIcon.textContent = ' ⇅';
+                    }
+                }
+            });
+        }
+
+        function aggregateLineLeaderStats() {
+            const lineLeaderStats = {};
+
+            // 라인리더by 집계
+            aqlFailEmployees.forEach(emp => {
+                const supervisorId = emp['MST direct boss name'];
+                const supervisorName = emp['direct boss name'];
+
+                if (!supervisorId || !supervisorName) return;
+
+                if (!lineLeaderStats[supervisorId]) {
+                    // 라인리더의 상사 정보 찾기
+                    const supervisorData = window.employeeData.find(e => e['Employee No'] === supervisorId);
+                    const supervisorOfSupervisor = supervisorData ? (supervisorData['direct boss name'] || '-') : '-';
+
+                    lineLeaderStats[supervisorId] = {
+                        name: supervisorName,
+                        supervisor: supervisorOfSupervisor,
+                        totalPass: 0,
+                        totalFail: 0
+                    };
+                }
+
+                const passCount = parseFloat(emp['AQL_Pass_Count'] || 0);
+                const failCount = parseFloat(emp[window.aqlFailuresColumn] || 0);
+
+                lineLeaderStats[supervisorId].totalPass += passCount;
+                lineLeaderStats[supervisorId].totalFail += failCount;
+            });
+
+            // 배열로 conversion 및 FAIL % calculation
+            return Object.values(lineLeaderStats).map(stat => {
+                const total = stat.totalPass + stat.totalFail;
+                const failPercent = total > 0 ? ((stat.totalFail / total) * 100).toFixed(1) : '0.0';
+                return { ...stat, failPercent: parseFloat(failPercent) };
+            }).sort((a, b) => b.failPercent - a.failPercent); // FAIL % 내림차순
+        }
+
+        function renderLineLeaderTable() {
+            const lineLeaderStats = aggregateLineLeaderStats();
+            const tbody = document.querySelector('#lineLeaderTable tbody');
+            if (!tbody) return;
+
+            const rows = lineLeaderStats.map(stat => {
+                let failBadgeClass = '';
+                if (stat.failPercent >= 30) {
+                    failBadgeClass = 'bg-danger';
+                } else if (stat.failPercent >= 20) {
+                    failBadgeClass = 'bg-warning text-dark';
+                } else {
+                    failBadgeClass = 'bg-info';
+                }
+
+                return `
+                    <tr>
+                        <td class="unified-table-cell">${stat.name}</td>
+                        <td class="unified-table-cell">${stat.supervisor}</td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge bg-success">${stat.totalPass}cases</span>
+                        </td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge bg-danger">${stat.totalFail}cases</span>
+                        </td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge ${failBadgeClass}">${stat.failPercent}%</span>
+                        </td>
+                    </tr>
+                `;
+            }).join('');
+
+            const emptyMessage = currentLang === 'ko' ? '라인리더 data가 not found' : currentLang === 'en' ? 'No Line Leader data' : 'Không có dữ liệu Line Leader';
+            tbody.innerHTML = rows || `<tr><td colspan="5" class="text-center text-muted">${emptyMessage}</td></tr>`;
+        }
+
+        function createAqlFailModal() {
+            const lang = currentLang;
+
+            function getSortIcon(column) {
+                if (sortColumn === column) {
+                    return sortOrder === 'asc' ? ' ▲' : ' ▼';
+                }
+                return ' ⇅';
+            }
+
+            let tableRows = aqlFailEmployees.map(emp => {
+                const failures = parseFloat(emp[window.aqlFailuresColumn] || 0);
+                const supervisorName = emp['direct boss name'] || '-';
+                const supervisorId = emp['MST direct boss name'] || '-';
+
+                const totalTests = emp['AQL_Total_Tests'] || 10;
+                const passCount = emp['AQL_Pass_Count'] || Math.max(0, totalTests - failures);
+                const failPercent = emp['AQL_Fail_Percent'] ? emp['AQL_Fail_Percent'].toFixed(1) : ((failures / totalTests * 100).toFixed(1));
+
+                let failBadgeClass = '';
+                let failBadgeText = '';
+                if (failPercent >= 30) {
+                    failBadgeClass = 'bg-danger';
+                    failBadgeText = lang === 'ko' ? `${failPercent}% (심각)` : lang === 'en' ? `${failPercent}% (Critical)` : `${failPercent}% (Nghiêm trọng)`;
+                } else if (failPercent >= 20) {
+                    failBadgeClass = 'bg-warning text-dark';
+                    failBadgeText = lang === 'ko' ? `${failPercent}% (경고)` : lang === 'en' ? `${failPercent}% (Warning)` : `${failPercent}% (Cảnh báo)`;
+                } else {
+                    failBadgeClass = 'bg-info';
+                    failBadgeText = `${failPercent}%`;
+                }
+
+                return `
+                    <tr class="unified-table-row">
+                        <td class="unified-table-cell">${emp['Employee No'] || ''}</td>
+                        <td class="unified-table-cell">${emp['Full Name'] || ''}</td>
+                        <td class="unified-table-cell">${supervisorName}</td>
+                        <td class="unified-table-cell text-center">${supervisorId}</td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge bg-success">${passCount}cases</span>
+                        </td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge bg-danger">${failures}cases</span>
+                        </td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge ${failBadgeClass}">${failBadgeText}</span>
+                        </td>
+                    </tr>
+                `;
+            }).join('');
+
+            // 라인리더 집계 테이블
+            const lineLeaderStats = aggregateLineLeaderStats();
+            const lineLeaderRows = lineLeaderStats.map(stat => {
+                let failBadgeClass = '';
+                if (stat.failPercent >= 30) {
+                    failBadgeClass = 'bg-danger';
+                } else if (stat.failPercent >= 20) {
+                    failBadgeClass = 'bg-warning text-dark';
+                } else {
+                    failBadgeClass = 'bg-info';
+                }
+
+                return `
+                    <tr>
+                        <td class="unified-table-cell">${stat.name}</td>
+                        <td class="unified-table-cell">${stat.supervisor}</td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge bg-success">${stat.totalPass}cases</span>
+                        </td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge bg-danger">${stat.totalFail}cases</span>
+                        </td>
+                        <td class="unified-table-cell text-center">
+                            <span class="badge ${failBadgeClass}">${stat.failPercent}%</span>
+                        </td>
+                    </tr>
+                `;
+            }).join('');
+
+            // 현재 월 이름을 언어별로 생성
+            const monthNamesMap = {
+                'ko': '{%month_ko_name%}',
+                'en': '{%month_en_name%}',
+                'vi': '{%month_vi_name%}'
+            };
+            const localizedMonth = monthNamesMap[lang] || monthNamesMap['en'];
+
+            const countMsg = getTranslation('validationTab.modals.aqlFail.totalCount', lang).replace('{' + '{count}' + '}', aqlFailEmployees.length).replace('{' + '{month}' + '}', localizedMonth);
+
+            let modalContent = `
+                <div class="modal-dialog modal-xl" style="max-width: 95%; margin: 20px auto;">
+                    <div class="modal-content">
+                        <div class="modal-header unified-modal-header">
+                            <h5 class="modal-title unified-modal-title">
+                                <i class="fas fa-exclamation-triangle me-2"></i>
+                                <span data-i18n="validationTab.modals.aqlFail.title">${getTranslation('validationTab.modals.aqlFail.title', lang)}</span>
+                            </h5>
+                            <div class="d-flex align-items-center">
+                                <div class="btn-group btn-group-sm me-2">
+                                    <button type="button" class="btn btn-sm ${lang === 'ko' ? 'btn-primary' : 'btn-outline-primary'}" onclick="window.switchAqlLang('ko')">한국어</button>
+                                    <button type="button" class="btn btn-sm ${lang === 'en' ? 'btn-primary' : 'btn-outline-primary'}" onclick="window.switchAqlLang('en')">English</button>
+                                    <button type="button" class="btn btn-sm ${lang === 'vi' ? 'btn-primary' : 'btn-outline-primary'}" onclick="window.switchAqlLang('vi')">Tiếng Việt</button>
+                                </div>
+                                <button type="button" class="btn-close" onclick="window.closeAqlModal()"></button>
+                            </div>
+                        </div>
+                        <div class="modal-body">
+                            <div class="alert alert-warning d-flex align-items-center mb-3">
+                                <i class="fas fa-info-circle me-2"></i>
+                                <div>
+                                    <strong><span data-i18n="aqlFailAlert">${getTranslation('validationTab.modals.aqlFail.alertMessage', lang)}</span></strong><br>
+                                    <span data-i18n="aqlFailCount">${countMsg}</span>
+                                </div>
+                            </div>
+
+                            <h6 class="mb-3" data-i18n="validationTab.modals.aqlFail.title"><i class="fas fa-list me-2"></i>${getTranslation('validationTab.modals.aqlFail.title', lang)}</h6>
+
+                            <table class="table table-hover" id="aqlFailEmployeeTable">
+                                <thead class="unified-table-header">
+                                    <tr>
+                                        <th style="cursor: pointer;" data-sort="empNo" onclick="window.sortAqlData('empNo')">
+                                            <span data-i18n="empNo">${getTranslation('validationTab.modals.aqlFail.headers.empNo', lang)}</span><span class="sort-icon">${getSortIcon('empNo')}</span>
+                                        </th>
+                                        <th style="cursor: pointer;" data-sort="name" onclick="window.sortAqlData('name')">
+                                            <span data-i18n="name">${getTranslation('validationTab.modals.aqlFail.headers.name', lang)}</span><span class="sort-icon">${getSortIcon('name')}</span>
+                                        </th>
+                                        <th style="cursor: pointer;" data-sort="supervisor" onclick="window.sortAqlData('supervisor')">
+                                            <span data-i18n="supervisor">${getTranslation('validationTab.modals.aqlFail.headers.supervisor', lang)}</span><span class="sort-icon">${getSortIcon('supervisor')}</span>
+                                        </th>
+                                        <th class="text-center" style="cursor: pointer;" data-sort="inspectorId" onclick="window.sortAqlData('inspectorId')">
+                                            <span data-i18n="inspectorId">${getTranslation('validationTab.modals.aqlFail.headers.inspectorId', lang)}</span><span class="sort-icon">${getSortIcon('inspectorId')}</span>
+                                        </th>
+                                        <th class="text-center" style="cursor: pointer;" data-sort="passCount" onclick="window.sortAqlData('passCount')">
+                                            <span data-i18n="aqlPass">${getTranslation('validationTab.modals.aqlFail.headers.aqlPass', lang)}</span><span class="sort-icon">${getSortIcon('passCount')}</span>
+                                        </th>
+                                        <th class="text-center" style="cursor: pointer;" data-sort="failures" onclick="window.sortAqlData('failures')">
+                                            <span data-i18n="aqlFail">${getTranslation('validationTab.modals.aqlFail.headers.aqlFail', lang)}</span><span class="sort-icon">${getSortIcon('failures')}</span>
+                                        </th>
+                                        <th class="text-center" style="cursor: pointer;" data-sort="failPercent" onclick="window.sortAqlData('failPercent')">
+                                            <span data-i18n="failPercent">${getTranslation('validationTab.modals.aqlFail.headers.failPercent', lang)}</span><span class="sort-icon">${getSortIcon('failPercent')}</span>
+                                        </th>
+                                    </tr>
+                                </thead>
+                                <tbody>
+                                    ${tableRows || '<tr><td colspan="7" class="text-center text-muted">AQL FAIL이 not found</td></tr>'}
+                                </tbody>
+                            </table>
+
+                            <hr class="my-4">
+
+                            <h6 class="mb-3" data-i18n="lineLeaderTitle"><i class="fas fa-users me-2"></i>${getTranslation('validationTab.modals.aqlFail.lineLeaderSummary.title', lang)}</h6>
+                            <p class="text-muted small" data-i18n="lineLeaderDesc">${getTranslation('validationTab.modals.aqlFail.lineLeaderSummary.description', lang)}</p>
+
+                            <table class="table table-hover" id="lineLeaderTable">
+                                <thead class="unified-table-header">
+                                    <tr>
+                                        <th data-i18n="leaderName">${getTranslation('validationTab.modals.aqlFail.lineLeaderSummary.headers.leaderName', lang)}</th>
+                                        <th data-i18n="leaderSupervisor">${getTranslation('validationTab.modals.aqlFail.lineLeaderSummary.headers.leaderSupervisor', lang)}</th>
+                                        <th class="text-center" data-i18n="subordinatePass">${getTranslation('validationTab.modals.aqlFail.lineLeaderSummary.headers.subordinatePass', lang)}</th>
+                                        <th class="text-center" data-i18n="subordinateFail">${getTranslation('validationTab.modals.aqlFail.lineLeaderSummary.headers.subordinateFail', lang)}</th>
+                                        <th class="text-center" data-i18n="failPercent">${getTranslation('validationTab.modals.aqlFail.lineLeaderSummary.headers.failPercent', lang)}</th>
+                                    </tr>
+                                </thead>
+                                <tbody>
+                                    ${lineLeaderRows || '<tr><td colspan="5" class="text-center text-muted">라인리더 data가 not found</td></tr>'}
+                                </tbody>
+                            </table>
+                        </div>
+                    </div>
+                </div>
+            `;
+
+            // existing 모달 제거
+            const existingModal = document.getElementById('aqlFailModal');
+            if (existingModal) {
+                existingModal.remove();
+            }
+
+            // 백드롭 제거
+            const existingBackdrop = document.querySelector('.modal-backdrop');
+            if (existingBackdrop) {
+                existingBackdrop.remove();
+            }
+
+            // 새 모달 creation
+            modalDiv = document.createElement('div');
+            modalDiv.id = 'aqlFailModal';
+            modalDiv.className = 'modal fade show';
+            modalDiv.style.display = 'block';
+            modalDiv.style.zIndex = '1055';
+            modalDiv.innerHTML = modalContent;
+
+            // 백드롭 creation
+            backdrop = document.createElement('div');
+            backdrop.className = 'modal-backdrop fade show';
+            backdrop.style.zIndex = '1050';
+
+            document.body.appendChild(backdrop);
+            document.body.appendChild(modalDiv);
+            document.body.style.overflow = 'hidden';
+
+            // 전역 함count 등록
+            window.sortAqlData = sortData;
+            window.switchAqlLang = switchLanguage;
+
+            // 초기 언어 버튼 상태 설정
+            updateLanguageButtons();
+        }
+
+        // 모달 닫기 함count
+        window.closeAqlModal = function() {
+            if (modalDiv) {
+                modalDiv.remove();
+                modalDiv = null;
+            }
+            if (backdrop) {
+                backdrop.remove();
+                backdrop = null;
+            }
+            document.body.style.overflow = '';
+        };
+
+        // 초기 렌더링
+        sortData('failPercent');  // FAIL %로 정렬
+        createAqlFailModal();
+    }
+
+    // Area AQL Reject Rate 상세 모달 (조건 7번, 8번 구분 표시)
+    function showAreaRejectRateDetails() {
+        // ========================================================================
+        // Buildingby AQL 검사 성과 분석 - 3개 테이블 구조
+        // 테이블 1: Buildingby AQL 검사 실적 (AQL file 기준)
+        // 테이블 2: Assembly Inspector 인력 기준 검사 실적 (Employee CSV 기준)
+        // 테이블 3: Auditor/Trainer incentive 현황 (책임 range)
+        // ========================================================================
+
+        // 현재 보고서 연도/월 가져오기
+        const reportYear = parseInt(document.getElementById('incentiveDataPeriod').getAttribute('data-year'));
+        const reportMonthNum = parseInt(document.getElementById('incentiveDataPeriod').getAttribute('data-month'));
+        const monthAbbr = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+        const monthKorean = ['1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월'];
+        const reportMonthName = monthAbbr[reportMonthNum - 1];
+        const reportMonthKorean = monthKorean[reportMonthNum - 1];
+
+        // AQL file data (Python에서 calculation된 actual data use)
+        // Buildingby actual 검사 통계 (검사 casescount 기준 Reject Rate)
+        const aqlFileStats = window.aqlFileStats || {
+            // Fallback: window.aqlFileStats가 없는 경우 빈 객체 use
+            'Building B': { total: 0, pass: 0, fail: 0, rejectRate: 0.0 },
+            'Building D': { total: 0, pass: 0, fail: 0, rejectRate: 0.0 },
+            'Building A': { total: 0, pass: 0, fail: 0, rejectRate: 0.0 },
+            'Building C': { total: 0, pass: 0, fail: 0, rejectRate: 0.0 },
+            'total': { total: 0, pass: 0, fail: 0, rejectRate: 0.0 }
+        };
+
+        console.log('[AQL Modal] Using AQL File Stats:', aqlFileStats);
+
+        // Total AQL tests count 계산 (window.aqlFileStats의 total에서)
+        const totalAqlTests = aqlFileStats['total'] ? aqlFileStats['total'].total : 0;
+
+        // AQL 관련 직원 필터링 함count
+        function isAqlRelevantEmployee(emp) {
+            const aqlTests = parseFloat(emp['AQL_Total_Tests'] || 0);
+            const areaRate = parseFloat(emp['Area_Reject_Rate'] || 0);
+
+            // 조건 1: actual AQL 검사 count행 (28employees)
+            if (aqlTests > 0) return true;
+
+            // 조건 2: Auditor/Trainer (Area_Reject_Rate > 0인 10명)
+            if (areaRate > 0) return true;
+
+            // 나머지는 Non-AQL Staff로 제외
+            return false;
+        }
+
+        // Building 매핑 함수 (JSON 기반 동적 매핑)
+        function getEmployeeArea(emp) {
+            const building = emp['BUILDING'];
+            const aqlTests = parseFloat(emp['AQL_Total_Tests'] || 0);
+            const empNo = String(emp['Employee No'] || emp['emp_no'] || '');
+
+            // 1순위: BUILDING column (actual 검사 수행 Assembly Inspectors)
+            if (building && aqlTests > 0) {
+                return 'Building ' + building;
+            }
+
+            // 2순위: JSON 매핑 데이터로 Auditor/Trainer/Model Master 분류
+            if (window.auditorAreaMapping && empNo) {
+                // Model Master 체크 (All Buildings 담당)
+                const modelMasters = window.auditorAreaMapping.model_master?.employees || {};
+                if (modelMasters[empNo]) {
+                    return 'All Buildings';
+                }
+
+                // Auditor/Trainer 체크 (Building별 담당)
+                const auditorAreas = window.auditorAreaMapping.auditor_trainer_areas || {};
+                if (auditorAreas[empNo]) {
+                    const config = auditorAreas[empNo];
+                    // conditions에서 BUILDING 값 추출
+                    for (const condition of (config.conditions || [])) {
+                        if (condition.type === 'AND') {
+                            for (const filter of (condition.filters || [])) {
+                                if (filter.column === 'BUILDING') {
+                                    return 'Building ' + filter.value;
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+
+            // Fallback (발생하면 안 됨)
+            return 'Unknown';
+        }
+
+        // AQL 관련 직원만 필터링 (38employees: 검사자 28employees + Auditor 10명)
+        const aqlRelevantEmployees = window.employeeData.filter(isAqlRelevantEmployee);
+
+        // 조건 7번: 팀/구역 AQL 3연속 개월 실패 (AQL 관련 직원 중)
+        let cond7FailEmployees = aqlRelevantEmployees.filter(emp => {
+            const cond7 = emp['cond_7_aql_team_area'] || 'PASS';
+            return cond7 === 'FAIL';
+        });
+
+        // 조건 8번: 구역 reject rate > 3% (AQL 관련 직원 중)
+        let cond8FailEmployees = aqlRelevantEmployees.filter(emp => {
+            const cond8 = emp['cond_8_area_reject'] || 'PASS';
+            const areaRejectRate = parseFloat(emp['Area_Reject_Rate'] || 0);
+            return cond8 === 'FAIL' || areaRejectRate > 3;
+        });
+
+        // 조건별 실패 인원 수 계산
+        const cond7FailCount = cond7FailEmployees.length;
+        const cond8FailCount = cond8FailEmployees.length;
+
+        // 테이블 2: Assembly Inspector 인원 기준 검사 실적 calculation
+        function calculateInspectorStats() {
+            // Python에서 AQL file 기준으로 calculation한 data use
+            if (window.aqlInspectorStats) {
+                return window.aqlInspectorStats;
+            }
+
+            // Fallback: Employee CSV 기준 calculation (AQL file data가 없는 경우)
+            const inspectorStats = {};
+
+            // Assembly Inspector만 필터 (AQL_Total_Tests > 0)
+            const inspectors = window.employeeData.filter(emp =>
+                parseFloat(emp['AQL_Total_Tests'] || 0) > 0
+            );
+
+            inspectors.forEach(emp => {
+                const building = emp['BUILDING'];
+                if (!building) return;
+
+                const area = 'Building ' + building;
+                const totalTests = parseFloat(emp['AQL_Total_Tests'] || 0);
+                const passCount = parseFloat(emp['AQL_Pass_Count'] || 0);
+                const failCount = totalTests - passCount;
+
+                if (!inspectorStats[area]) {
+                    inspectorStats[area] = {
+                        totalInspectors: 0,      // total inspectors count
+                        rejectInspectors: 0,     // with Rejects시킨 inspectors count
+                        passOnlyInspectors: 0    // Pass만 발생시킨 inspectors count
+                    };
+                }
+
+                // inspectors count 카운트
+                inspectorStats[area].totalInspectors += 1;
+
+                // with Rejects 여부
+                if (failCount > 0) {
+                    inspectorStats[area].rejectInspectors += 1;
+                } else {
+                    inspectorStats[area].passOnlyInspectors += 1;
+                }
+            });
+
+            // 인원 기준 Reject Rate calculation
+            Object.keys(inspectorStats).forEach(area => {
+                const stats = inspectorStats[area];
+                stats.rejectRate = stats.totalInspectors > 0 ?
+                    ((stats.rejectInspectors / stats.totalInspectors) * 100).toFixed(1) : '0.0';
+            });
+
+            // total 통계
+            const totalAll = Object.values(inspectorStats).reduce((sum, s) => sum + s.totalInspectors, 0);
+            const rejectAll = Object.values(inspectorStats).reduce((sum, s) => sum + s.rejectInspectors, 0);
+            const passAll = Object.values(inspectorStats).reduce((sum, s) => sum + s.passOnlyInspectors, 0);
+
+            inspectorStats['total'] = {
+                totalInspectors: totalAll,
+                rejectInspectors: rejectAll,
+                passOnlyInspectors: passAll,
+                rejectRate: totalAll > 0 ? ((rejectAll / totalAll) * 100).toFixed(1) : '0.0'
+            };
+
+            return inspectorStats;
+        }
+
+        // 테이블 3: Auditor/Trainer incentive 현황 calculation (JSON + CSV 동적 조합)
+        function calculateAuditorStats() {
+            const auditorStats = [];
+
+            if (!window.auditorAreaMapping) {
+                console.warn('Auditor Area Mapping not loaded');
+                return auditorStats;
+            }
+
+            // Building 순서 정의 (표시 순서: B → D → A → C → All Buildings)
+            const buildingOrder = { 'B': 1, 'D': 2, 'A': 3, 'C': 4, 'All': 5 };
+
+            // Auditor/Trainer 수집 (JSON에서)
+            const auditorAreas = window.auditorAreaMapping.auditor_trainer_areas || {};
+            Object.keys(auditorAreas).forEach(empNo => {
+                const config = auditorAreas[empNo];
+                const emp = window.employeeData.find(e =>
+                    String(e['Employee No']) === empNo ||
+                    String(e['emp_no']) === empNo
+                );
+
+                if (emp) {
+                    // Building 추출
+                    let building = 'Unknown';
+                    for (const condition of (config.conditions || [])) {
+                        if (condition.type === 'AND') {
+                            for (const filter of (condition.filters || [])) {
+                                if (filter.column === 'BUILDING') {
+                                    building = 'Building ' + filter.value;
+                                    break;
+                                }
+                            }
+                        }
+                    }
+
+                    const areaRate = parseFloat(emp['Area_Reject_Rate'] || 0);
+                    const cond7 = emp['cond_7_aql_team_area'] !== 'FAIL';
+                    const cond8 = emp['cond_8_area_reject'] !== 'FAIL';
+
+                    auditorStats.push({
+                        empNo: empNo,
+                        name: config.name || emp['Full Name'],
+                        building: building,
+                        jobTitle: 'Auditor/Trainer',
+                        count: 1,
+                        rejectRate: areaRate.toFixed(1),
+                        consecutive: 0,
+                        cond7: cond7,
+                        cond8: cond8,
+                        incentiveStatus: cond7 && cond8 ? '지급' : '미지급',
+                        sortOrder: buildingOrder[building.replace('Building ', '')] || 99
+                    });
+                }
+            });
+
+            // Model Master 수집 (JSON에서)
+            const modelMasters = window.auditorAreaMapping.model_master?.employees || {};
+            Object.keys(modelMasters).forEach(empNo => {
+                const config = modelMasters[empNo];
+                const emp = window.employeeData.find(e =>
+                    String(e['Employee No']) === empNo ||
+                    String(e['emp_no']) === empNo
+                );
+
+                if (emp) {
+                    const areaRate = parseFloat(emp['Area_Reject_Rate'] || 0);
+                    const cond7 = emp['cond_7_aql_team_area'] !== 'FAIL';
+                    const cond8 = emp['cond_8_area_reject'] !== 'FAIL';
+
+                    // Position에서 Job Title 추출
+                    const position = String(emp['QIP POSITION 1ST  NAME'] || '').toUpperCase();
+                    let jobTitle = 'Model Master';
+                    if (position.includes('TEAM LEADER')) {
+                        jobTitle = 'Team Leader';
+                    }
+
+                    auditorStats.push({
+                        empNo: empNo,
+                        name: config.name || emp['Full Name'],
+                        building: 'All Buildings',
+                        jobTitle: jobTitle,
+                        count: 1,
+                        rejectRate: areaRate.toFixed(1),
+                        consecutive: 0,
+                        cond7: cond7,
+                        cond8: cond8,
+                        incentiveStatus: cond7 && cond8 ? '지급' : '미지급',
+                        sortOrder: 5  // All Buildings는 마지막
+                    });
+                }
+            });
+
+            // Building 순서대로 정렬
+            auditorStats.sort((a, b) => a.sortOrder - b.sortOrder);
+
+            return auditorStats;
+        }
+
+        const inspectorStats = calculateInspectorStats();
+        const auditorStats = calculateAuditorStats();
+
+        // 번역 텍스트 미리 fetch
+        const t = {
+            title: getTranslation('aqlModal.title'),
+            summaryTitle: getTranslation('aqlModal.summaryTitle'),
+            condition7: getTranslation('aqlModal.condition7'),
+            condition7Detail: getTranslation('aqlModal.condition7Detail').replace(/0명|0 people|0 người/, cond7FailCount + (currentLanguage === 'ko' ? '명' : currentLanguage === 'en' ? ' people' : ' người')),
+            condition8: getTranslation('aqlModal.condition8'),
+            condition8Detail: getTranslation('aqlModal.condition8Detail'),
+            auditorTrainer: getTranslation('aqlModal.auditorTrainer'),
+            tableNote: getTranslation('aqlModal.tableNote'),
+            tableNoteDetail: getTranslation('aqlModal.tableNoteDetail'),
+            table1Title: getTranslation('aqlModal.table1Title'),
+            table2Title: getTranslation('aqlModal.table2Title'),
+            table2InspectorTitle: getTranslation('aqlModal.table2InspectorTitle'),
+            table3Title: getTranslation('aqlModal.table3Title'),
+            table3AuditorTitle: getTranslation('aqlModal.table3AuditorTitle'),
+            dataSource: getTranslation('aqlModal.dataSource'),
+            aqlFile: getTranslation('aqlModal.aqlFile'),
+            building: getTranslation('aqlModal.building'),
+            totalTests: getTranslation('aqlModal.totalTests'),
+            pass: getTranslation('aqlModal.pass'),
+            fail: getTranslation('aqlModal.fail'),
+            rejectRate: getTranslation('aqlModal.rejectRate'),
+            performanceGrade: getTranslation('aqlModal.performanceGrade'),
+            totalInspectors: getTranslation('aqlModal.totalInspectors'),
+            rejectInspectors: getTranslation('aqlModal.rejectInspectors'),
+            passOnlyInspectors: getTranslation('aqlModal.passOnlyInspectors'),
+            personnelRejectRate: getTranslation('aqlModal.personnelRejectRate'),
+            jobTitle: getTranslation('aqlModal.jobTitle'),
+            responsibleArea: getTranslation('aqlModal.responsibleArea'),
+            personnel: getTranslation('aqlModal.personnel'),
+            consecutiveMonths: getTranslation('aqlModal.consecutiveMonths'),
+            incentiveStatus: getTranslation('aqlModal.incentiveStatus'),
+            performanceExcellent: getTranslation('aqlModal.performanceExcellent'),
+            performanceGood: getTranslation('aqlModal.performanceGood'),
+            performanceWarning: getTranslation('aqlModal.performanceWarning'),
+            performanceImprovement: getTranslation('aqlModal.performanceImprovement'),
+            paid: getTranslation('aqlModal.paid'),
+            notPaid: getTranslation('aqlModal.notPaid'),
+            noteTitle: getTranslation('aqlModal.noteTitle'),
+            condition7Description: getTranslation('aqlModal.condition7Description'),
+            condition8Description: getTranslation('aqlModal.condition8Description'),
+            incentiveNote: getTranslation('aqlModal.incentiveNote'),
+            unitTests: getTranslation('aqlModal.unitTests'),
+            unitPeople: getTranslation('aqlModal.unitPeople'),
+            unitYear: getTranslation('aqlModal.unitYear'),
+            total: getTranslation('aqlModal.total'),
+            allBuildings: getTranslation('aqlModal.allBuildings')
+        };
+
+        // Bootstrap 모달 creation 및 표시
+        const modalContent = `
+            <div class="modal-header unified-modal-header">
+                <h5 class="modal-title unified-modal-title">
+                    <i class="bi bi-graph-up-arrow"></i>
+                    ${t.title}
+                </h5>
+                <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
+            </div>
+            <div class="modal-body">
+                <div class="mb-3">
+                    <div class="alert alert-info">
+                        <strong>📊 ${t.summaryTitle}:</strong> ${totalAqlTests}${t.unitTests} (NORMAL PO)<br>
+                        <strong>${t.condition7}:</strong> ${t.condition7Detail}<br>
+                        <strong>${t.condition8}:</strong> ${t.condition8Detail} ${cond8FailCount}${t.unitPeople} ${t.auditorTrainer}
+                    </div>
+                    <p><strong>${t.tableNote}:</strong><br><br>${t.tableNoteDetail}</p>
+                </div>
+
+                <!-- 테이블 1: Buildingby AQL 검사 실적 (AQL file 기준) -->
+                <div class="mb-4">
+                    <h6 class="mb-3"><i class="fas fa-chart-bar me-2"></i>📊 ${t.table1Title}</h6>
+                    <p class="text-muted small mb-2">${t.dataSource}: ${reportYear}${t.unitYear} ${reportMonthNum}month ${t.aqlFile} ${totalAqlTests}${t.unitTests} (NORMAL PO)</p>
+                    <div class="table-responsive">
+                        <table class="table table-bordered" style="font-size: 13px;">
+                            <thead class="table-light">
+                                <tr>
+                                    <th style="padding: 10px;">${t.building}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.totalTests}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.pass}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.fail}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.rejectRate}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.performanceGrade}</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                ${['Building B', 'Building D', 'Building A', 'Building C', 'All Buildings', t.total].map(building => {
+                                    const stats = aqlFileStats[building];
+                                    if (!stats) return '';
+
+                                    const isTotal = building === t.total;
+                                    const rejectRate = stats.rejectRate;
+                                    let badgeClass = 'bg-success';
+                                    let statusText = t.performanceExcellent;
+
+                                    if (rejectRate > 3) {
+                                        badgeClass = 'bg-danger';
+                                        statusText = t.performanceImprovement;
+                                    } else if (rejectRate > 2.5) {
+                                        badgeClass = 'bg-warning';
+                                        statusText = t.performanceWarning;
+                                    } else if (rejectRate > 1.5) {
+                                        badgeClass = 'bg-info';
+                                        statusText = t.performanceGood;
+                                    }
+
+                                    return `
+                                        <tr class="${isTotal ? 'table-primary fw-bold' : ''}">
+                                            <td style="padding: 8px;">${building}</td>
+                                            <td style="padding: 8px; text-align: center;"><strong>${stats.total}${t.unitTests}</strong></td>
+                                            <td style="padding: 8px; text-align: center;">${stats.pass}${t.unitTests}</td>
+                                            <td style="padding: 8px; text-align: center;">${stats.fail}${t.unitTests}</td>
+                                            <td style="padding: 8px; text-align: center;">
+                                                <span class="badge ${badgeClass}" style="font-size: 13px; padding: 5px 10px;">
+                                                    ${stats.rejectRate}%
+                                                </span>
+                                            </td>
+                                            <td style="padding: 8px; text-align: center;">
+                                                <span class="badge ${badgeClass}" style="font-size: 12px; padding: 4px 8px;">
+                                                    ${statusText}
+                                                </span>
+                                            </td>
+                                        </tr>
+                                    `;
+                                }).join('')}
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+
+                <!-- 테이블 2: Assembly Inspector 인력 기준 검사 실적 -->
+                <div class="mb-4">
+                    <h6 class="mb-3"><i class="fas fa-users me-2"></i>👥 ${t.table2Title}</h6>
+                    <p class="text-muted small mb-2">${t.dataSource}: ${t.aqlFile} (${t.total} PO TYPE) - ${t.table2InspectorTitle}</p>
+                    <div class="table-responsive">
+                        <table class="table table-bordered" style="font-size: 13px;">
+                            <thead class="table-light">
+                                <tr>
+                                    <th style="padding: 10px;">${t.building}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.totalInspectors}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.rejectInspectors}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.passOnlyInspectors}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.personnelRejectRate}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.performanceGrade}</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                ${['Building B', 'Building D', 'Building A', 'Building C', t.total].map(building => {
+                                    const stats = inspectorStats[building];
+                                    if (!stats) return '';
+
+                                    const isTotal = building === t.total;
+                                    const rejectRate = parseFloat(stats.rejectRate);
+                                    let badgeClass = 'bg-success';
+                                    let statusText = t.performanceExcellent;
+
+                                    if (rejectRate > 3) {
+                                        badgeClass = 'bg-danger';
+                                        statusText = t.performanceImprovement;
+                                    } else if (rejectRate > 2.5) {
+                                        badgeClass = 'bg-warning';
+                                        statusText = t.performanceWarning;
+                                    } else if (rejectRate > 1.5) {
+                                        badgeClass = 'bg-info';
+                                        statusText = t.performanceGood;
+                                    }
+
+                                    return `
+                                        <tr class="${isTotal ? 'table-primary fw-bold' : ''}">
+                                            <td style="padding: 8px;">${building}</td>
+                                            <td style="padding: 8px; text-align: center;"><strong>${stats.totalInspectors}${t.unitPeople}</strong></td>
+                                            <td style="padding: 8px; text-align: center;">${stats.rejectInspectors}${t.unitPeople}</td>
+                                            <td style="padding: 8px; text-align: center;">${stats.passOnlyInspectors}${t.unitPeople}</td>
+                                            <td style="padding: 8px; text-align: center;">
+                                                <span class="badge ${badgeClass}" style="font-size: 13px; padding: 5px 10px;">
+                                                    ${stats.rejectRate}%
+                                                </span>
+                                            </td>
+                                            <td style="padding: 8px; text-align: center;">
+                                                <span class="badge ${badgeClass}" style="font-size: 12px; padding: 4px 8px;">
+                                                    ${statusText}
+                                                </span>
+                                            </td>
+                                        </tr>
+                                    `;
+                                }).join('')}
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+
+                <!-- 테이블 3: Auditor/Trainer incentive 현황 -->
+                <div class="mb-4">
+                    <h6 class="mb-3">🎯 ${t.table3Title}</h6>
+                    <p class="text-muted small mb-2">${t.table3AuditorTitle}</p>
+                    <div class="table-responsive">
+                        <table class="table table-bordered" style="font-size: 13px;">
+                            <thead class="table-light">
+                                <tr>
+                                    <th style="padding: 10px;">${t.jobTitle}</th>
+                                    <th style="padding: 10px;">${t.responsibleArea}</th>
+                                    <th style="padding: 10px;">${t.personnel}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.rejectRate}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.consecutiveMonths}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.condition7}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.condition8}</th>
+                                    <th style="padding: 10px; text-align: center;">${t.incentiveStatus}</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                ${auditorStats.map(stats => {
+                                    const isPayment = stats.incentiveStatus === t.paid || stats.incentiveStatus === '지급';
+                                    const badgeClass = isPayment ? 'bg-success' : 'bg-danger';
+                                    const cond7Badge = stats.cond7 ? '<span class="badge bg-success">✅</span>' : '<span class="badge bg-danger">❌</span>';
+                                    const cond8Badge = stats.cond8 ? '<span class="badge bg-success">✅</span>' : '<span class="badge bg-danger">❌</span>';
+                                    const statusText = isPayment ? t.paid : t.notPaid;
+
+                                    return `
+                                        <tr>
+                                            <td style="padding: 8px;">${stats.jobTitle}</td>
+                                            <td style="padding: 8px;"><strong>${stats.building}</strong></td>
+                                            <td style="padding: 8px;">${stats.name}</td>
+                                            <td style="padding: 8px; text-align: center;">
+                                                <span class="badge ${parseFloat(stats.rejectRate) > 3 ? 'bg-danger' : 'bg-success'}" style="font-size: 13px;">
+                                                    ${stats.rejectRate}%
+                                                </span>
+                                            </td>
+                                            <td style="padding: 8px; text-align: center;">${stats.consecutive}${t.unitPeople}</td>
+                                            <td style="padding: 8px; text-align: center;">${cond7Badge}</td>
+                                            <td style="padding: 8px; text-align: center;">${cond8Badge}</td>
+                                            <td style="padding: 8px; text-align: center;">
+                                                <span class="badge ${badgeClass}" style="font-size: 12px; padding: 4px 8px;">
+                                                    ${isPayment ? '🟢' : '🔴'} ${statusText}
+                                                </span>
+                                            </td>
+                                        </tr>
+                                    `;
+                                }).join('')}
+                            </tbody>
+                        </table>
+                    </div>
+                    <p class="small text-muted mt-2">
+                        <strong>${t.noteTitle}:</strong><br>
+                        • ${t.condition7Description}<br>
+                        • ${t.condition8Description}<br>
+                        • ${t.incentiveNote}
+                    </p>
+                </div>
+            </div>
+        </div>
+    </div>
+            `;
+
+        // Bootstrap 모달 처리
+        let modal = document.getElementById('detailModal');
+        if (!modal) {
+            const modalHTML = `
+                <div class="modal fade" id="detailModal" tabindex="-1" aria-labelledby="detailModalLabel" aria-hidden="true" data-bs-backdrop="true" data-bs-keyboard="true">
+                    <div class="modal-dialog modal-xl">
+                        <div class="modal-content" id="detailModalContent"></div>
+                    </div>
+                </div>
+            `;
+            document.body.insertAdjacentHTML('beforeend', modalHTML);
+            modal = document.getElementById('detailModal');
+        }
+
+        document.getElementById('detailModalContent').innerHTML = modalContent;
+
+        // Bootstrap 5 Modal 처리
+        const modalElement = document.getElementById('detailModal');
+
+        // existing 모달 인스턴스 정리
+        const existingModal = bootstrap.Modal.getInstance(modalElement);
+        if (existingModal) {
+            existingModal.dispose();
+        }
+
+        // 새 모달 인스턴스 creation with proper options
+        const bsModal = new bootstrap.Modal(modalElement, {
+            backdrop: 'static',  // 모달 내부 클릭시 닫히지 않도록 설정
+            keyboard: true,      // ESC 키로 닫기
+            focus: true
+        });
+
+        bsModal.show();
+
+        // 백드롭 클릭 이벤트 직원시적 처리 (구역 AQL 모달)
+        setTimeout(() => {
+            const backdrop = document.querySelector('.modal-backdrop');
+            if (backdrop) {
+                backdrop.style.cursor = 'pointer';
+                backdrop.addEventListener('click', function(e) {
+                    if (e.target === backdrop) {
+                        bsModal.hide();
+                    }
+                });
+            }
+        }, 100);
+
+        // 모달 닫기 이벤트 리스너 추가
+        modalElement.addEventListener('hidden.bs.modal', function () {
+            // 모달이 닫힌 후 정리 작업
+            const backdrop = document.querySelector('.modal-backdrop');
+            if (backdrop) {
+                backdrop.remove();
+            }
+            document.body.classList.remove('modal-open');
+            document.body.style.removeProperty('overflow');
+            document.body.style.removeProperty('padding-right');
+        });
+    }
+
+    // 5PRS 통과율 < 95% 상세 모달
+    function showLowPassRateDetails() {
+        // Load translations
+        const t = {
+            title: getTranslation('fivePrsModal.title'),
+            description: getTranslation('fivePrsModal.description'),
+            totalCount: getTranslation('fivePrsModal.totalCount'),
+            table1Title: getTranslation('fivePrsModal.table1Title'),
+            table2Title: getTranslation('fivePrsModal.table2Title'),
+            employeeId: getTranslation('fivePrsModal.employeeId'),
+            name: getTranslation('fivePrsModal.name'),
+            position: getTranslation('fivePrsModal.position'),
+            type: getTranslation('fivePrsModal.type'),
+            totalQuantity: getTranslation('fivePrsModal.totalQuantity'),
+            passQuantity: getTranslation('fivePrsModal.passQuantity'),
+            passRate: getTranslation('fivePrsModal.passRate'),
+            conditionStatus: getTranslation('fivePrsModal.conditionStatus'),
+            rank: getTranslation('fivePrsModal.rank'),
+            unitPcs: getTranslation('fivePrsModal.unitPcs')
+        };
+
+        // Move these variables outside so they can be accessed by nested functions
+        let allType1Inspectors = [];
+        let lowPassEmployees = [];
+        let sortColumn = 'passRate';
+        let sortOrder = 'asc';
+        let sortColumn2 = 'passRate';
+        let sortOrder2 = 'asc';
+        let modalDiv = null;
+        let backdrop = null;
+
+        function sortData(column) {
+            if (sortColumn === column) {
+                sortOrder = sortOrder === 'asc' ? 'desc' : 'asc';
+            } else {
+                sortColumn = column;
+                sortOrder = column === 'passRate' ? 'asc' : 'desc';
+            }
+            updateTableBody();
+        }
+
+        function sortData2(column) {
+            if (sortColumn2 === column) {
+                sortOrder2 = sortOrder2 === 'asc' ? 'desc' : 'asc';
+            } else {
+                sortColumn2 = column;
+                sortOrder2 = column === 'passRate' ? 'asc' : 'desc';
+            }
+            updateTableBody2();
+        }
+
+        function updateTableBody() {
+            const tbody = document.querySelector('#lowPassRateModal tbody');
+            if (!tbody) return;
+
+            // 정렬
+            lowPassEmployees.sort((a, b) => {
+                let aVal, bVal;
+                switch (sortColumn) {
+                    case 'empNo':
+                        aVal = a['Employee No'] || a['emp_no'];
+                        bVal = b['Employee No'] || b['emp_no'];
+                        break;
+                    case 'name':
+                        aVal = a['Full Name'] || a['name'];
+                        bVal = b['Full Name'] || b['name'];
+                        break;
+                    case 'position':
+                        aVal = a['position'] || a['FINAL QIP POSITION NAME CODE'] || '';
+                        bVal = b['position'] || b['FINAL QIP POSITION NAME CODE'] || '';
+                        break;
+                    case 'totalQty':
+                        aVal = parseFloat(a['validation_qty'] || a['5PRS_Inspection_Qty'] || a['5PRS Inspection Quantity'] || 0);
+                        bVal = parseFloat(b['validation_qty'] || b['5PRS_Inspection_Qty'] || b['5PRS Inspection Quantity'] || 0);
+                        break;
+                    case 'passQty':
+                        const aPassRate = parseFloat(a['pass_rate'] || a['5PRS_Pass_Rate'] || a['5PRS Pass Rate'] || 0);
+                        const aTotalQty = parseFloat(a['validation_qty'] || a['5PRS_Inspection_Qty'] || a['5PRS Inspection Quantity'] || 0);
+                        aVal = Math.round(aTotalQty * aPassRate / 100);
+                        const bPassRate = parseFloat(b['pass_rate'] || b['5PRS_Pass_Rate'] || b['5PRS Pass Rate'] || 0);
+                        const bTotalQty = parseFloat(b['validation_qty'] || b['5PRS_Inspection_Qty'] || b['5PRS Inspection Quantity'] || 0);
+                        bVal = Math.round(bTotalQty * bPassRate / 100);
+                        break;
+                    case 'passRate':
+                        aVal = parseFloat(a['pass_rate'] || a['5PRS_Pass_Rate'] || a['5PRS Pass Rate'] || 100);
+                        bVal = parseFloat(b['pass_rate'] || b['5PRS_Pass_Rate'] || b['5PRS Pass Rate'] || 100);
+                        break;
+                }
+
+                if (typeof aVal === 'string') {
+                    return sortOrder === 'asc' ? aVal.localeCompare(bVal) : bVal.localeCompare(aVal);
+                }
+                return sortOrder === 'asc' ? aVal - bVal : bVal - aVal;
+            });
+
+            // 테이블 업데이트
+            tbody.innerHTML = '';
+            lowPassEmployees.forEach(emp => {
+                const empNo = emp['Employee No'] || emp['emp_no'];
+                const name = emp['Full Name'] || emp['name'];
+                const position = emp['position'] || emp['FINAL QIP POSITION NAME CODE'] || '-';
+                const totalQty = parseFloat(emp['validation_qty'] || emp['5PRS_Inspection_Qty'] || emp['5PRS Inspection Quantity'] || 0);
+                const passRate = parseFloat(emp['pass_rate'] || emp['5PRS_Pass_Rate'] || emp['5PRS Pass Rate'] || 0);
+                const passQty = Math.round(totalQty * passRate / 100);
+
+                // Pass Rate에 따른 색상
+                let badgeClass = 'bg-danger';
+                if (passRate >= 90) badgeClass = 'bg-warning';
+                else if (passRate >= 80) badgeClass = 'bg-orange';
+
+                const row = document.createElement('tr');
+                row.innerHTML = `
+                    <td>${empNo}</td>
+                    <td>${name}</td>
+                    <td>${position}</td>
+                    <td>TYPE-1</td>
+                    <td>${totalQty.toFixed(0)}${t.unitPcs}</td>
+                    <td>${passQty}${t.unitPcs}</td>
+                    <td><span class="badge ${badgeClass}">${passRate.toFixed(1)}%</span></td>
+                    <td>${passRate < 95 ? t.conditionStatus.split('/')[1] : t.conditionStatus.split('/')[0]}</td>
+                `;
+                tbody.appendChild(row);
+            });
+        }
+
+        function updateTableBody2() {
+            const tbody = document.querySelector('#lowPassRateModal2 tbody');
+            if (!tbody) return;
+
+            // Get top 10 lowest pass rates from ALL TYPE-1 ASSEMBLY INSPECTORS
+            let top10Lowest = [...allType1Inspectors].sort((a, b) => {
+                const aRate = parseFloat(a['pass_rate'] || a['5PRS_Pass_Rate'] || a['5PRS Pass Rate'] || 100);
+                const bRate = parseFloat(b['pass_rate'] || b['5PRS_Pass_Rate'] || b['5PRS Pass Rate'] || 100);
+                return aRate - bRate;
+            }).slice(0, 10);
+
+            // Apply secondary sorting
+            top10Lowest.sort((a, b) => {
+                let aVal, bVal;
+                switch (sortColumn2) {
+                    case 'empNo':
+                        aVal = a['Employee No'] || a['emp_no'];
+                        bVal = b['Employee No'] || b['emp_no'];
+                        break;
+                    case 'name':
+                        aVal = a['Full Name'] || a['name'];
+                        bVal = b['Full Name'] || b['name'];
+                        break;
+                    case 'position':
+                        aVal = a['position'] || a['FINAL QIP POSITION NAME CODE'] || '';
+                        bVal = b['position'] || b['FINAL QIP POSITION NAME CODE'] || '';
+                        break;
+                    case 'totalQty':
+                        aVal = parseFloat(a['validation_qty'] || a['5PRS_Inspection_Qty'] || a['5PRS Inspection Quantity'] || 0);
+                        bVal = parseFloat(b['validation_qty'] || b['5PRS_Inspection_Qty'] || b['5PRS Inspection Quantity'] || 0);
+                        break;
+                    case 'passQty':
+                        const aPassRate = parseFloat(a['pass_rate'] || a['5PRS_Pass_Rate'] || a['5PRS Pass Rate'] || 0);
+                        const aTotalQty = parseFloat(a['validation_qty'] || a['5PRS_Inspection_Qty'] || a['5PRS Inspection Quantity'] || 0);
+                        aVal = Math.round(aTotalQty * aPassRate / 100);
+                        const bPassRate = parseFloat(b['pass_rate'] || b['5PRS_Pass_Rate'] || b['5PRS Pass Rate'] || 0);
+                        const bTotalQty = parseFloat(b['validation_qty'] || b['5PRS_Inspection_Qty'] || b['5PRS Inspection Quantity'] || 0);
+                        bVal = Math.round(bTotalQty * bPassRate / 100);
+                        break;
+                    case 'passRate':
+                        aVal = parseFloat(a['pass_rate'] || a['5PRS_Pass_Rate'] || a['5PRS Pass Rate'] || 100);
+                        bVal = parseFloat(b['pass_rate'] || b['5PRS_Pass_Rate'] || b['5PRS Pass Rate'] || 100);
+                        break;
+                }
+
+                if (typeof aVal === 'string') {
+                    return sortOrder2 === 'asc' ? aVal.localeCompare(bVal) : bVal.localeCompare(aVal);
+                }
+                return sortOrder2 === 'asc' ? aVal - bVal : bVal - aVal;
+            });
+
+            // 테이블 업데이트
+            tbody.innerHTML = '';
+            top10Lowest.forEach((emp, index) => {
+                const empNo = emp['Employee No'] || emp['emp_no'];
+                const name = emp['Full Name'] || emp['name'];
+                const position = emp['position'] || emp['FINAL QIP POSITION NAME CODE'] || '-';
+                const totalQty = parseFloat(emp['validation_qty'] || emp['5PRS_Inspection_Qty'] || emp['5PRS Inspection Quantity'] || 0);
+                const passRate = parseFloat(emp['pass_rate'] || emp['5PRS_Pass_Rate'] || emp['5PRS Pass Rate'] || 0);
+                const passQty = Math.round(totalQty * passRate / 100);
+
+                // Pass Rate에 따른 색상
+                let badgeClass = 'bg-danger';
+                if (passRate >= 90) badgeClass = 'bg-warning';
+                else if (passRate >= 80) badgeClass = 'bg-orange';
+
+                const row = document.createElement('tr');
+                row.innerHTML = `
+                    <td><strong>${index + 1}</strong></td>
+                    <td>${empNo}</td>
+                    <td>${name}</td>
+                    <td>${position}</td>
+                    <td>TYPE-1</td>
+                    <td>${totalQty.toFixed(0)}${t.unitPcs}</td>
+                    <td>${passQty}${t.unitPcs}</td>
+                    <td><span class="badge ${badgeClass}">${passRate.toFixed(1)}%</span></td>
+                    <td>${passRate < 95 ? t.conditionStatus.split('/')[1] : t.conditionStatus.split('/')[0]}</td>
+                `;
+                tbody.appendChild(row);
+            });
+        }
+
+        function create5PrsModal() {
+            // CRITICAL FIX: Filter data when modal is created, not when function is defined
+            console.log('[5PRS Modal] window.employeeData length:', window.employeeData ? window.employeeData.length : 0);
+
+            // TYPE-1 ASSEMBLY INSPECTOR total (position code based)
+            // A1A, A1B, A1C = ASSEMBLY INSPECTOR
+            allType1Inspectors = (window.employeeData || []).filter(emp => {
+                const isType1 = emp['type'] === 'TYPE-1' || emp['ROLE TYPE STD'] === 'TYPE-1';
+                // CRITICAL FIX: Use position_code field (FINAL QIP POSITION NAME CODE)
+                const positionCode = (emp['position_code'] || '').toUpperCase().trim();
+                const isAssemblyInspector = ['A1A', 'A1B', 'A1C'].includes(positionCode);
+                console.log(`[5PRS Modal Filter] Employee ${emp['emp_no']}: type=${emp['type']}, position_code=${emp['position_code']}, isType1=${isType1}, isAssembly=${isAssemblyInspector}`);
+                return isType1 && isAssemblyInspector;
+            });
+
+            console.log('[5PRS Modal] TYPE-1 ASSEMBLY INSPECTORS found:', allType1Inspectors.length);
+
+            // TYPE-1 ASSEMBLY INSPECTOR with pass rate < 95% 필터링 (첫 번째 테이블용)
+            lowPassEmployees = allType1Inspectors.filter(emp => {
+                const passRate = parseFloat(emp['pass_rate'] || emp['5PRS_Pass_Rate'] || emp['5PRS Pass Rate'] || 100);
+                console.log(`[5PRS Pass Rate Filter] Employee ${emp['emp_no']}: pass_rate=${emp['pass_rate']}, 5PRS_Pass_Rate=${emp['5PRS_Pass_Rate']}, parsed=${passRate}, below95=${passRate < 95}`);
+                return passRate < 95;
+            });
+
+            console.log('[5PRS Modal] Employees with pass rate < 95%:', lowPassEmployees.length);
+
+            // 백드롭 creation
+            backdrop = document.createElement('div');
+            backdrop.className = 'modal-backdrop fade show';
+            backdrop.style.zIndex = '1040';
+            document.body.appendChild(backdrop);
+
+            // 모달 creation
+            modalDiv = document.createElement('div');
+            modalDiv.className = 'modal fade show d-block';
+            modalDiv.style.zIndex = '1050';
+            modalDiv.setAttribute('id', 'lowPassRateModal');
+
+            const modalHTML = `
+                <div class="modal-dialog modal-xl">
+                    <div class="modal-content">
+                        <div class="modal-header unified-modal-header">
+                            <h5 class="modal-title unified-modal-title">
+                                <i class="bi bi-graph-down"></i>
+                                ${t.title}
+                            </h5>
+                            <button type="button" class="btn-close" onclick="window.closeLowPassRateModal()"></button>
+                        </div>
+                        <div class="modal-body">
+                            <div class="mb-3">
+                                <div class="alert alert-warning">
+                                    <strong>${t.description}</strong>
+                                </div>
+                                <p>${t.totalCount.replace('{count}', lowPassEmployees.length)}</p>
+                            </div>
+
+                            <!-- Table 1: All 직원 with pass rate < 95% -->
+                            <h6 class="mb-3">${t.table1Title}</h6>
+                            <div class="table-responsive mb-4">
+                                <table class="table table-hover">
+                                    <thead class="unified-table-header">
+                                        <tr>
+                                            <th class="sortable-header" data-sort="empNo">${t.employeeId} ${getSortIcon('empNo')}</th>
+                                            <th class="sortable-header" data-sort="name">${t.name} ${getSortIcon('name')}</th>
+                                            <th class="sortable-header" data-sort="position">${t.position} ${getSortIcon('position')}</th>
+                                            <th>${t.type}</th>
+                                            <th class="sortable-header" data-sort="totalQty">${t.totalQuantity} ${getSortIcon('totalQty')}</th>
+                                            <th class="sortable-header" data-sort="passQty">${t.passQuantity} ${getSortIcon('passQty')}</th>
+                                            <th class="sortable-header" data-sort="passRate">${t.passRate} ${getSortIcon('passRate')}</th>
+                                            <th>${t.conditionStatus.split('/')[2]}</th>
+                                        </tr>
+                                    </thead>
+                                    <tbody></tbody>
+                                </table>
+                            </div>
+
+                            <!-- Table 2: Top 10 lowest pass rates -->
+                            <h6 class="mb-3">${t.table2Title}</h6>
+                            <div class="table-responsive">
+                                <table class="table table-hover" id="lowPassRateModal2">
+                                    <thead class="unified-table-header">
+                                        <tr>
+                                            <th>${t.rank}</th>
+                                            <th class="sortable-header-2" data-sort="empNo">${t.employeeId} ${getSortIcon2('empNo')}</th>
+                                            <th class="sortable-header-2" data-sort="name">${t.name} ${getSortIcon2('name')}</th>
+                                            <th class="sortable-header-2" data-sort="position">${t.position} ${getSortIcon2('position')}</th>
+                                            <th>${t.type}</th>
+                                            <th class="sortable-header-2" data-sort="totalQty">${t.totalQuantity} ${getSortIcon2('totalQty')}</th>
+                                            <th class="sortable-header-2" data-sort="passQty">${t.passQuantity} ${getSortIcon2('passQty')}</th>
+                                            <th class="sortable-header-2" data-sort="passRate">${t.passRate} ${getSortIcon2('passRate')}</th>
+                                            <th>${t.conditionStatus.split('/')[2]}</th>
+                                        </tr>
+                                    </thead>
+                                    <tbody></tbody>
+                                </table>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            `;
+
+            modalDiv.innerHTML = modalHTML;
+            document.body.appendChild(modalDiv);
+            document.body.classList.add('modal-open');
+
+            // 정렬 이벤트 추가 - Table 1
+            modalDiv.querySelectorAll('.sortable-header').forEach(header => {
+                header.addEventListener('click', function() {
+                    const column = this.getAttribute('data-sort');
+                    sortData(column);
+
+                    // 헤더 업데이트
+                    modalDiv.querySelectorAll('.sortable-header').forEach(h => {
+                        const col = h.getAttribute('data-sort');
+                        const icon = getSortIcon(col);
+                        const text = h.textContent.replace(/[▲▼]/g, '').trim();
+                        h.innerHTML = text + ' ' + icon;
+                    });
+                });
+            });
+
+            // 정렬 이벤트 추가 - Table 2
+            modalDiv.querySelectorAll('.sortable-header-2').forEach(header => {
+                header.addEventListener('click', function() {
+                    const column = this.getAttribute('data-sort');
+                    sortData2(column);
+
+                    // 헤더 업데이트
+                    modalDiv.querySelectorAll('.sortable-header-2').forEach(h => {
+                        const col = h.getAttribute('data-sort');
+                        const icon = getSortIcon2(col);
+                        const text = h.textContent.replace(/[▲▼]/g, '').trim();
+                        h.innerHTML = text + ' ' + icon;
+                    });
+                });
+            });
+
+            // 초기 data load
+            updateTableBody();
+            updateTableBody2();
+
+            // 닫기 함count
+            window.closeLowPassRateModal = function() {
+                if (modalDiv) {
+                    modalDiv.remove();
+                    modalDiv = null;
+                }
+                if (backdrop) {
+                    backdrop.remove();
+                    backdrop = null;
+                }
+                document.body.classList.remove('modal-open');
+                window.closeLowPassRateModal = null;
+            };
+
+            // 백드롭 클릭으로 닫기
+            backdrop.onclick = function(e) {
+                if (e.target === backdrop) {
+                    window.closeLowPassRateModal();
+                }
+            };
+
+            // 모달 내부 클릭 시 이벤트 전파 중단
+            modalDiv.querySelector('.modal-content').onclick = function(e) {
+                e.stopPropagation();
+            };
+        }
+
+        function getSortIcon(column) {
+            if (sortColumn !== column) return '';
+            return sortOrder === 'asc' ? '▲' : '▼';
+        }
+
+        function getSortIcon2(column) {
+            if (sortColumn2 !== column) return '';
+            return sortOrder2 === 'asc' ? '▲' : '▼';
+        }
+
+        create5PrsModal();
+    }
+
+    // 5PRS 검사량 < 100족 상세 모달
+    function showLowInspectionQtyDetails() {
+        // CRITICAL FIX: 5PRS data file에 actual로 있는 직원만 표시
+        // TYPE-1 ASSEMBLY INSPECTOR with inspection qty < 100 필터링
+        let lowQtyEmployees = window.employeeData.filter(emp => {
+            const isType1 = emp['type'] === 'TYPE-1' || emp['ROLE TYPE STD'] === 'TYPE-1';
+            const positionCode = (emp['position_code'] || '').toUpperCase().trim();
+            const isAssemblyInspector = ['A1A', 'A1B', 'A1C'].includes(positionCode);
+
+            // CRITICAL: validation_qty가 actual로 존재하고(NaN 아님) 100 미만인 경우만
+            const hasValidationData = emp['validation_qty'] !== null &&
+                                     emp['validation_qty'] !== undefined &&
+                                     emp['validation_qty'] !== '' &&
+                                     !isNaN(parseFloat(emp['validation_qty']));
+            const inspectionQty = hasValidationData ? parseFloat(emp['validation_qty']) : 999999;
+
+            return isType1 && isAssemblyInspector && hasValidationData && inspectionQty < 100;
+        });
+
+        let sortColumn = 'inspectionQty';
+        let sortOrder = 'asc';
+        let modalDiv = null;
+        let backdrop = null;
+
+        function sortData(column) {
+            if (sortColumn === column) {
+                sortOrder = sortOrder === 'asc' ? 'desc' : 'asc';
+            } else {
+                sortColumn = column;
+                sortOrder = column === 'inspectionQty' ? 'asc' : 'desc';
+            }
+            updateTableBody();
+        }
+
+        function updateTableBody() {
+            const tbody = document.querySelector('#lowInspectionQtyModal tbody');
+            if (!tbody) return;
+
+            // 정렬
+            lowQtyEmployees.sort((a, b) => {
+                let aVal, bVal;
+                switch (sortColumn) {
+                    case 'empNo':
+                        aVal = a['Employee No'] || a['emp_no'];
+                        bVal = b['Employee No'] || b['emp_no'];
+                        break;
+                    case 'name':
+                        aVal = a['Full Name'] || a['name'];
+                        bVal = b['Full Name'] || b['name'];
+                        break;
+                    case 'position':
+                        aVal = a['position'] || a['FINAL QIP POSITION NAME CODE'] || '';
+                        bVal = b['position'] || b['FINAL QIP POSITION NAME CODE'] || '';
+                        break;
+                    case 'inspectionQty':
+                        aVal = parseFloat(a['validation_qty'] || a['5PRS Inspection Quantity'] || 0);
+                        bVal = parseFloat(b['validation_qty'] || b['5PRS Inspection Quantity'] || 0);
+                        break;
+                }
+
+                if (typeof aVal === 'string') {
+                    return sortOrder === 'asc' ? aVal.localeCompare(bVal) : bVal.localeCompare(aVal);
+                }
+                return sortOrder === 'asc' ? aVal - bVal : bVal - aVal;
+            });
+
+            // 테이블 업데이트
+            tbody.innerHTML = '';
+            lowQtyEmployees.forEach(emp => {
+                const empNo = emp['Employee No'] || emp['emp_no'];
+                const name = emp['Full Name'] || emp['name'];
+                const position = emp['position'] || emp['FINAL QIP POSITION NAME CODE'] || '-';
+                const inspectionQty = Math.round(parseFloat(emp['validation_qty'] || emp['5PRS Inspection Quantity'] || 0));
+
+                // Inspection Qty에 따른 색상 및 텍스트 색상
+                // 0-49족: 빨간색 (심각), 50-79족: 주황색 (주의), 80-99족: 노란색 (경고)
+                let badgeClass = 'bg-danger text-white';
+                if (inspectionQty >= 80) {
+                    badgeClass = 'bg-warning text-dark';
+                } else if (inspectionQty >= 50) {
+                    badgeClass = 'bg-orange text-white';
+                }
+
+                // 언어별 단위 및 상태 텍스트
+                const qtyUnit = currentLanguage === 'ko' ? '족' : currentLanguage === 'en' ? ' prs' : ' bộ';
+                const statusText = inspectionQty < 100 ?
+                    (currentLanguage === 'ko' ? '미충족' : currentLanguage === 'en' ? 'Not Met' : 'Không đạt') :
+                    (currentLanguage === 'ko' ? '충족' : currentLanguage === 'en' ? 'Met' : 'Đạt');
+
+                const row = document.createElement('tr');
+                row.innerHTML = `
+                    <td>${empNo}</td>
+                    <td>${name}</td>
+                    <td>${position}</td>
+                    <td>TYPE-1</td>
+                    <td><span class="badge ${badgeClass}">${inspectionQty}${qtyUnit}</span></td>
+                    <td>${statusText}</td>
+                `;
+                tbody.appendChild(row);
+            });
+        }
+
+        function createInspectionModal() {
+            // Get current language
+            const lang = currentLanguage || 'ko';
+            const t = (key) => getTranslation(key, lang);
+
+            // 백드롭 creation
+            backdrop = document.createElement('div');
+            backdrop.className = 'modal-backdrop fade show';
+            backdrop.style.zIndex = '1040';
+            document.body.appendChild(backdrop);
+
+            // 모달 creation
+            modalDiv = document.createElement('div');
+            modalDiv.className = 'modal fade show d-block';
+            modalDiv.style.zIndex = '1050';
+            modalDiv.setAttribute('id', 'lowInspectionQtyModal');
+
+            const countText = t('validationTab.modals.lowInspectionQty.count').replace('{count}', lowQtyEmployees.length);
+
+            const modalHTML = `
+                <div class="modal-dialog modal-xl">
+                    <div class="modal-content">
+                        <div class="modal-header unified-modal-header">
+                            <h5 class="modal-title unified-modal-title" data-i18n="validationTab.modals.lowInspectionQty.title">
+                                <i class="bi bi-search"></i>
+                                ${t('validationTab.modals.lowInspectionQty.title')}
+                            </h5>
+                            <button type="button" class="btn-close" onclick="window.closeLowInspectionQtyModal()"></button>
+                        </div>
+                        <div class="modal-body">
+                            <div class="mb-3">
+                                <div class="alert alert-warning" data-i18n="validationTab.modals.lowInspectionQty.alert">
+                                    ${t('validationTab.modals.lowInspectionQty.alert')}
+                                </div>
+                                <p data-i18n="validationTab.modals.lowInspectionQty.count">${countText}</p>
+                            </div>
+                            <div class="table-responsive">
+                                <table class="table table-hover">
+                                    <thead class="unified-table-header">
+                                        <tr>
+                                            <th class="sortable-header" data-sort="empNo" data-i18n="validationTab.modals.lowInspectionQty.headers.empNo">${t('validationTab.modals.lowInspectionQty.headers.empNo')} ${getSortIcon('empNo')}</th>
+                                            <th class="sortable-header" data-sort="name" data-i18n="validationTab.modals.lowInspectionQty.headers.name">${t('validationTab.modals.lowInspectionQty.headers.name')} ${getSortIcon('name')}</th>
+                                            <th class="sortable-header" data-sort="position" data-i18n="validationTab.modals.lowInspectionQty.headers.position">${t('validationTab.modals.lowInspectionQty.headers.position')} ${getSortIcon('position')}</th>
+                                            <th data-i18n="validationTab.modals.lowInspectionQty.headers.type">${t('validationTab.modals.lowInspectionQty.headers.type')}</th>
+                                            <th class="sortable-header" data-sort="inspectionQty" data-i18n="validationTab.modals.lowInspectionQty.headers.inspectionQty">${t('validationTab.modals.lowInspectionQty.headers.inspectionQty')} ${getSortIcon('inspectionQty')}</th>
+                                            <th data-i18n="validationTab.modals.lowInspectionQty.headers.conditionMet">${t('validationTab.modals.lowInspectionQty.headers.conditionMet')}</th>
+                                        </tr>
+                                    </thead>
+                                    <tbody></tbody>
+                                </table>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            `;
+
+            modalDiv.innerHTML = modalHTML;
+            document.body.appendChild(modalDiv);
+            document.body.classList.add('modal-open');
+
+            // 정렬 이벤트 추가
+            modalDiv.querySelectorAll('.sortable-header').forEach(header => {
+                header.addEventListener('click', function() {
+                    const column = this.getAttribute('data-sort');
+                    sortData(column);
+
+                    // 헤더 업데이트
+                    modalDiv.querySelectorAll('.sortable-header').forEach(h => {
+                        const col = h.getAttribute('data-sort');
+                        const icon = getSortIcon(col);
+                        h.innerHTML = h.textContent.replace(/[▲▼]/g, '').trim() + ' ' + icon;
+                    });
+                });
+            });
+
+            // 초기 data load
+            updateTableBody();
+
+            // 닫기 함count
+            window.closeLowInspectionQtyModal = function() {
+                if (modalDiv) {
+                    modalDiv.remove();
+                    modalDiv = null;
+                }
+                if (backdrop) {
+                    backdrop.remove();
+                    backdrop = null;
+                }
+                document.body.classList.remove('modal-open');
+                window.closeLowInspectionQtyModal = null;
+            };
+
+            // 백드롭 클릭으로 닫기
+            backdrop.onclick = function(e) {
+                if (e.target === backdrop) {
+                    window.closeLowInspectionQtyModal();
+                }
+            };
+
+            // 모달 내부 클릭 시 이벤트 전파 중단
+            modalDiv.querySelector('.modal-content').onclick = function(e) {
+                e.stopPropagation();
+            };
+        }
+
+        function getSortIcon(column) {
+            if (sortColumn !== column) return '';
+            return sortOrder === 'asc' ? '▲' : '▼';
+        }
+
+        createInspectionModal();
+    }
+    
\ No newline at end of file